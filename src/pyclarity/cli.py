@@ -8,6 +8,7 @@ from rich import print as rprint
 from rich.console import Console
 
 from pyclarity.server.mcp_server import create_server
+from pyclarity.tools.base import set_strict_validation
 
 app = typer.Typer(help="PyClarity - Cognitive Tools for Strategic Thinking")
 console = Console()
@@ -52,6 +53,8 @@ def server(
     console.print("  • Impact Propagation")
 
     try:
+        if debug:
+            set_strict_validation(True)
         mcp: FastMCP = create_server()
         if transport == "http":
             mcp.run(transport="http", host=host, port=port)
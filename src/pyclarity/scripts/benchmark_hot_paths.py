@@ -0,0 +1,219 @@
+"""
+Benchmark the hot paths whose cost should not grow with their input.
+
+Each case times one workload in wall-clock seconds, taking the best of
+several runs, and compares it with the budget the workload was designed
+for. Wall time is used because several cases rely on concurrent stages
+overlapping rather than on CPU savings. Budgets are for a typical
+developer machine; the tests check the same workloads for correctness
+only, so timings never make them flaky.
+
+Usage:
+    python -m pyclarity.scripts.benchmark_hot_paths [repeats]
+"""
+
+import asyncio
+import inspect
+import random
+import sys
+import time
+from collections.abc import Callable
+
+import numpy as np
+from rich.console import Console
+from rich.table import Table
+
+from pyclarity.tools.debugging_approaches.analyzer import ERROR_CATEGORY_KEYWORDS
+from pyclarity.tools.design_patterns import (
+    DesignPattern,
+    PatternCategory,
+    PatternComplexity,
+    PatternIndex,
+)
+from pyclarity.tools.mental_models import (
+    ComplexityLevel,
+    MentalModelContext,
+    MentalModelsAnalyzer,
+    MentalModelType,
+)
+from pyclarity.tools.scientific_method import ScientificMethodAnalyzer, ScientificMethodContext
+from pyclarity.tools.scientific_method.statistics import compare_samples
+from pyclarity.tools.sequential_readiness import ReadinessGraph, ReadinessLevel
+from pyclarity.tools.triple_constraint import (
+    ConstraintDimension,
+    TripleConstraintAnalyzer,
+    TripleConstraintContext,
+)
+
+DEFAULT_REPEATS = 3
+
+
+def _keyword_scan() -> Callable[[], object]:
+    rng = random.Random(3)
+    words = ["request", "handled", "user", "timeout", "latency", "deadlock", "value", "cache"]
+    text = " ".join(rng.choice(words) for _ in range(130_000))[:1_000_000]
+    return lambda: ERROR_CATEGORY_KEYWORDS.scan(text)
+
+
+def _pattern(pattern_id: str, name: str, intent: str, applicability: list[str]) -> DesignPattern:
+    return DesignPattern(
+        pattern_id=pattern_id,
+        name=name,
+        category=PatternCategory.ENTERPRISE,
+        description=f"{name} pattern for distributed enterprise systems",
+        intent=intent,
+        applicability=applicability,
+        complexity=PatternComplexity.MEDIUM,
+    )
+
+
+def _pattern_search() -> Callable[[], object]:
+    patterns = [
+        _pattern(
+            f"pattern_{i}",
+            f"Enterprise Pattern {i}",
+            f"Coordinate workload {i} across regional clusters and queues",
+            [f"Capability {i} required"],
+        )
+        for i in range(2000)
+    ]
+    patterns.append(_pattern(
+        "circuit_breaker",
+        "Circuit Breaker",
+        "Stop calling a failing remote service until it recovers",
+        ["Remote calls can fail", "Cascading failures"],
+    ))
+    index = PatternIndex(patterns)
+    query = "Cascading failures when a remote service is failing"
+
+    def run() -> None:
+        for _ in range(200):
+            index.search(query, limit=5)
+
+    return run
+
+
+def _readiness_replans() -> Callable[[], object]:
+    """1000 readiness updates of a 500-state DAG; each state depends on three of the prior level."""
+    rng = random.Random(0)
+    durations, edges = {}, []
+    for level in range(25):
+        for k in range(20):
+            name = f"s{level}_{k}"
+            durations[name] = rng.uniform(0.5, 6.0)
+            if level:
+                for parent in rng.sample(range(20), 3):
+                    edges.append((f"s{level - 1}_{parent}", name))
+    levels = list(ReadinessLevel)
+
+    def run() -> None:
+        graph = ReadinessGraph(durations, edges)
+        updates = random.Random(1)
+        for _ in range(1000):
+            graph.set_readiness(updates.choice(graph.names), updates.choice(levels))
+
+    return run
+
+
+def _batch_means() -> Callable[[], object]:
+    rng = np.random.default_rng(4)
+    treatment = rng.normal(0.02, 1.0, 100_000)
+    control = rng.normal(0.0, 1.0, 100_000)
+    return lambda: compare_samples(treatment, control, rng=np.random.default_rng(4))
+
+
+def _scientific_method() -> Callable[[], object]:
+    analyzer = ScientificMethodAnalyzer()
+    context = ScientificMethodContext(
+        problem="Checkout latency spikes every evening under peak load",
+        research_question="Why does checkout latency spike in the evening?",
+        domain_knowledge="Distributed services with shared caches and queues",
+        evidence_sources=["APM traces"],
+        max_hypotheses=40,
+    )
+    return lambda: analyzer.analyze(context)
+
+
+def _mental_models() -> Callable[[], object]:
+    analyzer = MentalModelsAnalyzer()
+    context = MentalModelContext(
+        problem=(
+            "Design a scalable microservices architecture for an e-commerce platform "
+            "with 1M+ daily users"
+        ),
+        model_type=MentalModelType.FIRST_PRINCIPLES,
+        additional_models=[
+            MentalModelType.OPPORTUNITY_COST,
+            MentalModelType.PARETO_PRINCIPLE,
+            MentalModelType.OCCAMS_RAZOR,
+        ],
+        complexity_level=ComplexityLevel.COMPLEX,
+        focus_areas=["scalability", "reliability", "performance"],
+        constraints=["budget limitations", "team size", "timeline"],
+    )
+    return lambda: analyzer.analyze(context)
+
+
+def _triple_constraint() -> Callable[[], object]:
+    analyzer = TripleConstraintAnalyzer()
+    dimensions = list(ConstraintDimension)
+    context = TripleConstraintContext(
+        scenario="Platform re-architecture",
+        predefined_constraints=[
+            dict(
+                dimension=dimensions[i].value,
+                name=f"constraint_{i}",
+                current_value=40 + i,
+                target_value=80,
+                flexibility=0.4,
+            )
+            for i in range(12)
+        ],
+        trade_off_matrix={"constraint_0": {"constraint_1": -0.5, "constraint_2": 0.2}},
+        max_scenarios=5,
+        random_seed=5,
+    )
+    return lambda: analyzer.analyze(context)
+
+
+# Workload factory and budget in seconds of each benchmarked hot path
+HOT_PATH_CASES: dict[str, tuple[Callable[[], Callable[[], object]], float]] = {
+    "Keyword scan, 1 MB of text": (_keyword_scan, 1.0),
+    "Pattern search, 200 queries over 2001 patterns": (_pattern_search, 1.0),
+    "Readiness re-plans, 1000 updates of 500 states": (_readiness_replans, 1.0),
+    "Batch-means statistics, 2 x 100k samples": (_batch_means, 1.0),
+    "Mental models, 4 models in one call": (_mental_models, 0.3),
+    "Scientific method, 40 hypotheses": (_scientific_method, 2.0),
+    "Triple constraint, 12 dimensions": (_triple_constraint, 2.0),
+}
+
+
+async def _best_seconds(run: Callable[[], object], repeats: int) -> float:
+    """Fastest wall-clock time of a workload over the given number of runs."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = run()
+        if inspect.isawaitable(result):
+            await result
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def main(repeats: int = DEFAULT_REPEATS) -> None:
+    """Time every hot path and print it against its budget."""
+    table = Table(title=f"Hot paths (best of {repeats} runs, wall-clock seconds)")
+    table.add_column("Workload")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Budget", justify="right")
+    table.add_column("Status")
+
+    for name, (factory, budget) in HOT_PATH_CASES.items():
+        seconds = await _best_seconds(factory(), repeats)
+        status = "ok" if seconds < budget else "[red]over budget[/red]"
+        table.add_row(name, f"{seconds:.3f}", f"{budget:.1f}", status)
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REPEATS))
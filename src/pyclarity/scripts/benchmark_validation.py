@@ -0,0 +1,284 @@
+"""
+Benchmark trusted model construction against full validation, per analyzer.
+
+Each run analyzes a representative context and encodes the result for an
+MCP response. With strict validation every model is validated when it is
+built; with trusted construction the analyzer skips validating the
+intermediate models it discards, and the response encoder validates any
+trusted model that reached the result. CPU time is used instead of
+wall time so the simulated processing delays in some analyzers do not
+hide the difference. The two modes run in alternating rounds and the
+median round is reported, so drift over the run does not favour either.
+
+Usage:
+    python -m pyclarity.scripts.benchmark_validation [iterations]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+
+from rich.console import Console
+from rich.table import Table
+
+from pyclarity.server.encoding import encode_result
+from pyclarity.tools.base import strict_validation
+from pyclarity.tools.collaborative_reasoning import (
+    CollaborativeReasoningAnalyzer,
+    CollaborativeReasoningContext,
+    Persona,
+    PersonaType,
+    ReasoningStyle,
+)
+from pyclarity.tools.debugging_approaches import (
+    DebuggingApproachesAnalyzer,
+    DebuggingApproachesContext,
+)
+from pyclarity.tools.decision_framework import (
+    CriteriaType,
+    DecisionCriteria,
+    DecisionFrameworkAnalyzer,
+    DecisionFrameworkContext,
+    DecisionOption,
+)
+from pyclarity.tools.design_patterns import DesignPatternsAnalyzer, DesignPatternsContext
+from pyclarity.tools.impact_propagation import ImpactPropagationAnalyzer, ImpactPropagationContext
+from pyclarity.tools.iterative_validation import (
+    IterativeValidationAnalyzer,
+    IterativeValidationContext,
+)
+from pyclarity.tools.mental_models import MentalModelContext, MentalModelsAnalyzer, MentalModelType
+from pyclarity.tools.metacognitive_monitoring import (
+    MetacognitiveMonitoringAnalyzer,
+    MetacognitiveMonitoringContext,
+)
+from pyclarity.tools.multi_perspective import MultiPerspectiveAnalyzer, MultiPerspectiveContext
+from pyclarity.tools.programming_paradigms import (
+    ProgrammingParadigmsAnalyzer,
+    ProgrammingParadigmsContext,
+)
+from pyclarity.tools.scientific_method import ScientificMethodAnalyzer, ScientificMethodContext
+from pyclarity.tools.sequential_readiness import (
+    SequentialReadinessAnalyzer,
+    SequentialReadinessContext,
+)
+from pyclarity.tools.sequential_thinking import (
+    SequentialThinkingAnalyzer,
+    SequentialThinkingContext,
+)
+from pyclarity.tools.structured_argumentation import (
+    StructuredArgumentationAnalyzer,
+    StructuredArgumentationContext,
+)
+from pyclarity.tools.triple_constraint import TripleConstraintAnalyzer, TripleConstraintContext
+from pyclarity.tools.visual_reasoning import VisualReasoningAnalyzer, VisualReasoningContext
+
+DEFAULT_ITERATIONS = 20
+
+ROUNDS = 5
+
+PROBLEM = "Select the best hosting platform for our e-commerce workload before the holiday peak"
+
+CRITERIA_NAMES = ["Cost", "Performance", "Reliability", "Scalability", "Security"]
+
+
+def _decision_framework_context() -> DecisionFrameworkContext:
+    return DecisionFrameworkContext(
+        problem=PROBLEM,
+        criteria=[
+            DecisionCriteria(name=name, weight=0.2, criteria_type=CriteriaType.BENEFIT)
+            for name in CRITERIA_NAMES
+        ],
+        options=[
+            DecisionOption(
+                name=f"Option {index + 1}",
+                scores={
+                    name: ((index + offset) % 10) / 10
+                    for offset, name in enumerate(CRITERIA_NAMES)
+                },
+                risks=["Vendor lock-in", "Migration effort"],
+            )
+            for index in range(8)
+        ],
+    )
+
+
+def _collaborative_reasoning_context() -> CollaborativeReasoningContext:
+    return CollaborativeReasoningContext(
+        problem=PROBLEM,
+        reasoning_focus="Trade-offs between cost, reliability and delivery risk",
+        personas=[
+            Persona(
+                name="Platform engineer",
+                persona_type=PersonaType.EXPERT,
+                reasoning_style=ReasoningStyle.ANALYTICAL,
+                background="Runs the production clusters and on-call rotation",
+            ),
+            Persona(
+                name="Finance lead",
+                persona_type=PersonaType.STAKEHOLDER,
+                reasoning_style=ReasoningStyle.CREATIVE,
+                background="Owns the infrastructure budget and vendor contracts",
+            ),
+        ],
+    )
+
+
+def _visual_reasoning_context() -> VisualReasoningContext:
+    return VisualReasoningContext(
+        problem_type="Architecture diagram review",
+        visual_elements_data=[
+            {
+                "element_id": f"service_{index}",
+                "element_type": "service",
+                "position": [index * 10.0, 20.0],
+                "size": [5.0, 5.0],
+            }
+            for index in range(6)
+        ],
+    )
+
+
+# Analyzer factory and representative context of each benchmarked tool
+ANALYZER_CASES: dict[str, tuple[Callable[[], object], Callable[[], object]]] = {
+    "Collaborative Reasoning": (CollaborativeReasoningAnalyzer, _collaborative_reasoning_context),
+    "Debugging Approaches": (
+        DebuggingApproachesAnalyzer,
+        lambda: DebuggingApproachesContext(
+            problem_description="Checkout requests time out for some customers after the release",
+            system_context="Python order service behind a public REST API",
+            error_symptoms=["Timeouts on /checkout", "Connection pool exhausted"],
+        ),
+    ),
+    "Decision Framework": (DecisionFrameworkAnalyzer, _decision_framework_context),
+    "Design Patterns": (
+        DesignPatternsAnalyzer,
+        lambda: DesignPatternsContext(
+            problem="Checkout must swap pricing algorithms at runtime without conditionals",
+            system_description="Order service with many pricing rules per market",
+        ),
+    ),
+    "Impact Propagation": (
+        ImpactPropagationAnalyzer,
+        lambda: ImpactPropagationContext(scenario=PROBLEM),
+    ),
+    "Iterative Validation": (
+        IterativeValidationAnalyzer,
+        lambda: IterativeValidationContext(scenario=PROBLEM),
+    ),
+    "Mental Models": (
+        MentalModelsAnalyzer,
+        lambda: MentalModelContext(problem=PROBLEM, model_type=MentalModelType.FIRST_PRINCIPLES),
+    ),
+    "Metacognitive Monitoring": (
+        MetacognitiveMonitoringAnalyzer,
+        lambda: MetacognitiveMonitoringContext(
+            problem=PROBLEM, reasoning_target="Hosting platform selection"
+        ),
+    ),
+    "Multi-Perspective": (
+        MultiPerspectiveAnalyzer,
+        lambda: MultiPerspectiveContext(scenario=PROBLEM),
+    ),
+    "Programming Paradigms": (
+        ProgrammingParadigmsAnalyzer,
+        lambda: ProgrammingParadigmsContext(
+            problem_description="Add customer account management screens to the web application",
+            project_type="Web application",
+        ),
+    ),
+    "Scientific Method": (
+        ScientificMethodAnalyzer,
+        lambda: ScientificMethodContext(
+            problem=PROBLEM,
+            research_question="Which platform keeps p95 checkout latency lowest at peak?",
+            domain_knowledge="Distributed services with shared caches and queues",
+        ),
+    ),
+    "Sequential Readiness": (
+        SequentialReadinessAnalyzer,
+        lambda: SequentialReadinessContext(scenario=PROBLEM),
+    ),
+    "Sequential Thinking": (
+        SequentialThinkingAnalyzer,
+        lambda: SequentialThinkingContext(problem=PROBLEM, reasoning_depth=8),
+    ),
+    "Structured Argumentation": (
+        StructuredArgumentationAnalyzer,
+        lambda: StructuredArgumentationContext(
+            argument_text=(
+                "We should move to the managed platform. It scales automatically during peak "
+                "traffic. Outages last season were caused by manual scaling. Since on-call load "
+                "is already high, removing that work lets the team focus on features."
+            )
+        ),
+    ),
+    "Triple Constraint": (
+        TripleConstraintAnalyzer,
+        lambda: TripleConstraintContext(scenario=PROBLEM),
+    ),
+    "Visual Reasoning": (VisualReasoningAnalyzer, _visual_reasoning_context),
+}
+
+
+def build_run(name: str) -> Callable[[], Awaitable[dict]]:
+    """Analyze the case's context and encode the result, as the MCP server does."""
+    analyzer_factory, context_factory = ANALYZER_CASES[name]
+    analyzer, context = analyzer_factory(), context_factory()
+
+    async def run() -> dict:
+        return encode_result(await analyzer.analyze(context))
+
+    return run
+
+
+async def _cpu_ms_per_run(run: Callable[[], Awaitable[object]], iterations: int) -> float:
+    """Average CPU milliseconds per run after one warm-up run."""
+    await run()
+    start = time.process_time()
+    for _ in range(iterations):
+        await run()
+    return (time.process_time() - start) * 1000 / iterations
+
+
+async def _interleaved_cpu_ms(
+    run: Callable[[], Awaitable[object]], iterations: int
+) -> tuple[float, float]:
+    """Median strict and trusted CPU milliseconds per run over alternating rounds."""
+    per_round = max(1, iterations // ROUNDS)
+    samples: dict[bool, list[float]] = {True: [], False: []}
+    for round_index in range(ROUNDS):
+        order = (True, False) if round_index % 2 == 0 else (False, True)
+        for strict in order:
+            with strict_validation(strict):
+                samples[strict].append(await _cpu_ms_per_run(run, per_round))
+    return statistics.median(samples[True]), statistics.median(samples[False])
+
+
+def _saved(baseline: float, trusted: float) -> str:
+    return f"{(1 - trusted / baseline) * 100:.0f}%" if baseline else "-"
+
+
+async def _analyzer_table(iterations: int) -> Table:
+    table = Table(title=f"Analyzers ({iterations} runs, CPU ms per analysis and encoding)")
+    table.add_column("Analyzer")
+    table.add_column("Strict", justify="right")
+    table.add_column("Trusted", justify="right")
+    table.add_column("Saved", justify="right")
+
+    for name in ANALYZER_CASES:
+        run = build_run(name)
+        strict_ms, trusted_ms = await _interleaved_cpu_ms(run, iterations)
+        table.add_row(name, f"{strict_ms:.2f}", f"{trusted_ms:.2f}", _saved(strict_ms, trusted_ms))
+    return table
+
+
+async def main(iterations: int = DEFAULT_ITERATIONS) -> None:
+    """Run the per-analyzer benchmark and print a summary table."""
+    Console().print(await _analyzer_table(iterations))
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITERATIONS))
@@ -1,6 +1,7 @@
 """PyClarity MCP Server package."""
 
 from pyclarity.server.mcp_server import create_server, start_server
+from pyclarity.server.metrics import ServerMetrics
 from pyclarity.server.tool_handlers import CognitiveToolHandler
 
-__all__ = ["create_server", "start_server", "CognitiveToolHandler"]
+__all__ = ["create_server", "start_server", "CognitiveToolHandler", "ServerMetrics"]
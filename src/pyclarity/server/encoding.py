@@ -0,0 +1,159 @@
+"""
+Response Encoding for PyClarity MCP Server
+
+Turns analyzer results into compact MCP responses. Clients choose how much
+of a result they receive with a verbosity level, and large payloads can
+optionally be gzip-compressed. Responses are serialized once, here, and
+handed to FastMCP pre-serialized. Uses orjson when the ``performance``
+extra is installed.
+"""
+
+import base64
+import gzip
+import json
+from enum import StrEnum
+from typing import Any
+
+from fastmcp.tools import ToolResult
+from mcp.types import TextContent
+from pydantic import BaseModel
+
+from pyclarity.tools.base import validated_dump
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional "performance" extra
+    orjson = None
+
+# Payloads smaller than this are returned uncompressed even when requested
+DEFAULT_COMPRESSION_THRESHOLD = 16 * 1024
+COMPRESSED_ENCODING = "gzip+base64"
+
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+class Verbosity(StrEnum):
+    """How much of an analysis result is returned to the client"""
+
+    SUMMARY = "summary"    # Top-level scalar fields and collection sizes
+    STANDARD = "standard"  # Full result without default or null fields
+    FULL = "full"          # Every field
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize JSON-compatible data to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def summarize(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Reduce a dumped result to its top-level scalars plus collection sizes.
+
+    Args:
+        data: JSON-mode dump of a result model
+
+    Returns:
+        Scalar fields, with list and dict fields replaced by a ``counts`` entry
+    """
+    summary: dict[str, Any] = {}
+    counts: dict[str, int] = {}
+    for key, value in data.items():
+        if isinstance(value, _SCALAR_TYPES):
+            summary[key] = value
+        elif isinstance(value, list | dict):
+            counts[key] = len(value)
+    if counts:
+        summary["counts"] = counts
+    return summary
+
+
+def _envelope(payload: bytes) -> dict[str, Any]:
+    return {
+        "encoding": COMPRESSED_ENCODING,
+        "original_size": len(payload),
+        "data": base64.b64encode(gzip.compress(payload)).decode("ascii"),
+    }
+
+
+def compress_payload(data: Any) -> dict[str, Any]:
+    """Compress JSON-compatible data into a gzip+base64 envelope."""
+    return _envelope(dumps(data))
+
+
+def decompress_payload(envelope: dict[str, Any]) -> Any:
+    """Restore data produced by compress_payload."""
+    if envelope.get("encoding") != COMPRESSED_ENCODING:
+        raise ValueError(f"Unsupported payload encoding: {envelope.get('encoding')}")
+    return json.loads(gzip.decompress(base64.b64decode(envelope["data"])))
+
+
+def encode_result(
+    result: BaseModel,
+    verbosity: Verbosity | str = Verbosity.FULL,
+    compress: bool = False,
+    fields: list[str] | None = None,
+    compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+) -> dict[str, Any]:
+    """
+    Encode an analysis result for an MCP response.
+
+    The result is validated at this boundary (see validated_dump) and
+    dumped in JSON mode, ready for tool_result to serialize.
+
+    Args:
+        result: Analysis result model
+        verbosity: Level of detail to return
+        compress: Compress the payload if it exceeds compression_threshold
+        fields: Result fields to return, or None for all fields
+        compression_threshold: Minimum serialized size in bytes to compress
+
+    Returns:
+        Encoded result, or a compressed envelope
+
+    Raises:
+        ValueError: If verbosity is not a known level or a field is unknown
+    """
+    verbosity = Verbosity(verbosity)
+
+    dump_options: dict[str, Any] = {"mode": "json"}
+    if fields is not None:
+        unknown = set(fields) - set(type(result).model_fields)
+        if unknown:
+            raise ValueError(f"Unknown result fields: {', '.join(sorted(unknown))}")
+        dump_options["include"] = set(fields)
+
+    if verbosity == Verbosity.FULL:
+        data = validated_dump(result, **dump_options)
+    else:
+        data = validated_dump(result, exclude_defaults=True, exclude_none=True, **dump_options)
+        if verbosity == Verbosity.SUMMARY:
+            data = summarize(data)
+
+    if compress:
+        payload = dumps(data)
+        if len(payload) >= compression_threshold:
+            return _envelope(payload)
+
+    return data
+
+
+def tool_result(response: dict[str, Any]) -> ToolResult:
+    """
+    Serialize a handler response into an MCP tool result.
+
+    The response is serialized once, with orjson when available, and passed
+    to FastMCP as both the text and the structured content, so FastMCP
+    neither converts nor serializes it again.
+
+    Args:
+        response: JSON-compatible handler response
+
+    Returns:
+        Tool result carrying the pre-serialized response
+    """
+    return ToolResult(
+        content=[TextContent(type="text", text=dumps(response).decode("utf-8"))],
+        structured_content=response,
+    )
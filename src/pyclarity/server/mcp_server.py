@@ -6,11 +6,19 @@ Integrates with Claude Desktop and other MCP clients to provide analysis capabil
 """
 
 import logging
+from collections.abc import Awaitable, Callable
+from functools import wraps
 from typing import Any
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
+from fastmcp.tools import ToolResult
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
 
+from pyclarity.server.encoding import tool_result
+from pyclarity.server.metrics import CONTENT_TYPE, ServerMetrics
 from pyclarity.server.tool_handlers import CognitiveToolHandler
+from pyclarity.tools.base import set_strict_validation
 
 logger = logging.getLogger(__name__)
 
@@ -25,11 +33,13 @@ def create_server() -> FastMCP:
     # Initialize the FastMCP server
     mcp = FastMCP("PyClarity")
 
-    # Initialize the cognitive tool handler
-    tool_handler = CognitiveToolHandler()
+    # Initialize the cognitive tool handler, recording every call in the server metrics
+    metrics = ServerMetrics()
+    tool_handler = CognitiveToolHandler(metrics=metrics)
 
     # Register all cognitive tools
     _register_cognitive_tools(mcp, tool_handler)
+    _register_metrics(mcp, metrics)
 
     # Add server info
     logger.info("Registering PyClarity cognitive tools...")
@@ -60,18 +70,62 @@ def create_server() -> FastMCP:
     return mcp
 
 
+def _pre_serialized(
+    tool: Callable[..., Awaitable[dict[str, Any]]],
+) -> Callable[..., Awaitable[ToolResult]]:
+    """Return a tool's response to FastMCP already serialized (see tool_result)."""
+
+    @wraps(tool)
+    async def serialized(*args, **kwargs) -> ToolResult:
+        return tool_result(await tool(*args, **kwargs))
+
+    return serialized
+
+
+def _progress_reporter(ctx: Context | None):
+    """Build a streaming-event callback that forwards events as MCP progress notifications."""
+    if ctx is None:
+        return None
+
+    async def report(event) -> None:
+        await ctx.report_progress(progress=event.sequence + 1, message=event.summary)
+
+    return report
+
+
+def _register_metrics(mcp: FastMCP, metrics: ServerMetrics) -> None:
+    """Expose server metrics at /metrics over HTTP and as an MCP resource for stdio clients."""
+
+    @mcp.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+    async def metrics_endpoint(request: Request) -> PlainTextResponse:
+        return PlainTextResponse(metrics.render(), headers={"Content-Type": CONTENT_TYPE})
+
+    @mcp.resource(
+        "pyclarity://metrics",
+        name="server_metrics",
+        description="Request rates, latency histograms, errors, in-flight calls, cache hit rates and event-loop lag",
+        mime_type="text/plain",
+    )
+    def server_metrics() -> str:
+        return metrics.render()
+
+
 def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> None:
     """Register all cognitive tools with the MCP server."""
 
     # Mental Models Tool
     @mcp.tool()
+    @_pre_serialized
     async def mental_models_analysis(
         problem: str,
         model_type: str = "first_principles",
+        additional_models: list[str] | None = None,
         complexity_level: str = "moderate",
         focus_areas: list[str] | None = None,
         constraints: list[str] | None = None,
         domain_expertise: str | None = None,
+        verbosity: str = "full",
+        compress: bool = False,
     ) -> dict[str, Any]:
         """
         Analyze problems using structured mental model frameworks.
@@ -87,10 +141,14 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
         Args:
             problem: The problem or question to analyze
             model_type: Mental model framework to apply
+            additional_models: Further frameworks to apply in the same call,
+                concurrently over one decomposition of the problem
             complexity_level: Analysis depth (simple, moderate, complex)
             focus_areas: Specific areas to focus analysis on
             constraints: Known limitations or constraints
             domain_expertise: Relevant domain expertise level
+            verbosity: Level of detail returned (summary, standard, full)
+            compress: Gzip-compress large results, returned base64-encoded
 
         Returns:
             Analysis results with insights and recommendations
@@ -98,27 +156,36 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
         return await handler.handle_mental_models(
             problem=problem,
             model_type=model_type,
+            additional_models=additional_models,
             complexity_level=complexity_level,
             focus_areas=focus_areas,
             constraints=constraints,
             domain_expertise=domain_expertise,
+            verbosity=verbosity,
+            compress=compress,
         )
 
     # Sequential Thinking Tool
     @mcp.tool()
+    @_pre_serialized
     async def sequential_thinking(
         problem: str,
         complexity_level: str = "moderate",
         reasoning_depth: int = 5,
         enable_branching: bool = True,
         enable_revision: bool = True,
-        branch_strategy: str = "adaptive",
+        branch_strategy: str = "parallel_exploration",
+        verbosity: str = "full",
+        compress: bool = False,
+        ctx: Context | None = None,
     ) -> dict[str, Any]:
         """
         Apply structured sequential thinking with branching and revision.
 
         Provides step-by-step logical reasoning with the ability to explore
         alternative paths and revise conclusions based on new insights.
+        Each step, branch and revision is reported as a progress notification
+        as soon as it is produced.
 
         Args:
             problem: The problem to analyze step by step
@@ -126,7 +193,11 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             reasoning_depth: Number of reasoning steps to perform
             enable_branching: Allow exploration of alternative reasoning paths
             enable_revision: Enable revision of earlier steps based on new insights
-            branch_strategy: How to handle branching (linear, adaptive, exhaustive)
+            branch_strategy: How to handle branching (parallel_exploration,
+                sequential_exploration, convergent_synthesis, competitive_selection,
+                hybrid_approach)
+            verbosity: Level of detail returned (summary, standard, full)
+            compress: Gzip-compress large results, returned base64-encoded
 
         Returns:
             Sequential analysis with reasoning steps and conclusions
@@ -138,33 +209,41 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             enable_branching=enable_branching,
             enable_revision=enable_revision,
             branch_strategy=branch_strategy,
+            on_event=_progress_reporter(ctx),
+            verbosity=verbosity,
+            compress=compress,
         )
 
     # Decision Framework Tool
     @mcp.tool()
+    @_pre_serialized
     async def decision_framework(
         decision_problem: str,
         complexity_level: str = "moderate",
         criteria: list[dict] | None = None,
         options: list[dict] | None = None,
         decision_methods: list[str] | None = None,
-        stakeholder_weights: dict[str, float] | None = None,
-        time_constraints: str | None = None,
+        verbosity: str = "full",
+        compress: bool = False,
+        fields: list[str] | None = None,
     ) -> dict[str, Any]:
         """
         Systematic decision-making using multi-criteria analysis.
 
         Supports various decision methods including weighted scoring,
-        AHP (Analytical Hierarchy Process), and consensus building.
+        AHP (Analytical Hierarchy Process), TOPSIS and cost-benefit analysis.
 
         Args:
             decision_problem: The decision to be made
             complexity_level: Analysis complexity (simple, moderate, complex)
             criteria: Decision criteria with weights and types
             options: Available decision options with scores
-            decision_methods: Methods to use (weighted_sum, ahp, consensus)
-            stakeholder_weights: Importance weighting by stakeholder group
-            time_constraints: Timeline or urgency considerations
+            decision_methods: Method to apply, as a one-item list (weighted_scoring,
+                analytical_hierarchy_process, topsis, cost_benefit, risk_adjusted,
+                multi_objective; default weighted_scoring)
+            verbosity: Level of detail returned (summary, standard, full)
+            compress: Gzip-compress large results, returned base64-encoded
+            fields: Result fields to compute and return (default: all)
 
         Returns:
             Decision analysis with recommendations and rationale
@@ -175,12 +254,14 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             criteria=criteria,
             options=options,
             decision_methods=decision_methods,
-            stakeholder_weights=stakeholder_weights,
-            time_constraints=time_constraints,
+            verbosity=verbosity,
+            compress=compress,
+            fields=fields,
         )
 
     # Scientific Method Tool
     @mcp.tool()
+    @_pre_serialized
     async def scientific_method(
         problem: str,
         complexity_level: str = "moderate",
@@ -189,6 +270,9 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
         max_hypotheses: int = 3,
         evidence_sources: list[str] | None = None,
         significance_threshold: float = 0.05,
+        measurements: list[dict] | None = None,
+        verbosity: str = "full",
+        compress: bool = False,
     ) -> dict[str, Any]:
         """
         Apply scientific method for hypothesis-driven problem solving.
@@ -200,10 +284,15 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             problem: The problem to investigate scientifically
             complexity_level: Analysis complexity (simple, moderate, complex)
             research_question: Specific research question to investigate
-            domain_knowledge: Existing knowledge and context
+                (default: derived from the problem)
+            domain_knowledge: Existing knowledge and context (default: the problem)
             max_hypotheses: Maximum number of hypotheses to generate
             evidence_sources: Available sources of evidence
             significance_threshold: Statistical significance threshold
+            measurements: Numeric telemetry to test statistically, each as
+                {name, observations, baseline_observations?, description?}
+            verbosity: Level of detail returned (summary, standard, full)
+            compress: Gzip-compress large results, returned base64-encoded
 
         Returns:
             Scientific analysis with hypotheses, evidence, and conclusions
@@ -216,18 +305,25 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             max_hypotheses=max_hypotheses,
             evidence_sources=evidence_sources,
             significance_threshold=significance_threshold,
+            measurements=measurements,
+            verbosity=verbosity,
+            compress=compress,
         )
 
     # Add remaining tools with similar pattern...
     # (Continuing with abbreviated versions for brevity)
 
     @mcp.tool()
+    @_pre_serialized
     async def design_patterns(
         problem: str,
         complexity_level: str = "moderate",
         problem_domain: str | None = None,
         system_scale: str | None = None,
         constraints: list[str] | None = None,
+        verbosity: str = "full",
+        compress: bool = False,
+        fields: list[str] | None = None,
     ) -> dict[str, Any]:
         """Apply design pattern analysis for architectural solutions."""
         return await handler.handle_design_patterns(
@@ -236,52 +332,87 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             problem_domain=problem_domain,
             system_scale=system_scale,
             constraints=constraints,
+            verbosity=verbosity,
+            compress=compress,
+            fields=fields,
         )
 
     @mcp.tool()
+    @_pre_serialized
     async def programming_paradigms(
         problem: str,
         complexity_level: str = "moderate",
         current_paradigms: list[str] | None = None,
         target_paradigms: list[str] | None = None,
         project_constraints: list[str] | None = None,
+        codebase_path: str | None = None,
+        verbosity: str = "full",
+        compress: bool = False,
+        fields: list[str] | None = None,
     ) -> dict[str, Any]:
-        """Analyze programming paradigm selection and application."""
+        """Analyze programming paradigm selection and application.
+
+        codebase_path names a Python source tree on the server to analyze
+        statically; repeat calls only re-parse files that changed. It must
+        lie under PYCLARITY_ARTIFACT_ROOT (default: the working directory).
+        """
         return await handler.handle_programming_paradigms(
             problem=problem,
             complexity_level=complexity_level,
             current_paradigms=current_paradigms,
             target_paradigms=target_paradigms,
             project_constraints=project_constraints,
+            codebase_path=codebase_path,
+            verbosity=verbosity,
+            compress=compress,
+            fields=fields,
         )
 
     @mcp.tool()
+    @_pre_serialized
     async def debugging_approaches(
         problem: str,
         complexity_level: str = "moderate",
         problem_domain: str | None = None,
         error_symptoms: list[str] | None = None,
+        log_paths: list[str] | None = None,
         system_complexity: str | None = None,
         available_tools: list[str] | None = None,
         time_constraints: str | None = None,
+        verbosity: str = "full",
+        compress: bool = False,
+        fields: list[str] | None = None,
     ) -> dict[str, Any]:
-        """Systematic debugging methodology and approach selection."""
+        """Systematic debugging methodology and approach selection.
+
+        log_paths names log files or stack-trace dumps on the server to
+        cluster into error signatures before classification. They must lie
+        under PYCLARITY_ARTIFACT_ROOT (default: the working directory).
+        """
         return await handler.handle_debugging_approaches(
             problem=problem,
             complexity_level=complexity_level,
             problem_domain=problem_domain,
             error_symptoms=error_symptoms,
+            log_paths=log_paths,
             system_complexity=system_complexity,
             available_tools=available_tools,
             time_constraints=time_constraints,
+            verbosity=verbosity,
+            compress=compress,
+            fields=fields,
         )
 
     @mcp.tool()
+    @_pre_serialized
     async def visual_reasoning(
         problem: str,
         visual_elements: list[dict] | None = None,
         representation_type: str = "diagram",
         analysis_focus: list[str] | None = None,
+        verbosity: str = "full",
+        compress: bool = False,
+        fields: list[str] | None = None,
     ) -> dict[str, Any]:
         """Visual problem representation and spatial reasoning analysis."""
         return await handler.handle_visual_reasoning(
@@ -289,9 +420,13 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             visual_elements=visual_elements,
             representation_type=representation_type,
             analysis_focus=analysis_focus,
+            verbosity=verbosity,
+            compress=compress,
+            fields=fields,
         )
 
     @mcp.tool()
+    @_pre_serialized
     async def structured_argumentation(
         problem: str,
         complexity_level: str = "moderate",
@@ -299,6 +434,9 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
         premises: list[str] | None = None,
         evidence_sources: list[str] | None = None,
         counter_arguments: list[str] | None = None,
+        verbosity: str = "full",
+        compress: bool = False,
+        fields: list[str] | None = None,
     ) -> dict[str, Any]:
         """Logical argumentation structure and fallacy analysis."""
         return await handler.handle_structured_argumentation(
@@ -308,18 +446,29 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             premises=premises,
             evidence_sources=evidence_sources,
             counter_arguments=counter_arguments,
+            verbosity=verbosity,
+            compress=compress,
+            fields=fields,
         )
 
     @mcp.tool()
+    @_pre_serialized
     async def metacognitive_monitoring(
         problem: str,
         complexity_level: str = "moderate",
         reasoning_target: str | None = None,
         monitoring_focus: list[str] | None = None,
-        monitoring_depth: str = "standard",
+        monitoring_depth: str = "moderate",
         intervention_threshold: float = 0.7,
+        verbosity: str = "full",
+        compress: bool = False,
+        fields: list[str] | None = None,
     ) -> dict[str, Any]:
-        """Self-awareness and reasoning quality monitoring."""
+        """Self-awareness and reasoning quality monitoring.
+
+        The reasoning target defaults to the problem; monitoring_depth is
+        surface, moderate or deep.
+        """
         return await handler.handle_metacognitive_monitoring(
             problem=problem,
             complexity_level=complexity_level,
@@ -327,16 +476,44 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             monitoring_focus=monitoring_focus,
             monitoring_depth=monitoring_depth,
             intervention_threshold=intervention_threshold,
+            verbosity=verbosity,
+            compress=compress,
+            fields=fields,
+        )
+
+    @mcp.tool()
+    @_pre_serialized
+    async def metacognitive_stream(
+        stream_id: str,
+        chunk: str,
+        intervention_threshold: float = 0.7,
+        finish: bool = False,
+    ) -> dict[str, Any]:
+        """Monitor reasoning while it is produced, one chunk per call.
+
+        Send each reasoning step under the same stream_id as it is written.
+        Alerts are returned the moment a bias or unsupported confidence crosses
+        intervention_threshold, so the reasoning can be corrected before it is
+        complete. Set finish on the last chunk to release the stream.
+        """
+        return await handler.handle_metacognitive_stream(
+            stream_id=stream_id,
+            chunk=chunk,
+            intervention_threshold=intervention_threshold,
+            finish=finish,
         )
 
     @mcp.tool()
+    @_pre_serialized
     async def collaborative_reasoning(
         problem: str,
         complexity_level: str = "moderate",
         collaboration_objective: str | None = None,
         perspectives_needed: list[str] | None = None,
         max_rounds: int = 3,
-        consensus_threshold: float = 0.7,
+        verbosity: str = "full",
+        compress: bool = False,
+        fields: list[str] | None = None,
     ) -> dict[str, Any]:
         """Multi-perspective collaborative problem-solving."""
         return await handler.handle_collaborative_reasoning(
@@ -345,7 +522,9 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             collaboration_objective=collaboration_objective,
             perspectives_needed=perspectives_needed,
             max_rounds=max_rounds,
-            consensus_threshold=consensus_threshold,
+            verbosity=verbosity,
+            compress=compress,
+            fields=fields,
         )
 
     # Temporarily disabled due to dependency issues
@@ -370,6 +549,7 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
 
     # New FastMCP tools
     @mcp.tool()
+    @_pre_serialized
     async def iterative_validation(
         scenario: str,
         complexity_level: str = "moderate",
@@ -378,6 +558,12 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
         max_iterations: int = 5,
         target_confidence: float | None = None,
         previous_cycles: list[dict] | None = None,
+        candidate_refinements: int = 1,
+        convergence_patience: int | None = 2,
+        session_id: str | None = None,
+        finish: bool = False,
+        verbosity: str = "full",
+        compress: bool = False,
     ) -> dict[str, Any]:
         """
         Hypothesis-test-learn-refine cycles for continuous improvement.
@@ -393,6 +579,12 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             max_iterations: Maximum validation cycles to perform
             target_confidence: Desired confidence level to achieve
             previous_cycles: History of previous validation attempts
+            candidate_refinements: Refinements evaluated concurrently per cycle (1-3)
+            convergence_patience: Cycles without improvement before stopping
+            session_id: Server-side session to continue; each call runs one more cycle
+            finish: Delete the session after this call's cycle
+            verbosity: Level of detail returned (summary, standard, full)
+            compress: Gzip-compress large results, returned base64-encoded
 
         Returns:
             Validation analysis with cycles, learnings, and refinements
@@ -405,9 +597,16 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             max_iterations=max_iterations,
             target_confidence=target_confidence,
             previous_cycles=previous_cycles,
+            candidate_refinements=candidate_refinements,
+            convergence_patience=convergence_patience,
+            session_id=session_id,
+            finish=finish,
+            verbosity=verbosity,
+            compress=compress,
         )
 
     @mcp.tool()
+    @_pre_serialized
     async def multi_perspective_analysis(
         scenario: str,
         domain_context: str | None = None,
@@ -417,6 +616,8 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
         desired_outcome: str | None = None,
         time_horizon: str | None = None,
         cultural_context: str | None = None,
+        verbosity: str = "full",
+        compress: bool = False,
     ) -> dict[str, Any]:
         """
         Analyze from multiple stakeholder viewpoints to find integration paths.
@@ -433,6 +634,8 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             desired_outcome: The ideal outcome being sought
             time_horizon: Timeframe for implementation or impact
             cultural_context: Cultural factors affecting perspectives
+            verbosity: Level of detail returned (summary, standard, full)
+            compress: Gzip-compress large results, returned base64-encoded
 
         Returns:
             Multi-perspective analysis with viewpoints and integration strategies
@@ -446,19 +649,28 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             desired_outcome=desired_outcome,
             time_horizon=time_horizon,
             cultural_context=cultural_context,
+            verbosity=verbosity,
+            compress=compress,
         )
 
     @mcp.tool()
+    @_pre_serialized
     async def sequential_readiness_assessment(
         scenario: str,
         complexity_level: str = "moderate",
         domain_context: str | None = None,
         predefined_states: list[dict] | None = None,
+        current_status: dict[str, str] | None = None,
+        state_transitions: list[dict] | None = None,
+        what_if: dict[str, str] | None = None,
         assessment_criteria: list[str] | None = None,
         key_constraints: list[str] | None = None,
         timeline_flexibility: str = "medium",
         risk_tolerance: str = "medium",
         organizational_readiness: str = "medium",
+        verbosity: str = "full",
+        compress: bool = False,
+        fields: list[str] | None = None,
     ) -> dict[str, Any]:
         """
         Assess readiness progression through sequential states or phases.
@@ -470,12 +682,20 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             scenario: The transition or change to assess readiness for
             complexity_level: Analysis complexity (simple, moderate, complex)
             domain_context: Specific domain or industry context
-            predefined_states: Known states or phases in the sequence
+            predefined_states: Known states or phases; prerequisites naming other
+                states and typical durations (e.g. '2-4 weeks') form the readiness DAG
+            current_status: Current readiness level per state name
+            state_transitions: Explicit transitions between states; parallel ones
+                add no ordering
+            what_if: Readiness levels to try one state at a time, as {state: level}
             assessment_criteria: Criteria for evaluating readiness
             key_constraints: Major constraints affecting progression
             timeline_flexibility: Flexibility in transition timing (low, medium, high)
             risk_tolerance: Acceptable risk level (low, medium, high)
             organizational_readiness: Overall organizational maturity level
+            verbosity: Level of detail returned (summary, standard, full)
+            compress: Gzip-compress large results, returned base64-encoded
+            fields: Result fields to compute and return (default: all)
 
         Returns:
             Readiness assessment with states, gaps, and intervention recommendations
@@ -485,14 +705,21 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             complexity_level=complexity_level,
             domain_context=domain_context,
             predefined_states=predefined_states,
+            current_status=current_status,
+            state_transitions=state_transitions,
+            what_if=what_if,
             assessment_criteria=assessment_criteria,
             key_constraints=key_constraints,
             timeline_flexibility=timeline_flexibility,
             risk_tolerance=risk_tolerance,
             organizational_readiness=organizational_readiness,
+            verbosity=verbosity,
+            compress=compress,
+            fields=fields,
         )
 
     @mcp.tool()
+    @_pre_serialized
     async def triple_constraint_optimization(
         scenario: str,
         complexity_level: str = "moderate",
@@ -500,10 +727,16 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
         predefined_constraints: list[dict] | None = None,
         optimization_focus: str | None = None,
         flexibility_parameters: dict[str, float] | None = None,
+        trade_off_matrix: dict[str, dict[str, float]] | None = None,
+        max_scenarios: int = 3,
+        random_seed: int | None = None,
         risk_tolerance: str = "medium",
         timeline_flexibility: str = "medium",
         primary_stakeholders: list[str] | None = None,
         organizational_readiness: str = "medium",
+        verbosity: str = "full",
+        compress: bool = False,
+        fields: list[str] | None = None,
     ) -> dict[str, Any]:
         """
         Optimize trade-offs between competing constraints (scope/time/cost).
@@ -515,13 +748,22 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             scenario: The situation requiring constraint optimization
             complexity_level: Analysis depth (simple, moderate, complex)
             domain: Project, product, business, or other domain
-            predefined_constraints: Known constraints and their current values
-            optimization_focus: Primary optimization goal or priority
+            predefined_constraints: Constraints (any number of dimensions) with current and
+                target values
+            optimization_focus: Strategy (balanced, maximize_value, minimize_trade_offs,
+                prioritize_a/b/c) or the name of a constraint to prioritize
             flexibility_parameters: How flexible each constraint dimension is
+            trade_off_matrix: Gap fraction of one constraint gained or lost per unit
+                of effort on another, as {source: {target: value}}
+            max_scenarios: Number of Pareto-optimal scenarios to return
+            random_seed: Seed for reproducible scenarios
             risk_tolerance: Acceptable risk level (low, medium, high)
             timeline_flexibility: Schedule flexibility (low, medium, high)
             primary_stakeholders: Key stakeholders affected by trade-offs
             organizational_readiness: Organizational capacity for change
+            verbosity: Level of detail returned (summary, standard, full)
+            compress: Gzip-compress large results, returned base64-encoded
+            fields: Result fields to compute and return (default: all)
 
         Returns:
             Optimization analysis with scenarios and balanced recommendations
@@ -533,10 +775,16 @@ def _register_cognitive_tools(mcp: FastMCP, handler: CognitiveToolHandler) -> No
             predefined_constraints=predefined_constraints,
             optimization_focus=optimization_focus,
             flexibility_parameters=flexibility_parameters,
+            trade_off_matrix=trade_off_matrix,
+            max_scenarios=max_scenarios,
+            random_seed=random_seed,
             risk_tolerance=risk_tolerance,
             timeline_flexibility=timeline_flexibility,
             primary_stakeholders=primary_stakeholders,
             organizational_readiness=organizational_readiness,
+            verbosity=verbosity,
+            compress=compress,
+            fields=fields,
         )
 
 
@@ -547,10 +795,11 @@ async def start_server(host: str = "localhost", port: int = 8000, debug: bool =
     Args:
         host: Host to bind to
         port: Port to listen on
-        debug: Enable debug logging
+        debug: Enable debug logging and strict validation of generated models
     """
     if debug:
         logging.basicConfig(level=logging.DEBUG)
+        set_strict_validation(True)
     else:
         logging.basicConfig(level=logging.INFO)
 
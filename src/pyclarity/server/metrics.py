@@ -0,0 +1,210 @@
+"""
+Server Metrics for PyClarity MCP Server
+
+Per-tool request counters, in-flight gauges and latency histograms around
+CognitiveToolHandler, plus cache hit rates, event-loop lag and analyzer
+phase timings, rendered in the Prometheus text exposition format.
+
+Recording a call costs two clock reads and a few integer updates on the
+event loop thread; everything else happens when metrics are scraped.
+"""
+
+import asyncio
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterable
+from functools import wraps
+from typing import Any
+
+from pyclarity.tools.base import Histogram, phase_histograms
+from pyclarity.tools.catalogs import load_catalog
+from pyclarity.tools.debugging_approaches.logs import normalize_frame
+from pyclarity.tools.mental_models.analyzer import decompose_problem
+from pyclarity.tools.multi_perspective.index import scenario_terms
+from pyclarity.tools.programming_paradigms.source import source_tree
+
+# Upper bounds, in seconds, of tool latency histogram buckets
+LATENCY_BUCKETS_S = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Upper bounds, in seconds, of event-loop lag histogram buckets
+LOOP_LAG_BUCKETS_S = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# Memoized analysis steps whose hit rates are exported
+CACHES: dict[str, Callable[..., Any]] = {
+    "catalogs": load_catalog,
+    "log_frames": normalize_frame,
+    "problem_decompositions": decompose_problem,
+    "scenario_terms": scenario_terms,
+    "source_trees": source_tree,
+}
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    """Render a Prometheus label set; empty when there are no labels."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _histogram_lines(
+    name: str, histogram: Histogram, scale: float = 1.0, **labels: str
+) -> Iterable[str]:
+    """Bucket, sum and count samples of a histogram, with bounds and sum multiplied by scale."""
+    count = 0
+    for bound, count in histogram.cumulative_counts():
+        yield f"{name}_bucket{_labels(**labels, le=_number(bound * scale))} {count}"
+    yield f"{name}_sum{_labels(**labels)} {_number(histogram.sum * scale)}"
+    yield f"{name}_count{_labels(**labels)} {count}"
+
+
+class ServerMetrics:
+    """
+    Metrics of one server process.
+
+    Args:
+        loop_lag_interval: Seconds between event-loop lag probes; None disables them
+    """
+
+    def __init__(self, loop_lag_interval: float | None = 0.5) -> None:
+        self.loop_lag_interval = loop_lag_interval
+        self.started_at = time.time()
+        self._requests: Counter[tuple[str, str]] = Counter()
+        self._in_flight: Counter[str] = Counter()
+        self._latency: dict[str, Histogram] = {}
+        self._loop_lag = Histogram(LOOP_LAG_BUCKETS_S)
+        self._last_loop_lag = 0.0
+        self._lag_task: asyncio.Task | None = None
+
+    def instrument(
+        self, tool: str, handler: Callable[..., Awaitable[dict[str, Any]]]
+    ) -> Callable[..., Awaitable[dict[str, Any]]]:
+        """
+        Wrap a tool handler so each call is counted and timed.
+
+        A call is an error if it raises or its response reports
+        ``success: False``.
+        """
+        latency = self._latency.setdefault(tool, Histogram(LATENCY_BUCKETS_S))
+        requests, in_flight = self._requests, self._in_flight
+
+        @wraps(handler)
+        async def measured(*args, **kwargs) -> dict[str, Any]:
+            if self._lag_task is None and self.loop_lag_interval is not None:
+                self._start_loop_monitor()
+            in_flight[tool] += 1
+            outcome = "error"
+            start = time.perf_counter()
+            try:
+                response = await handler(*args, **kwargs)
+                if response.get("success", True):
+                    outcome = "success"
+                return response
+            finally:
+                latency.observe(time.perf_counter() - start)
+                in_flight[tool] -= 1
+                requests[tool, outcome] += 1
+
+        return measured
+
+    def _start_loop_monitor(self) -> None:
+        self._lag_task = asyncio.get_running_loop().create_task(self._monitor_loop_lag())
+
+    async def _monitor_loop_lag(self) -> None:
+        """Measure how late the event loop wakes a sleeping task."""
+        interval = self.loop_lag_interval
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            lag = max(time.perf_counter() - start - interval, 0.0)
+            self._last_loop_lag = lag
+            self._loop_lag.observe(lag)
+
+    def requests(self, tool: str, outcome: str = "success") -> int:
+        """Calls of a tool that ended with the given outcome."""
+        return self._requests[tool, outcome]
+
+    def in_flight(self, tool: str) -> int:
+        """Calls of a tool currently running."""
+        return self._in_flight[tool]
+
+    def latency(self, tool: str) -> Histogram:
+        """Latency histogram of a tool, in seconds."""
+        return self._latency.setdefault(tool, Histogram(LATENCY_BUCKETS_S))
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP pyclarity_uptime_seconds Seconds since the server started.",
+            "# TYPE pyclarity_uptime_seconds gauge",
+            f"pyclarity_uptime_seconds {_number(time.time() - self.started_at)}",
+            "# HELP pyclarity_tool_requests_total Tool calls by outcome.",
+            "# TYPE pyclarity_tool_requests_total counter",
+        ]
+        for (tool, outcome), count in sorted(self._requests.items()):
+            lines.append(f"pyclarity_tool_requests_total{_labels(tool=tool, outcome=outcome)} {count}")
+
+        lines += [
+            "# HELP pyclarity_tool_in_flight Tool calls currently running.",
+            "# TYPE pyclarity_tool_in_flight gauge",
+        ]
+        for tool in sorted(self._latency):
+            lines.append(f"pyclarity_tool_in_flight{_labels(tool=tool)} {self._in_flight[tool]}")
+
+        lines += [
+            "# HELP pyclarity_tool_duration_seconds Tool call latency.",
+            "# TYPE pyclarity_tool_duration_seconds histogram",
+        ]
+        for tool, histogram in sorted(self._latency.items()):
+            if histogram.count:
+                lines += _histogram_lines("pyclarity_tool_duration_seconds", histogram, tool=tool)
+
+        lines += [
+            "# HELP pyclarity_cache_hits_total Hits of memoized analysis steps.",
+            "# TYPE pyclarity_cache_hits_total counter",
+        ]
+        cache_info = {name: cached.cache_info() for name, cached in CACHES.items()}
+        lines += [f"pyclarity_cache_hits_total{_labels(cache=name)} {info.hits}" for name, info in cache_info.items()]
+        lines += [
+            "# HELP pyclarity_cache_misses_total Misses of memoized analysis steps.",
+            "# TYPE pyclarity_cache_misses_total counter",
+        ]
+        lines += [f"pyclarity_cache_misses_total{_labels(cache=name)} {info.misses}" for name, info in cache_info.items()]
+        lines += [
+            "# HELP pyclarity_cache_entries Entries held by memoized analysis steps.",
+            "# TYPE pyclarity_cache_entries gauge",
+        ]
+        lines += [f"pyclarity_cache_entries{_labels(cache=name)} {info.currsize}" for name, info in cache_info.items()]
+
+        lines += [
+            "# HELP pyclarity_event_loop_lag_seconds Delay of event-loop wake-ups past their deadline.",
+            "# TYPE pyclarity_event_loop_lag_seconds histogram",
+            *_histogram_lines("pyclarity_event_loop_lag_seconds", self._loop_lag),
+            "# HELP pyclarity_event_loop_last_lag_seconds Most recent event-loop lag probe.",
+            "# TYPE pyclarity_event_loop_last_lag_seconds gauge",
+            f"pyclarity_event_loop_last_lag_seconds {_number(self._last_loop_lag)}",
+        ]
+
+        phases = phase_histograms()
+        if phases:
+            lines += [
+                "# HELP pyclarity_phase_duration_seconds Analyzer phase latency.",
+                "# TYPE pyclarity_phase_duration_seconds histogram",
+            ]
+            for (tool, phase), histogram in sorted(phases.items()):
+                lines += _histogram_lines(
+                    "pyclarity_phase_duration_seconds", histogram, scale=0.001, tool=tool, phase=phase
+                )
+
+        return "\n".join(lines) + "\n"
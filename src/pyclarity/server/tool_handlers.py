@@ -6,33 +6,54 @@ Handles parameter validation, context creation, and result formatting.
 """
 
 import logging
+import os
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import wraps
 from typing import Any, Dict, List, Optional
 
+from pyclarity.server.encoding import encode_result
+from pyclarity.server.metrics import ServerMetrics
+from pyclarity.tools.base import project_fields, record_phases
 from pyclarity.tools.collaborative_reasoning import (
     CollaborativeReasoningAnalyzer,
     CollaborativeReasoningContext,
+    CollaborativeReasoningResult,
+    Persona,
+    PersonaType,
+    ReasoningStyle,
 )
 from pyclarity.tools.debugging_approaches import (
     DebuggingApproachesAnalyzer,
     DebuggingApproachesContext,
+    DebuggingApproachesResult,
 )
 from pyclarity.tools.decision_framework import (
     CriteriaType,
     DecisionCriteria,
     DecisionFrameworkAnalyzer,
     DecisionFrameworkContext,
+    DecisionFrameworkResult,
+    DecisionMethodType,
     DecisionOption,
 )
-from pyclarity.tools.design_patterns import DesignPatternsAnalyzer, DesignPatternsContext
+from pyclarity.tools.design_patterns import (
+    DesignPatternsAnalyzer,
+    DesignPatternsContext,
+    DesignPatternsResult,
+    default_catalog_paths,
+)
 from pyclarity.tools.impact_propagation import (
     ImpactPropagationAnalyzer,
     ImpactPropagationContext,
+    ImpactPropagationResult,
 )
 
 # New FastMCP tools
 from pyclarity.tools.iterative_validation import (
     IterativeValidationAnalyzer,
     IterativeValidationContext,
+    default_session_store,
 )
 
 # Import working analyzers (skip problematic ones for now)
@@ -45,48 +66,90 @@ from pyclarity.tools.mental_models import (
 from pyclarity.tools.metacognitive_monitoring import (
     MetacognitiveMonitoringAnalyzer,
     MetacognitiveMonitoringContext,
+    MetacognitiveMonitoringResult,
+    ReasoningStreamMonitor,
 )
 from pyclarity.tools.multi_perspective import MultiPerspectiveAnalyzer, MultiPerspectiveContext
 from pyclarity.tools.programming_paradigms import (
     ProgrammingParadigmsAnalyzer,
     ProgrammingParadigmsContext,
+    ProgrammingParadigmsResult,
 )
 from pyclarity.tools.scientific_method import ScientificMethodAnalyzer, ScientificMethodContext
 from pyclarity.tools.sequential_readiness import (
     SequentialReadinessAnalyzer,
     SequentialReadinessContext,
+    SequentialReadinessResult,
 )
 from pyclarity.tools.sequential_thinking import (
     BranchStrategy,
     SequentialThinkingAnalyzer,
     SequentialThinkingContext,
+    ThoughtEvent,
+    ThoughtEventType,
 )
 from pyclarity.tools.structured_argumentation import (
     StructuredArgumentationAnalyzer,
     StructuredArgumentationContext,
+    StructuredArgumentationResult,
+)
+from pyclarity.tools.triple_constraint import (
+    TripleConstraintAnalyzer,
+    TripleConstraintContext,
+    TripleConstraintResult,
 )
-from pyclarity.tools.triple_constraint import TripleConstraintAnalyzer, TripleConstraintContext
 from pyclarity.tools.visual_reasoning import (
-    VisualElement,
     VisualReasoningAnalyzer,
     VisualReasoningContext,
+    VisualReasoningResult,
     VisualRepresentationType,
 )
 
 logger = logging.getLogger(__name__)
 
+# Reasoning streams monitored at once; the least recently fed is dropped first
+MAX_STREAM_MONITORS = 256
+
+
+def _with_phase_timings(
+    handler: Callable[..., Awaitable[dict[str, Any]]]
+) -> Callable[..., Awaitable[dict[str, Any]]]:
+    """Add the analysis phase timings of each call to its response."""
+
+    @wraps(handler)
+    async def timed(*args, **kwargs) -> dict[str, Any]:
+        with record_phases() as timings:
+            response = await handler(*args, **kwargs)
+        if response.get("success"):
+            response["phase_timings_ms"] = {phase: round(ms, 3) for phase, ms in timings.items()}
+        return response
+
+    return timed
+
 
 class CognitiveToolHandler:
     """Handles MCP tool calls for cognitive analyzers."""
 
-    def __init__(self):
-        """Initialize all cognitive analyzers."""
+    def __init__(
+        self,
+        include_phase_timings: bool | None = None,
+        metrics: ServerMetrics | None = None
+    ):
+        """Initialize all cognitive analyzers.
+
+        Args:
+            include_phase_timings: Report per-phase timings with each result;
+                defaults to the PYCLARITY_PHASE_TIMINGS environment variable
+            metrics: Server metrics to record each tool call in
+        """
         self.analyzers = {
             'mental_models': MentalModelsAnalyzer(),
             'sequential_thinking': SequentialThinkingAnalyzer(),
             'decision_framework': DecisionFrameworkAnalyzer(),
             'scientific_method': ScientificMethodAnalyzer(),
-            'design_patterns': DesignPatternsAnalyzer(),
+            'design_patterns': DesignPatternsAnalyzer(
+                catalog_paths=default_catalog_paths()
+            ),
             'programming_paradigms': ProgrammingParadigmsAnalyzer(),
             'debugging_approaches': DebuggingApproachesAnalyzer(),
             'visual_reasoning': VisualReasoningAnalyzer(),
@@ -96,7 +159,9 @@ class CognitiveToolHandler:
             # Temporarily disabled
             # 'impact_propagation': ImpactPropagationAnalyzer(),
             # New FastMCP tools
-            'iterative_validation': IterativeValidationAnalyzer(),
+            'iterative_validation': IterativeValidationAnalyzer(
+                session_store=default_session_store()
+            ),
             'multi_perspective': MultiPerspectiveAnalyzer(),
             'sequential_readiness': SequentialReadinessAnalyzer(),
             'triple_constraint': TripleConstraintAnalyzer(),
@@ -104,14 +169,33 @@ class CognitiveToolHandler:
 
         logger.info(f"Initialized {len(self.analyzers)} cognitive analyzers")
 
+        self._stream_monitors: OrderedDict[str, ReasoningStreamMonitor] = OrderedDict()
+
+        if include_phase_timings is None:
+            include_phase_timings = os.environ.get(
+                "PYCLARITY_PHASE_TIMINGS", ""
+            ).lower() in {"1", "true", "yes"}
+        for name in dir(self):
+            if not name.startswith("handle_"):
+                continue
+            handler = getattr(self, name)
+            if include_phase_timings:
+                handler = _with_phase_timings(handler)
+            if metrics is not None:
+                handler = metrics.instrument(name.removeprefix("handle_"), handler)
+            setattr(self, name, handler)
+
     async def handle_mental_models(
         self,
         problem: str,
         model_type: str = "first_principles",
+        additional_models: list[str] | None = None,
         complexity_level: str = "moderate",
         focus_areas: list[str] | None = None,
         constraints: list[str] | None = None,
-        domain_expertise: str | None = None
+        domain_expertise: str | None = None,
+        verbosity: str = "full",
+        compress: bool = False
     ) -> dict[str, Any]:
         """Handle mental models analysis."""
         try:
@@ -123,6 +207,7 @@ class CognitiveToolHandler:
             context = MentalModelContext(
                 problem=problem,
                 model_type=model_type_enum,
+                additional_models=[MentalModelType(model) for model in additional_models or []],
                 complexity_level=complexity_enum,
                 focus_areas=focus_areas,
                 constraints=constraints,
@@ -138,7 +223,7 @@ class CognitiveToolHandler:
                 "tool": "Mental Models",
                 "model_type": model_type,
                 "complexity_level": complexity_level,
-                "analysis": result.model_dump(),
+                "analysis": encode_result(result, verbosity, compress),
                 "success": True
             }
 
@@ -157,9 +242,16 @@ class CognitiveToolHandler:
         reasoning_depth: int = 5,
         enable_branching: bool = True,
         enable_revision: bool = True,
-        branch_strategy: str = "adaptive"
+        branch_strategy: str = "parallel_exploration",
+        on_event: Callable[[ThoughtEvent], Awaitable[None]] | None = None,
+        verbosity: str = "full",
+        compress: bool = False
     ) -> dict[str, Any]:
-        """Handle sequential thinking analysis."""
+        """Handle sequential thinking analysis.
+
+        When ``on_event`` is given, the analysis is streamed and the callback
+        is awaited with each step, branch and revision event as it is produced.
+        """
         try:
             # Convert enums
             complexity_enum = ComplexityLevel(complexity_level)
@@ -177,13 +269,20 @@ class CognitiveToolHandler:
 
             # Run analysis
             analyzer = self.analyzers['sequential_thinking']
-            result = await analyzer.analyze(context)
+            if on_event is None:
+                result = await analyzer.analyze(context)
+            else:
+                async for event in analyzer.analyze_stream(context):
+                    if event.event_type == ThoughtEventType.RESULT:
+                        result = event.result
+                    else:
+                        await on_event(event)
 
             return {
                 "tool": "Sequential Thinking",
                 "reasoning_depth": reasoning_depth,
                 "enable_branching": enable_branching,
-                "analysis": result.model_dump(),
+                "analysis": encode_result(result, verbosity, compress),
                 "success": True
             }
 
@@ -202,13 +301,23 @@ class CognitiveToolHandler:
         criteria: list[dict] | None = None,
         options: list[dict] | None = None,
         decision_methods: list[str] | None = None,
-        stakeholder_weights: dict[str, float] | None = None,
-        time_constraints: str | None = None
+        verbosity: str = "full",
+        compress: bool = False,
+        fields: list[str] | None = None
     ) -> dict[str, Any]:
         """Handle decision framework analysis."""
         try:
             complexity_enum = ComplexityLevel(complexity_level)
 
+            # The analyzer applies one decision method per analysis
+            if decision_methods and len(decision_methods) > 1:
+                raise ValueError("Only one decision method can be applied per analysis")
+            decision_method = (
+                DecisionMethodType(decision_methods[0])
+                if decision_methods
+                else DecisionMethodType.WEIGHTED_SCORING
+            )
+
             # Convert criteria and options if provided
             criteria_objs = []
             if criteria:
@@ -227,29 +336,29 @@ class CognitiveToolHandler:
                     options_objs.append(DecisionOption(
                         name=o.get('name', ''),
                         description=o.get('description', ''),
-                        scores=o.get('scores', {})
+                        scores=o.get('scores', {}),
+                        risks=o.get('risks')
                     ))
 
             # Create context
             context = DecisionFrameworkContext(
-                decision_problem=decision_problem,
+                problem=decision_problem,
                 complexity_level=complexity_enum,
                 criteria=criteria_objs,
                 options=options_objs,
-                decision_methods=decision_methods or ["WEIGHTED_SUM"],
-                stakeholder_weights=stakeholder_weights,
-                time_constraints=time_constraints
+                decision_method=decision_method
             )
 
             # Run analysis
             analyzer = self.analyzers['decision_framework']
-            result = await analyzer.analyze(context)
+            with project_fields(fields, DecisionFrameworkResult):
+                result = await analyzer.analyze(context)
 
             return {
                 "tool": "Decision Framework",
                 "decision_problem": decision_problem,
-                "methods_used": decision_methods,
-                "analysis": result.model_dump(),
+                "methods_used": [decision_method.value],
+                "analysis": encode_result(result, verbosity, compress, fields),
                 "success": True
             }
 
@@ -269,20 +378,28 @@ class CognitiveToolHandler:
         domain_knowledge: str | None = None,
         max_hypotheses: int = 3,
         evidence_sources: list[str] | None = None,
-        significance_threshold: float = 0.05
+        significance_threshold: float = 0.05,
+        measurements: list[dict] | None = None,
+        verbosity: str = "full",
+        compress: bool = False
     ) -> dict[str, Any]:
         """Handle scientific method analysis."""
         try:
             complexity_enum = ComplexityLevel(complexity_level)
 
+            # Without a research question or background, both come from the problem
+            if not research_question:
+                research_question = f"What explains {problem.strip().rstrip('.?!')[:480]}?"
+
             context = ScientificMethodContext(
                 problem=problem,
                 complexity_level=complexity_enum,
                 research_question=research_question,
-                domain_knowledge=domain_knowledge,
+                domain_knowledge=domain_knowledge or problem,
                 max_hypotheses=max_hypotheses,
-                evidence_sources=evidence_sources,
-                significance_threshold=significance_threshold
+                evidence_sources=evidence_sources or [],
+                significance_threshold=significance_threshold,
+                measurements=measurements or []
             )
 
             analyzer = self.analyzers['scientific_method']
@@ -292,7 +409,7 @@ class CognitiveToolHandler:
                 "tool": "Scientific Method",
                 "research_question": research_question,
                 "max_hypotheses": max_hypotheses,
-                "analysis": result.model_dump(),
+                "analysis": encode_result(result, verbosity, compress),
                 "success": True
             }
 
@@ -310,7 +427,10 @@ class CognitiveToolHandler:
         complexity_level: str = "moderate",
         problem_domain: str | None = None,
         system_scale: str | None = None,
-        constraints: list[str] | None = None
+        constraints: list[str] | None = None,
+        verbosity: str = "full",
+        compress: bool = False,
+        fields: list[str] | None = None
     ) -> dict[str, Any]:
         """Handle design patterns analysis."""
         try:
@@ -318,20 +438,26 @@ class CognitiveToolHandler:
 
             context = DesignPatternsContext(
                 problem=problem,
+                system_description=" ".join(
+                    part for part in (
+                        problem,
+                        f"Domain: {problem_domain}." if problem_domain else None,
+                        f"Scale: {system_scale}." if system_scale else None,
+                    ) if part
+                ),
                 complexity_level=complexity_enum,
-                problem_domain=problem_domain,
-                system_scale=system_scale,
-                constraints=constraints
+                constraints=constraints or []
             )
 
             analyzer = self.analyzers['design_patterns']
-            result = await analyzer.analyze(context)
+            with project_fields(fields, DesignPatternsResult):
+                result = await analyzer.analyze(context)
 
             return {
                 "tool": "Design Patterns",
                 "problem_domain": problem_domain,
                 "system_scale": system_scale,
-                "analysis": result.model_dump(),
+                "analysis": encode_result(result, verbosity, compress, fields),
                 "success": True
             }
 
@@ -351,19 +477,27 @@ class CognitiveToolHandler:
             complexity_enum = ComplexityLevel(kwargs.get('complexity_level', 'moderate'))
 
             context = ProgrammingParadigmsContext(
-                problem=kwargs['problem'],
+                problem_description=kwargs['problem'],
+                project_type=kwargs.get('project_type') or "Software project",
                 complexity_level=complexity_enum,
                 current_paradigms=kwargs.get('current_paradigms'),
                 target_paradigms=kwargs.get('target_paradigms'),
-                project_constraints=kwargs.get('project_constraints')
+                constraints=kwargs.get('project_constraints') or [],
+                codebase_path=kwargs.get('codebase_path')
             )
 
             analyzer = self.analyzers['programming_paradigms']
-            result = await analyzer.analyze(context)
+            with project_fields(kwargs.get('fields'), ProgrammingParadigmsResult):
+                result = await analyzer.analyze(context)
 
             return {
                 "tool": "Programming Paradigms",
-                "analysis": result.model_dump(),
+                "analysis": encode_result(
+                    result,
+                    kwargs.get('verbosity', 'full'),
+                    kwargs.get('compress', False),
+                    kwargs.get('fields'),
+                ),
                 "success": True
             }
         except Exception as e:
@@ -375,22 +509,36 @@ class CognitiveToolHandler:
         try:
             complexity_enum = ComplexityLevel(kwargs.get('complexity_level', 'moderate'))
 
+            problem = kwargs['problem']
             context = DebuggingApproachesContext(
-                problem=kwargs['problem'],
+                problem_description=problem,
+                system_context=" ".join(
+                    part for part in (
+                        problem,
+                        f"Domain: {kwargs['problem_domain']}." if kwargs.get('problem_domain') else None,
+                        f"System complexity: {kwargs['system_complexity']}." if kwargs.get('system_complexity') else None,
+                    ) if part
+                ),
                 complexity_level=complexity_enum,
-                problem_domain=kwargs.get('problem_domain'),
-                error_symptoms=kwargs.get('error_symptoms'),
-                system_complexity=kwargs.get('system_complexity'),
-                available_tools=kwargs.get('available_tools'),
+                # Without symptoms or logs, the problem statement is the symptom
+                error_symptoms=kwargs.get('error_symptoms') or ([] if kwargs.get('log_paths') else [problem]),
+                log_paths=kwargs.get('log_paths') or [],
+                available_tools=kwargs.get('available_tools') or [],
                 time_constraints=kwargs.get('time_constraints')
             )
 
             analyzer = self.analyzers['debugging_approaches']
-            result = await analyzer.analyze(context)
+            with project_fields(kwargs.get('fields'), DebuggingApproachesResult):
+                result = await analyzer.analyze(context)
 
             return {
                 "tool": "Debugging Approaches",
-                "analysis": result.model_dump(),
+                "analysis": encode_result(
+                    result,
+                    kwargs.get('verbosity', 'full'),
+                    kwargs.get('compress', False),
+                    kwargs.get('fields'),
+                ),
                 "success": True
             }
         except Exception as e:
@@ -400,31 +548,42 @@ class CognitiveToolHandler:
     async def handle_visual_reasoning(self, **kwargs) -> dict[str, Any]:
         """Handle visual reasoning analysis."""
         try:
-            # Convert visual elements if provided
-            visual_elements = []
-            if kwargs.get('visual_elements'):
-                for elem in kwargs['visual_elements']:
-                    visual_elements.append(VisualElement(
-                        element_id=elem.get('id', ''),
-                        element_type=elem.get('type', ''),
-                        position=tuple(elem.get('position', (0, 0))),
-                        size=tuple(elem.get('size', (1, 1))),
-                        properties=elem.get('properties', {})
-                    ))
+            representation_type = VisualRepresentationType(
+                kwargs.get('representation_type', 'diagram')
+            )
+
+            # Convert visual elements to the analyzer's element data
+            visual_elements_data = [
+                {
+                    'element_id': elem.get('id', f"element_{i + 1}"),
+                    'element_type': elem.get('type', 'shape'),
+                    'position': list(elem.get('position', (0, 0))),
+                    'size': list(elem.get('size', (1, 1))),
+                    'properties': elem.get('properties', {}),
+                }
+                for i, elem in enumerate(kwargs.get('visual_elements') or [])
+            ]
 
             context = VisualReasoningContext(
-                problem=kwargs['problem'],
-                visual_elements=visual_elements,
-                representation_type=VisualRepresentationType(kwargs.get('representation_type', 'diagram')),
-                analysis_focus=kwargs.get('analysis_focus')
+                problem_type=f"{representation_type.value} analysis",
+                visual_elements_data=visual_elements_data,
+                representation_type=representation_type,
+                analysis_goals=kwargs.get('analysis_focus') or [],
+                problem_description=kwargs['problem'],
             )
 
             analyzer = self.analyzers['visual_reasoning']
-            result = await analyzer.analyze(context)
+            with project_fields(kwargs.get('fields'), VisualReasoningResult):
+                result = await analyzer.analyze(context)
 
             return {
                 "tool": "Visual Reasoning",
-                "analysis": result.model_dump(),
+                "analysis": encode_result(
+                    result,
+                    kwargs.get('verbosity', 'full'),
+                    kwargs.get('compress', False),
+                    kwargs.get('fields'),
+                ),
                 "success": True
             }
         except Exception as e:
@@ -434,23 +593,32 @@ class CognitiveToolHandler:
     async def handle_structured_argumentation(self, **kwargs) -> dict[str, Any]:
         """Handle structured argumentation analysis."""
         try:
-            complexity_enum = ComplexityLevel(kwargs.get('complexity_level', 'moderate'))
-
-            context = StructuredArgumentationContext(
-                problem=kwargs['problem'],
-                complexity_level=complexity_enum,
-                main_claim=kwargs.get('main_claim'),
-                premises=kwargs.get('premises'),
-                evidence_sources=kwargs.get('evidence_sources'),
-                counter_arguments=kwargs.get('counter_arguments')
+            # Assemble the claim, premises, evidence and objections into one argument text
+            statements = [
+                kwargs['problem'],
+                kwargs.get('main_claim'),
+                *(kwargs.get('premises') or []),
+                *(kwargs.get('evidence_sources') or []),
+                *(kwargs.get('counter_arguments') or []),
+            ]
+            argument_text = " ".join(
+                statement.strip().rstrip('.') + '.' for statement in statements if statement
             )
 
+            context = StructuredArgumentationContext(argument_text=argument_text)
+
             analyzer = self.analyzers['structured_argumentation']
-            result = await analyzer.analyze(context)
+            with project_fields(kwargs.get('fields'), StructuredArgumentationResult):
+                result = await analyzer.analyze(context)
 
             return {
                 "tool": "Structured Argumentation",
-                "analysis": result.model_dump(),
+                "analysis": encode_result(
+                    result,
+                    kwargs.get('verbosity', 'full'),
+                    kwargs.get('compress', False),
+                    kwargs.get('fields'),
+                ),
                 "success": True
             }
         except Exception as e:
@@ -465,44 +633,114 @@ class CognitiveToolHandler:
             context = MetacognitiveMonitoringContext(
                 problem=kwargs['problem'],
                 complexity_level=complexity_enum,
-                reasoning_target=kwargs.get('reasoning_target'),
-                monitoring_focus=kwargs.get('monitoring_focus'),
-                monitoring_depth=kwargs.get('monitoring_depth', 'standard'),
+                reasoning_target=kwargs.get('reasoning_target') or kwargs['problem'],
+                monitoring_focus=kwargs.get('monitoring_focus') or [],
+                monitoring_depth=kwargs.get('monitoring_depth', 'moderate'),
                 intervention_threshold=kwargs.get('intervention_threshold', 0.7)
             )
 
             analyzer = self.analyzers['metacognitive_monitoring']
-            result = await analyzer.analyze(context)
+            with project_fields(kwargs.get('fields'), MetacognitiveMonitoringResult):
+                result = await analyzer.analyze(context)
 
             return {
                 "tool": "Metacognitive Monitoring",
-                "analysis": result.model_dump(),
+                "analysis": encode_result(
+                    result,
+                    kwargs.get('verbosity', 'full'),
+                    kwargs.get('compress', False),
+                    kwargs.get('fields'),
+                ),
                 "success": True
             }
         except Exception as e:
             logger.error(f"Metacognitive monitoring analysis failed: {e}")
             return {"tool": "Metacognitive Monitoring", "error": str(e), "success": False}
 
+    async def handle_metacognitive_stream(
+        self,
+        stream_id: str,
+        chunk: str,
+        intervention_threshold: float = 0.7,
+        finish: bool = False
+    ) -> dict[str, Any]:
+        """Feed one chunk of a reasoning stream to its monitor.
+
+        The monitor for ``stream_id`` is created on the first chunk and kept
+        until ``finish`` is set; only the alerts this chunk raised are returned,
+        alongside the stream's running statistics.
+        """
+        try:
+            monitor = self._stream_monitors.get(stream_id)
+            if monitor is None:
+                monitor = ReasoningStreamMonitor(intervention_threshold)
+                self._stream_monitors[stream_id] = monitor
+                while len(self._stream_monitors) > MAX_STREAM_MONITORS:
+                    self._stream_monitors.popitem(last=False)
+            self._stream_monitors.move_to_end(stream_id)
+
+            alerts = monitor.feed(chunk)
+            if finish:
+                del self._stream_monitors[stream_id]
+
+            return {
+                "tool": "Metacognitive Stream",
+                "stream_id": stream_id,
+                "alerts": [alert.model_dump(mode="json") for alert in alerts],
+                "state": monitor.state.model_dump(mode="json"),
+                "success": True
+            }
+        except Exception as e:
+            logger.error(f"Metacognitive stream monitoring failed: {e}")
+            return {"tool": "Metacognitive Stream", "error": str(e), "success": False}
+
     async def handle_collaborative_reasoning(self, **kwargs) -> dict[str, Any]:
         """Handle collaborative reasoning analysis."""
         try:
-            complexity_enum = ComplexityLevel(kwargs.get('complexity_level', 'moderate'))
-
+            perspectives = kwargs.get('perspectives_needed') or [
+                PersonaType.EXPERT.value, PersonaType.STAKEHOLDER.value, PersonaType.CRITIC.value
+            ]
+            persona_types = list(PersonaType)
+
+            # Simulate one persona per perspective, cycling types for free-form names
+            personas = []
+            for i, perspective in enumerate(perspectives):
+                try:
+                    persona_type = PersonaType(perspective.strip().lower().replace(' ', '_'))
+                except ValueError:
+                    persona_type = persona_types[i % len(persona_types)]
+                personas.append(Persona(
+                    name=perspective,
+                    persona_type=persona_type,
+                    reasoning_style=(
+                        ReasoningStyle.CRITICAL
+                        if persona_type is PersonaType.CRITIC
+                        else ReasoningStyle.ANALYTICAL
+                    ),
+                    background=persona_type.description,
+                ))
+
+            objective = kwargs.get('collaboration_objective') or kwargs['problem']
             context = CollaborativeReasoningContext(
                 problem=kwargs['problem'],
-                complexity_level=complexity_enum,
-                collaboration_objective=kwargs.get('collaboration_objective'),
-                perspectives_needed=kwargs.get('perspectives_needed'),
-                max_rounds=kwargs.get('max_rounds', 3),
-                consensus_threshold=kwargs.get('consensus_threshold', 0.7)
+                personas=personas,
+                reasoning_focus=objective[:200],
+                complexity_level=kwargs.get('complexity_level', 'moderate'),
+                max_dialogue_rounds=kwargs.get('max_rounds', 3),
             )
 
             analyzer = self.analyzers['collaborative_reasoning']
-            result = await analyzer.analyze(context)
+            with project_fields(kwargs.get('fields'), CollaborativeReasoningResult):
+                result = await analyzer.analyze(context)
 
             return {
                 "tool": "Collaborative Reasoning",
-                "analysis": result.model_dump(),
+                "analysis": encode_result(
+                    result,
+                    kwargs.get('verbosity', 'full'),
+                    kwargs.get('compress', False),
+                    kwargs.get('fields'),
+                ),
                 "success": True
             }
         except Exception as e:
@@ -524,11 +762,17 @@ class CognitiveToolHandler:
             )
 
             analyzer = self.analyzers['impact_propagation']
-            result = await analyzer.analyze(context)
+            with project_fields(kwargs.get('fields'), ImpactPropagationResult):
+                result = await analyzer.analyze(context)
 
             return {
                 "tool": "Impact Propagation",
-                "analysis": result.model_dump(),
+                "analysis": encode_result(
+                    result,
+                    kwargs.get('verbosity', 'full'),
+                    kwargs.get('compress', False),
+                    kwargs.get('fields'),
+                ),
                 "success": True
             }
         except Exception as e:
@@ -547,15 +791,24 @@ class CognitiveToolHandler:
                 test_preferences=kwargs.get('test_preferences'),
                 max_iterations=kwargs.get('max_iterations', 5),
                 target_confidence=kwargs.get('target_confidence'),
-                previous_cycles=kwargs.get('previous_cycles')
+                previous_cycles=kwargs.get('previous_cycles'),
+                candidate_refinements=kwargs.get('candidate_refinements', 1),
+                convergence_patience=kwargs.get('convergence_patience', 2),
+                session_id=kwargs.get('session_id')
             )
 
             analyzer = self.analyzers['iterative_validation']
             result = await analyzer.analyze(context)
 
+            if context.session_id and kwargs.get('finish'):
+                async with analyzer.session_store.lock(context.session_id):
+                    await analyzer.session_store.delete(context.session_id)
+
             return {
                 "tool": "Iterative Validation",
-                "analysis": result.model_dump(),
+                "analysis": encode_result(
+                    result, kwargs.get('verbosity', 'full'), kwargs.get('compress', False)
+                ),
                 "success": True
             }
         except Exception as e:
@@ -581,7 +834,9 @@ class CognitiveToolHandler:
 
             return {
                 "tool": "Multi-Perspective Analysis",
-                "analysis": result.model_dump(),
+                "analysis": encode_result(
+                    result, kwargs.get('verbosity', 'full'), kwargs.get('compress', False)
+                ),
                 "success": True
             }
         except Exception as e:
@@ -598,19 +853,31 @@ class CognitiveToolHandler:
                 complexity_level=complexity_enum,
                 domain_context=kwargs.get('domain_context'),
                 predefined_states=kwargs.get('predefined_states'),
+                current_status=kwargs.get('current_status'),
+                state_transitions=kwargs.get('state_transitions'),
+                what_if=kwargs.get('what_if'),
+                constraints={
+                    f"constraint_{i + 1}": constraint
+                    for i, constraint in enumerate(kwargs.get('key_constraints') or [])
+                } or None,
                 assessment_criteria=kwargs.get('assessment_criteria'),
-                key_constraints=kwargs.get('key_constraints'),
                 timeline_flexibility=kwargs.get('timeline_flexibility', 'medium'),
                 risk_tolerance=kwargs.get('risk_tolerance', 'medium'),
                 organizational_readiness=kwargs.get('organizational_readiness', 'medium')
             )
 
             analyzer = self.analyzers['sequential_readiness']
-            result = await analyzer.analyze(context)
+            with project_fields(kwargs.get('fields'), SequentialReadinessResult):
+                result = await analyzer.analyze(context)
 
             return {
                 "tool": "Sequential Readiness",
-                "analysis": result.model_dump(),
+                "analysis": encode_result(
+                    result,
+                    kwargs.get('verbosity', 'full'),
+                    kwargs.get('compress', False),
+                    kwargs.get('fields'),
+                ),
                 "success": True
             }
         except Exception as e:
@@ -625,10 +892,13 @@ class CognitiveToolHandler:
             context = TripleConstraintContext(
                 scenario=kwargs['scenario'],
                 complexity_level=complexity_enum,
-                domain=kwargs.get('domain'),
+                domain_context=kwargs.get('domain'),
                 predefined_constraints=kwargs.get('predefined_constraints'),
                 optimization_focus=kwargs.get('optimization_focus'),
-                flexibility_parameters=kwargs.get('flexibility_parameters'),
+                constraints_flexibility=kwargs.get('flexibility_parameters'),
+                trade_off_matrix=kwargs.get('trade_off_matrix'),
+                max_scenarios=kwargs.get('max_scenarios', 3),
+                random_seed=kwargs.get('random_seed'),
                 risk_tolerance=kwargs.get('risk_tolerance', 'medium'),
                 timeline_flexibility=kwargs.get('timeline_flexibility', 'medium'),
                 primary_stakeholders=kwargs.get('primary_stakeholders'),
@@ -636,11 +906,17 @@ class CognitiveToolHandler:
             )
 
             analyzer = self.analyzers['triple_constraint']
-            result = await analyzer.analyze(context)
+            with project_fields(kwargs.get('fields'), TripleConstraintResult):
+                result = await analyzer.analyze(context)
 
             return {
                 "tool": "Triple Constraint Optimizer",
-                "analysis": result.model_dump(),
+                "analysis": encode_result(
+                    result,
+                    kwargs.get('verbosity', 'full'),
+                    kwargs.get('compress', False),
+                    kwargs.get('fields'),
+                ),
                 "success": True
             }
         except Exception as e:
@@ -0,0 +1,38 @@
+"""
+Artifact Paths
+
+Some tools read files on the server: log files and stack-trace dumps for
+debugging approaches, a source tree for programming paradigms. Those paths
+come from MCP clients, so they are confined to one allowlisted root
+directory, PYCLARITY_ARTIFACT_ROOT (the server's working directory when
+unset). Paths are resolved, following symlinks, before they are checked,
+and relative paths are taken relative to the root.
+"""
+
+import os
+from pathlib import Path
+
+# Environment variable naming the directory artifact paths must lie under
+ARTIFACT_ROOT_ENV = "PYCLARITY_ARTIFACT_ROOT"
+
+
+def artifact_root() -> Path:
+    """Allowlisted root directory, from PYCLARITY_ARTIFACT_ROOT or the working directory."""
+    return Path(os.environ.get(ARTIFACT_ROOT_ENV) or os.getcwd()).resolve()
+
+
+def resolve_artifact_path(path: str | os.PathLike[str]) -> str:
+    """
+    Resolve a client-supplied path inside the artifact root.
+
+    Returns:
+        The absolute, resolved path
+
+    Raises:
+        ValueError: If the path resolves outside the artifact root
+    """
+    root = artifact_root()
+    resolved = (root / path).resolve()
+    if not resolved.is_relative_to(root):
+        raise ValueError(f"Path {os.fspath(path)!r} is outside the artifact root {str(root)!r}")
+    return str(resolved)
@@ -4,11 +4,26 @@ Base classes for PyClarity cognitive analyzers.
 Provides common interfaces and functionality for all cognitive tools.
 """
 
+import bisect
+import hashlib
+import inspect
+import itertools
+import math
+import os
+import random
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
 from enum import Enum
-from typing import Any, Dict, Generic, Optional, TypeVar
+from functools import cache, lru_cache, wraps
+from typing import Any, ClassVar, Dict, Optional, get_args
 
 from pydantic import BaseModel
+from pydantic.fields import FieldInfo
 
 
 class ComplexityLevel(str, Enum):
@@ -34,14 +49,448 @@ class BaseCognitiveResult(BaseModel):
     error_message: str | None = None
 
 
-# Generic type variables for context and result models
-Ctx = TypeVar("Ctx", bound=BaseCognitiveContext)
-Res = TypeVar("Res", bound=BaseCognitiveResult)
+# Strict validation re-enables full validation of analyzer-generated models (debug mode)
+_strict_validation: ContextVar[bool] = ContextVar(
+    "pyclarity_strict_validation",
+    default=os.environ.get("PYCLARITY_STRICT_VALIDATION", "").lower() in {"1", "true", "yes"},
+)
 
+# Models built by trusted_construct whose fields have not been validated yet,
+# keyed by id; entries disappear with the model
+_unvalidated_models: weakref.WeakValueDictionary[int, BaseModel] = weakref.WeakValueDictionary()
 
-class BaseCognitiveAnalyzer(Generic[Ctx, Res], ABC):
+
+def strict_validation_enabled() -> bool:
+    """Whether analyzer-generated models are validated on construction"""
+    return _strict_validation.get()
+
+
+def set_strict_validation(enabled: bool) -> None:
+    """Enable or disable strict validation for the current context and tasks it starts"""
+    _strict_validation.set(enabled)
+
+
+@contextmanager
+def strict_validation(enabled: bool = True) -> Iterator[None]:
+    """Temporarily enable or disable strict validation"""
+    token = _strict_validation.set(enabled)
+    try:
+        yield
+    finally:
+        _strict_validation.reset(token)
+
+
+# Result fields requested by the caller; None means the full result is computed
+_requested_fields: ContextVar[frozenset[str] | None] = ContextVar(
+    "pyclarity_requested_fields", default=None
+)
+
+
+def requested_fields() -> frozenset[str] | None:
+    """Result fields requested for analyses in the current context, or None for all"""
+    return _requested_fields.get()
+
+
+@contextmanager
+def project_fields(
+    fields: Iterable[str] | None, result_model: type[BaseModel] | None = None
+) -> Iterator[None]:
+    """
+    Restrict analyses run in this block to the given result fields.
+
+    Analyzers skip optional phases that no requested field depends on
+    (see BaseCognitiveAnalyzer.phase_dependencies). Passing None leaves
+    the full result enabled.
+
+    Args:
+        fields: Requested result fields, or None for all fields
+        result_model: Result model the fields are checked against, before
+            any analysis runs
+
+    Raises:
+        ValueError: If a field is not a field of result_model
+    """
+    fields = None if fields is None else frozenset(fields)
+    if fields is not None and result_model is not None:
+        unknown = fields - set(result_model.model_fields)
+        if unknown:
+            raise ValueError(f"Unknown result fields: {', '.join(sorted(unknown))}")
+    token = _requested_fields.set(fields)
+    try:
+        yield
+    finally:
+        _requested_fields.reset(token)
+
+
+@lru_cache(maxsize=256)
+def _phase_closure(
+    dependencies: tuple[tuple[str, tuple[str, ...]], ...],
+    fields: frozenset[str],
+) -> frozenset[str]:
+    """Requested fields plus every phase they transitively depend on."""
+    graph = dict(dependencies)
+    needed: set[str] = set()
+    pending = list(fields)
+    while pending:
+        phase = pending.pop()
+        if phase not in needed:
+            needed.add(phase)
+            pending.extend(graph.get(phase, ()))
+    return frozenset(needed)
+
+
+@cache
+def _trusted_fields(model_cls: type[BaseModel]) -> tuple[tuple[str, FieldInfo], ...] | None:
+    """
+    Field table for building ``model_cls`` directly, or None if unsupported.
+
+    ``model_construct`` re-inspects every default factory's signature on
+    each call, which costs more than validation for small models, so the
+    field table is resolved once per class instead. Models with private
+    attributes, post-init hooks, extra fields or factories that take
+    validated data fall back to ``model_construct``.
+    """
+    if (
+        model_cls.__private_attributes__
+        or model_cls.model_post_init is not BaseModel.model_post_init
+        or model_cls.model_config.get("extra") == "allow"
+        or any(
+            field.default_factory_takes_validated_data
+            for field in model_cls.model_fields.values()
+        )
+    ):
+        return None
+    return tuple(model_cls.model_fields.items())
+
+
+@cache
+def _after_validators(model_cls: type[BaseModel]) -> tuple[str, ...]:
+    """Names of the ``mode="after"`` model validators of ``model_cls``."""
+    return tuple(
+        name
+        for name, decorator in model_cls.__pydantic_decorators__.model_validators.items()
+        if decorator.info.mode == "after"
+    )
+
+
+def trusted_construct[Model: BaseModel](model_cls: type[Model], **values: Any) -> Model:
+    """
+    Build a model from values the analyzer generated itself.
+
+    Field defaults are applied and field validators are skipped, unless
+    strict validation is enabled. ``mode="after"`` model validators still
+    run, since some of them fill in fields derived from the others. The
+    skipped checks run in validated_dump if the model reaches a result,
+    so this pays off for intermediate models that are discarded, not for
+    the result and its parts. Only use this for data produced
+    internally; user input must always go through normal validation.
+
+    Args:
+        model_cls: Model class to build
+        **values: Field values
+
+    Returns:
+        Model instance
+    """
+    if _strict_validation.get():
+        return model_cls(**values)
+
+    fields = _trusted_fields(model_cls)
+    if fields is None:
+        instance = model_cls.model_construct(**values)
+    else:
+        data = {}
+        for name, field in fields:
+            if name in values:
+                data[name] = values[name]
+            elif field.default_factory is not None:
+                data[name] = field.default_factory()
+            elif not field.is_required():
+                data[name] = field.get_default()
+
+        instance = model_cls.__new__(model_cls)
+        object.__setattr__(instance, "__dict__", data)
+        object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+
+    for name in _after_validators(model_cls):
+        instance = getattr(instance, name)()
+    _unvalidated_models[id(instance)] = instance
+    return instance
+
+
+_SCALAR_TYPES = (str, int, float)
+_COLLECTION_TYPES = (list, tuple, set, frozenset)
+
+
+def _may_hold_model(annotation: Any) -> bool:
+    """Whether values of a field annotation can contain a model instance."""
+    if annotation is Any:
+        return True
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_may_hold_model(arg) for arg in get_args(annotation))
+
+
+@cache
+def _model_valued_fields(model_cls: type[BaseModel]) -> tuple[str, ...]:
+    """Names of the fields of ``model_cls`` whose values can contain models."""
+    return tuple(
+        name
+        for name, field in model_cls.model_fields.items()
+        if _may_hold_model(field.annotation)
+    )
+
+
+def _validate_trusted(value: Any) -> None:
+    """
+    Validate every model built by trusted_construct within ``value``.
+
+    Each such model is checked once against its own fields. Nested model
+    instances pass through that check unchanged, so models that were
+    validated when they were built are not validated again.
+    """
+    # Scalars are by far the most common values, and an isinstance check
+    # against BaseModel goes through pydantic's slower metaclass hook
+    if value is None or isinstance(value, _SCALAR_TYPES):
+        return
+    if isinstance(value, _COLLECTION_TYPES):
+        for item in value:
+            _validate_trusted(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _validate_trusted(item)
+    elif isinstance(value, BaseModel):
+        fields = value.__dict__
+        for name in _model_valued_fields(type(value)):
+            _validate_trusted(fields.get(name))
+        if _unvalidated_models.get(id(value)) is value:
+            type(value).model_validate(value.__dict__)
+            del _unvalidated_models[id(value)]
+
+
+def validated_dump(
+    model: BaseModel, include: Iterable[str] | None = None, **dump_options: Any
+) -> dict[str, Any]:
+    """
+    Dump a result for transport, validating it first.
+
+    This is the single boundary check for models built with
+    trusted_construct: only those models are validated, each against
+    its own fields. Models built normally, including every model built
+    in strict mode, were validated when they were built and are not
+    checked again. The model is dumped once, and a projection only
+    selects top-level keys of that dump.
+
+    Args:
+        model: Result model to serialize
+        include: Top-level fields to return, or None for all fields
+        **dump_options: Options passed to ``model_dump`` (mode, exclude_defaults, ...)
+
+    Returns:
+        Plain dict representation of the model
+
+    Raises:
+        ValidationError: If the generated data violates the model's constraints
+    """
+    if _unvalidated_models:
+        _validate_trusted(model)
+    data = model.model_dump(**dump_options)
+    if include is not None:
+        include = set(include)
+        data = {key: value for key, value in data.items() if key in include}
+    return data
+
+
+# Upper bounds, in milliseconds, of phase latency histogram buckets
+PHASE_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0)
+
+
+class Histogram:
+    """
+    Latency histogram with fixed buckets, in the Prometheus style.
+
+    Args:
+        buckets: Increasing upper bounds; an implicit +Inf bucket follows them
+    """
+
+    def __init__(self, buckets: Iterable[float] = PHASE_BUCKETS_MS) -> None:
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        """Sum of all observations."""
+        return self._sum
+
+    def cumulative_counts(self) -> list[tuple[float, int]]:
+        """Observations at or below each bound, ending with +Inf."""
+        with self._lock:
+            counts = list(self._counts)
+        return list(zip((*self.buckets, math.inf), itertools.accumulate(counts), strict=True))
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation within its bucket."""
+        cumulative = self.cumulative_counts()
+        total = cumulative[-1][1]
+        if total == 0:
+            return 0.0
+        rank = q * total
+        lower, below = 0.0, 0
+        for bound, seen in cumulative:
+            if seen >= rank:
+                if math.isinf(bound):
+                    return lower
+                return lower + (bound - lower) * (rank - below) / max(seen - below, 1)
+            lower, below = bound, seen
+        return lower
+
+
+# Per-call phase timings being collected, or None when no caller asked for them
+_phase_timings: ContextVar[dict[str, float] | None] = ContextVar("pyclarity_phase_timings", default=None)
+
+# Process-wide phase latency histograms, keyed by (tool name, phase)
+_phase_histograms: dict[tuple[str, str], Histogram] = {}
+_phase_metrics_enabled = os.environ.get("PYCLARITY_PHASE_METRICS", "").lower() in {"1", "true", "yes"}
+_NO_SPAN = nullcontext()  # Returned by BaseCognitiveAnalyzer.phase while timing is disabled
+
+
+def enable_phase_metrics(enabled: bool = True) -> None:
+    """Enable or disable the process-wide phase latency histograms"""
+    global _phase_metrics_enabled
+    _phase_metrics_enabled = enabled
+
+
+def phase_histograms() -> dict[tuple[str, str], Histogram]:
+    """Phase latency histograms recorded so far, keyed by (tool name, phase)"""
+    return dict(_phase_histograms)
+
+
+def phase_timing_enabled() -> bool:
+    """Whether phases run in the current context are timed"""
+    return _phase_metrics_enabled or _phase_timings.get() is not None
+
+
+@contextmanager
+def record_phases() -> Iterator[dict[str, float]]:
+    """
+    Collect the phase timings of analyses run in this block.
+
+    Yields:
+        Dict filled with milliseconds spent per phase, summed over repeats
+    """
+    timings: dict[str, float] = {}
+    token = _phase_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _phase_timings.reset(token)
+
+
+@contextmanager
+def phase_span(tool: str, phase: str) -> Iterator[None]:
+    """
+    Time one phase of an analysis.
+
+    The elapsed time is added to the timings collected by record_phases and,
+    when phase metrics are enabled, to the (tool, phase) histogram. With
+    neither active the span only checks two flags.
+
+    Args:
+        tool: Tool the phase belongs to
+        phase: Phase name
+    """
+    if not phase_timing_enabled():
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        timings = _phase_timings.get()
+        if timings is not None:
+            timings[phase] = timings.get(phase, 0.0) + elapsed_ms
+        if _phase_metrics_enabled:
+            histogram = _phase_histograms.get((tool, phase))
+            if histogram is None:
+                histogram = _phase_histograms.setdefault((tool, phase), Histogram())
+            histogram.observe(elapsed_ms)
+
+
+def timed_phase[F: Callable[..., Any]](method: F) -> F:
+    """
+    Time an analyzer method as a phase named after it.
+
+    Works for sync and async methods; the tool is the analyzer's tool_name.
+    When timing is disabled the method is called directly.
+    """
+    name = method.__name__.lstrip("_")
+
+    if inspect.iscoroutinefunction(method):
+        @wraps(method)
+        async def timed_async(self, *args, **kwargs):
+            if not phase_timing_enabled():
+                return await method(self, *args, **kwargs)
+            with phase_span(getattr(self, "tool_name", type(self).__name__), name):
+                return await method(self, *args, **kwargs)
+
+        return timed_async  # type: ignore[return-value]
+
+    @wraps(method)
+    def timed(self, *args, **kwargs):
+        if not phase_timing_enabled():
+            return method(self, *args, **kwargs)
+        with phase_span(getattr(self, "tool_name", type(self).__name__), name):
+            return method(self, *args, **kwargs)
+
+    return timed  # type: ignore[return-value]
+
+
+def request_seed(context: BaseModel) -> int:
+    """
+    Seed for the randomness of one analysis.
+
+    The context's ``random_seed`` is used when set; otherwise the seed is
+    derived from a hash of the whole input, so identical inputs produce
+    identical results and can be memoized.
+
+    Args:
+        context: Analysis context
+
+    Returns:
+        64-bit seed
+    """
+    seed = getattr(context, "random_seed", None)
+    if seed is not None:
+        return seed
+    digest = hashlib.blake2b(context.model_dump_json().encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class BaseCognitiveAnalyzer[Ctx: BaseCognitiveContext, Res: BaseCognitiveResult](ABC):
     """Base class for all cognitive analyzers"""
 
+    # Optional phases, named by the result field they produce, mapped to the
+    # phases whose output they consume. Phases not listed always run.
+    phase_dependencies: ClassVar[dict[str, tuple[str, ...]]] = {}
+
     def __init__(
         self,
         tool_name: str = "Base Cognitive Analyzer",
@@ -59,6 +508,51 @@ class BaseCognitiveAnalyzer(Generic[Ctx, Res], ABC):
         self.tool_description = tool_description
         self.version = version
 
+    def needs_phase(self, phase: str) -> bool:
+        """
+        Whether an optional phase must run for the current field projection.
+
+        Args:
+            phase: Result field produced by the phase
+
+        Returns:
+            True if no projection is active or a requested field depends on the phase
+        """
+        fields = _requested_fields.get()
+        if fields is None:
+            return True
+        return phase in _phase_closure(tuple(self.phase_dependencies.items()), fields)
+
+    def request_rng(self, context: BaseModel) -> random.Random:
+        """
+        Random generator for one analysis, seeded by request_seed.
+
+        Analyzers thread this generator through their phases instead of
+        using the module-level ``random`` functions, so concurrent requests
+        never share or reseed a generator.
+
+        Args:
+            context: Analysis context
+
+        Returns:
+            Generator private to the request
+        """
+        return random.Random(request_seed(context))  # noqa: S311
+
+    def phase(self, name: str) -> AbstractContextManager[None]:
+        """
+        Time a block of an analysis as a phase of this tool.
+
+        Args:
+            name: Phase name
+
+        Returns:
+            Context manager timing the block (see phase_span)
+        """
+        if not phase_timing_enabled():
+            return _NO_SPAN
+        return phase_span(self.tool_name, name)
+
     @abstractmethod
     async def analyze(self, context: Ctx) -> Res:
         """
@@ -0,0 +1,306 @@
+"""
+Knowledge Catalogs
+
+Static knowledge the analyzers consult (pattern catalogs, paradigm and
+strategy profiles, fallacy patterns) lives in versioned JSON files next to
+each tool:
+
+    {"catalog": "<name>", "version": 1, "entries": {"<key>": {...}, ...}}
+
+The first time a catalog is needed it is compiled into a compact binary
+file in the catalog cache directory. Workers memory-map that file
+read-only, so every process on a host shares the same physical pages;
+entries are decoded only when looked up, and each decoded entry is kept
+for the life of the process.
+
+Binary layout (little-endian):
+
+    header         magic, format version, catalog version, entry count,
+                   source size and mtime (ns), SHA-256 of the JSON source
+    key offsets    uint32[count + 1] into the key table
+    value offsets  uint64[count + 1] into the value blob
+    key table      UTF-8 keys, back to back
+    value blob     one compact JSON document per entry
+
+Each source has one compiled file, named after its path. Opening a catalog
+only stats the source while its size and mtime match the header; when they
+change the source is hashed, and recompiled only if its digest changed.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Callable, Iterator, Mapping
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+FORMAT_MAGIC = b"PYCLCAT"
+FORMAT_VERSION = 2
+
+# magic, format version, catalog version, entry count, source size,
+# source mtime in nanoseconds, source digest
+_HEADER = struct.Struct("<7sBIIQq32s")
+
+
+def catalog_cache_dir() -> Path:
+    """Directory for compiled catalogs, from PYCLARITY_CATALOG_DIR or the user cache."""
+    configured = os.environ.get("PYCLARITY_CATALOG_DIR")
+    if configured:
+        return Path(configured)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "pyclarity" / "catalogs"
+
+
+def _pad(size: int, alignment: int = 8) -> int:
+    return -size % alignment
+
+
+def _read_source(source: bytes, path: Path) -> tuple[int, dict[str, Any]]:
+    """Catalog version and entries of a JSON source."""
+    data = json.loads(source)
+    if not isinstance(data, dict) or not isinstance(data.get("entries"), dict):
+        raise ValueError(f"Catalog {path} must be an object with an 'entries' object")
+    version = data.get("version")
+    if not isinstance(version, int) or version < 0:
+        raise ValueError(f"Catalog {path} must have a non-negative integer 'version'")
+    return version, data["entries"]
+
+
+def compile_catalog(source_path: str | Path) -> bytes:
+    """
+    Compile a JSON catalog into the binary format.
+
+    Raises:
+        ValueError: If the source is not a versioned catalog
+    """
+    path = Path(source_path)
+    stat = path.stat()
+    return _compile(path, path.read_bytes(), stat.st_size, stat.st_mtime_ns)
+
+
+def _compile(path: Path, source: bytes, size: int, mtime_ns: int) -> bytes:
+    version, entries = _read_source(source, path)
+
+    keys = [str(key).encode("utf-8") for key in entries]
+    values = [
+        json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        for value in entries.values()
+    ]
+    key_offsets = np.zeros(len(keys) + 1, dtype="<u4")
+    key_offsets[1:] = np.cumsum([len(key) for key in keys])
+    value_offsets = np.zeros(len(values) + 1, dtype="<u8")
+    value_offsets[1:] = np.cumsum([len(value) for value in values])
+
+    header = _HEADER.pack(
+        FORMAT_MAGIC,
+        FORMAT_VERSION,
+        version,
+        len(keys),
+        size,
+        mtime_ns,
+        hashlib.sha256(source).digest(),
+    )
+    key_table = b"".join(keys)
+    parts = [
+        header, b"\0" * _pad(len(header)),
+        key_offsets.tobytes(), b"\0" * _pad(key_offsets.nbytes),
+        value_offsets.tobytes(),
+        key_table, b"\0" * _pad(len(key_table)),
+        *values,
+    ]
+    return b"".join(parts)
+
+
+class Catalog(Mapping[str, Any]):
+    """
+    Read-only view of a compiled catalog.
+
+    Keys are decoded up front; each lookup decodes its entry's JSON from
+    the underlying buffer.
+
+    Args:
+        buffer: Compiled catalog bytes or a memory map of a compiled file
+
+    Raises:
+        ValueError: If the buffer is not a compiled catalog
+    """
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Compiled catalog is truncated")
+        magic, format_version, version, count, size, mtime_ns, digest = _HEADER.unpack_from(buffer)
+        if magic != FORMAT_MAGIC or format_version != FORMAT_VERSION:
+            raise ValueError("Not a compiled catalog of a supported format version")
+
+        self.version = version
+        self.source_size = size
+        self.source_mtime_ns = mtime_ns
+        self.digest = digest
+        self._buffer = buffer
+        offset = _HEADER.size + _pad(_HEADER.size)
+        key_offsets = np.frombuffer(buffer, dtype="<u4", count=count + 1, offset=offset)
+        offset += key_offsets.nbytes + _pad(key_offsets.nbytes)
+        self._value_offsets = np.frombuffer(buffer, dtype="<u8", count=count + 1, offset=offset)
+        offset += self._value_offsets.nbytes
+
+        key_table = bytes(buffer[offset:offset + int(key_offsets[-1])])
+        self._values_start = offset + len(key_table) + _pad(len(key_table))
+        bounds = key_offsets.tolist()
+        self._index = {
+            key_table[start:end].decode("utf-8"): i
+            for i, (start, end) in enumerate(zip(bounds, bounds[1:]))
+        }
+        if self._values_start + int(self._value_offsets[-1]) > len(buffer):
+            raise ValueError("Compiled catalog is truncated")
+
+    def __getitem__(self, key: str) -> Any:
+        i = self._index[key]
+        start = self._values_start + int(self._value_offsets[i])
+        end = self._values_start + int(self._value_offsets[i + 1])
+        return json.loads(self._buffer[start:end])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+
+def _compiled_path(source_path: Path) -> Path:
+    path_digest = hashlib.sha256(os.fsencode(source_path.resolve())).hexdigest()[:16]
+    return catalog_cache_dir() / f"{source_path.stem}-{path_digest}.bin"
+
+
+def _map_compiled(path: Path) -> Catalog | None:
+    """Memory-map a compiled file, or None if it is missing or unreadable."""
+    try:
+        with open(path, "rb") as handle:
+            buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        return Catalog(buffer)
+    except ValueError:
+        return None
+
+
+def _restamp(catalog: Catalog, size: int, mtime_ns: int) -> bytes:
+    """Compiled bytes of an unchanged catalog with a new source size and mtime."""
+    header = _HEADER.pack(
+        FORMAT_MAGIC,
+        FORMAT_VERSION,
+        catalog.version,
+        len(catalog),
+        size,
+        mtime_ns,
+        catalog.digest,
+    )
+    return header + bytes(catalog._buffer[_HEADER.size:])
+
+
+def _write_compiled(path: Path, data: bytes) -> bool:
+    """Atomically write a compiled file; False if the cache is not writable."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.chmod(temp, 0o644)
+            os.replace(temp, path)
+        except BaseException:
+            os.unlink(temp)
+            raise
+    except OSError:
+        return False
+    return True
+
+
+@cache
+def load_catalog(source_path: str | Path) -> Catalog:
+    """
+    Open a JSON catalog through its compiled, memory-mapped form.
+
+    Compiles the source on first use (or after it changes) and caches the
+    open catalog for the life of the process. Falls back to an in-memory
+    compilation when the cache directory cannot be written.
+
+    Raises:
+        ValueError: If the source is not a versioned catalog
+    """
+    path = Path(source_path)
+    stat = path.stat()
+    compiled = _compiled_path(path)
+
+    catalog = _map_compiled(compiled)
+    if (
+        catalog is not None
+        and (catalog.source_size, catalog.source_mtime_ns) == (stat.st_size, stat.st_mtime_ns)
+    ):
+        return catalog
+
+    source = path.read_bytes()
+    if catalog is not None and catalog.digest == hashlib.sha256(source).digest():
+        # Touched but unchanged: keep the compiled entries, record the new stat
+        data = _restamp(catalog, stat.st_size, stat.st_mtime_ns)
+    else:
+        data = _compile(path, source, stat.st_size, stat.st_mtime_ns)
+    if _write_compiled(compiled, data):
+        catalog = _map_compiled(compiled)
+        if catalog is not None:
+            return catalog
+    return Catalog(data)
+
+
+class CatalogView[K, V](Mapping[K, V]):
+    """
+    Typed view of a catalog that decodes each entry once, on first access.
+
+    Args:
+        catalog: Compiled catalog to read
+        decode_key: Converts a stored key, e.g. to an enum member
+        decode_value: Converts a stored entry, e.g. to a Pydantic model
+    """
+
+    def __init__(
+        self,
+        catalog: Catalog,
+        decode_key: Callable[[str], K],
+        decode_value: Callable[[Any], V],
+    ) -> None:
+        self.catalog = catalog
+        self._keys = {decode_key(key): key for key in catalog}
+        self._decode_value = decode_value
+        self._decoded: dict[K, V] = {}
+
+    def __getitem__(self, key: K) -> V:
+        try:
+            return self._decoded[key]
+        except KeyError:
+            pass
+        value = self._decode_value(self.catalog[self._keys[key]])
+        self._decoded[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    @property
+    def decoded_count(self) -> int:
+        """Number of entries decoded so far."""
+        return len(self._decoded)
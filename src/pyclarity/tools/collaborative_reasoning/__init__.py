@@ -7,6 +7,7 @@ role-based decision making, and team dynamics modeling.
 """
 
 from .analyzer import CollaborativeReasoningAnalyzer
+from .dialogue import DialogueBackend
 from .models import (
     CollaborativeDialogue,
     # Main models
@@ -41,4 +42,5 @@ __all__ = [
     "CollaborativeReasoningResult",
     # Main class
     "CollaborativeReasoningAnalyzer",
+    "DialogueBackend",
 ]
@@ -11,6 +11,9 @@ import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..base import BaseCognitiveAnalyzer, timed_phase
+from ..similarity import cluster_texts, shared_elements
+from .dialogue import ConsensusTracker, DialogueBackend
 from .models import (
     CollaborativeDialogue,
     CollaborativeReasoningContext,
@@ -24,14 +27,34 @@ from .models import (
     ReasoningStyle,
 )
 
+# Viewpoints at least this similar count as the same viewpoint for diversity
+NEAR_DUPLICATE_THRESHOLD = 0.9
 
-class CollaborativeReasoningAnalyzer:
+
+class CollaborativeReasoningAnalyzer(BaseCognitiveAnalyzer):
     """Collaborative reasoning cognitive tool analyzer"""
 
-    def __init__(self):
-        """Initialize the collaborative reasoning analyzer"""
-        self.tool_name = "Collaborative Reasoning"
-        self.version = "1.0.0"
+    # Perspectives, dialogue and consensus feed the required scores and always
+    # run; insights, next steps and implementation notes come from one phase
+    phase_dependencies = {
+        "key_insights": (),
+        "recommended_next_steps": (),
+        "implementation_considerations": (),
+        "stakeholder_buy_in_assessment": (),
+    }
+
+    def __init__(self, dialogue_backend: DialogueBackend | None = None):
+        """Initialize the collaborative reasoning analyzer
+
+        Args:
+            dialogue_backend: Optional batched model backend for dialogue messages
+        """
+        super().__init__(
+            tool_name="Collaborative Reasoning",
+            tool_description="Simulates a dialogue between personas to reach consensus",
+            version="1.0.0"
+        )
+        self.dialogue_backend = dialogue_backend
 
         # Internal state for processing
         self._processing_start_time = 0.0
@@ -61,19 +84,30 @@ class CollaborativeReasoningAnalyzer:
             context, persona_perspectives, dialogue_records
         )
 
+        sections: dict[str, Any] = {}
+
         # Phase 4: Generate insights and recommendations
-        key_insights, recommendations, considerations = await self._generate_insights(
-            context, persona_perspectives, dialogue_records, consensus_result
-        )
+        if any(
+            self.needs_phase(field)
+            for field in ("key_insights", "recommended_next_steps", "implementation_considerations")
+        ):
+            (
+                sections["key_insights"],
+                sections["recommended_next_steps"],
+                sections["implementation_considerations"],
+            ) = await self._generate_insights(
+                context, persona_perspectives, dialogue_records, consensus_result
+            )
 
         # Calculate quality metrics
         diversity_score = self._calculate_diversity_score(persona_perspectives)
         collaboration_quality = self._calculate_collaboration_quality(
             dialogue_records, consensus_result
         )
-        stakeholder_buy_in = self._assess_stakeholder_buy_in(
-            persona_perspectives, consensus_result
-        )
+        if self.needs_phase("stakeholder_buy_in_assessment"):
+            sections["stakeholder_buy_in_assessment"] = self._assess_stakeholder_buy_in(
+                persona_perspectives, consensus_result
+            )
 
         # Calculate processing time
         processing_time = time.time() - self._processing_start_time
@@ -82,31 +116,26 @@ class CollaborativeReasoningAnalyzer:
             persona_perspectives=persona_perspectives,
             dialogue_records=dialogue_records,
             consensus_result=consensus_result,
-            key_insights=key_insights,
             perspective_diversity_score=diversity_score,
             collaboration_quality_score=collaboration_quality,
             unresolved_tensions=consensus_result.unresolved_issues,
-            recommended_next_steps=recommendations,
-            stakeholder_buy_in_assessment=stakeholder_buy_in,
-            implementation_considerations=considerations,
             dialogue_duration_minutes=processing_time / 60.0,
             personas_engaged=len([p for p in persona_perspectives if p.confidence_level > 0.3]),
             consensus_confidence=consensus_result.confidence_in_consensus,
-            processing_time_ms=round(processing_time * 1000)
+            processing_time_ms=round(processing_time * 1000),
+            **sections,
         )
 
+    @timed_phase
     async def _generate_persona_perspectives(
         self, context: CollaborativeReasoningContext
     ) -> list[PersonaPerspective]:
         """Generate individual perspectives from each persona"""
-        perspectives = []
-
-        # Simulate processing delay
-        await asyncio.sleep(0.1)
-
-        for persona in context.personas:
-            perspective = await self._simulate_persona_reasoning(persona, context)
-            perspectives.append(perspective)
+        # Personas reason independently of each other
+        perspectives = list(await asyncio.gather(*(
+            self._simulate_persona_reasoning(persona, context)
+            for persona in context.personas
+        )))
 
         # Add devil's advocate if enabled
         if context.include_devil_advocate:
@@ -150,6 +179,7 @@ class CollaborativeReasoningAnalyzer:
             reasoning_path=reasoning_path
         )
 
+    @timed_phase
     async def _facilitate_dialogue(
         self,
         context: CollaborativeReasoningContext,
@@ -157,39 +187,42 @@ class CollaborativeReasoningAnalyzer:
     ) -> list[CollaborativeDialogue]:
         """Facilitate dialogue between personas"""
         dialogues = []
-
-        # Simulate processing delay
-        await asyncio.sleep(0.1)
+        tracker = ConsensusTracker()
+        participants = [p.persona_name for p in perspectives]
+        consensus_points: list[str] = []
+        disagreements: list[str] = []
+        resolution_attempts: list[str] = []
 
         for round_num in range(context.max_dialogue_rounds):
-            # Create dialogue for this round
+            # All personas speak concurrently within a round
+            messages = await self._generate_round_messages(context, perspectives, round_num)
+            timestamp = datetime.now().isoformat()
+
+            # Only perspectives that changed since last round are re-evaluated
+            changed = tracker.update(perspectives)
+            if changed:
+                consensus_points = self._identify_consensus_points(tracker)
+                disagreements = self._identify_disagreements(tracker)
+                resolution_attempts = self._generate_resolution_attempts(disagreements)
+
             dialogue = CollaborativeDialogue(
-                participants=[p.persona_name for p in perspectives],
+                participants=participants,
                 topic=f"Round {round_num + 1}: {context.reasoning_focus}",
-                exchanges=[],
-                consensus_points=[],
-                disagreements=[],
-                resolution_attempts=[],
+                exchanges=[
+                    {
+                        "speaker": perspective.persona_name,
+                        "message": message,
+                        "timestamp": timestamp,
+                        "response_to": None
+                    }
+                    for perspective, message in zip(perspectives, messages)
+                ],
+                consensus_points=list(consensus_points),
+                disagreements=list(disagreements),
+                resolution_attempts=list(resolution_attempts),
                 duration_minutes=2.0  # Simulated duration
             )
 
-            # Simulate exchanges
-            for perspective in perspectives:
-                exchange = {
-                    "speaker": perspective.persona_name,
-                    "message": self._generate_dialogue_message(perspective, round_num),
-                    "timestamp": datetime.now().isoformat(),
-                    "response_to": None
-                }
-                dialogue.exchanges.append(exchange)
-
-            # Identify consensus points and disagreements
-            dialogue.consensus_points = self._identify_consensus_points(perspectives)
-            dialogue.disagreements = self._identify_disagreements(perspectives)
-            dialogue.resolution_attempts = self._generate_resolution_attempts(
-                dialogue.disagreements
-            )
-
             # Set outcome
             if len(dialogue.consensus_points) > len(dialogue.disagreements):
                 dialogue.outcome = "Productive dialogue with emerging consensus"
@@ -199,11 +232,46 @@ class CollaborativeReasoningAnalyzer:
             dialogues.append(dialogue)
 
             # Allow persona evolution if enabled
+            confidence_before = [p.confidence_level for p in perspectives]
             if context.allow_persona_evolution:
                 await self._evolve_perspectives(perspectives, dialogue)
 
+            # Stop once a round changes neither positions nor confidence
+            if context.stop_on_convergence and round_num > 0 and not changed:
+                max_shift = max(
+                    (abs(p.confidence_level - before)
+                     for p, before in zip(perspectives, confidence_before)),
+                    default=0.0
+                )
+                if max_shift <= context.convergence_tolerance:
+                    break
+
         return dialogues
 
+    async def _generate_round_messages(
+        self,
+        context: CollaborativeReasoningContext,
+        perspectives: list[PersonaPerspective],
+        round_num: int
+    ) -> list[str]:
+        """Generate one message per perspective for a dialogue round"""
+        if self.dialogue_backend is not None:
+            messages = await self.dialogue_backend.generate_round_messages(
+                perspectives, round_num, context
+            )
+            if len(messages) != len(perspectives):
+                raise ValueError(
+                    f"Dialogue backend returned {len(messages)} messages "
+                    f"for {len(perspectives)} perspectives"
+                )
+            return list(messages)
+
+        async def speak(perspective: PersonaPerspective) -> str:
+            return self._generate_dialogue_message(perspective, round_num)
+
+        return list(await asyncio.gather(*(speak(p) for p in perspectives)))
+
+    @timed_phase
     async def _build_consensus(
         self,
         context: CollaborativeReasoningContext,
@@ -361,6 +429,7 @@ class CollaborativeReasoningAnalyzer:
             confidence_in_consensus=avg_confidence
         )
 
+    @timed_phase
     async def _generate_insights(
         self,
         context: CollaborativeReasoningContext,
@@ -549,23 +618,18 @@ class CollaborativeReasoningAnalyzer:
         """Generate dialogue message for a perspective"""
         return f"Round {round_num + 1}: {perspective.viewpoint[:100]}..."
 
-    def _identify_consensus_points(
-        self, perspectives: list[PersonaPerspective]
-    ) -> list[str]:
+    def _identify_consensus_points(self, tracker: ConsensusTracker) -> list[str]:
         """Identify points of consensus among perspectives"""
         # Simple implementation - in practice would use NLP
         consensus_points = ["Need for clear problem definition"]
 
         # Check if majority share concerns
-        all_concerns = [concern for p in perspectives for concern in p.concerns]
-        if all_concerns:
+        if tracker.concern_counts:
             consensus_points.append("Shared concern for outcome quality")
 
         return consensus_points[:3]
 
-    def _identify_disagreements(
-        self, perspectives: list[PersonaPerspective]
-    ) -> list[str]:
+    def _identify_disagreements(self, tracker: ConsensusTracker) -> list[str]:
         """Identify disagreements among perspectives"""
         return [
             "Different priority rankings",
@@ -578,15 +642,20 @@ class CollaborativeReasoningAnalyzer:
         return [f"Attempt to resolve: {d}" for d in disagreements[:2]]
 
     # Metric calculation methods
+    @timed_phase
     def _calculate_diversity_score(self, perspectives: list[PersonaPerspective]) -> float:
         """Calculate diversity score of perspectives"""
         if len(perspectives) <= 1:
             return 0.0
 
         # Calculate based on viewpoint uniqueness
-        unique_viewpoints = len(set(p.viewpoint[:50] for p in perspectives))
+        unique_viewpoints = len(cluster_texts(
+            [p.viewpoint for p in perspectives],
+            threshold=NEAR_DUPLICATE_THRESHOLD
+        ))
         return min(1.0, unique_viewpoints / len(perspectives))
 
+    @timed_phase
     def _calculate_collaboration_quality(
         self,
         dialogues: list[CollaborativeDialogue],
@@ -610,6 +679,7 @@ class CollaborativeReasoningAnalyzer:
 
         return (dialogue_quality + consensus_quality) / 2.0
 
+    @timed_phase
     def _assess_stakeholder_buy_in(
         self,
         perspectives: list[PersonaPerspective],
@@ -641,18 +711,13 @@ class CollaborativeReasoningAnalyzer:
         self, perspectives: list[PersonaPerspective]
     ) -> list[list[PersonaPerspective]]:
         """Group similar perspectives together"""
-        # Simple grouping by confidence level
-        high_confidence = [p for p in perspectives if p.confidence_level >= 0.7]
-        medium_confidence = [p for p in perspectives if 0.4 <= p.confidence_level < 0.7]
-        low_confidence = [p for p in perspectives if p.confidence_level < 0.4]
-
-        groups = []
-        if high_confidence:
-            groups.append(high_confidence)
-        if medium_confidence:
-            groups.append(medium_confidence)
-        if low_confidence:
-            groups.append(low_confidence)
+        # Cluster on what each persona says and worries about
+        clusters = cluster_texts([
+            " ".join([p.viewpoint, *p.concerns, *p.suggestions])
+            for p in perspectives
+        ])
+
+        groups = [[perspectives[i] for i in cluster] for cluster in clusters]
 
         return groups if groups else [[]]
 
@@ -670,14 +735,8 @@ class CollaborativeReasoningAnalyzer:
         if not perspectives:
             return []
 
-        # Simple implementation - find common concerns
-        common_elements = []
-
-        # Check first perspective's concerns against others
-        if perspectives[0].concerns:
-            for concern in perspectives[0].concerns:
-                if all(concern in p.concerns for p in perspectives[1:]):
-                    common_elements.append(concern)
+        # Concerns of the first perspective echoed by every other perspective
+        common_elements = shared_elements([p.concerns for p in perspectives])
 
         # Add default common elements
         common_elements.extend([
@@ -0,0 +1,72 @@
+"""
+Collaborative Dialogue Engine Support
+
+Pluggable message generation and incremental consensus tracking used by
+the round-based dialogue in CollaborativeReasoningAnalyzer.
+"""
+
+from collections import Counter
+from typing import Protocol
+
+from .models import CollaborativeReasoningContext, PersonaPerspective
+
+
+class DialogueBackend(Protocol):
+    """Pluggable message generator serving every persona in one call per round"""
+
+    async def generate_round_messages(
+        self,
+        perspectives: list[PersonaPerspective],
+        round_num: int,
+        context: CollaborativeReasoningContext
+    ) -> list[str]:
+        """Return one message per perspective, in the same order"""
+        ...
+
+
+class ConsensusTracker:
+    """
+    Incrementally maintained consensus inputs across dialogue rounds.
+
+    Each perspective is fingerprinted by its concerns and objections; on
+    update only perspectives whose fingerprint changed are re-counted.
+    """
+
+    def __init__(self) -> None:
+        self._fingerprints: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {}
+        self.concern_counts: Counter[str] = Counter()
+        self.objection_counts: Counter[str] = Counter()
+
+    @property
+    def participant_count(self) -> int:
+        """Number of perspectives currently tracked"""
+        return len(self._fingerprints)
+
+    def update(self, perspectives: list[PersonaPerspective]) -> bool:
+        """
+        Re-evaluate changed perspectives.
+
+        Returns:
+            True if any perspective's concerns or objections changed
+        """
+        changed = False
+
+        for perspective in perspectives:
+            fingerprint = (tuple(perspective.concerns), tuple(perspective.objections))
+            previous = self._fingerprints.get(perspective.persona_name)
+            if previous == fingerprint:
+                continue
+
+            if previous is not None:
+                self.concern_counts.subtract(previous[0])
+                self.objection_counts.subtract(previous[1])
+            self.concern_counts.update(fingerprint[0])
+            self.objection_counts.update(fingerprint[1])
+            self._fingerprints[perspective.persona_name] = fingerprint
+            changed = True
+
+        if changed:
+            self.concern_counts = +self.concern_counts
+            self.objection_counts = +self.objection_counts
+
+        return changed
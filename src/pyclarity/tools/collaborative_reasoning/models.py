@@ -379,6 +379,18 @@ class CollaborativeReasoningContext(BaseModel):
         description="Allow personas to change their views"
     )
 
+    stop_on_convergence: bool = Field(
+        default=True,
+        description="End dialogue early once a round no longer changes positions"
+    )
+
+    convergence_tolerance: float = Field(
+        default=0.01,
+        ge=0.0,
+        le=1.0,
+        description="Largest confidence shift per round still treated as converged"
+    )
+
     conflict_resolution_enabled: bool = Field(
         default=True,
         description="Enable conflict resolution mechanisms"
@@ -6,6 +6,7 @@ debugging strategy selection, and root cause analysis frameworks.
 """
 
 from .analyzer import DebuggingApproachesAnalyzer
+from .logs import LogScanner, scan_logs
 from .models import (
     # Enums
     ComplexityLevel,
@@ -22,6 +23,8 @@ from .models import (
     DebuggingStrategy,
     ErrorCategory,
     ErrorClassification,
+    LogCluster,
+    LogDigest,
     RootCauseAnalysis,
     Severity,
 )
@@ -41,9 +44,14 @@ __all__ = [
     "RootCauseAnalysis",
     "DebuggingSession",
     "DebuggingRecommendation",
+    "LogCluster",
+    "LogDigest",
     # Main models
     "DebuggingApproachesContext",
     "DebuggingApproachesResult",
     # Main class
     "DebuggingApproachesAnalyzer",
+    # Log ingestion
+    "LogScanner",
+    "scan_logs",
 ]
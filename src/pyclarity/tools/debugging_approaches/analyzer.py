@@ -9,8 +9,14 @@ debugging strategy selection, and root cause analysis frameworks.
 import asyncio
 import time
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..base import BaseCognitiveAnalyzer, timed_phase
+from ..catalogs import CatalogView, load_catalog
+from ..keywords import KeywordClassifier
+from .logs import scan_logs
 from .models import (
     DebugContext,
     DebuggingApproachesContext,
@@ -23,18 +29,92 @@ from .models import (
     DebuggingStrategy,
     ErrorCategory,
     ErrorClassification,
+    LogDigest,
     RootCauseAnalysis,
     Severity,
 )
 
-
-class DebuggingApproachesAnalyzer:
+STRATEGY_CATALOG_PATH = Path(__file__).with_name("strategies.json")
+
+# Occurrences of the top log cluster at which the error counts as frequent / constant
+FREQUENT_LOG_EVENTS = 10
+CONSTANT_LOG_EVENTS = 100
+
+FREQUENCY_ORDER = ["rare", "occasional", "frequent", "constant"]
+
+# Indicator keywords per error category; the first category with a hit wins
+ERROR_CATEGORY_KEYWORDS = KeywordClassifier({
+    ErrorCategory.SYNTAX_ERROR: ["syntax", "parse", "compilation", "compiler error"],
+    ErrorCategory.RUNTIME_ERROR: ["null pointer", "segmentation fault", "access violation", "crash", "exception"],
+    ErrorCategory.PERFORMANCE_ERROR: ["performance", "slow", "timeout", "latency", "bottleneck"],
+    ErrorCategory.MEMORY_ERROR: ["memory", "heap", "stack overflow", "out of memory", "leak"],
+    ErrorCategory.CONCURRENCY_ERROR: ["deadlock", "race condition", "concurrent", "thread", "synchronization"],
+    ErrorCategory.CONFIGURATION_ERROR: ["config", "configuration", "setting", "property", "environment"],
+    ErrorCategory.INTEGRATION_ERROR: ["integration", "api", "service", "connection", "network"],
+    ErrorCategory.USER_INPUT_ERROR: ["user input", "validation", "form", "input error"],
+    ErrorCategory.ENVIRONMENT_ERROR: ["environment", "deployment", "system", "platform"],
+})
+
+REPRODUCIBILITY_KEYWORDS = KeywordClassifier({
+    "always": ["always", "every time", "consistently", "reproducible"],
+    "sometimes": ["sometimes", "intermittent", "occasionally", "sporadic"],
+    "never": ["never", "cannot reproduce", "one time", "random"],
+})
+
+FREQUENCY_KEYWORDS = KeywordClassifier({
+    "constant": ["constant", "continuous", "always", "every time"],
+    "frequent": ["frequent", "often", "regular", "common"],
+    "occasional": ["occasional", "sometimes", "sporadic", "intermittent"],
+})
+
+COMPONENT_KEYWORDS = KeywordClassifier({
+    "database": ["database", "sql", "query", "table", "db"],
+    "user_interface": ["ui", "interface", "frontend", "view", "form", "screen"],
+    "backend_service": ["api", "service", "backend", "server", "endpoint"],
+    "network": ["network", "connection", "http", "tcp", "socket"],
+    "authentication": ["auth", "login", "security", "token", "session"],
+    "file_system": ["file", "disk", "storage", "path", "directory"],
+    "memory": ["memory", "ram", "heap", "stack", "cache"],
+    "configuration": ["config", "settings", "properties", "environment"],
+})
+
+
+def _decode_strategy_profile(profile: dict[str, Any]) -> dict[str, Any]:
+    profile["error_categories"] = [ErrorCategory(c) for c in profile["error_categories"]]
+    return profile
+
+
+@lru_cache(maxsize=1)
+def strategy_profile_catalog() -> CatalogView[DebuggingStrategy, dict[str, Any]]:
+    """Debugging strategy profiles, shared by every analyzer in the process."""
+    return CatalogView(
+        load_catalog(STRATEGY_CATALOG_PATH), DebuggingStrategy, _decode_strategy_profile
+    )
+
+
+class DebuggingApproachesAnalyzer(BaseCognitiveAnalyzer):
     """Debugging approaches cognitive tool analyzer"""
 
+    # The error classification and strategy recommendations are always
+    # computed; the remaining result sections run only when requested
+    phase_dependencies = {
+        "debugging_session": (),
+        "root_cause_analysis": (),
+        "prevention_measures": ("root_cause_analysis",),
+        "debugging_roadmap": (),
+        "risk_assessment": (),
+        "tool_recommendations": (),
+        "best_practices": (),
+        "learning_opportunities": (),
+    }
+
     def __init__(self):
         """Initialize the debugging approaches analyzer"""
-        self.tool_name = "Debugging Approaches"
-        self.version = "1.0.0"
+        super().__init__(
+            tool_name="Debugging Approaches",
+            tool_description="Recommends debugging strategies for an observed error",
+            version="1.0.0"
+        )
 
         # Internal state for processing
         self._processing_start_time = 0.0
@@ -44,127 +124,7 @@ class DebuggingApproachesAnalyzer:
 
     def _initialize_strategy_profiles(self):
         """Initialize profiles for different debugging strategies"""
-        self.strategy_profiles = {
-            DebuggingStrategy.PRINT_DEBUGGING: {
-                "description": "Adding print statements to trace program execution",
-                "best_for": ["Simple logic errors", "Value tracking", "Flow verification"],
-                "effectiveness": 0.7,
-                "time_cost": "low",
-                "tool_requirements": ["text editor", "console output"],
-                "limitations": ["Code pollution", "Performance impact", "Not suitable for production"],
-                "error_categories": [ErrorCategory.LOGIC_ERROR, ErrorCategory.RUNTIME_ERROR]
-            },
-
-            DebuggingStrategy.INTERACTIVE_DEBUGGING: {
-                "description": "Using debugger to step through code execution",
-                "best_for": ["Complex logic errors", "State inspection", "Runtime behavior"],
-                "effectiveness": 0.9,
-                "time_cost": "medium",
-                "tool_requirements": ["debugger", "IDE", "symbol information"],
-                "limitations": ["Setup overhead", "Tool dependency", "May alter timing"],
-                "error_categories": [ErrorCategory.LOGIC_ERROR, ErrorCategory.RUNTIME_ERROR, ErrorCategory.MEMORY_ERROR]
-            },
-
-            DebuggingStrategy.LOG_ANALYSIS: {
-                "description": "Analyzing application logs to identify issues",
-                "best_for": ["Production issues", "Historical analysis", "Pattern identification"],
-                "effectiveness": 0.75,
-                "time_cost": "low",
-                "tool_requirements": ["log viewer", "grep/search tools", "log aggregation"],
-                "limitations": ["Depends on log quality", "May miss context", "Large data volumes"],
-                "error_categories": [ErrorCategory.INTEGRATION_ERROR, ErrorCategory.CONFIGURATION_ERROR, ErrorCategory.PERFORMANCE_ERROR]
-            },
-
-            DebuggingStrategy.BINARY_SEARCH: {
-                "description": "Systematically narrowing down error location",
-                "best_for": ["Large codebases", "Integration errors", "Regression bugs"],
-                "effectiveness": 0.8,
-                "time_cost": "medium",
-                "tool_requirements": ["version control", "build system"],
-                "limitations": ["Requires reproducible error", "May be time-intensive"],
-                "error_categories": [ErrorCategory.INTEGRATION_ERROR, ErrorCategory.LOGIC_ERROR]
-            },
-
-            DebuggingStrategy.RUBBER_DUCK: {
-                "description": "Explaining the problem aloud to identify solutions",
-                "best_for": ["Logic errors", "Design issues", "Conceptual problems"],
-                "effectiveness": 0.6,
-                "time_cost": "low",
-                "tool_requirements": ["none"],
-                "limitations": ["Depends on explanation skills", "May not work for complex issues"],
-                "error_categories": [ErrorCategory.LOGIC_ERROR, ErrorCategory.SYNTAX_ERROR]
-            },
-
-            DebuggingStrategy.UNIT_TESTING: {
-                "description": "Creating targeted tests to isolate problems",
-                "best_for": ["Logic errors", "Regression prevention", "Component validation"],
-                "effectiveness": 0.85,
-                "time_cost": "medium",
-                "tool_requirements": ["testing framework", "test runner"],
-                "limitations": ["Requires test writing skills", "Initial setup time"],
-                "error_categories": [ErrorCategory.LOGIC_ERROR, ErrorCategory.RUNTIME_ERROR]
-            },
-
-            DebuggingStrategy.INTEGRATION_TESTING: {
-                "description": "Testing interactions between system components",
-                "best_for": ["Integration errors", "API issues", "System-level problems"],
-                "effectiveness": 0.8,
-                "time_cost": "high",
-                "tool_requirements": ["test environment", "integration tools", "monitoring"],
-                "limitations": ["Complex setup", "Environment dependencies", "Time intensive"],
-                "error_categories": [ErrorCategory.INTEGRATION_ERROR, ErrorCategory.CONFIGURATION_ERROR]
-            },
-
-            DebuggingStrategy.PROFILING: {
-                "description": "Analyzing performance characteristics and resource usage",
-                "best_for": ["Performance issues", "Memory problems", "Resource bottlenecks"],
-                "effectiveness": 0.9,
-                "time_cost": "medium",
-                "tool_requirements": ["profiler", "performance tools", "monitoring"],
-                "limitations": ["Tool overhead", "May alter behavior", "Complex analysis"],
-                "error_categories": [ErrorCategory.PERFORMANCE_ERROR, ErrorCategory.MEMORY_ERROR]
-            },
-
-            DebuggingStrategy.STATIC_ANALYSIS: {
-                "description": "Analyzing code without executing it",
-                "best_for": ["Code quality", "Potential bugs", "Security issues"],
-                "effectiveness": 0.7,
-                "time_cost": "low",
-                "tool_requirements": ["static analysis tools", "linters", "code scanners"],
-                "limitations": ["False positives", "Limited runtime context", "Tool configuration"],
-                "error_categories": [ErrorCategory.SYNTAX_ERROR, ErrorCategory.LOGIC_ERROR, ErrorCategory.MEMORY_ERROR]
-            },
-
-            DebuggingStrategy.CODE_REVIEW: {
-                "description": "Systematic examination of code by peers",
-                "best_for": ["Code quality", "Logic errors", "Best practices"],
-                "effectiveness": 0.75,
-                "time_cost": "medium",
-                "tool_requirements": ["code review tools", "team collaboration"],
-                "limitations": ["Requires team expertise", "Time coordinating", "Subjective"],
-                "error_categories": [ErrorCategory.LOGIC_ERROR, ErrorCategory.SYNTAX_ERROR]
-            },
-
-            DebuggingStrategy.DIVIDE_AND_CONQUER: {
-                "description": "Breaking down complex problems into smaller parts",
-                "best_for": ["Complex systems", "Multiple symptoms", "System-wide issues"],
-                "effectiveness": 0.8,
-                "time_cost": "medium",
-                "tool_requirements": ["modular architecture", "isolation capabilities"],
-                "limitations": ["Requires good system design", "May miss interactions"],
-                "error_categories": [ErrorCategory.INTEGRATION_ERROR, ErrorCategory.LOGIC_ERROR, ErrorCategory.PERFORMANCE_ERROR]
-            },
-
-            DebuggingStrategy.HYPOTHESIS_TESTING: {
-                "description": "Forming and testing specific hypotheses about the problem",
-                "best_for": ["Complex issues", "Multiple possible causes", "Scientific approach"],
-                "effectiveness": 0.85,
-                "time_cost": "medium",
-                "tool_requirements": ["testing capabilities", "measurement tools"],
-                "limitations": ["Requires hypothesis formation skills", "Time intensive"],
-                "error_categories": [ErrorCategory.LOGIC_ERROR, ErrorCategory.PERFORMANCE_ERROR, ErrorCategory.INTEGRATION_ERROR]
-            }
-        }
+        self.strategy_profiles = strategy_profile_catalog()
 
     async def analyze(self, context: DebuggingApproachesContext) -> DebuggingApproachesResult:
         """
@@ -178,52 +138,67 @@ class DebuggingApproachesAnalyzer:
         """
         self._processing_start_time = time.time()
 
+        # Phase 0: Digest attached logs in a worker thread
+        log_digest = None
+        if context.log_paths:
+            log_digest = await asyncio.to_thread(
+                scan_logs, context.log_paths, context.max_log_clusters
+            )
+
         # Phase 1: Classify the error
-        error_classification = await self._classify_error(context)
+        error_classification = await self._classify_error(context, log_digest)
 
         # Phase 2: Generate debugging recommendations
         debugging_recommendations = await self._generate_debugging_recommendations(
             error_classification, context
         )
 
+        sections: dict[str, Any] = {}
+
         # Phase 3: Create debugging session structure
-        debugging_session = await self._create_debugging_session(
-            error_classification, context
-        )
+        if self.needs_phase("debugging_session"):
+            sections["debugging_session"] = await self._create_debugging_session(
+                error_classification, context, log_digest
+            )
 
         # Phase 4: Root cause analysis (if enabled)
         root_cause_analysis = None
-        if context.include_root_cause_analysis:
+        if context.include_root_cause_analysis and self.needs_phase("root_cause_analysis"):
             root_cause_analysis = await self._perform_root_cause_analysis(
-                context.problem_description, context.error_symptoms
+                context.problem_description, error_classification.symptoms
             )
+        sections["root_cause_analysis"] = root_cause_analysis
 
         # Phase 5: Generate debugging roadmap
-        debugging_roadmap = self._generate_debugging_roadmap(
-            error_classification, debugging_recommendations
-        )
+        if self.needs_phase("debugging_roadmap"):
+            sections["debugging_roadmap"] = self._generate_debugging_roadmap(
+                error_classification, debugging_recommendations
+            )
 
         # Phase 6: Generate prevention measures (if enabled)
-        prevention_measures = []
-        if context.include_prevention_measures:
-            prevention_measures = self._generate_prevention_measures(
+        if context.include_prevention_measures and self.needs_phase("prevention_measures"):
+            sections["prevention_measures"] = self._generate_prevention_measures(
                 error_classification, root_cause_analysis
             )
 
         # Phase 7: Generate additional recommendations
-        risk_assessment = self._generate_risk_assessment(
-            error_classification, debugging_recommendations
-        )
+        if self.needs_phase("risk_assessment"):
+            sections["risk_assessment"] = self._generate_risk_assessment(
+                error_classification, debugging_recommendations
+            )
 
-        tool_recommendations = self._generate_tool_recommendations(
-            debugging_recommendations, context.available_tools
-        )
+        if self.needs_phase("tool_recommendations"):
+            sections["tool_recommendations"] = self._generate_tool_recommendations(
+                debugging_recommendations, context.available_tools
+            )
 
-        best_practices = self._generate_best_practices(error_classification)
+        if self.needs_phase("best_practices"):
+            sections["best_practices"] = self._generate_best_practices(error_classification)
 
-        learning_opportunities = self._generate_learning_opportunities(
-            error_classification, debugging_recommendations
-        )
+        if self.needs_phase("learning_opportunities"):
+            sections["learning_opportunities"] = self._generate_learning_opportunities(
+                error_classification, debugging_recommendations
+            )
 
         # Calculate processing time
         processing_time = time.time() - self._processing_start_time
@@ -231,31 +206,34 @@ class DebuggingApproachesAnalyzer:
         return DebuggingApproachesResult(
             error_classification=error_classification,
             debugging_recommendations=debugging_recommendations[:context.max_strategy_recommendations],
-            debugging_session=debugging_session,
-            root_cause_analysis=root_cause_analysis,
+            log_digest=log_digest,
             top_recommended_strategy=debugging_recommendations[0].recommended_strategy.value if debugging_recommendations else None,
             strategy_effectiveness_scores={
                 rec.recommended_strategy.value: rec.expected_effectiveness
                 for rec in debugging_recommendations
             },
-            debugging_roadmap=debugging_roadmap,
-            prevention_measures=prevention_measures,
-            risk_assessment=risk_assessment,
-            tool_recommendations=tool_recommendations,
-            best_practices=best_practices,
-            learning_opportunities=learning_opportunities,
-            processing_time_ms=round(processing_time * 1000)
+            processing_time_ms=round(processing_time * 1000),
+            **{name: value for name, value in sections.items() if value is not None}
         )
 
-    async def _classify_error(self, context: DebuggingApproachesContext) -> ErrorClassification:
-        """Classify the error based on context information"""
+    @timed_phase
+    async def _classify_error(
+        self,
+        context: DebuggingApproachesContext,
+        log_digest: LogDigest | None = None
+    ) -> ErrorClassification:
+        """Classify the error based on context information and ingested logs"""
         # Simulate processing delay
         await asyncio.sleep(0.05)
 
+        # The most frequent log clusters count as symptoms
+        clusters = log_digest.clusters if log_digest else []
+        symptoms = (context.error_symptoms + [c.summary() for c in clusters])[:10]
+
         # Determine error category
         category = self._determine_error_category(
             context.problem_description,
-            context.error_symptoms,
+            symptoms,
             context.environment_details
         )
 
@@ -263,28 +241,34 @@ class DebuggingApproachesAnalyzer:
         severity = context.impact_level
 
         # Generate potential causes
-        potential_causes = self._generate_potential_causes(category, context.error_symptoms)
+        potential_causes = self._generate_potential_causes(category, symptoms)
 
         # Assess reproducibility and frequency
-        reproducibility = self._assess_reproducibility(context.error_symptoms, context.reproduction_steps)
+        reproducibility = self._assess_reproducibility(symptoms, context.reproduction_steps)
         frequency = self._assess_frequency(context.error_symptoms)
+        if clusters:
+            frequency = max(
+                frequency, self._assess_log_frequency(clusters[0].count), key=FREQUENCY_ORDER.index
+            )
 
         # Identify affected components
         affected_components = self._identify_affected_components(
-            context.problem_description, context.system_context
+            " ".join([context.problem_description, *(f for c in clusters for f in c.frames[:3])]),
+            context.system_context
         )
 
+        top = clusters[0] if clusters else None
         return ErrorClassification(
             error_category=category,
             severity=severity,
-            error_message=None,  # Would be extracted from context if available
-            stack_trace=None,    # Would be extracted from context if available
-            symptoms=context.error_symptoms,
+            error_message=top.sample[:1000] if top else None,
+            stack_trace="\n".join(top.frames)[:5000] if top and top.frames else None,
+            symptoms=symptoms or ["No errors found in the attached logs"],
             potential_causes=potential_causes,
             affected_components=affected_components,
             frequency=frequency,
             reproducibility=reproducibility,
-            confidence_level=0.8  # Base confidence
+            confidence_level=0.9 if top else 0.8  # Logged evidence raises confidence
         )
 
     def _determine_error_category(
@@ -294,40 +278,10 @@ class DebuggingApproachesAnalyzer:
         environment: dict[str, str]
     ) -> ErrorCategory:
         """Determine the category of error based on available information"""
-        description_lower = description.lower()
-        symptoms_text = " ".join(symptoms).lower()
-        combined_text = f"{description_lower} {symptoms_text}"
-
-        # Check for specific error patterns
-        if any(word in combined_text for word in ["syntax", "parse", "compilation", "compiler error"]):
-            return ErrorCategory.SYNTAX_ERROR
-
-        if any(word in combined_text for word in ["null pointer", "segmentation fault", "access violation", "crash", "exception"]):
-            return ErrorCategory.RUNTIME_ERROR
-
-        if any(word in combined_text for word in ["performance", "slow", "timeout", "latency", "bottleneck"]):
-            return ErrorCategory.PERFORMANCE_ERROR
-
-        if any(word in combined_text for word in ["memory", "heap", "stack overflow", "out of memory", "leak"]):
-            return ErrorCategory.MEMORY_ERROR
-
-        if any(word in combined_text for word in ["deadlock", "race condition", "concurrent", "thread", "synchronization"]):
-            return ErrorCategory.CONCURRENCY_ERROR
-
-        if any(word in combined_text for word in ["config", "configuration", "setting", "property", "environment"]):
-            return ErrorCategory.CONFIGURATION_ERROR
-
-        if any(word in combined_text for word in ["integration", "api", "service", "connection", "network"]):
-            return ErrorCategory.INTEGRATION_ERROR
-
-        if any(word in combined_text for word in ["user input", "validation", "form", "input error"]):
-            return ErrorCategory.USER_INPUT_ERROR
-
-        if any(word in combined_text for word in ["environment", "deployment", "system", "platform"]):
-            return ErrorCategory.ENVIRONMENT_ERROR
+        combined_text = " ".join([description, *symptoms])
 
         # Default to logic error if no specific pattern matches
-        return ErrorCategory.LOGIC_ERROR
+        return ERROR_CATEGORY_KEYWORDS.classify(combined_text, ErrorCategory.LOGIC_ERROR)
 
     def _generate_potential_causes(self, category: ErrorCategory, symptoms: list[str]) -> list[str]:
         """Generate potential causes based on error category and symptoms"""
@@ -407,16 +361,9 @@ class DebuggingApproachesAnalyzer:
 
     def _assess_reproducibility(self, symptoms: list[str], reproduction_steps: list[str]) -> str:
         """Assess how reproducible the error is"""
-        symptoms_text = " ".join(symptoms).lower()
-        steps_text = " ".join(reproduction_steps).lower()
-        combined_text = f"{symptoms_text} {steps_text}"
-
-        if any(word in combined_text for word in ["always", "every time", "consistently", "reproducible"]):
-            return "always"
-        elif any(word in combined_text for word in ["sometimes", "intermittent", "occasionally", "sporadic"]):
-            return "sometimes"
-        elif any(word in combined_text for word in ["never", "cannot reproduce", "one time", "random"]):
-            return "never"
+        stated = REPRODUCIBILITY_KEYWORDS.classify(" ".join([*symptoms, *reproduction_steps]))
+        if stated:
+            return stated
         elif reproduction_steps:
             return "always"  # If steps are provided, assume reproducible
         else:
@@ -424,40 +371,22 @@ class DebuggingApproachesAnalyzer:
 
     def _assess_frequency(self, symptoms: list[str]) -> str:
         """Assess how frequently the error occurs"""
-        symptoms_text = " ".join(symptoms).lower()
+        return FREQUENCY_KEYWORDS.classify(" ".join(symptoms), "rare")
 
-        if any(word in symptoms_text for word in ["constant", "continuous", "always", "every time"]):
+    def _assess_log_frequency(self, occurrences: int) -> str:
+        """Assess frequency from the occurrences of the top log cluster"""
+        if occurrences >= CONSTANT_LOG_EVENTS:
             return "constant"
-        elif any(word in symptoms_text for word in ["frequent", "often", "regular", "common"]):
+        if occurrences >= FREQUENT_LOG_EVENTS:
             return "frequent"
-        elif any(word in symptoms_text for word in ["occasional", "sometimes", "sporadic", "intermittent"]):
-            return "occasional"
-        else:
-            return "rare"
+        return "occasional" if occurrences > 1 else "rare"
 
     def _identify_affected_components(self, description: str, system_context: str) -> list[str]:
         """Identify which components are affected by the error"""
-        components = []
-        text = f"{description} {system_context}".lower()
-
-        # Common component patterns
-        component_keywords = {
-            "database": ["database", "sql", "query", "table", "db"],
-            "user_interface": ["ui", "interface", "frontend", "view", "form", "screen"],
-            "backend_service": ["api", "service", "backend", "server", "endpoint"],
-            "network": ["network", "connection", "http", "tcp", "socket"],
-            "authentication": ["auth", "login", "security", "token", "session"],
-            "file_system": ["file", "disk", "storage", "path", "directory"],
-            "memory": ["memory", "ram", "heap", "stack", "cache"],
-            "configuration": ["config", "settings", "properties", "environment"]
-        }
-
-        for component, keywords in component_keywords.items():
-            if any(keyword in text for keyword in keywords):
-                components.append(component)
-
+        components = COMPONENT_KEYWORDS.scan(f"{description} {system_context}").matched()
         return components if components else ["unknown"]
 
+    @timed_phase
     async def _generate_debugging_recommendations(
         self,
         error_classification: ErrorClassification,
@@ -629,10 +558,12 @@ class DebuggingApproachesAnalyzer:
 
         return alternatives_map.get(strategy, [])
 
+    @timed_phase
     async def _create_debugging_session(
         self,
         error_classification: ErrorClassification,
-        context: DebuggingApproachesContext
+        context: DebuggingApproachesContext,
+        log_digest: LogDigest | None = None
     ) -> DebuggingSession:
         """Create a structured debugging session"""
         # Simulate processing delay
@@ -642,7 +573,7 @@ class DebuggingApproachesAnalyzer:
         debug_context = DebugContext(
             system_description=context.system_context,
             environment=context.environment_details,
-            error_symptoms=context.error_symptoms,
+            error_symptoms=error_classification.symptoms,
             reproduction_steps=context.reproduction_steps,
             constraints=context.available_tools,
             available_tools=context.available_tools,
@@ -650,8 +581,10 @@ class DebuggingApproachesAnalyzer:
             impact_assessment=f"Impact level: {context.impact_level.value}"
         )
 
-        # Generate initial hypotheses
+        # Generate initial hypotheses, led by the most frequent logged failures
         hypotheses = self._generate_initial_hypotheses(error_classification)
+        if log_digest:
+            hypotheses = (self._generate_log_hypotheses(log_digest) + hypotheses)[:10]
 
         # Create debugging steps
         debugging_steps = self._create_debugging_steps(error_classification, context)
@@ -695,6 +628,38 @@ class DebuggingApproachesAnalyzer:
 
         return hypotheses
 
+    def _generate_log_hypotheses(self, log_digest: LogDigest) -> list[DebuggingHypothesis]:
+        """Generate hypotheses from the most frequent log clusters"""
+        hypotheses = []
+
+        for cluster in log_digest.clusters[:3]:
+            location = f" in {cluster.frames[0]}" if cluster.frames else ""
+            seen = f"between {cluster.first_seen} and {cluster.last_seen}" if cluster.first_seen else (
+                f"from {cluster.first_location} to {cluster.last_location}"
+            )
+            hypotheses.append(DebuggingHypothesis(
+                description=f"The recurring failure{location} causes the error: {cluster.signature}"[:500],
+                confidence_level=round(0.5 + 0.4 * cluster.share, 3),
+                supporting_evidence=[
+                    f"{cluster.count} occurrences ({cluster.share:.0%} of logged errors) {seen}",
+                    f"First occurrence at {cluster.first_location}",
+                    *cluster.frames[:3],
+                ],
+                contradicting_evidence=[],
+                test_plan=[
+                    f"Reproduce the failure logged at {cluster.first_location}",
+                    f"Inspect the code path{location or ' that logs it'}",
+                    "Check whether the failure stops after a candidate fix",
+                ],
+                estimated_effort="low" if cluster.frames else "medium",
+                risk_level="low",
+                alternative_hypotheses=[
+                    other.summary()[:200] for other in log_digest.clusters[:4] if other is not cluster
+                ][:3]
+            ))
+
+        return hypotheses
+
     def _create_debugging_steps(
         self,
         classification: ErrorClassification,
@@ -748,6 +713,7 @@ class DebuggingApproachesAnalyzer:
 
         return steps
 
+    @timed_phase
     async def _perform_root_cause_analysis(
         self,
         problem_statement: str,
@@ -796,6 +762,7 @@ class DebuggingApproachesAnalyzer:
             confidence_score=0.75
         )
 
+    @timed_phase
     def _generate_debugging_roadmap(
         self,
         classification: ErrorClassification,
@@ -833,6 +800,7 @@ class DebuggingApproachesAnalyzer:
 
         return roadmap
 
+    @timed_phase
     def _generate_prevention_measures(
         self,
         classification: ErrorClassification,
@@ -886,6 +854,7 @@ class DebuggingApproachesAnalyzer:
 
         return measures[:10]  # Limit to 10 measures
 
+    @timed_phase
     def _generate_risk_assessment(
         self,
         classification: ErrorClassification,
@@ -921,6 +890,7 @@ class DebuggingApproachesAnalyzer:
 
         return risks[:8]  # Limit to 8 risks
 
+    @timed_phase
     def _generate_tool_recommendations(
         self,
         recommendations: list[DebuggingRecommendation],
@@ -950,6 +920,7 @@ class DebuggingApproachesAnalyzer:
         tool_explanations.extend(general_tools)
         return tool_explanations[:10]
 
+    @timed_phase
     def _generate_best_practices(self, classification: ErrorClassification) -> list[str]:
         """Generate best practices based on error category"""
         general_practices = [
@@ -985,6 +956,7 @@ class DebuggingApproachesAnalyzer:
         practices = general_practices + category_practices.get(classification.error_category, [])
         return practices[:10]
 
+    @timed_phase
     def _generate_learning_opportunities(
         self,
         classification: ErrorClassification,
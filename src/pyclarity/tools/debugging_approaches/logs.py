@@ -0,0 +1,495 @@
+"""
+Log Ingestion
+
+Single-pass digest of log files and stack-trace dumps for debugging
+analysis. Files are memory-mapped and read line by line, so a multi-GB
+log costs one sequential scan and a fixed amount of memory.
+
+- Error lines are reduced to signatures by masking their variable parts
+  (numbers, addresses, quoted values, UUIDs), so 'timeout after 503ms'
+  and 'timeout after 1200ms' share a signature.
+- Stack traces (Python tracebacks and the 'at ...' frames of JVM, .NET
+  and JavaScript traces) are fingerprinted from their exception type and
+  innermost normalized frames, so one failure reached from different
+  requests or line numbers forms one cluster.
+- At most max_clusters clusters are tracked. When a new one arrives with
+  the table full, the least frequent cluster is replaced and its count
+  carried over (Space-Saving): every cluster seen more often than
+  events / max_clusters is kept, and a count overestimates by at most the
+  cluster's error bound.
+"""
+
+import hashlib
+import heapq
+import mmap
+import re
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+from .models import LogCluster, LogDigest
+
+DEFAULT_MAX_CLUSTERS = 256
+
+# Innermost frames that identify a stack trace
+FINGERPRINT_FRAMES = 8
+
+# Frames kept per trace and reported per cluster
+MAX_TRACE_FRAMES = 32
+
+# Longest line prefix that is parsed; the rest of a line is skipped
+MAX_LINE_BYTES = 4096
+
+MAX_SIGNATURE_CHARS = 240
+
+# Bytes searched backwards for the timestamp of a line that has none
+TIMESTAMP_LOOKBACK_BYTES = 4096
+
+COUNT_CHUNK_BYTES = 1 << 24
+
+_TIMESTAMP = re.compile(
+    r"\[?(\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?)"
+)
+_ERROR_LEVEL = re.compile(r"\b(?:ERROR|FATAL|CRITICAL|SEVERE|PANIC)\b|\bpanic:|Segmentation fault")
+_EXCEPTION_SUFFIX = re.compile(r"(?:Error|Exception|Fault|Failure|Panic)\b")
+# Literal cue of every line that can start an error or a trace
+_TRIGGER = re.compile(
+    rb"Error|Exception|Fault|Failure|Panic|ERROR|FATAL|CRITICAL|SEVERE|PANIC|panic:"
+    rb"|Segmentation fault|Traceback \(most recent call last\)"
+)
+_PY_TRACEBACK = "Traceback (most recent call last):"
+_PY_FRAME = re.compile(r'^\s+File "([^"]+)", line \d+, in (\S+)')
+_AT_FRAME = re.compile(r"^\s+at\s+(.+?)\s*$")
+_CAUSED_BY = re.compile(r"^(?:Caused by|During handling|The above exception)")
+_ELIDED_FRAMES = re.compile(r"^\s+\.\.\. \d+ (?:more|common frames omitted)")
+
+_MASKS = [
+    (re.compile(r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"), "<uuid>"),
+    (re.compile(r"\b0x[0-9a-fA-F]+\b"), "<hex>"),
+    (re.compile(r"\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b"), "<ip>"),
+    (re.compile(r"'[^']*'|\"[^\"]*\""), "<str>"),
+    (re.compile(r"\b[0-9a-fA-F]*\d[0-9a-fA-F]*\b"), "<n>"),
+    (re.compile(r"\d+"), "<n>"),
+    (re.compile(r"\s+"), " "),
+]
+_FRAME_POSITION = re.compile(r":(?:line )?\d+(?::\d+)?(?=\)?$)")
+_DOTNET_SOURCE = re.compile(r"\s+in\s+.+$")
+_FRAME_NUMBERS = re.compile(r"\d+")
+
+
+def mask_message(text: str) -> str:
+    """Signature of a message: its variable parts replaced by placeholders."""
+    for pattern, placeholder in _MASKS:
+        text = pattern.sub(placeholder, text)
+    return text.strip()[:MAX_SIGNATURE_CHARS]
+
+
+def find_exception(line: str) -> tuple[str, str] | None:
+    """
+    First exception type named in a line, with the message after it.
+
+    Matches dotted names such as 'java.io.IOException' or 'KeyError' whose
+    last part is capitalized and ends in Error, Exception, Fault, Failure
+    or Panic.
+    """
+    for match in _EXCEPTION_SUFFIX.finditer(line):
+        start = match.start()
+        while start and (line[start - 1].isalnum() or line[start - 1] in "_$."):
+            start -= 1
+        name = line[start:match.end()].strip(".")
+        last = name.rsplit(".", 1)[-1]
+        if last[:1].isupper() and len(last) > match.end() - match.start():
+            rest = line[match.end():]
+            return name, rest[1:].strip() if rest.startswith(":") else ""
+    return None
+
+
+@lru_cache(maxsize=4096)
+def normalize_frame(frame: str) -> str:
+    """Stable form of a stack frame, without line numbers or generated suffixes."""
+    frame = _DOTNET_SOURCE.sub("", frame.strip())
+    frame = _FRAME_POSITION.sub("", frame)
+    return _FRAME_NUMBERS.sub("N", frame)
+
+
+@lru_cache(maxsize=4096)
+def _python_frame(path: str, function: str) -> str:
+    module = Path(path).with_suffix("").parts[-2:]
+    return f"{'.'.join(module)}.{function}"
+
+
+def _fingerprint(*parts: str) -> str:
+    return hashlib.blake2b("\n".join(parts).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _decode(raw: bytes) -> str:
+    return raw.decode("utf-8", "replace").rstrip("\r\n")
+
+
+def _count_newlines(buffer: mmap.mmap, start: int, end: int) -> int:
+    """Newlines in buffer[start:end], counted a bounded chunk at a time."""
+    return sum(
+        buffer[i:min(i + COUNT_CHUNK_BYTES, end)].count(b"\n")
+        for i in range(start, end, COUNT_CHUNK_BYTES)
+    )
+
+
+def _last_timestamp(buffer: mmap.mmap, start: int) -> str | None:
+    """Timestamp of the nearest line before an offset that has one."""
+    window = buffer[max(0, start - TIMESTAMP_LOOKBACK_BYTES):start]
+    for raw in reversed(window.split(b"\n")):
+        match = _TIMESTAMP.match(raw[:64].decode("utf-8", "replace"))
+        if match:
+            return match.group(1)
+    return None
+
+
+@dataclass
+class _Cluster:
+    """Running statistics of one signature or stack-trace fingerprint."""
+
+    fingerprint: str
+    kind: str
+    exception_type: str | None
+    signature: str
+    frames: list[str]
+    sample: str
+    count: int
+    error_bound: int
+    first_source: str
+    first_line: int
+    last_source: str
+    last_line: int
+    first_seen: str | None
+    last_seen: str | None
+
+
+@dataclass
+class _Trace:
+    """A stack trace being read."""
+
+    line: int
+    timestamp: str | None
+    python: bool
+    exception_type: str | None = None
+    message: str = ""
+    frames: deque = field(default_factory=lambda: deque(maxlen=MAX_TRACE_FRAMES))
+
+
+class _SourceReader:
+    """Parsing state for one source, fed one line at a time."""
+
+    def __init__(self, scanner: "LogScanner", source: str) -> None:
+        self.scanner = scanner
+        self.source = source
+        self.timestamp: str | None = None
+        self.trace: _Trace | None = None
+        # Error line that may head a stack trace: (line number, text, timestamp)
+        self.pending: tuple[int, str, str | None] | None = None
+
+    @property
+    def active(self) -> bool:
+        """Whether the next line may continue a stack trace."""
+        return self.trace is not None or self.pending is not None
+
+    def line(self, number: int, line: str) -> None:
+        stamp = _TIMESTAMP.match(line)
+        if stamp:
+            self.timestamp = stamp.group(1)
+
+        if self.trace is not None and self._continue_trace(number, line):
+            return
+
+        if self.pending is not None:
+            start, text, timestamp = self.pending
+            self.pending = None
+            if _PY_TRACEBACK in line:
+                # The traceback explains the error line before it
+                self.trace = _Trace(line=start, timestamp=timestamp, python=True)
+                return
+            frame = _AT_FRAME.match(line)
+            exception = find_exception(text) if frame else None
+            if exception:
+                self.trace = _Trace(
+                    line=start,
+                    timestamp=timestamp,
+                    python=False,
+                    exception_type=exception[0],
+                    message=exception[1],
+                )
+                self.trace.frames.append(normalize_frame(frame.group(1)))
+                return
+            self.scanner._record_error(text, self.source, start, timestamp)
+
+        if _PY_TRACEBACK in line:
+            self.trace = _Trace(line=number, timestamp=self.timestamp, python=True)
+        elif _ERROR_LEVEL.search(line) or find_exception(line):
+            self.pending = (number, line, self.timestamp)
+
+    def _continue_trace(self, number: int, line: str) -> bool:
+        """Add a line to the open trace; False once the trace has ended before it."""
+        trace = self.trace
+        if trace.python:
+            frame = _PY_FRAME.match(line)
+            if frame:
+                trace.frames.append(_python_frame(*frame.groups()))
+            elif not line.startswith((" ", "\t")) and line.strip():
+                exception_type, _, message = line.partition(":")
+                trace.exception_type, trace.message = find_exception(line) or (exception_type, message.strip())
+                self.scanner._close_trace(trace, self.source, self.timestamp)
+                self.trace = None
+            return True  # Frames, source excerpts and the closing exception line
+
+        frame = _AT_FRAME.match(line)
+        if frame:
+            if len(trace.frames) < MAX_TRACE_FRAMES:
+                trace.frames.append(normalize_frame(frame.group(1)))
+            return True
+        if _CAUSED_BY.match(line) or _ELIDED_FRAMES.match(line):
+            return True
+        self.scanner._close_trace(trace, self.source, self.timestamp)
+        self.trace = None
+        return False
+
+    def close(self, number: int) -> None:
+        """Flush a trace or error line left open at the end of the source."""
+        if self.trace is not None:
+            self.scanner._close_trace(self.trace, self.source, self.timestamp)
+            self.trace = None
+        if self.pending is not None:
+            start, text, timestamp = self.pending
+            self.scanner._record_error(text, self.source, start, timestamp)
+            self.pending = None
+
+
+class LogScanner:
+    """
+    Accumulates error signatures and stack-trace clusters over log streams.
+
+    Args:
+        max_clusters: Most clusters tracked at once; bounds memory use
+    """
+
+    def __init__(self, max_clusters: int = DEFAULT_MAX_CLUSTERS) -> None:
+        if max_clusters < 1:
+            raise ValueError("max_clusters must be at least 1")
+        self.max_clusters = max_clusters
+        self.sources: list[str] = []
+        self.bytes_scanned = 0
+        self.lines_scanned = 0
+        self.error_events = 0
+        self.stack_traces = 0
+        self.evictions = 0
+        self._clusters: dict[str, _Cluster] = {}
+        self._heap: list[tuple[int, str]] = []  # (count, key); stale entries are skipped
+
+    def feed_file(self, path: str | Path) -> None:
+        """
+        Scan a log file through a read-only memory map.
+
+        One regex search over the mapped bytes finds the lines that can
+        start an error or stack trace; only those lines and the traces that
+        follow them are decoded and parsed.
+
+        Raises:
+            ValueError: If the path is not a readable file
+        """
+        path = Path(path)
+        if not path.is_file():
+            raise ValueError(f"Log file not found: {path}")
+        if path.stat().st_size == 0:
+            self.feed((), source=str(path))
+            return
+        with open(path, "rb") as handle, \
+                mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            self._scan_buffer(mapped, str(path))
+
+    def _scan_buffer(self, buffer: mmap.mmap, source: str) -> None:
+        self.sources.append(source)
+        reader = _SourceReader(self, source)
+        size = len(buffer)
+        position = number = 0  # Offset of the next unread line and lines before it
+
+        while position < size:
+            if not reader.active:
+                match = _TRIGGER.search(buffer, position)
+                if match is None:
+                    break
+                start = buffer.rfind(b"\n", position, match.start()) + 1 or position
+                if start > position:
+                    number += _count_newlines(buffer, position, start)
+                    reader.timestamp = _last_timestamp(buffer, start) or reader.timestamp
+                position = start
+            end = buffer.find(b"\n", position)
+            end = size if end < 0 else end + 1
+            number += 1
+            reader.line(number, _decode(buffer[position:min(end, position + MAX_LINE_BYTES)]))
+            position = end
+
+        number += _count_newlines(buffer, position, size)
+        if position < size and buffer[size - 1:size] != b"\n":
+            number += 1  # Unterminated last line
+        reader.close(number)
+        self.lines_scanned += number
+        self.bytes_scanned += size
+
+    def feed(self, lines: Iterable[bytes | str], source: str = "<stream>") -> None:
+        """Scan lines of one source, in order."""
+        self.sources.append(source)
+        reader = _SourceReader(self, source)
+        number = 0
+        for number, raw in enumerate(lines, 1):
+            if isinstance(raw, str):
+                raw = raw.encode("utf-8", "replace")
+            self.bytes_scanned += len(raw)
+            reader.line(number, _decode(raw[:MAX_LINE_BYTES]))
+        reader.close(number)
+        self.lines_scanned += number
+
+    def _record_error(self, line: str, source: str, number: int, timestamp: str | None) -> None:
+        """Count an error line by its signature."""
+        stamp = _TIMESTAMP.match(line)
+        text = line[stamp.end():] if stamp else line
+        level = _ERROR_LEVEL.search(text)
+        exception = find_exception(text)
+        if level:
+            text = text[level.start():]
+        elif exception:
+            text = text[text.find(exception[0]):]
+        signature = mask_message(text.lstrip("] "))
+        self.error_events += 1
+        self._observe(
+            _fingerprint("error", signature), "error",
+            exception[0] if exception else None, signature, [],
+            text.strip(), source, number, timestamp,
+        )
+
+    def _close_trace(self, trace: _Trace, source: str, timestamp: str | None) -> None:
+        """Count a completed stack trace by its fingerprint."""
+        frames = list(trace.frames)
+        # Python lists the innermost frame last, the others first
+        innermost = frames[::-1] if trace.python else frames
+        exception_type = trace.exception_type or "UnknownError"
+        signature = mask_message(f"{exception_type}: {trace.message}" if trace.message else exception_type)
+        self.stack_traces += 1
+        self.error_events += 1
+        self._observe(
+            _fingerprint("trace", exception_type, *innermost[:FINGERPRINT_FRAMES]), "stack_trace",
+            exception_type, signature, innermost,
+            f"{exception_type}: {trace.message}".strip().rstrip(":"),
+            source, trace.line, trace.timestamp or timestamp,
+        )
+
+    def _observe(
+        self,
+        key: str,
+        kind: str,
+        exception_type: str | None,
+        signature: str,
+        frames: list[str],
+        sample: str,
+        source: str,
+        number: int,
+        timestamp: str | None,
+    ) -> None:
+        cluster = self._clusters.get(key)
+        if cluster is None:
+            count = error_bound = 0
+            if len(self._clusters) >= self.max_clusters:
+                error_bound = self._evict()
+                count = error_bound
+            cluster = _Cluster(
+                fingerprint=key,
+                kind=kind,
+                exception_type=exception_type,
+                signature=signature,
+                frames=frames,
+                sample=sample[:MAX_SIGNATURE_CHARS],
+                count=count,
+                error_bound=error_bound,
+                first_source=source,
+                first_line=number,
+                last_source=source,
+                last_line=number,
+                first_seen=timestamp,
+                last_seen=timestamp,
+            )
+            self._clusters[key] = cluster
+        cluster.count += 1
+        cluster.last_source, cluster.last_line = source, number
+        if timestamp is not None:
+            cluster.first_seen = cluster.first_seen or timestamp
+            cluster.last_seen = timestamp
+
+        heapq.heappush(self._heap, (cluster.count, key))
+        if len(self._heap) > 4 * self.max_clusters:
+            self._heap = [(c.count, k) for k, c in self._clusters.items()]
+            heapq.heapify(self._heap)
+
+    def _evict(self) -> int:
+        """Drop the least frequent cluster and return its count."""
+        while True:
+            count, key = heapq.heappop(self._heap)
+            cluster = self._clusters.get(key)
+            if cluster is not None and cluster.count == count:
+                del self._clusters[key]
+                self.evictions += 1
+                return count
+
+    def digest(self, limit: int = 10) -> LogDigest:
+        """Summary of everything scanned, with the most frequent clusters first."""
+        ranked = heapq.nlargest(
+            limit, self._clusters.values(),
+            key=lambda c: (c.count - c.error_bound, c.kind == "stack_trace", c.count),
+        )
+        return LogDigest(
+            sources=list(self.sources),
+            bytes_scanned=self.bytes_scanned,
+            lines_scanned=self.lines_scanned,
+            error_events=self.error_events,
+            stack_traces=self.stack_traces,
+            tracked_clusters=len(self._clusters),
+            evicted_clusters=self.evictions,
+            clusters=[
+                LogCluster(
+                    fingerprint=c.fingerprint,
+                    kind=c.kind,
+                    exception_type=c.exception_type,
+                    signature=c.signature,
+                    sample=c.sample,
+                    frames=c.frames,
+                    count=c.count,
+                    error_bound=c.error_bound,
+                    share=c.count / self.error_events if self.error_events else 0.0,
+                    first_location=f"{c.first_source}:{c.first_line}",
+                    last_location=f"{c.last_source}:{c.last_line}",
+                    first_seen=c.first_seen,
+                    last_seen=c.last_seen,
+                )
+                for c in ranked
+            ],
+        )
+
+
+def scan_logs(
+    paths: Sequence[str | Path],
+    limit: int = 10,
+    max_clusters: int = DEFAULT_MAX_CLUSTERS,
+) -> LogDigest:
+    """
+    Digest log files in one pass each.
+
+    Args:
+        paths: Log files or stack-trace dumps
+        limit: Clusters to report
+        max_clusters: Most clusters tracked at once
+
+    Raises:
+        ValueError: If a path is not a readable file
+    """
+    scanner = LogScanner(max_clusters)
+    for path in paths:
+        scanner.feed_file(path)
+    return scanner.digest(limit)
@@ -10,7 +10,9 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from ..artifacts import resolve_artifact_path
 
 
 class ComplexityLevel(str, Enum):
@@ -528,6 +530,129 @@ class DebuggingRecommendation(BaseModel):
     )
 
 
+class LogCluster(BaseModel):
+    """Repeated error signature or stack trace found in logs"""
+
+    fingerprint: str = Field(
+        ...,
+        description="Stable identifier of the signature or normalized trace"
+    )
+
+    kind: str = Field(
+        ...,
+        description="Whether the cluster groups error lines or stack traces",
+        pattern="^(error|stack_trace)$"
+    )
+
+    exception_type: str | None = Field(
+        None,
+        description="Exception type, if one was recognized"
+    )
+
+    signature: str = Field(
+        ...,
+        description="Message with its variable parts masked"
+    )
+
+    sample: str = Field(
+        ...,
+        description="First occurrence of the message"
+    )
+
+    frames: list[str] = Field(
+        default_factory=list,
+        description="Normalized stack frames, innermost first"
+    )
+
+    count: int = Field(
+        ...,
+        ge=1,
+        description="Occurrences, possibly overestimated by error_bound"
+    )
+
+    error_bound: int = Field(
+        0,
+        ge=0,
+        description="Most occurrences that may belong to evicted clusters"
+    )
+
+    share: float = Field(
+        ...,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of all error events in this cluster"
+    )
+
+    first_location: str = Field(
+        ...,
+        description="Source and line of the first occurrence"
+    )
+
+    last_location: str = Field(
+        ...,
+        description="Source and line of the last occurrence"
+    )
+
+    first_seen: str | None = Field(
+        None,
+        description="Timestamp of the first occurrence, if logged"
+    )
+
+    last_seen: str | None = Field(
+        None,
+        description="Timestamp of the last occurrence, if logged"
+    )
+
+    def summary(self) -> str:
+        """One-line description of the cluster"""
+        where = f" at {self.frames[0]}" if self.frames else ""
+        return f"{self.signature}{where} ({self.count} occurrences)"
+
+
+class LogDigest(BaseModel):
+    """Single-pass summary of ingested log files"""
+
+    sources: list[str] = Field(
+        default_factory=list,
+        description="Scanned log files"
+    )
+
+    bytes_scanned: int = Field(
+        0,
+        description="Bytes read across all sources"
+    )
+
+    lines_scanned: int = Field(
+        0,
+        description="Lines read across all sources"
+    )
+
+    error_events: int = Field(
+        0,
+        description="Error lines and stack traces found"
+    )
+
+    stack_traces: int = Field(
+        0,
+        description="Stack traces found"
+    )
+
+    tracked_clusters: int = Field(
+        0,
+        description="Clusters held at the end of the scan"
+    )
+
+    evicted_clusters: int = Field(
+        0,
+        description="Infrequent clusters dropped to bound memory"
+    )
+
+    clusters: list[LogCluster] = Field(
+        default_factory=list,
+        description="Most frequent clusters first"
+    )
+
+
 class DebuggingApproachesContext(BaseModel):
     """Context for debugging approaches analysis"""
 
@@ -551,12 +676,24 @@ class DebuggingApproachesContext(BaseModel):
     )
 
     error_symptoms: list[str] = Field(
-        ...,
-        description="Observable symptoms of the error",
-        min_length=1,
+        default_factory=list,
+        description="Observable symptoms of the error; may be left empty when log_paths are given",
         max_length=10
     )
 
+    log_paths: list[str] = Field(
+        default_factory=list,
+        description="Log files or stack-trace dumps to ingest, under the artifact root",
+        max_length=20
+    )
+
+    max_log_clusters: int = Field(
+        5,
+        ge=1,
+        le=10,
+        description="Log clusters to feed into classification and hypotheses"
+    )
+
     environment_details: dict[str, str] = Field(
         default_factory=dict,
         description="Environment details (OS, language, framework, etc.)"
@@ -623,6 +760,19 @@ class DebuggingApproachesContext(BaseModel):
             raise ValueError("Problem description must be at least 20 characters")
         return v
 
+    @field_validator('log_paths')
+    @classmethod
+    def validate_log_paths(cls, v):
+        """Confine log paths to the artifact root"""
+        return [resolve_artifact_path(path) for path in v]
+
+    @model_validator(mode='after')
+    def validate_evidence(self):
+        """Require symptoms or logs to work from"""
+        if not self.error_symptoms and not self.log_paths:
+            raise ValueError("Provide at least one error symptom or log path")
+        return self
+
 
 class DebuggingApproachesResult(BaseModel):
     """Result of debugging approaches analysis"""
@@ -647,6 +797,11 @@ class DebuggingApproachesResult(BaseModel):
         description="Root cause analysis if performed"
     )
 
+    log_digest: LogDigest | None = Field(
+        None,
+        description="Summary of ingested logs, if log paths were given"
+    )
+
     top_recommended_strategy: str | None = Field(
         None,
         description="Top recommended debugging strategy"
@@ -14,6 +14,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from ..base import BaseCognitiveAnalyzer, timed_phase, trusted_construct
 from .models import (
     CriteriaType,
     DecisionCriteria,
@@ -30,13 +31,30 @@ from .models import (
 )
 
 
-class DecisionFrameworkAnalyzer:
+class DecisionFrameworkAnalyzer(BaseCognitiveAnalyzer):
     """Decision framework cognitive tool analyzer"""
 
+    # Required fields (matrix, recommendation, rankings, insights and
+    # rationale) are always computed; the optional sections run only when
+    # requested. Insights use the risk assessments when they are available.
+    phase_dependencies = {
+        "risk_assessments": (),
+        "trade_off_analyses": (),
+        "sensitivity_analysis": (),
+        "key_insights": ("risk_assessments",),
+        "implementation_considerations": ("risk_assessments",),
+        "monitoring_metrics": (),
+        "alternative_scenarios": (),
+        "confidence_factors": ("sensitivity_analysis",),
+    }
+
     def __init__(self):
         """Initialize the decision framework analyzer"""
-        self.tool_name = "Decision Framework"
-        self.version = "1.0.0"
+        super().__init__(
+            tool_name="Decision Framework",
+            tool_description="Systematic multi-criteria decision analysis",
+            version="1.0.0"
+        )
 
         # Internal state for processing
         self._processing_start_time = 0.0
@@ -45,6 +63,9 @@ class DecisionFrameworkAnalyzer:
         """
         Analyze a decision problem using the specified decision framework.
 
+        Under a field projection (see ``project_fields``) only the phases
+        needed for the requested result fields are run.
+
         Args:
             context: Decision framework context with criteria and options
 
@@ -69,46 +90,60 @@ class DecisionFrameworkAnalyzer:
             context, decision_matrix
         )
 
+        sections: dict[str, Any] = {}
+
         # Phase 4: Risk assessment (if enabled)
         risk_assessments = None
-        if context.include_risk_analysis:
+        if context.include_risk_analysis and self.needs_phase("risk_assessments"):
             risk_assessments = await self._perform_risk_assessment(context)
+        sections["risk_assessments"] = risk_assessments
 
         # Phase 5: Trade-off analysis (if enabled)
-        trade_off_analyses = None
-        if context.include_trade_off_analysis and len(option_rankings) >= 2:
-            trade_off_analyses = await self._perform_trade_off_analysis(
+        if (
+            context.include_trade_off_analysis
+            and len(option_rankings) >= 2
+            and self.needs_phase("trade_off_analyses")
+        ):
+            sections["trade_off_analyses"] = await self._perform_trade_off_analysis(
                 context, option_rankings[:3]
             )
 
         # Phase 6: Sensitivity analysis (if enabled)
         sensitivity_analysis = None
-        if context.include_sensitivity_analysis:
+        if context.include_sensitivity_analysis and self.needs_phase("sensitivity_analysis"):
             sensitivity_analysis = await self._perform_sensitivity_analysis(
                 context, decision_matrix, option_rankings
             )
+        sections["sensitivity_analysis"] = sensitivity_analysis
 
         # Phase 7: Generate insights and recommendations
         key_insights = self._generate_key_insights(
             context, decision_matrix, option_rankings, risk_assessments
         )
-
         decision_rationale = self._generate_decision_rationale(
             context, recommended_option, option_rankings, decision_matrix
         )
 
-        implementation_considerations = self._generate_implementation_considerations(
-            context, recommended_option, risk_assessments
-        )
+        if self.needs_phase("implementation_considerations"):
+            sections["implementation_considerations"] = (
+                self._generate_implementation_considerations(
+                    context, recommended_option, risk_assessments
+                )
+            )
 
-        monitoring_metrics = self._generate_monitoring_metrics(
-            context, recommended_option
-        )
+        if self.needs_phase("monitoring_metrics"):
+            sections["monitoring_metrics"] = self._generate_monitoring_metrics(
+                context, recommended_option
+            )
+
+        if self.needs_phase("alternative_scenarios"):
+            sections["alternative_scenarios"] = self._generate_alternative_scenarios(context)
 
         # Calculate confidence factors
-        confidence_factors = self._calculate_confidence_factors(
-            context, option_rankings, sensitivity_analysis
-        )
+        if self.needs_phase("confidence_factors"):
+            sections["confidence_factors"] = self._calculate_confidence_factors(
+                context, option_rankings, sensitivity_analysis
+            )
 
         # Calculate processing time
         processing_time = time.time() - self._processing_start_time
@@ -119,17 +154,12 @@ class DecisionFrameworkAnalyzer:
             recommended_option=recommended_option,
             option_rankings=option_rankings,
             key_insights=key_insights,
-            risk_assessments=risk_assessments,
-            trade_off_analyses=trade_off_analyses,
-            sensitivity_analysis=sensitivity_analysis,
             decision_rationale=decision_rationale,
-            implementation_considerations=implementation_considerations,
-            monitoring_metrics=monitoring_metrics,
-            alternative_scenarios=self._generate_alternative_scenarios(context),
-            confidence_factors=confidence_factors,
-            processing_time_ms=round(processing_time * 1000)
+            processing_time_ms=round(processing_time * 1000),
+            **{name: value for name, value in sections.items() if value is not None}
         )
 
+    @timed_phase
     async def _build_decision_matrix(
         self, context: DecisionFrameworkContext
     ) -> DecisionMatrix:
@@ -173,6 +203,7 @@ class DecisionFrameworkAnalyzer:
         # Calculate weighted scores and rankings
         return matrix.calculate_weighted_scores()
 
+    @timed_phase
     async def _apply_decision_method(
         self,
         context: DecisionFrameworkContext,
@@ -329,7 +360,7 @@ class DecisionFrameworkAnalyzer:
             risk_map = {ra.option_name: ra.risk_score for ra in risk_assessments}
 
             for ranking in base_rankings:
-                risk_score = risk_map.get(ranking['option'], 0.5)
+                risk_score = risk_map.get(ranking['option'], 0.1)  # Low risk if no factors identified
                 # Adjust score by risk (lower risk is better)
                 ranking['score'] = ranking['score'] * (1.0 - risk_score * 0.5)
                 ranking['risk_adjusted'] = True
@@ -356,6 +387,7 @@ class DecisionFrameworkAnalyzer:
         # In a real implementation, this would include Pareto frontier calculation
         return await self._weighted_scoring_method(decision_matrix)
 
+    @timed_phase
     async def _perform_risk_assessment(
         self, context: DecisionFrameworkContext
     ) -> list[RiskAssessment]:
@@ -391,13 +423,14 @@ class DecisionFrameworkAnalyzer:
                         'impact': 0.6
                     })
 
+            # Options without identified risk factors get no assessment
+            if not risk_factors:
+                continue
+
             # Calculate overall risk
-            if risk_factors:
-                avg_probability = sum(rf['probability'] for rf in risk_factors) / len(risk_factors)
-                avg_impact = sum(rf['impact'] for rf in risk_factors) / len(risk_factors)
-                risk_score = avg_probability * avg_impact
-            else:
-                risk_score = 0.1  # Low risk if no factors identified
+            avg_probability = sum(rf['probability'] for rf in risk_factors) / len(risk_factors)
+            avg_impact = sum(rf['impact'] for rf in risk_factors) / len(risk_factors)
+            risk_score = avg_probability * avg_impact
 
             # Determine risk level
             if risk_score >= 0.7:
@@ -432,6 +465,7 @@ class DecisionFrameworkAnalyzer:
 
         return risk_assessments
 
+    @timed_phase
     async def _perform_trade_off_analysis(
         self,
         context: DecisionFrameworkContext,
@@ -502,6 +536,7 @@ class DecisionFrameworkAnalyzer:
 
         return trade_off_analyses
 
+    @timed_phase
     async def _perform_sensitivity_analysis(
         self,
         context: DecisionFrameworkContext,
@@ -541,7 +576,9 @@ class DecisionFrameworkAnalyzer:
                 test_weights = [w / total for w in test_weights]
 
                 # Recalculate with new weights
-                test_matrix = DecisionMatrix(
+                test_matrix = trusted_construct(
+                    DecisionMatrix,
+
                     criteria=decision_matrix.criteria,
                     options=decision_matrix.options,
                     scores_matrix=decision_matrix.scores_matrix,
@@ -618,6 +655,7 @@ class DecisionFrameworkAnalyzer:
             else:
                 return f"{option_b} performs better by {diff:.1f} points"
 
+    @timed_phase
     def _generate_key_insights(
         self,
         context: DecisionFrameworkContext,
@@ -660,6 +698,7 @@ class DecisionFrameworkAnalyzer:
 
         return insights[:5]
 
+    @timed_phase
     def _generate_decision_rationale(
         self,
         context: DecisionFrameworkContext,
@@ -713,6 +752,7 @@ class DecisionFrameworkAnalyzer:
 
         return " ".join(rationale_parts)
 
+    @timed_phase
     def _generate_implementation_considerations(
         self,
         context: DecisionFrameworkContext,
@@ -750,6 +790,7 @@ class DecisionFrameworkAnalyzer:
 
         return considerations[:5]
 
+    @timed_phase
     def _generate_monitoring_metrics(
         self,
         context: DecisionFrameworkContext,
@@ -781,6 +822,7 @@ class DecisionFrameworkAnalyzer:
 
         return metrics[:6]
 
+    @timed_phase
     def _generate_alternative_scenarios(
         self, context: DecisionFrameworkContext
     ) -> list[str]:
@@ -806,6 +848,7 @@ class DecisionFrameworkAnalyzer:
 
         return scenarios[:5]
 
+    @timed_phase
     def _calculate_confidence_factors(
         self,
         context: DecisionFrameworkContext,
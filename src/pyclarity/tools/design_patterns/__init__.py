@@ -6,6 +6,7 @@ pattern selection frameworks, and architecture decision support.
 """
 
 from .analyzer import DesignPatternsAnalyzer
+from .index import PatternIndex, default_catalog_paths, load_pattern_catalog
 from .models import (
     ArchitecturalDecision,
     # Enums
@@ -38,6 +39,10 @@ __all__ = [
     # Main models
     "DesignPatternsContext",
     "DesignPatternsResult",
+    # Pattern index
+    "PatternIndex",
+    "load_pattern_catalog",
+    "default_catalog_paths",
     # Main class
     "DesignPatternsAnalyzer",
 ]
@@ -8,9 +8,15 @@ pattern selection frameworks, and architecture decision support.
 
 import asyncio
 import time
+from collections.abc import Sequence
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..base import BaseCognitiveAnalyzer, timed_phase
+from ..catalogs import CatalogView
+from .index import PatternIndex, load_pattern_catalog
 from .models import (
     ArchitecturalDecision,
     DesignAnalysis,
@@ -19,149 +25,73 @@ from .models import (
     DesignPatternsResult,
     DesignPrinciple,
     PatternApplication,
-    PatternCategory,
     PatternCombination,
     PatternComplexity,
 )
 
+# Minimum fit for a pattern to be recommended
+FIT_THRESHOLD = 0.3
 
-class DesignPatternsAnalyzer:
+PATTERN_CATALOG_PATH = Path(__file__).with_name("patterns.json")
+
+
+@lru_cache(maxsize=1)
+def builtin_pattern_catalog() -> CatalogView[str, DesignPattern]:
+    """Built-in design patterns, shared by every analyzer in the process."""
+    return load_pattern_catalog(PATTERN_CATALOG_PATH)
+
+
+@lru_cache(maxsize=1)
+def _builtin_pattern_index() -> PatternIndex:
+    return PatternIndex(builtin_pattern_catalog().values())
+
+
+class DesignPatternsAnalyzer(BaseCognitiveAnalyzer):
     """Design patterns cognitive tool analyzer"""
 
-    def __init__(self):
-        """Initialize the design patterns analyzer"""
-        self.tool_name = "Design Patterns"
-        self.version = "1.0.0"
+    # Pattern recommendations and quality scores are always computed; the
+    # remaining result sections run only when requested
+    phase_dependencies = {
+        "architectural_decisions": (),
+        "pattern_combinations": (),
+        "improvement_suggestions": (),
+    }
+
+    def __init__(self, catalog_paths: Sequence[str | Path] | None = None):
+        """
+        Initialize the design patterns analyzer.
+
+        Args:
+            catalog_paths: Versioned pattern catalogs to load on top of the built-in
+                patterns; a pattern with a built-in ID replaces it
+        """
+        super().__init__(
+            tool_name="Design Patterns",
+            tool_description="Recommends design patterns for a system and its requirements",
+            version="1.0.0"
+        )
 
         # Internal state for processing
         self._processing_start_time = 0.0
 
         # Initialize pattern catalog
         self._initialize_pattern_catalog()
+        if not catalog_paths:
+            # The built-in catalog and its index are shared process-wide
+            self.pattern_index = _builtin_pattern_index()
+            return
+
+        self.pattern_catalog = dict(self.pattern_catalog)
+        for path in catalog_paths:
+            for pattern in load_pattern_catalog(path).values():
+                self.pattern_catalog[pattern.pattern_id] = pattern
+
+        # Compile the catalog into an inverted index for recommendation
+        self.pattern_index = PatternIndex(self.pattern_catalog.values())
 
     def _initialize_pattern_catalog(self):
         """Initialize the catalog of design patterns"""
-        self.pattern_catalog = {
-            "singleton": DesignPattern(
-                pattern_id="singleton",
-                name="Singleton",
-                category=PatternCategory.CREATIONAL,
-                description="Ensures a class has only one instance and provides global access to it",
-                intent="Ensure a class only has one instance, and provide a global point of access to it",
-                applicability=["Need exactly one instance", "Global access required", "Lazy initialization needed"],
-                structure={"class": "Singleton", "method": "getInstance()"},
-                participants=["Singleton"],
-                collaborations=["Clients access singleton through getInstance()"],
-                consequences={
-                    "benefits": ["Controlled access", "Reduced namespace", "Permits refinement of operations"],
-                    "drawbacks": ["Global state", "Testing difficulties", "Hidden dependencies"]
-                },
-                implementation_notes=["Thread safety considerations", "Lazy vs eager initialization"],
-                related_patterns=["Factory Method", "Abstract Factory"],
-                complexity=PatternComplexity.LOW,
-                principles_supported=[DesignPrinciple.SINGLE_RESPONSIBILITY]
-            ),
-
-            "observer": DesignPattern(
-                pattern_id="observer",
-                name="Observer",
-                category=PatternCategory.BEHAVIORAL,
-                description="Defines one-to-many dependency between objects for automatic notification",
-                intent="Define a one-to-many dependency between objects so that when one object changes state, all dependents are notified",
-                applicability=["Loose coupling needed", "Dynamic relationships", "Event notification"],
-                structure={"subject": "Subject", "observer": "Observer", "concrete": "ConcreteObserver"},
-                participants=["Subject", "Observer", "ConcreteSubject", "ConcreteObserver"],
-                collaborations=["Subject notifies observers", "Observers register/unregister"],
-                consequences={
-                    "benefits": ["Loose coupling", "Dynamic relationships", "Broadcast communication"],
-                    "drawbacks": ["Unexpected updates", "Complex update semantics", "Memory leaks potential"]
-                },
-                implementation_notes=["Push vs pull model", "Subject state consistency"],
-                related_patterns=["Mediator", "Model-View-Controller"],
-                complexity=PatternComplexity.MEDIUM,
-                principles_supported=[DesignPrinciple.LOOSE_COUPLING, DesignPrinciple.OPEN_CLOSED]
-            ),
-
-            "strategy": DesignPattern(
-                pattern_id="strategy",
-                name="Strategy",
-                category=PatternCategory.BEHAVIORAL,
-                description="Defines family of algorithms and makes them interchangeable",
-                intent="Define a family of algorithms, encapsulate each one, and make them interchangeable",
-                applicability=["Multiple algorithms", "Runtime algorithm selection", "Avoid conditionals"],
-                structure={"context": "Context", "strategy": "Strategy", "concrete": "ConcreteStrategy"},
-                participants=["Strategy", "ConcreteStrategy", "Context"],
-                collaborations=["Context delegates to Strategy", "Strategy implements algorithm"],
-                consequences={
-                    "benefits": ["Algorithm family", "Eliminates conditionals", "Runtime choice"],
-                    "drawbacks": ["Clients must know strategies", "Communication overhead", "Increased objects"]
-                },
-                implementation_notes=["Strategy interface design", "Context-strategy communication"],
-                related_patterns=["State", "Template Method"],
-                complexity=PatternComplexity.MEDIUM,
-                principles_supported=[DesignPrinciple.OPEN_CLOSED, DesignPrinciple.SINGLE_RESPONSIBILITY]
-            ),
-
-            "factory_method": DesignPattern(
-                pattern_id="factory_method",
-                name="Factory Method",
-                category=PatternCategory.CREATIONAL,
-                description="Creates objects without specifying their concrete classes",
-                intent="Define an interface for creating an object, but let subclasses decide which class to instantiate",
-                applicability=["Class can't anticipate objects to create", "Subclasses specify objects", "Delegate creation"],
-                structure={"creator": "Creator", "product": "Product", "concrete": "ConcreteCreator"},
-                participants=["Product", "ConcreteProduct", "Creator", "ConcreteCreator"],
-                collaborations=["Creator relies on subclasses", "ConcreteCreator creates ConcreteProduct"],
-                consequences={
-                    "benefits": ["Eliminates concrete classes", "Provides hooks", "Connects parallel hierarchies"],
-                    "drawbacks": ["Complex class hierarchy", "Subclass required for creation"]
-                },
-                implementation_notes=["Creator can provide default implementation", "Parameterized factory methods"],
-                related_patterns=["Abstract Factory", "Template Method", "Prototype"],
-                complexity=PatternComplexity.MEDIUM,
-                principles_supported=[DesignPrinciple.OPEN_CLOSED, DesignPrinciple.DEPENDENCY_INVERSION]
-            ),
-
-            "adapter": DesignPattern(
-                pattern_id="adapter",
-                name="Adapter",
-                category=PatternCategory.STRUCTURAL,
-                description="Allows incompatible interfaces to work together",
-                intent="Convert the interface of a class into another interface clients expect",
-                applicability=["Use existing class with incompatible interface", "Create reusable class", "Interface mismatch"],
-                structure={"target": "Target", "adapter": "Adapter", "adaptee": "Adaptee"},
-                participants=["Target", "Client", "Adaptee", "Adapter"],
-                collaborations=["Client calls Adapter", "Adapter translates to Adaptee"],
-                consequences={
-                    "benefits": ["Allows incompatible classes to work", "Increases reusability", "Separates interface from implementation"],
-                    "drawbacks": ["Increases complexity", "All requests forwarded", "May limit functionality"]
-                },
-                implementation_notes=["Object vs class adapter", "Two-way adapters", "Pluggable adapters"],
-                related_patterns=["Bridge", "Decorator", "Proxy"],
-                complexity=PatternComplexity.LOW,
-                principles_supported=[DesignPrinciple.OPEN_CLOSED, DesignPrinciple.SINGLE_RESPONSIBILITY]
-            ),
-
-            "decorator": DesignPattern(
-                pattern_id="decorator",
-                name="Decorator",
-                category=PatternCategory.STRUCTURAL,
-                description="Adds behavior to objects dynamically without altering their structure",
-                intent="Attach additional responsibilities to an object dynamically",
-                applicability=["Add responsibilities dynamically", "Responsibilities can be withdrawn", "Extension by subclassing impractical"],
-                structure={"component": "Component", "decorator": "Decorator", "concrete": "ConcreteDecorator"},
-                participants=["Component", "ConcreteComponent", "Decorator", "ConcreteDecorator"],
-                collaborations=["Decorator forwards requests to Component", "May perform additional actions"],
-                consequences={
-                    "benefits": ["More flexibility than inheritance", "Avoids feature-laden classes", "Pay-as-you-go approach"],
-                    "drawbacks": ["Lots of little objects", "Identity problems", "Complex configuration"]
-                },
-                implementation_notes=["Interface conformance", "Omitting abstract Decorator", "Changing object skin vs guts"],
-                related_patterns=["Adapter", "Composite", "Strategy"],
-                complexity=PatternComplexity.MEDIUM,
-                principles_supported=[DesignPrinciple.OPEN_CLOSED, DesignPrinciple.COMPOSITION_OVER_INHERITANCE]
-            )
-        }
+        self.pattern_catalog = builtin_pattern_catalog()
 
     async def analyze(self, context: DesignPatternsContext) -> DesignPatternsResult:
         """
@@ -183,17 +113,21 @@ class DesignPatternsAnalyzer:
         # Phase 2: Generate pattern recommendations
         pattern_recommendations = await self._recommend_patterns(context)
 
+        sections: dict[str, Any] = {}
+
         # Phase 3: Analyze architectural decisions (if enabled)
-        architectural_decisions = []
-        if context.include_architectural_decisions:
-            architectural_decisions = await self._analyze_architectural_decisions(
+        if context.include_architectural_decisions and self.needs_phase("architectural_decisions"):
+            sections["architectural_decisions"] = await self._analyze_architectural_decisions(
                 context, pattern_recommendations
             )
 
         # Phase 4: Analyze pattern combinations (if enabled)
-        pattern_combinations = []
-        if context.include_pattern_combinations and len(identified_patterns) > 1:
-            pattern_combinations = await self._analyze_pattern_combinations(
+        if (
+            context.include_pattern_combinations
+            and len(identified_patterns) > 1
+            and self.needs_phase("pattern_combinations")
+        ):
+            sections["pattern_combinations"] = await self._analyze_pattern_combinations(
                 identified_patterns
             )
 
@@ -216,9 +150,10 @@ class DesignPatternsAnalyzer:
         )
 
         # Phase 7: Generate improvement suggestions
-        improvement_suggestions = self._generate_improvement_suggestions(
-            context, principle_adherence, pattern_recommendations
-        )
+        if self.needs_phase("improvement_suggestions"):
+            sections["improvement_suggestions"] = self._generate_improvement_suggestions(
+                context, principle_adherence, pattern_recommendations
+            )
 
         # Calculate processing time
         processing_time = time.time() - self._processing_start_time
@@ -226,19 +161,18 @@ class DesignPatternsAnalyzer:
         return DesignPatternsResult(
             identified_patterns=identified_patterns,
             pattern_recommendations=pattern_recommendations[:context.max_recommendations],
-            architectural_decisions=architectural_decisions,
-            pattern_combinations=pattern_combinations,
             design_quality_score=design_quality_score,
             principle_adherence={p.value: score for p, score in principle_adherence.items()},
-            improvement_suggestions=improvement_suggestions,
             pattern_catalog_size=len(self.pattern_catalog),
             top_recommended_pattern=pattern_recommendations[0].pattern.name if pattern_recommendations else None,
             complexity_assessment=self._assess_complexity(context, identified_patterns),
             maintainability_score=maintainability_score,
             extensibility_score=extensibility_score,
-            processing_time_ms=round(processing_time * 1000)
+            processing_time_ms=round(processing_time * 1000),
+            **sections
         )
 
+    @timed_phase
     async def _identify_existing_patterns(
         self, existing_pattern_ids: list[str]
     ) -> list[DesignPattern]:
@@ -254,74 +188,23 @@ class DesignPatternsAnalyzer:
 
         return identified
 
+    @timed_phase
     async def _recommend_patterns(
         self, context: DesignPatternsContext
     ) -> list[PatternApplication]:
-        """Recommend patterns based on context"""
-        # Simulate processing delay
-        await asyncio.sleep(0.1)
+        """Recommend patterns matching the problem and requirements, best first"""
+        query = " ".join([context.problem, *context.requirements])
 
         recommendations = []
-
-        for pattern in self.pattern_catalog.values():
-            fit_score = self._calculate_pattern_fit(
-                pattern, context.problem, context.requirements
-            )
-
-            if fit_score > 0.3:  # Threshold for consideration
-                application = await self._create_pattern_application(
-                    pattern, context, fit_score
-                )
-                recommendations.append(application)
-
-        # Sort by fit score
-        return sorted(recommendations, key=lambda x: x.fit_score, reverse=True)
-
-    def _calculate_pattern_fit(
-        self,
-        pattern: DesignPattern,
-        problem_description: str,
-        requirements: list[str]
-    ) -> float:
-        """Calculate how well a pattern fits the given context"""
-        score = 0.0
-        factors = 0
-
-        # Check applicability match
-        for applicability in pattern.applicability:
-            for requirement in requirements:
-                if applicability.lower() in requirement.lower():
-                    score += 0.3
-                    factors += 1
-
-        # Check problem description relevance
-        problem_lower = problem_description.lower()
-        if pattern.intent.lower() in problem_lower:
-            score += 0.4
-            factors += 1
-
-        # Check category relevance based on keywords
-        category_keywords = {
-            PatternCategory.CREATIONAL: ["create", "instantiate", "construct", "build", "factory"],
-            PatternCategory.STRUCTURAL: ["compose", "structure", "organize", "interface", "adapter", "wrapper"],
-            PatternCategory.BEHAVIORAL: ["behavior", "algorithm", "responsibility", "interaction", "communication"],
-            PatternCategory.ARCHITECTURAL: ["architecture", "system", "component", "layer", "module"],
-            PatternCategory.CONCURRENCY: ["thread", "concurrent", "parallel", "synchronization", "lock"],
-            PatternCategory.ENTERPRISE: ["enterprise", "business", "service", "transaction", "persistence"]
-        }
-
-        keywords = category_keywords.get(pattern.category, [])
-        for keyword in keywords:
-            if keyword in problem_lower:
-                score += 0.2
-                factors += 1
+        for pattern_id, fit_score in self.pattern_index.search(query):
+            if fit_score <= FIT_THRESHOLD:  # Results are sorted, so the rest fit worse
                 break
+            application = await self._create_pattern_application(
+                self.pattern_catalog[pattern_id], context, fit_score
+            )
+            recommendations.append(application)
 
-        # Base score for having the pattern available
-        if factors == 0:
-            return 0.1  # Minimal relevance
-
-        return min(1.0, score / max(1, factors))
+        return recommendations
 
     async def _create_pattern_application(
         self,
@@ -369,6 +252,7 @@ class DesignPatternsAnalyzer:
             recommendation=recommendation
         )
 
+    @timed_phase
     async def _analyze_architectural_decisions(
         self,
         context: DesignPatternsContext,
@@ -399,6 +283,7 @@ class DesignPatternsAnalyzer:
 
         return decisions
 
+    @timed_phase
     async def _analyze_pattern_combinations(
         self, patterns: list[DesignPattern]
     ) -> list[PatternCombination]:
@@ -461,6 +346,7 @@ class DesignPatternsAnalyzer:
             ]
         )
 
+    @timed_phase
     async def _evaluate_design_principles(
         self,
         context: DesignPatternsContext,
@@ -539,6 +425,7 @@ class DesignPatternsAnalyzer:
 
         return max(-0.3, min(0.3, score_delta))  # Limit impact
 
+    @timed_phase
     def _calculate_design_quality_score(
         self,
         patterns: list[DesignPattern],
@@ -571,6 +458,7 @@ class DesignPatternsAnalyzer:
         else:
             return 0.5  # Neutral if no factors
 
+    @timed_phase
     def _calculate_maintainability_score(
         self,
         patterns: list[DesignPattern],
@@ -604,6 +492,7 @@ class DesignPatternsAnalyzer:
 
         return sum(maintainability_factors) / len(maintainability_factors) if maintainability_factors else 0.5
 
+    @timed_phase
     def _calculate_extensibility_score(
         self,
         recommendations: list[PatternApplication],
@@ -635,6 +524,7 @@ class DesignPatternsAnalyzer:
 
         return sum(extensibility_factors) / len(extensibility_factors) if extensibility_factors else 0.5
 
+    @timed_phase
     def _generate_improvement_suggestions(
         self,
         context: DesignPatternsContext,
@@ -677,6 +567,7 @@ class DesignPatternsAnalyzer:
 
         return suggestions[:10]  # Limit to 10 suggestions
 
+    @timed_phase
     def _assess_complexity(
         self, context: DesignPatternsContext, patterns: list[DesignPattern]
     ) -> str:
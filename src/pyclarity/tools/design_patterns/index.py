@@ -0,0 +1,191 @@
+"""
+Design Pattern Index
+
+Compiles a pattern catalog into an inverted index for recommendation.
+
+Each pattern is a document built from weighted fields (name, intent,
+applicability, description, participants and its category's keywords).
+Terms are lowercased, stop words dropped and common suffixes stripped, so
+'creating', 'creates' and 'creation' share one term. Every posting stores
+its precomputed BM25 term weight, so scoring a query only walks the
+postings of the query's terms: the cost grows with the query and the
+patterns it matches, not with the catalog. Terms found in nearly every
+pattern carry almost no weight and are left out of the index.
+"""
+
+import heapq
+import math
+import os
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from pathlib import Path
+
+from ..catalogs import CatalogView, load_catalog
+from ..similarity import tokenize
+from .models import DesignPattern, PatternCategory
+
+# BM25 term-frequency saturation and length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Terms with a lower IDF (in nearly every pattern) get no postings
+MIN_IDF = 0.05
+
+# Score at which a pattern's fit reaches 0.5
+FIT_HALF_SCORE = 4.0
+
+# Term frequency contributed by each occurrence in a field
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "applicability": 2.0,
+    "intent": 1.5,
+    "description": 1.0,
+    "participants": 0.5,
+    "category": 1.0,
+}
+
+CATEGORY_KEYWORDS = {
+    PatternCategory.CREATIONAL: ["create", "instantiate", "construct", "build", "factory"],
+    PatternCategory.STRUCTURAL: ["compose", "structure", "organize", "interface", "adapter", "wrapper"],
+    PatternCategory.BEHAVIORAL: ["behavior", "algorithm", "responsibility", "interaction", "communication"],
+    PatternCategory.ARCHITECTURAL: ["architecture", "system", "component", "layer", "module"],
+    PatternCategory.CONCURRENCY: ["thread", "concurrent", "parallel", "synchronization", "lock"],
+    PatternCategory.ENTERPRISE: ["enterprise", "business", "service", "transaction", "persistence"],
+}
+
+STOP_WORDS = frozenset(
+    "a an and are as at be by can for from has have how in into is it its need needs "
+    "needed of on or our should so that the their them then there these this to use "
+    "used we when which while will with without".split()
+)
+
+_SUFFIXES = ("ations", "ation", "ings", "ing", "ness", "ments", "ment", "ers", "er", "ed", "ly")
+
+
+def normalize_term(token: str) -> str:
+    """Reduce a lowercase token to its index term by stripping common suffixes."""
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[:-len(suffix)]
+            break
+    else:
+        if token.endswith("es") and token[-3:-2] in ("s", "x", "z", "h") and len(token) > 4:
+            token = token[:-2]
+        elif token.endswith("s") and not token.endswith("ss") and len(token) > 3:
+            token = token[:-1]
+    if token.endswith("e") and len(token) > 4:
+        token = token[:-1]
+    return token
+
+
+def index_terms(text: str) -> list[str]:
+    """Normalized, stop-word-free terms of a text, in order."""
+    return [normalize_term(token) for token in tokenize(text) if token not in STOP_WORDS]
+
+
+def _pattern_fields(pattern: DesignPattern) -> dict[str, list[str]]:
+    """Texts of each indexed field of a pattern."""
+    return {
+        "name": [pattern.name, pattern.pattern_id.replace("_", " ")],
+        "applicability": pattern.applicability,
+        "intent": [pattern.intent],
+        "description": [pattern.description],
+        "participants": pattern.participants,
+        "category": CATEGORY_KEYWORDS.get(pattern.category, []),
+    }
+
+
+class PatternIndex:
+    """
+    Inverted index over a pattern catalog with BM25 scoring.
+
+    Args:
+        patterns: Patterns to index; later patterns replace earlier ones with the same ID
+    """
+
+    def __init__(self, patterns: Iterable[DesignPattern]) -> None:
+        catalog = {pattern.pattern_id: pattern for pattern in patterns}
+        self.pattern_ids = list(catalog)
+
+        frequencies: list[Counter] = []
+        for pattern in catalog.values():
+            counts: Counter = Counter()
+            for field, texts in _pattern_fields(pattern).items():
+                weight = FIELD_WEIGHTS[field]
+                for text in texts:
+                    for term in index_terms(text):
+                        counts[term] += weight
+            frequencies.append(counts)
+
+        n = len(frequencies)
+        lengths = [sum(counts.values()) for counts in frequencies]
+        average = sum(lengths) / n if n else 0.0
+        document_frequency = Counter(term for counts in frequencies for term in counts)
+        idfs = {
+            term: math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for term, df in document_frequency.items()
+        }
+
+        self._postings: dict[str, list[tuple[int, float]]] = defaultdict(list)
+        for doc, (counts, length) in enumerate(zip(frequencies, lengths)):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average)
+            for term, tf in counts.items():
+                idf = idfs[term]
+                if idf >= MIN_IDF:
+                    self._postings[term].append((doc, idf * tf * (BM25_K1 + 1) / (tf + norm)))
+        self._postings = dict(self._postings)
+
+    def __len__(self) -> int:
+        return len(self.pattern_ids)
+
+    @property
+    def vocabulary_size(self) -> int:
+        """Number of distinct index terms."""
+        return len(self._postings)
+
+    def score(self, query: str) -> dict[str, float]:
+        """BM25 score of every pattern sharing a term with the query."""
+        scores: dict[int, float] = defaultdict(float)
+        for term in set(index_terms(query)):
+            for doc, weight in self._postings.get(term, ()):
+                scores[doc] += weight
+        return {self.pattern_ids[doc]: score for doc, score in scores.items()}
+
+    def search(self, query: str, limit: int | None = None) -> list[tuple[str, float]]:
+        """
+        Patterns matching a query, best first.
+
+        Args:
+            query: Free text, e.g. a problem statement and its requirements
+            limit: Maximum results (default: every matching pattern)
+
+        Returns:
+            (pattern ID, fit) pairs; fit maps the BM25 score into [0, 1)
+        """
+        scores = self.score(query)
+        if limit is None:
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        else:
+            ranked = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(pattern_id, score / (score + FIT_HALF_SCORE)) for pattern_id, score in ranked]
+
+
+def load_pattern_catalog(path: str | Path) -> CatalogView[str, DesignPattern]:
+    """
+    Open a pattern catalog file.
+
+    The file is a versioned catalog (see pyclarity.tools.catalogs) whose
+    entries map pattern IDs to objects shaped like DesignPattern. It is
+    compiled and memory-mapped like the built-in catalog; each pattern is
+    validated when first read.
+
+    Raises:
+        ValueError: If the file is not a versioned catalog
+    """
+    return CatalogView(load_catalog(path), str, DesignPattern.model_validate)
+
+
+def default_catalog_paths() -> list[str]:
+    """Pattern catalogs named by PYCLARITY_DESIGN_PATTERN_CATALOGS, separated by os.pathsep."""
+    value = os.environ.get("PYCLARITY_DESIGN_PATTERN_CATALOGS", "")
+    return [path for path in value.split(os.pathsep) if path]
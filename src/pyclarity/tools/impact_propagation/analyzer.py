@@ -10,7 +10,7 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 import networkx as nx
 
-from ..base import BaseCognitiveAnalyzer
+from ..base import BaseCognitiveAnalyzer, timed_phase
 from .models import (
     ComplexityLevel,
     Edge,
@@ -37,6 +37,13 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
     feedback loops, and suggests intervention points.
     """
 
+    # Every other section feeds the required risk, mitigation and insight
+    # fields and always runs; these two are computed only when requested
+    phase_dependencies = {
+        "timeline_projection": (),
+        "visualization_data": (),
+    }
+
     def __init__(self):
         super().__init__(
             tool_name="Impact Propagation",
@@ -115,10 +122,13 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
         # Identify critical nodes
         critical_nodes = await self._identify_critical_nodes(network)
 
+        sections: dict[str, Any] = {}
+
         # Generate timeline projection
-        timeline = await self._project_timeline(
-            primary_impacts, cascade_effects, context.time_horizon
-        )
+        if self.needs_phase("timeline_projection"):
+            sections["timeline_projection"] = await self._project_timeline(
+                primary_impacts, cascade_effects, context.time_horizon
+            )
 
         # Develop mitigation strategies
         mitigation_strategies = await self._develop_mitigation_strategies(
@@ -129,9 +139,10 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
         resilience_score = await self._calculate_resilience(network, critical_nodes)
 
         # Generate visualization data
-        viz_data = await self._generate_visualization_data(
-            network, propagation_paths, feedback_loops
-        )
+        if self.needs_phase("visualization_data"):
+            sections["visualization_data"] = await self._generate_visualization_data(
+                network, propagation_paths, feedback_loops
+            )
 
         # Extract key insights
         key_insights = await self._extract_key_insights(
@@ -158,7 +169,6 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
             risk_areas=risk_areas,
             intervention_points=intervention_points,
             critical_nodes=critical_nodes,
-            timeline_projection=timeline,
             mitigation_strategies=mitigation_strategies,
             amplification_risks=[
                 f"Positive feedback in {loop.loop_id} could amplify impacts"
@@ -166,12 +176,13 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
                 if loop.feedback_type == FeedbackType.POSITIVE
             ],
             system_resilience_score=resilience_score,
-            visualization_data=viz_data,
             key_insights=key_insights,
             confidence_score=confidence,
-            processing_time_ms=processing_time
+            processing_time_ms=processing_time,
+            **sections,
         )
 
+    @timed_phase
     async def _build_network(self, context: ImpactPropagationContext) -> dict[str, Any]:
         """Build the impact network from context or generate it"""
         if context.system_nodes and context.system_edges:
@@ -265,6 +276,7 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
 
         return entities
 
+    @timed_phase
     async def _identify_primary_impacts(
         self, context: ImpactPropagationContext, network: dict[str, Any]
     ) -> list[ImpactEvent]:
@@ -303,6 +315,7 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
 
         return primary_impacts
 
+    @timed_phase
     async def _trace_propagation_paths(
         self, network: dict[str, Any], impacts: list[ImpactEvent], max_depth: int
     ) -> list[PropagationPath]:
@@ -377,6 +390,7 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
 
         return paths
 
+    @timed_phase
     async def _detect_feedback_loops(self, network: dict[str, Any]) -> list[FeedbackLoop]:
         """Detect feedback loops in the network"""
         loops = []
@@ -426,6 +440,7 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
 
         return loops
 
+    @timed_phase
     async def _identify_cascade_effects(
         self, network: dict[str, Any], paths: list[PropagationPath], time_horizon: str | None
     ) -> list[ImpactEvent]:
@@ -460,6 +475,7 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
 
         return cascade_effects
 
+    @timed_phase
     async def _assess_risk_areas(
         self,
         network: dict[str, Any],
@@ -541,6 +557,7 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
 
         return risk_areas
 
+    @timed_phase
     async def _find_intervention_points(
         self,
         network: dict[str, Any],
@@ -589,6 +606,7 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
 
         return interventions
 
+    @timed_phase
     async def _identify_critical_nodes(self, network: dict[str, Any]) -> list[str]:
         """Identify nodes critical for system stability"""
         # Build graph for centrality analysis
@@ -624,6 +642,7 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
 
         return []
 
+    @timed_phase
     async def _project_timeline(
         self,
         primary: list[ImpactEvent],
@@ -658,6 +677,7 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
 
         return timeline
 
+    @timed_phase
     async def _develop_mitigation_strategies(
         self,
         risks: list[RiskArea],
@@ -701,6 +721,7 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
 
         return unique_strategies
 
+    @timed_phase
     async def _calculate_resilience(
         self, network: dict[str, Any], critical_nodes: list[str]
     ) -> float:
@@ -741,6 +762,7 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
 
         return round(system_resilience, 3)
 
+    @timed_phase
     async def _generate_visualization_data(
         self,
         network: dict[str, Any],
@@ -788,6 +810,7 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
 
         return viz_data
 
+    @timed_phase
     async def _extract_key_insights(
         self,
         primary: list[ImpactEvent],
@@ -878,6 +901,7 @@ class ImpactPropagationAnalyzer(BaseCognitiveAnalyzer[ImpactPropagationContext,
         else:
             return "#44ff44"  # Green for stable
 
+    @timed_phase
     def _calculate_confidence(
         self, complexity: ComplexityLevel, node_count: int, loop_count: int
     ) -> float:
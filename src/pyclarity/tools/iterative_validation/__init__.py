@@ -10,6 +10,7 @@ from .models import (
     # Enums
     ComplexityLevel,
     ConfidenceLevel,
+    ConvergenceStats,
     # Supporting models
     Hypothesis,
     # Main models
@@ -22,8 +23,15 @@ from .models import (
     TestResults,
     TestType,
     ValidationCycle,
+    ValidationSession,
     ValidationStatus,
 )
+from .sessions import (
+    InMemoryValidationSessionStore,
+    SQLiteValidationSessionStore,
+    ValidationSessionStore,
+    default_session_store,
+)
 
 __all__ = [
     # Enums
@@ -39,6 +47,13 @@ __all__ = [
     "Learning",
     "Refinement",
     "ValidationCycle",
+    "ConvergenceStats",
+    "ValidationSession",
+    # Session stores
+    "ValidationSessionStore",
+    "InMemoryValidationSessionStore",
+    "SQLiteValidationSessionStore",
+    "default_session_store",
     # Main models
     "IterativeValidationContext",
     "IterativeValidationResult",
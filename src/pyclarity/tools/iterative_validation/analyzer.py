@@ -5,12 +5,14 @@ Implements systematic hypothesis-test-learn-refine cycles for continuous improve
 """
 
 import asyncio
+from contextlib import nullcontext
 from typing import Any, Dict, List, Optional
 
-from ..base import BaseCognitiveAnalyzer
+from ..base import BaseCognitiveAnalyzer, timed_phase
 from .models import (
     ComplexityLevel,
     ConfidenceLevel,
+    ConvergenceStats,
     Hypothesis,
     IterativeValidationContext,
     IterativeValidationResult,
@@ -23,6 +25,30 @@ from .models import (
     ValidationCycle,
     ValidationStatus,
 )
+from .sessions import InMemoryValidationSessionStore, ValidationSessionStore
+
+# Ordering used to compare confidence levels
+CONFIDENCE_RANK = {
+    ConfidenceLevel.VERY_LOW: 0,
+    ConfidenceLevel.LOW: 1,
+    ConfidenceLevel.MEDIUM: 2,
+    ConfidenceLevel.HIGH: 3,
+    ConfidenceLevel.VERY_HIGH: 4,
+}
+
+CONFIDENCE_SCORES = {
+    ConfidenceLevel.VERY_LOW: 0.2,
+    ConfidenceLevel.LOW: 0.4,
+    ConfidenceLevel.MEDIUM: 0.6,
+    ConfidenceLevel.HIGH: 0.8,
+    ConfidenceLevel.VERY_HIGH: 0.95,
+}
+
+# Success rate lost per assumption beyond the number of success criteria
+ASSUMPTION_RISK = 0.03
+
+# Cycles loaded from a session store; covers the overall-confidence window
+RECENT_CYCLES = 4
 
 
 class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
@@ -33,6 +59,19 @@ class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
     and refinement for continuous improvement in any domain.
     """
 
+    def __init__(self, session_store: ValidationSessionStore | None = None) -> None:
+        """Initialize the iterative validation analyzer.
+
+        Args:
+            session_store: Store for validation sessions (in-memory by default).
+        """
+        super().__init__(
+            tool_name="Iterative Validation",
+            tool_description="Runs hypothesis-test-learn-refine validation cycles",
+            version="1.0.0"
+        )
+        self.session_store = session_store or InMemoryValidationSessionStore()
+
     async def analyze(
         self,
         context: IterativeValidationContext
@@ -46,92 +85,29 @@ class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
         Returns:
             IterativeValidationResult with complete validation analysis
         """
-        # Generate initial hypothesis if not provided
-        if not context.initial_hypothesis:
-            initial_hypothesis = await self._generate_initial_hypothesis(context)
-        else:
-            initial_hypothesis = context.initial_hypothesis
-
-        # Initialize validation cycles
-        validation_cycles = context.previous_cycles or []
-        current_hypothesis = initial_hypothesis
-        cumulative_learnings = []
-        confidence_progression = {}
-        key_pivots = []
-
-        # Determine number of cycles based on complexity and constraints
-        max_cycles = context.max_iterations or self._determine_max_cycles(context)
-
-        # Run validation cycles
-        for cycle_num in range(len(validation_cycles) + 1, max_cycles + 1):
-            # Design test for current hypothesis
-            test_design = await self._design_test(
-                current_hypothesis,
-                context,
-                validation_cycles
-            )
-
-            # Simulate test execution and results
-            test_results = await self._simulate_test_results(
-                current_hypothesis,
-                test_design,
-                context
-            )
-
-            # Extract learnings from results
-            learnings = await self._extract_learnings(
-                current_hypothesis,
-                test_results,
-                context
-            )
-            cumulative_learnings.extend(learnings)
-
-            # Generate refinements based on learnings
-            refinements = await self._generate_refinements(
-                current_hypothesis,
-                learnings,
-                context
-            )
-
-            # Create validation cycle
-            cycle = ValidationCycle(
-                cycle_number=cycle_num,
-                hypothesis=current_hypothesis,
-                test_design=test_design,
-                test_results=test_results,
-                learnings=learnings,
-                refinements=refinements,
-                status=ValidationStatus.REFINED,
-                duration=f"Cycle {cycle_num} duration"
-            )
-            validation_cycles.append(cycle)
-
-            # Track confidence progression
-            confidence_progression[cycle_num] = test_results.confidence_in_results
-
-            # Check for pivots
-            if self._is_pivot(current_hypothesis, refinements):
-                key_pivots.append(
-                    f"Cycle {cycle_num}: {refinements[0].refinement_description}"
-                )
-
-            # Refine hypothesis for next cycle
-            if refinements and cycle_num < max_cycles:
-                current_hypothesis = await self._refine_hypothesis(
-                    current_hypothesis,
-                    refinements,
-                    learnings
-                )
-
-            # Check if target confidence reached
-            if (context.target_confidence and
-                test_results.confidence_in_results == context.target_confidence):
-                break
+        # Calls on one session run their cycles one after another
+        lock = self.session_store.lock(context.session_id) if context.session_id else nullcontext()
+        async with lock:
+            validation_cycles, stats, current_hypothesis, stop_reason = await self._advance(context)
+
+        # Session results cover the recent cycles; statistics cover all of them
+        cumulative_learnings = [
+            learning for cycle in validation_cycles for learning in cycle.learnings
+        ]
+        confidence_progression = {
+            cycle.cycle_number: cycle.test_results.confidence_in_results
+            for cycle in validation_cycles
+        }
+        key_pivots = [
+            f"Cycle {cycle.cycle_number}: {cycle.refinements[0].refinement_description}"
+            for cycle in validation_cycles
+            if self._is_pivot(cycle.hypothesis, cycle.refinements)
+        ]
 
         # Analyze convergence
         convergence_analysis = await self._analyze_convergence(
             validation_cycles,
-            confidence_progression
+            stats
         )
 
         # Identify remaining uncertainties
@@ -167,7 +143,7 @@ class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
 
         # Generate overall assessment
         overall_assessment = await self._generate_overall_assessment(
-            validation_cycles,
+            stats,
             convergence_analysis,
             confidence_score
         )
@@ -186,9 +162,164 @@ class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
             failure_points=failure_points,
             methodology_insights=methodology_insights,
             overall_assessment=overall_assessment,
+            stop_reason=stop_reason,
+            session_id=context.session_id,
+            convergence_stats=stats,
             confidence_score=confidence_score
         )
 
+    async def _advance(
+        self,
+        context: IterativeValidationContext
+    ) -> tuple[list[ValidationCycle], ConvergenceStats, Hypothesis, str | None]:
+        """Load the session, run its next cycles and store them."""
+        # Resume from a stored session or previous cycles without recomputing them
+        session = None
+        if context.session_id:
+            session = await self.session_store.load(context.session_id, RECENT_CYCLES)
+        if session is not None:
+            if context.previous_cycles:
+                raise ValueError(
+                    f"Session {context.session_id!r} already exists; "
+                    "previous_cycles can only seed a new session"
+                )
+            validation_cycles = session.recent_cycles
+            stats = session.stats
+            new_cycles = []
+        else:
+            validation_cycles = list(context.previous_cycles or [])
+            stats = ConvergenceStats()
+            for cycle in validation_cycles:
+                stats.update(cycle, self._cycle_score(cycle))
+            new_cycles = list(validation_cycles)
+
+        # Determine number of cycles based on complexity and constraints
+        max_cycles = context.max_iterations or self._determine_max_cycles(context)
+        if context.session_id:
+            # Session calls advance one cycle at a time
+            max_cycles = min(max_cycles, stats.cycle_count + 1)
+
+        stop_reason = self._stop_reason(stats, context)
+        if validation_cycles:
+            current_hypothesis = validation_cycles[-1].hypothesis
+            candidates = (
+                []
+                if stop_reason or stats.cycle_count >= max_cycles
+                else await self._candidate_hypotheses(validation_cycles[-1], context)
+            )
+        else:
+            current_hypothesis = (
+                context.initial_hypothesis
+                or await self._generate_initial_hypothesis(context)
+            )
+            candidates = [current_hypothesis]
+
+        # Run validation cycles, evaluating candidate hypotheses concurrently
+        for cycle_num in range(stats.cycle_count + 1, max_cycles + 1):
+            if not candidates:
+                break
+            evaluated = await asyncio.gather(*(
+                self._run_cycle(cycle_num, hypothesis, context, validation_cycles)
+                for hypothesis in candidates
+            ))
+            cycle = max(evaluated, key=self._cycle_score)
+            validation_cycles.append(cycle)
+            new_cycles.append(cycle)
+            current_hypothesis = cycle.hypothesis
+            stats.update(cycle, self._cycle_score(cycle))
+
+            stop_reason = self._stop_reason(stats, context)
+            if stop_reason or cycle_num == max_cycles:
+                break
+
+            # Refine hypothesis candidates for next cycle
+            candidates = await self._candidate_hypotheses(cycle, context)
+
+        if context.session_id and new_cycles:
+            await self.session_store.append(context.session_id, new_cycles, stats)
+
+        return validation_cycles, stats, current_hypothesis, stop_reason
+
+    @timed_phase
+    async def _run_cycle(
+        self,
+        cycle_num: int,
+        hypothesis: Hypothesis,
+        context: IterativeValidationContext,
+        previous_cycles: list[ValidationCycle]
+    ) -> ValidationCycle:
+        """Run one design-test-learn-refine cycle for a hypothesis."""
+        # Design test for current hypothesis
+        test_design = await self._design_test(hypothesis, context, previous_cycles)
+
+        # Simulate test execution and results
+        test_results = await self._simulate_test_results(hypothesis, test_design, context)
+
+        # Extract learnings from results
+        learnings = await self._extract_learnings(hypothesis, test_results, context)
+
+        # Generate refinements based on learnings
+        refinements = await self._generate_refinements(hypothesis, learnings, context)
+
+        return ValidationCycle(
+            cycle_number=cycle_num,
+            hypothesis=hypothesis,
+            test_design=test_design,
+            test_results=test_results,
+            learnings=learnings,
+            refinements=refinements,
+            status=ValidationStatus.REFINED,
+            duration=f"Cycle {cycle_num} duration"
+        )
+
+    def _cycle_score(self, cycle: ValidationCycle) -> tuple[int, float]:
+        """Rank a cycle by result confidence, then by completion rate."""
+        return (
+            CONFIDENCE_RANK[cycle.test_results.confidence_in_results],
+            float(cycle.test_results.raw_data.get("completion_rate", 0.0)),
+        )
+
+    def _stop_reason(
+        self,
+        stats: ConvergenceStats,
+        context: IterativeValidationContext
+    ) -> str | None:
+        """Return why validation should stop early, or None to continue."""
+        if not stats.cycle_count:
+            return None
+
+        target = context.target_confidence
+        confidence = stats.latest_confidence
+        if target and CONFIDENCE_RANK[confidence] >= CONFIDENCE_RANK[target]:
+            return f"Target confidence '{target.value}' reached in cycle {stats.latest_cycle}"
+
+        # Converged when the last `patience` cycles did not beat the earlier best
+        patience = context.convergence_patience
+        if patience and stats.cycles_since_improvement >= patience:
+            return f"Converged: no improvement in the last {patience} cycles"
+
+        return None
+
+    async def _candidate_hypotheses(
+        self,
+        cycle: ValidationCycle,
+        context: IterativeValidationContext
+    ) -> list[Hypothesis]:
+        """Build the candidate hypotheses to evaluate in the next cycle."""
+        if not cycle.refinements:
+            return [cycle.hypothesis]
+
+        strategies = (
+            self._refine_hypothesis,
+            self._focus_hypothesis,
+            self._pivot_hypothesis,
+        )[:context.candidate_refinements]
+        return list(await asyncio.gather(*(
+            strategy(cycle.hypothesis, cycle.refinements, cycle.learnings)
+            for strategy in strategies
+        )))
+
+    @timed_phase
     async def _generate_initial_hypothesis(
         self,
         context: IterativeValidationContext
@@ -322,6 +453,10 @@ class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
             confidence = ConfidenceLevel.MEDIUM
             success_rate = 0.7
 
+        # Untested assumptions beyond the success criteria add risk
+        excess_assumptions = len(hypothesis.assumptions) - len(hypothesis.success_criteria)
+        success_rate = round(success_rate - ASSUMPTION_RISK * max(0, excess_assumptions), 4)
+
         # Generate test results
         key_findings = [
             f"Primary metric achieved {success_rate*100:.0f}% of target",
@@ -441,6 +576,7 @@ class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
 
         return refinements
 
+    @timed_phase
     def _determine_max_cycles(self, context: IterativeValidationContext) -> int:
         """Determine maximum cycles based on complexity."""
         if context.complexity_level == ComplexityLevel.SIMPLE:
@@ -489,7 +625,75 @@ class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
                     f"New insight: {learning.key_insight}"
                 )
 
-        # Update confidence based on learnings
+        return Hypothesis(
+            statement=refined_statement,
+            assumptions=refined_assumptions[:5],  # Keep manageable
+            success_criteria=current.success_criteria,
+            confidence_level=self._refined_confidence(current, learnings),
+            rationale="Refined based on cycle learnings",
+            risks=current.risks,
+            related_hypotheses=current.related_hypotheses
+        )
+
+    async def _focus_hypothesis(
+        self,
+        current: Hypothesis,
+        refinements: list[Refinement],
+        learnings: list[Learning]
+    ) -> Hypothesis:
+        """Narrow the hypothesis to its surviving assumptions."""
+        refuted = [
+            evidence
+            for learning in learnings
+            if learning.learning_type == LearningType.REFUTATION
+            for evidence in learning.supporting_evidence
+        ]
+        focused_assumptions = [
+            a for a in current.assumptions
+            if not any(e in a for e in refuted)
+        ] or current.assumptions[:1]
+
+        return Hypothesis(
+            statement=f"Focused: {current.statement.removeprefix('Focused: ')}",
+            assumptions=focused_assumptions[:len(current.success_criteria)],
+            success_criteria=current.success_criteria,
+            confidence_level=self._refined_confidence(current, learnings),
+            rationale="Focused on assumptions that survived testing",
+            risks=current.risks,
+            related_hypotheses=current.related_hypotheses
+        )
+
+    async def _pivot_hypothesis(
+        self,
+        current: Hypothesis,
+        refinements: list[Refinement],
+        learnings: list[Learning]
+    ) -> Hypothesis:
+        """Re-center the hypothesis on unexpected discoveries."""
+        insights = [
+            learning.key_insight
+            for learning in learnings
+            if learning.learning_type == LearningType.UNEXPECTED
+        ]
+        if not insights:
+            return await self._refine_hypothesis(current, refinements, learnings)
+
+        return Hypothesis(
+            statement=f"Pivot: {current.statement} toward {insights[0].lower()}",
+            assumptions=[f"New insight: {insight}" for insight in insights] + current.assumptions[:1],
+            success_criteria=current.success_criteria,
+            confidence_level=self._refined_confidence(current, learnings),
+            rationale="Pivoted toward unexpected discoveries",
+            risks=current.risks + ["Pivot abandons previously tested assumptions"],
+            related_hypotheses=current.related_hypotheses + [current.statement]
+        )
+
+    def _refined_confidence(
+        self,
+        current: Hypothesis,
+        learnings: list[Learning]
+    ) -> ConfidenceLevel:
+        """Update hypothesis confidence based on the leading learning."""
         confidence_map = {
             LearningType.CONFIRMATION: ConfidenceLevel.HIGH,
             LearningType.PARTIAL: ConfidenceLevel.MEDIUM,
@@ -497,35 +701,26 @@ class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
             LearningType.UNEXPECTED: ConfidenceLevel.MEDIUM
         }
 
-        new_confidence = confidence_map.get(
+        return confidence_map.get(
             learnings[0].learning_type if learnings else LearningType.PARTIAL,
             current.confidence_level
         )
 
-        return Hypothesis(
-            statement=refined_statement,
-            assumptions=refined_assumptions[:5],  # Keep manageable
-            success_criteria=current.success_criteria,
-            confidence_level=new_confidence,
-            rationale="Refined based on cycle learnings",
-            risks=current.risks,
-            related_hypotheses=current.related_hypotheses
-        )
-
+    @timed_phase
     async def _analyze_convergence(
         self,
         cycles: list[ValidationCycle],
-        confidence_progression: dict[int, ConfidenceLevel]
+        stats: ConvergenceStats
     ) -> str:
         """Analyze convergence toward validated solution."""
         if not cycles:
             return "No cycles completed yet"
 
         # Analyze confidence trend
-        confidence_values = list(confidence_progression.values())
-        if all(c == ConfidenceLevel.HIGH for c in confidence_values[-2:]):
+        recent_confidence = [c.test_results.confidence_in_results for c in cycles[-2:]]
+        if all(c == ConfidenceLevel.HIGH for c in recent_confidence):
             trend = "Strong convergence achieved"
-        elif confidence_values[-1] > confidence_values[0]:
+        elif CONFIDENCE_RANK[stats.latest_confidence] > CONFIDENCE_RANK[stats.first_confidence]:
             trend = "Positive convergence trend"
         else:
             trend = "Limited convergence observed"
@@ -541,8 +736,9 @@ class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
         else:
             stability = "continued iteration needed"
 
-        return f"{trend} with {stability}. {len(cycles)} cycles completed with progressive refinement."
+        return f"{trend} with {stability}. {stats.cycle_count} cycles completed with progressive refinement."
 
+    @timed_phase
     async def _identify_uncertainties(
         self,
         hypothesis: Hypothesis,
@@ -570,6 +766,7 @@ class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
 
         return uncertainties[:5]  # Top uncertainties
 
+    @timed_phase
     async def _generate_recommendations(
         self,
         hypothesis: Hypothesis,
@@ -597,6 +794,7 @@ class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
 
         return recommendations
 
+    @timed_phase
     async def _identify_success_factors(
         self,
         cycles: list[ValidationCycle]
@@ -626,6 +824,7 @@ class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
 
         return success_factors[:5]
 
+    @timed_phase
     async def _identify_failure_points(
         self,
         cycles: list[ValidationCycle]
@@ -654,6 +853,7 @@ class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
 
         return failure_points
 
+    @timed_phase
     async def _extract_methodology_insights(
         self,
         cycles: list[ValidationCycle],
@@ -686,6 +886,7 @@ class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
 
         return insights
 
+    @timed_phase
     def _calculate_overall_confidence(
         self,
         progression: dict[int, ConfidenceLevel],
@@ -695,15 +896,6 @@ class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
         if not progression:
             return 0.5
 
-        # Map confidence levels to scores
-        confidence_scores = {
-            ConfidenceLevel.VERY_LOW: 0.2,
-            ConfidenceLevel.LOW: 0.4,
-            ConfidenceLevel.MEDIUM: 0.6,
-            ConfidenceLevel.HIGH: 0.8,
-            ConfidenceLevel.VERY_HIGH: 0.95
-        }
-
         # Weight recent cycles more heavily
         weights = [0.1, 0.2, 0.3, 0.4]  # Recent cycles weighted more
         weighted_sum = 0
@@ -712,15 +904,16 @@ class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
         cycles = sorted(progression.keys())
         for i, cycle in enumerate(cycles[-4:]):  # Last 4 cycles
             weight = weights[min(i, len(weights)-1)]
-            score = confidence_scores.get(progression[cycle], 0.5)
+            score = CONFIDENCE_SCORES.get(progression[cycle], 0.5)
             weighted_sum += weight * score
             weight_total += weight
 
         return weighted_sum / weight_total if weight_total > 0 else 0.5
 
+    @timed_phase
     async def _generate_overall_assessment(
         self,
-        cycles: list[ValidationCycle],
+        stats: ConvergenceStats,
         convergence: str,
         confidence: float
     ) -> str:
@@ -734,12 +927,12 @@ class IterativeValidationAnalyzer(BaseCognitiveAnalyzer):
             success_level = "partially successful"
 
         # Count key metrics
-        total_learnings = sum(len(c.learnings) for c in cycles)
-        total_refinements = sum(len(c.refinements) for c in cycles)
+        total_learnings = sum(stats.learning_counts.values())
+        total_refinements = stats.refinement_count
 
         assessment = (
             f"The iterative validation process was {success_level} "
-            f"with {len(cycles)} cycles completed. {convergence} "
+            f"with {stats.cycle_count} cycles completed. {convergence} "
             f"The process generated {total_learnings} key learnings and "
             f"{total_refinements} refinements, achieving a final confidence "
             f"score of {confidence:.2f}. "
@@ -193,6 +193,79 @@ class ValidationCycle(BaseModel):
     )
 
 
+class ConvergenceStats(BaseModel):
+    """Convergence statistics maintained incrementally, one cycle at a time."""
+    cycle_count: int = Field(0, description="Cycles completed", ge=0)
+    latest_cycle: int | None = Field(None, description="Number of the latest cycle")
+    first_confidence: ConfidenceLevel | None = Field(
+        None,
+        description="Result confidence of the first cycle"
+    )
+    latest_confidence: ConfidenceLevel | None = Field(
+        None,
+        description="Result confidence of the latest cycle"
+    )
+    best_score: tuple[int, float] | None = Field(
+        None,
+        description="Best cycle score (confidence rank, completion rate)"
+    )
+    best_cycle: int | None = Field(None, description="Number of the best cycle")
+    cycles_since_improvement: int = Field(
+        0,
+        description="Cycles completed since the best score last improved",
+        ge=0
+    )
+    confidence_counts: dict[ConfidenceLevel, int] = Field(
+        default_factory=dict,
+        description="Cycles per result confidence level"
+    )
+    learning_counts: dict[LearningType, int] = Field(
+        default_factory=dict,
+        description="Learnings per learning type"
+    )
+    refinement_count: int = Field(0, description="Refinements generated", ge=0)
+
+    def update(self, cycle: ValidationCycle, score: tuple[int, float]) -> bool:
+        """
+        Fold one completed cycle into the statistics.
+
+        Args:
+            cycle: The completed cycle
+            score: The cycle's score; higher is better
+
+        Returns:
+            True if the cycle improved on the best score
+        """
+        confidence = cycle.test_results.confidence_in_results
+        self.cycle_count += 1
+        self.latest_cycle = cycle.cycle_number
+        self.first_confidence = self.first_confidence or confidence
+        self.latest_confidence = confidence
+        self.confidence_counts[confidence] = self.confidence_counts.get(confidence, 0) + 1
+        for learning in cycle.learnings:
+            self.learning_counts[learning.learning_type] = (
+                self.learning_counts.get(learning.learning_type, 0) + 1
+            )
+        self.refinement_count += len(cycle.refinements)
+
+        if self.best_score is None or score > self.best_score:
+            self.best_score = score
+            self.best_cycle = cycle.cycle_number
+            self.cycles_since_improvement = 0
+            return True
+        self.cycles_since_improvement += 1
+        return False
+
+
+class ValidationSession(BaseModel):
+    """Stored state of a validation session, as loaded for the next cycle."""
+    session_id: str = Field(description="Session identifier")
+    stats: ConvergenceStats = Field(description="Convergence statistics over all cycles")
+    recent_cycles: list[ValidationCycle] = Field(
+        description="Most recent cycles, oldest first"
+    )
+
+
 class IterativeValidationContext(BaseModel):
     """Input context for Iterative Validation analysis."""
     scenario: str = Field(
@@ -230,6 +303,23 @@ class IterativeValidationContext(BaseModel):
         default_factory=list,
         description="Preferred types of tests"
     )
+    candidate_refinements: int = Field(
+        1,
+        ge=1,
+        le=3,
+        description="Candidate refinements evaluated concurrently per cycle; the best is kept"
+    )
+    convergence_patience: int | None = Field(
+        2,
+        ge=1,
+        description="Stop after this many cycles without improvement (None disables)"
+    )
+    session_id: str | None = Field(
+        None,
+        description="Stored validation session to continue; each call runs one cycle",
+        min_length=1,
+        max_length=200
+    )
 
     class Config:
         json_schema_extra = {
@@ -286,6 +376,18 @@ class IterativeValidationResult(BaseModel):
     overall_assessment: str = Field(
         description="Overall assessment of the validation process"
     )
+    stop_reason: str | None = Field(
+        None,
+        description="Why validation stopped before the cycle limit, if it did"
+    )
+    session_id: str | None = Field(
+        None,
+        description="Validation session the cycles belong to"
+    )
+    convergence_stats: ConvergenceStats | None = Field(
+        None,
+        description="Convergence statistics over every cycle, including stored ones"
+    )
     confidence_score: float = Field(
         description="Overall confidence in the conclusions (0.0-1.0)",
         ge=0.0,
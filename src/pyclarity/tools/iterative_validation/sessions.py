@@ -0,0 +1,256 @@
+"""
+Validation Session Stores
+
+Server-side persistence for long-running iterative validations. A session
+keeps every cycle plus incrementally maintained convergence statistics, so
+each call loads only the statistics and the most recent cycles and appends
+the cycle it ran. Payload and compute per call stay constant however many
+cycles the session has accumulated.
+
+Calls on the same session are serialised by a per-session lock, so each one
+loads the statistics the previous call stored. The in-memory store keeps only
+the most recently used sessions.
+"""
+
+import asyncio
+import os
+import sqlite3
+import weakref
+from collections import OrderedDict
+from contextlib import closing
+from typing import Protocol
+
+from .models import ConvergenceStats, ValidationCycle, ValidationSession
+
+# Environment variable naming a SQLite file for the default session store
+SESSION_DB_ENV = "PYCLARITY_VALIDATION_SESSION_DB"
+
+# Sessions kept by the in-memory store; the least recently used is dropped first
+MAX_VALIDATION_SESSIONS = 256
+
+
+class SessionLocks:
+    """One asyncio lock per session id, dropped once no call holds it"""
+
+    def __init__(self) -> None:
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+
+    def get(self, session_id: str) -> asyncio.Lock:
+        lock = self._locks.get(session_id)
+        if lock is None:
+            lock = self._locks[session_id] = asyncio.Lock()
+        return lock
+
+    def held(self, session_id: str) -> bool:
+        """Whether a call currently holds the session's lock"""
+        lock = self._locks.get(session_id)
+        return lock is not None and lock.locked()
+
+
+class ValidationSessionStore(Protocol):
+    """Pluggable persistence for validation sessions"""
+
+    def lock(self, session_id: str) -> asyncio.Lock:
+        """Lock to hold from loading a session until appending to it"""
+        ...
+
+    async def load(self, session_id: str, recent: int) -> ValidationSession | None:
+        """Return the session's statistics and its last `recent` cycles, or None"""
+        ...
+
+    async def append(
+        self,
+        session_id: str,
+        cycles: list[ValidationCycle],
+        stats: ConvergenceStats
+    ) -> None:
+        """Append cycles to a session (creating it) and replace its statistics"""
+        ...
+
+    async def history(self, session_id: str) -> list[ValidationCycle]:
+        """Return every cycle of a session, oldest first"""
+        ...
+
+    async def delete(self, session_id: str) -> bool:
+        """Delete a session; returns False if it did not exist"""
+        ...
+
+
+class InMemoryValidationSessionStore:
+    """Session store kept in process memory, bounded to the most recently used sessions"""
+
+    def __init__(self, max_sessions: int = MAX_VALIDATION_SESSIONS) -> None:
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict[str, tuple[list[ValidationCycle], ConvergenceStats]] = (
+            OrderedDict()
+        )
+        self._locks = SessionLocks()
+
+    def _evict(self) -> None:
+        """Drop the least recently used sessions no call is advancing, down to the bound"""
+        for session_id in list(self._sessions):
+            if len(self._sessions) <= self.max_sessions:
+                break
+            if not self._locks.held(session_id):
+                del self._sessions[session_id]
+
+    def lock(self, session_id: str) -> asyncio.Lock:
+        return self._locks.get(session_id)
+
+    async def load(self, session_id: str, recent: int) -> ValidationSession | None:
+        if session_id not in self._sessions:
+            return None
+        self._sessions.move_to_end(session_id)
+        cycles, stats = self._sessions[session_id]
+        return ValidationSession(
+            session_id=session_id,
+            stats=stats.model_copy(deep=True),
+            recent_cycles=cycles[-recent:] if recent > 0 else [],
+        )
+
+    async def append(
+        self,
+        session_id: str,
+        cycles: list[ValidationCycle],
+        stats: ConvergenceStats
+    ) -> None:
+        stored = self._sessions[session_id][0] if session_id in self._sessions else []
+        stored.extend(cycles)
+        self._sessions[session_id] = (stored, stats.model_copy(deep=True))
+        self._sessions.move_to_end(session_id)
+        self._evict()
+
+    async def history(self, session_id: str) -> list[ValidationCycle]:
+        return list(self._sessions.get(session_id, ([], None))[0])
+
+    async def delete(self, session_id: str) -> bool:
+        return self._sessions.pop(session_id, None) is not None
+
+
+class SQLiteValidationSessionStore:
+    """Session store backed by a SQLite file, shareable across processes"""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._locks = SessionLocks()
+        with closing(self._connect()) as connection, connection:
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS validation_sessions (
+                    session_id TEXT PRIMARY KEY,
+                    stats TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS validation_cycles (
+                    session_id TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    cycle TEXT NOT NULL,
+                    PRIMARY KEY (session_id, position)
+                );
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _load(self, session_id: str, recent: int) -> ValidationSession | None:
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT stats FROM validation_sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            cycle_rows = connection.execute(
+                "SELECT cycle FROM validation_cycles WHERE session_id = ? "
+                "ORDER BY position DESC LIMIT ?",
+                (session_id, max(0, recent)),
+            ).fetchall()
+        return ValidationSession(
+            session_id=session_id,
+            stats=ConvergenceStats.model_validate_json(row[0]),
+            recent_cycles=[
+                ValidationCycle.model_validate_json(cycle) for (cycle,) in reversed(cycle_rows)
+            ],
+        )
+
+    def _append(
+        self,
+        session_id: str,
+        cycles: list[ValidationCycle],
+        stats: ConvergenceStats
+    ) -> None:
+        # Positions continue from the session's cycle count before this call.
+        # The count is read under a write lock, so a process that advanced
+        # the session since it was loaded is detected instead of overwritten.
+        first_position = stats.cycle_count - len(cycles) + 1
+        with closing(self._connect()) as connection, connection:
+            connection.execute("BEGIN IMMEDIATE")
+            (stored_count,) = connection.execute(
+                "SELECT COALESCE(MAX(position), 0) FROM validation_cycles WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+            if stored_count != first_position - 1:
+                raise ValueError(
+                    f"Session {session_id!r} was advanced concurrently; "
+                    f"it has {stored_count} cycles, expected {first_position - 1}"
+                )
+            connection.executemany(
+                "INSERT INTO validation_cycles (session_id, position, cycle) VALUES (?, ?, ?)",
+                [
+                    (session_id, first_position + offset, cycle.model_dump_json())
+                    for offset, cycle in enumerate(cycles)
+                ],
+            )
+            connection.execute(
+                "INSERT INTO validation_sessions (session_id, stats) VALUES (?, ?) "
+                "ON CONFLICT(session_id) DO UPDATE SET stats = excluded.stats",
+                (session_id, stats.model_dump_json()),
+            )
+
+    def _history(self, session_id: str) -> list[ValidationCycle]:
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT cycle FROM validation_cycles WHERE session_id = ? ORDER BY position",
+                (session_id,),
+            ).fetchall()
+        return [ValidationCycle.model_validate_json(cycle) for (cycle,) in rows]
+
+    def _delete(self, session_id: str) -> bool:
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "DELETE FROM validation_cycles WHERE session_id = ?", (session_id,)
+            )
+            deleted = connection.execute(
+                "DELETE FROM validation_sessions WHERE session_id = ?", (session_id,)
+            ).rowcount
+        return deleted > 0
+
+    def lock(self, session_id: str) -> asyncio.Lock:
+        return self._locks.get(session_id)
+
+    async def load(self, session_id: str, recent: int) -> ValidationSession | None:
+        return await asyncio.to_thread(self._load, session_id, recent)
+
+    async def append(
+        self,
+        session_id: str,
+        cycles: list[ValidationCycle],
+        stats: ConvergenceStats
+    ) -> None:
+        await asyncio.to_thread(self._append, session_id, cycles, stats)
+
+    async def history(self, session_id: str) -> list[ValidationCycle]:
+        return await asyncio.to_thread(self._history, session_id)
+
+    async def delete(self, session_id: str) -> bool:
+        return await asyncio.to_thread(self._delete, session_id)
+
+
+def default_session_store() -> ValidationSessionStore:
+    """SQLite store at $PYCLARITY_VALIDATION_SESSION_DB if set, else in-memory."""
+    path = os.environ.get(SESSION_DB_ENV)
+    if path:
+        return SQLiteValidationSessionStore(path)
+    return InMemoryValidationSessionStore()
@@ -0,0 +1,126 @@
+"""
+Keyword Classification
+
+Shared single-pass keyword matching for analyzers that classify text by
+lists of indicator phrases.
+
+A KeywordClassifier compiles a catalog (category -> keywords) once into a
+single regex whose alternatives are factored into a trie, so each text
+position is tested against one branch per character instead of every
+keyword in turn. The regex is a lookahead, so matches may overlap:
+'stack overflow' counts as both 'stack' and 'stack overflow', and
+'configuration' as both 'config' and 'configuration'. Matching is
+case-insensitive substring matching, the same as `keyword in text.lower()`.
+"""
+
+import re
+from collections import Counter
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex matching the longest of the words at a position, factored by common prefixes."""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # End of a word
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:
+            return f"(?:{body})?"  # Greedy, so the longer word wins
+        return body
+
+    return build(trie)
+
+
+@dataclass(frozen=True)
+class KeywordHits[C: Hashable]:
+    """Keyword matches of one text."""
+
+    keywords: Counter            # Occurrences of each matched keyword
+    categories: dict[C, int]     # Distinct keywords matched per category, catalog order
+    occurrences: dict[C, int]    # Keyword occurrences per category, catalog order
+
+    def first(self) -> C | None:
+        """First category, in catalog order, with any keyword in the text."""
+        return next((category for category, hits in self.categories.items() if hits), None)
+
+    def matched(self) -> list[C]:
+        """Categories with any keyword in the text, in catalog order."""
+        return [category for category, hits in self.categories.items() if hits]
+
+
+class KeywordClassifier[C: Hashable]:
+    """
+    Counts the keywords of every category in one pass over a text.
+
+    Args:
+        catalog: Keywords per category; a keyword may belong to several categories
+
+    Raises:
+        ValueError: If a keyword is empty
+    """
+
+    def __init__(self, catalog: Mapping[C, Iterable[str]]) -> None:
+        self.catalog = {category: list(dict.fromkeys(k.lower() for k in keywords))
+                        for category, keywords in catalog.items()}
+        self._categories_of: dict[str, list[C]] = {}
+        for category, keywords in self.catalog.items():
+            for keyword in keywords:
+                if not keyword:
+                    raise ValueError(f"Empty keyword in category {category!r}")
+                self._categories_of.setdefault(keyword, []).append(category)
+
+        vocabulary = list(self._categories_of)
+        # Longest keyword; a stream rescans this much of the previous chunk
+        self.max_length = max(map(len, vocabulary), default=0)
+        # Keywords that are proper prefixes of a longer keyword match wherever it does
+        self._prefixes = {
+            word: [other for other in vocabulary if other != word and word.startswith(other)]
+            for word in vocabulary
+        }
+        self._pattern = re.compile(f"(?=({_trie_pattern(vocabulary)}))") if vocabulary else None
+
+    def scan(self, text: str, after: int = 0) -> KeywordHits[C]:
+        """
+        Match every keyword of the catalog against a text in one pass.
+
+        Args:
+            text: Text to scan
+            after: Skip keywords ending at or before this offset, so a stream
+                can rescan the end of its previous chunk for keywords that
+                span chunks without counting any keyword twice
+        """
+        counts: Counter = Counter()
+        if self._pattern is not None and after <= 0:
+            longest = Counter(self._pattern.findall(text.lower()))
+            for word, n in longest.items():
+                counts[word] += n
+                for prefix in self._prefixes[word]:
+                    counts[prefix] += n
+        elif self._pattern is not None:
+            for match in self._pattern.finditer(text.lower()):
+                word = match.group(1)
+                for keyword in (word, *self._prefixes[word]):
+                    if match.start() + len(keyword) > after:
+                        counts[keyword] += 1
+
+        categories = dict.fromkeys(self.catalog, 0)
+        occurrences = dict.fromkeys(self.catalog, 0)
+        for word, n in counts.items():
+            for category in self._categories_of[word]:
+                categories[category] += 1
+                occurrences[category] += n
+        return KeywordHits(keywords=counts, categories=categories, occurrences=occurrences)
+
+    def classify(self, text: str, default: C | None = None) -> C | None:
+        """First category, in catalog order, with any keyword in the text."""
+        category = self.scan(text).first()
+        return default if category is None else category
@@ -7,10 +7,15 @@ Rubber Duck Debugging, Pareto Principle, and Occam's Razor.
 """
 
 import asyncio
-import random
 import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import zip_longest
 from typing import Any, Dict, List, Optional
 
+from ..base import timed_phase
+from ..keywords import KeywordClassifier
 from .models import (
     MentalModelAssumption,
     MentalModelContext,
@@ -20,6 +25,78 @@ from .models import (
     MentalModelUtils,
 )
 
+# Problem domains by keyword, each with the decomposition the models build on
+ELEMENT_DOMAINS = KeywordClassifier({
+    "data": ["database", "data", "storage", "query"],
+    "performance": ["performance", "speed", "slow", "optimize"],
+    "scale": ["scale", "scaling", "users", "load"],
+    "security": ["security", "auth", "permission", "access"],
+})
+FUNDAMENTAL_ELEMENTS = {
+    "data": ["Data access patterns", "Storage constraints", "Query optimization", "Consistency requirements"],
+    "performance": ["Resource bottlenecks", "Processing efficiency", "Network latency", "Caching strategies"],
+    "scale": ["Capacity limits", "Resource allocation", "Distribution patterns", "State management"],
+    "security": ["Authentication mechanisms", "Authorization boundaries", "Data protection", "Trust relationships"],
+    None: ["Core requirements", "Resource constraints", "User needs", "System boundaries"],
+}
+
+FACTOR_DOMAINS = KeywordClassifier({
+    "performance": ["performance", "speed", "optimize"],
+    "user": ["user", "experience", "interface"],
+    "business": ["business", "revenue", "cost", "profit"],
+    "organization": ["team", "organization", "process"],
+})
+CRITICAL_FACTORS = {
+    "performance": ["CPU utilization", "Memory allocation", "I/O bottlenecks", "Network latency", "Algorithm complexity"],
+    "user": ["User workflow efficiency", "Error handling", "Response time", "Information clarity", "Navigation design"],
+    "business": ["Customer acquisition cost", "Revenue per user", "Operational efficiency", "Market positioning", "Resource utilization"],
+    "organization": ["Communication effectiveness", "Decision-making speed", "Skill alignment", "Process bottlenecks", "Information flow"],
+    None: ["Primary constraint", "Key resource limitation", "Critical dependency", "Main user need", "Core functionality"],
+}
+
+EXPLANATION_DOMAINS = KeywordClassifier({
+    "data": ["database", "data", "query"],
+    "performance": ["performance", "slow", "speed"],
+    "user": ["user", "interface", "experience"],
+    "scale": ["scale", "growth", "users"],
+})
+SIMPLIFIED_EXPLANATIONS = {
+    "data": "The system needs to store and retrieve data efficiently. The simplest approach is to use appropriate data structures and indexing.",
+    "performance": "Something is taking too long. The simplest solution is to identify and eliminate the bottleneck causing the delay.",
+    "user": "Users need to accomplish a task easily. The simplest approach is to remove unnecessary steps and make the required actions obvious.",
+    "scale": "The system needs to handle more load. The simplest approach is to increase capacity where the constraint exists.",
+    None: "The core issue can likely be addressed directly without complex intermediary solutions or abstractions.",
+}
+
+
+@dataclass(frozen=True)
+class ProblemDecomposition:
+    """Analysis of a problem shared by every mental model applied to it."""
+
+    fundamental_elements: tuple[str, ...]
+    critical_factors: tuple[str, ...]
+    simplified_explanation: str
+
+
+@lru_cache(maxsize=256)
+def decompose_problem(problem: str) -> ProblemDecomposition:
+    """Decompose a problem once, however many models are applied to it."""
+    return ProblemDecomposition(
+        fundamental_elements=tuple(FUNDAMENTAL_ELEMENTS[ELEMENT_DOMAINS.classify(problem)]),
+        critical_factors=tuple(CRITICAL_FACTORS[FACTOR_DOMAINS.classify(problem)]),
+        simplified_explanation=SIMPLIFIED_EXPLANATIONS[EXPLANATION_DOMAINS.classify(problem)],
+    )
+
+
+def _interleave(lists: Iterable[list[Any]], limit: int) -> list[Any]:
+    """Round-robin merge of lists without duplicates, so every model is represented."""
+    merged: list[Any] = []
+    for row in zip_longest(*lists):
+        for item in row:
+            if item is not None and item not in merged:
+                merged.append(item)
+    return merged[:limit]
+
 
 class MentalModelsAnalyzer:
     """Mental models cognitive tool analyzer"""
@@ -32,33 +109,41 @@ class MentalModelsAnalyzer:
         # Internal state for processing
         self._processing_start_time = 0.0
 
+        self._model_handlers = {
+            MentalModelType.FIRST_PRINCIPLES: self._apply_first_principles,
+            MentalModelType.OPPORTUNITY_COST: self._apply_opportunity_cost,
+            MentalModelType.ERROR_PROPAGATION: self._apply_error_propagation,
+            MentalModelType.RUBBER_DUCK: self._apply_rubber_duck,
+            MentalModelType.PARETO_PRINCIPLE: self._apply_pareto_principle,
+            MentalModelType.OCCAMS_RAZOR: self._apply_occams_razor,
+        }
+
     async def analyze(self, context: MentalModelContext) -> MentalModelResult:
         """
         Analyze a problem using the specified mental model framework.
 
+        With additional models, every model runs concurrently over one
+        decomposition of the problem and the results are combined.
+
         Args:
-            context: Mental model context with problem and model type
+            context: Mental model context with problem and model types
 
         Returns:
             MentalModelResult with insights and recommendations
         """
         self._processing_start_time = time.time()
 
-        # Route to specific mental model implementation
-        if context.model_type == MentalModelType.FIRST_PRINCIPLES:
-            result = await self._apply_first_principles(context)
-        elif context.model_type == MentalModelType.OPPORTUNITY_COST:
-            result = await self._apply_opportunity_cost(context)
-        elif context.model_type == MentalModelType.ERROR_PROPAGATION:
-            result = await self._apply_error_propagation(context)
-        elif context.model_type == MentalModelType.RUBBER_DUCK:
-            result = await self._apply_rubber_duck(context)
-        elif context.model_type == MentalModelType.PARETO_PRINCIPLE:
-            result = await self._apply_pareto_principle(context)
-        elif context.model_type == MentalModelType.OCCAMS_RAZOR:
-            result = await self._apply_occams_razor(context)
-        else:
-            raise ValueError(f"Unsupported mental model: {context.model_type}")
+        models = list(dict.fromkeys([context.model_type, *context.additional_models]))
+        for model in models:
+            if model not in self._model_handlers:
+                raise ValueError(f"Unsupported mental model: {model}")
+
+        decomposition = decompose_problem(context.problem)
+        results = await asyncio.gather(*(
+            self._model_handlers[model](context, decomposition) for model in models
+        ))
+        result = results[0] if len(results) == 1 else self._combine_results(results)
+        result.models_applied = models
 
         # Set processing time
         processing_time = time.time() - self._processing_start_time
@@ -66,14 +151,44 @@ class MentalModelsAnalyzer:
 
         return result
 
-    async def _apply_first_principles(self, context: MentalModelContext) -> MentalModelResult:
+    @timed_phase
+    def _combine_results(self, results: list[MentalModelResult]) -> MentalModelResult:
+        """Combine the results of several models, primary model first"""
+        primary = results[0]
+        insights = sorted(
+            (insight for result in results for insight in result.key_insights),
+            key=lambda insight: insight.relevance_score,
+            reverse=True
+        )
+
+        def first(field: str) -> Any:
+            return next((value for r in results if (value := getattr(r, field)) is not None), None)
+
+        return MentalModelResult(
+            model_applied=primary.model_applied,
+            key_insights=insights[:10],
+            recommendations=_interleave((r.recommendations for r in results), 8),
+            assumptions_identified=_interleave((r.assumptions_identified for r in results), 6),
+            fundamental_elements=first("fundamental_elements"),
+            trade_offs=first("trade_offs"),
+            error_paths=first("error_paths"),
+            critical_factors=first("critical_factors"),
+            simplified_explanation=first("simplified_explanation"),
+            limitations=primary.limitations,
+            next_steps=_interleave((r.next_steps or [] for r in results), 5),
+            model_results=results
+        )
+
+    @timed_phase
+    async def _apply_first_principles(
+        self, context: MentalModelContext, decomposition: ProblemDecomposition
+    ) -> MentalModelResult:
         """Apply first principles thinking to the problem"""
 
         # Simulate processing time
         await asyncio.sleep(0.1)
 
-        # Generate fundamental elements
-        fundamental_elements = await self._identify_fundamental_elements(context.problem)
+        fundamental_elements = list(decomposition.fundamental_elements)
 
         # Generate insights based on first principles
         insights = [
@@ -135,7 +250,10 @@ class MentalModelsAnalyzer:
             ]
         )
 
-    async def _apply_opportunity_cost(self, context: MentalModelContext) -> MentalModelResult:
+    @timed_phase
+    async def _apply_opportunity_cost(
+        self, context: MentalModelContext, decomposition: ProblemDecomposition
+    ) -> MentalModelResult:
         """Apply opportunity cost analysis to the problem"""
 
         await asyncio.sleep(0.1)
@@ -208,7 +326,10 @@ class MentalModelsAnalyzer:
             ]
         )
 
-    async def _apply_error_propagation(self, context: MentalModelContext) -> MentalModelResult:
+    @timed_phase
+    async def _apply_error_propagation(
+        self, context: MentalModelContext, decomposition: ProblemDecomposition
+    ) -> MentalModelResult:
         """Apply error propagation analysis to the problem"""
 
         await asyncio.sleep(0.1)
@@ -273,7 +394,10 @@ class MentalModelsAnalyzer:
             ]
         )
 
-    async def _apply_rubber_duck(self, context: MentalModelContext) -> MentalModelResult:
+    @timed_phase
+    async def _apply_rubber_duck(
+        self, context: MentalModelContext, decomposition: ProblemDecomposition
+    ) -> MentalModelResult:
         """Apply rubber duck debugging method to the problem"""
 
         await asyncio.sleep(0.1)
@@ -344,13 +468,15 @@ class MentalModelsAnalyzer:
             simplified_explanation=structured_explanation
         )
 
-    async def _apply_pareto_principle(self, context: MentalModelContext) -> MentalModelResult:
+    @timed_phase
+    async def _apply_pareto_principle(
+        self, context: MentalModelContext, decomposition: ProblemDecomposition
+    ) -> MentalModelResult:
         """Apply Pareto Principle (80/20 rule) to the problem"""
 
         await asyncio.sleep(0.1)
 
-        # Generate critical factors based on problem analysis
-        critical_factors = await self._identify_critical_factors(context.problem)
+        critical_factors = list(decomposition.critical_factors)
 
         insights = [
             MentalModelInsight(
@@ -403,13 +529,15 @@ class MentalModelsAnalyzer:
             ]
         )
 
-    async def _apply_occams_razor(self, context: MentalModelContext) -> MentalModelResult:
+    @timed_phase
+    async def _apply_occams_razor(
+        self, context: MentalModelContext, decomposition: ProblemDecomposition
+    ) -> MentalModelResult:
         """Apply Occam's Razor to find simplest viable solution"""
 
         await asyncio.sleep(0.1)
 
-        # Generate simplified explanation
-        simplified_explanation = await self._generate_simplified_explanation(context.problem)
+        simplified_explanation = decomposition.simplified_explanation
 
         insights = [
             MentalModelInsight(
@@ -467,48 +595,3 @@ class MentalModelsAnalyzer:
                 "Document rationale for any added complexity"
             ]
         )
-
-    async def _identify_fundamental_elements(self, problem: str) -> list[str]:
-        """Identify fundamental elements for first principles analysis"""
-        problem_lower = problem.lower()
-
-        if any(word in problem_lower for word in ['database', 'data', 'storage', 'query']):
-            return ["Data access patterns", "Storage constraints", "Query optimization", "Consistency requirements"]
-        elif any(word in problem_lower for word in ['performance', 'speed', 'slow', 'optimize']):
-            return ["Resource bottlenecks", "Processing efficiency", "Network latency", "Caching strategies"]
-        elif any(word in problem_lower for word in ['scale', 'scaling', 'users', 'load']):
-            return ["Capacity limits", "Resource allocation", "Distribution patterns", "State management"]
-        elif any(word in problem_lower for word in ['security', 'auth', 'permission', 'access']):
-            return ["Authentication mechanisms", "Authorization boundaries", "Data protection", "Trust relationships"]
-        else:
-            return ["Core requirements", "Resource constraints", "User needs", "System boundaries"]
-
-    async def _identify_critical_factors(self, problem: str) -> list[str]:
-        """Identify critical 20% factors for Pareto analysis"""
-        problem_lower = problem.lower()
-
-        if any(word in problem_lower for word in ['performance', 'speed', 'optimize']):
-            return ["CPU utilization", "Memory allocation", "I/O bottlenecks", "Network latency", "Algorithm complexity"]
-        elif any(word in problem_lower for word in ['user', 'experience', 'interface']):
-            return ["User workflow efficiency", "Error handling", "Response time", "Information clarity", "Navigation design"]
-        elif any(word in problem_lower for word in ['business', 'revenue', 'cost', 'profit']):
-            return ["Customer acquisition cost", "Revenue per user", "Operational efficiency", "Market positioning", "Resource utilization"]
-        elif any(word in problem_lower for word in ['team', 'organization', 'process']):
-            return ["Communication effectiveness", "Decision-making speed", "Skill alignment", "Process bottlenecks", "Information flow"]
-        else:
-            return ["Primary constraint", "Key resource limitation", "Critical dependency", "Main user need", "Core functionality"]
-
-    async def _generate_simplified_explanation(self, problem: str) -> str:
-        """Generate simplified explanation for Occam's Razor analysis"""
-        problem_lower = problem.lower()
-
-        if any(word in problem_lower for word in ['database', 'data', 'query']):
-            return "The system needs to store and retrieve data efficiently. The simplest approach is to use appropriate data structures and indexing."
-        elif any(word in problem_lower for word in ['performance', 'slow', 'speed']):
-            return "Something is taking too long. The simplest solution is to identify and eliminate the bottleneck causing the delay."
-        elif any(word in problem_lower for word in ['user', 'interface', 'experience']):
-            return "Users need to accomplish a task easily. The simplest approach is to remove unnecessary steps and make the required actions obvious."
-        elif any(word in problem_lower for word in ['scale', 'growth', 'users']):
-            return "The system needs to handle more load. The simplest approach is to increase capacity where the constraint exists."
-        else:
-            return "The core issue can likely be addressed directly without complex intermediary solutions or abstractions."
@@ -136,6 +136,12 @@ class MentalModelContext(BaseModel):
         description="Type of mental model to apply"
     )
 
+    additional_models: list[MentalModelType] = Field(
+        default_factory=list,
+        description="Further models to apply concurrently over the same problem decomposition",
+        max_length=5
+    )
+
     complexity_level: ComplexityLevel = Field(
         ComplexityLevel.MODERATE,
         description="Complexity level of analysis to perform"
@@ -260,6 +266,16 @@ class MentalModelResult(BaseModel):
         max_length=5
     )
 
+    models_applied: list[MentalModelType] = Field(
+        default_factory=list,
+        description="Every model applied, primary first"
+    )
+
+    model_results: list["MentalModelResult"] = Field(
+        default_factory=list,
+        description="Result of each model when several were applied"
+    )
+
     processing_time_ms: int = Field(
         0,
         description="Time taken to process in milliseconds"
@@ -12,15 +12,20 @@ from .models import (
     ComplexityLevel,
     ConfidenceAssessment,
     ConfidenceCalibration,
+    InterventionAlert,
     MetacognitiveMonitoringContext,
     MetacognitiveMonitoringResult,
     MetaLearningInsight,
     MetaStrategies,
+    MonitorEvent,
+    MonitorEventType,
     MonitoringDepth,
     MonitoringFrequency,
     ReasoningMonitor,
     StrategyEvaluation,
+    StreamMonitorState,
 )
+from .stream import ReasoningStreamMonitor
 
 __all__ = [
     # Enums
@@ -30,6 +35,7 @@ __all__ = [
     "ConfidenceCalibration",
     "MonitoringDepth",
     "MonitoringFrequency",
+    "MonitorEventType",
     # Models
     "BiasDetection",
     "ReasoningMonitor",
@@ -38,6 +44,11 @@ __all__ = [
     "MetaLearningInsight",
     "MetacognitiveMonitoringContext",
     "MetacognitiveMonitoringResult",
+    "InterventionAlert",
+    "StreamMonitorState",
+    "MonitorEvent",
     # Main class
     "MetacognitiveMonitoringAnalyzer",
+    # Streaming
+    "ReasoningStreamMonitor",
 ]
@@ -12,6 +12,8 @@ import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..base import BaseCognitiveAnalyzer, timed_phase
+from ..keywords import KeywordClassifier
 from .models import (
     BiasDetection,
     BiasType,
@@ -27,14 +29,65 @@ from .models import (
     StrategyEvaluation,
 )
 
-
-class MetacognitiveMonitoringAnalyzer:
+# Phrases in the reasoning text that signal each detectable bias
+BIAS_PHRASES = KeywordClassifier({
+    BiasType.CONFIRMATION_BIAS: [
+        "as expected", "confirms my", "proves that", "obviously", "clearly shows"
+    ],
+    BiasType.ANCHORING_BIAS: [
+        "initial", "first impression", "baseline", "starting point", "originally"
+    ],
+    BiasType.AVAILABILITY_HEURISTIC: [
+        "recent", "memorable", "vivid", "striking example", "comes to mind"
+    ],
+    BiasType.OVERCONFIDENCE_BIAS: [
+        "certain", "definitely", "no doubt", "guaranteed", "impossible to be wrong"
+    ],
+})
+
+# Words that raise or lower the confidence the reasoning states
+CONFIDENCE_WORDS = KeywordClassifier({
+    "high": ["certain", "definitely", "clearly", "obviously", "undoubtedly"],
+    "low": ["maybe", "perhaps", "possibly", "might", "could be"],
+})
+
+# Phrases that show which reasoning strategies the text applies
+STRATEGY_PHRASES = KeywordClassifier({
+    "analytical": ["analyze", "break down", "component", "systematic", "step by step"],
+    "creative": ["creative", "innovative", "novel", "brainstorm", "imagine"],
+    "evidence_based": ["evidence", "data", "research", "study", "empirical"],
+})
+
+
+def stated_confidence_level(high_confidence_words: int, low_confidence_words: int) -> float:
+    """Confidence expressed by reasoning, from its distinct certain and hedging words."""
+    if high_confidence_words > low_confidence_words:
+        return min(0.95, 0.7 + (high_confidence_words * 0.05))
+    if low_confidence_words > high_confidence_words:
+        return max(0.3, 0.6 - (low_confidence_words * 0.05))
+    return 0.65
+
+
+class MetacognitiveMonitoringAnalyzer(BaseCognitiveAnalyzer):
     """Metacognitive monitoring cognitive tool analyzer"""
 
+    # Monitors, bias detection, confidence and strategy evaluation feed the
+    # required quality scores and always run; the remaining result sections
+    # run only when requested
+    phase_dependencies = {
+        "meta_learning_insights": (),
+        "improvement_recommendations": (),
+        "intervention_alerts": (),
+        "reasoning_patterns_identified": (),
+    }
+
     def __init__(self):
         """Initialize the metacognitive monitoring analyzer"""
-        self.tool_name = "Metacognitive Monitoring"
-        self.version = "2.0.0"
+        super().__init__(
+            tool_name="Metacognitive Monitoring",
+            tool_description="Monitors reasoning for biases, confidence calibration and strategy fit",
+            version="2.0.0"
+        )
 
         # Internal state for processing
         self._processing_start_time = 0.0
@@ -53,6 +106,7 @@ class MetacognitiveMonitoringAnalyzer:
             MetacognitiveMonitoringResult with monitoring insights and recommendations
         """
         self._processing_start_time = time.time()
+        rng = self.request_rng(context)
 
         # Initialize internal state
         self._active_monitors = []
@@ -60,27 +114,29 @@ class MetacognitiveMonitoringAnalyzer:
         self._strategy_scores = {}
 
         # Set up reasoning monitors
-        reasoning_monitors = await self._setup_reasoning_monitors(context)
+        reasoning_monitors = await self._setup_reasoning_monitors(context, rng)
         self._active_monitors = reasoning_monitors
 
         # Detect biases if enabled
         bias_detections = []
         if context.bias_detection_enabled:
-            bias_detections = await self._detect_biases(context)
+            bias_detections = await self._detect_biases(context, rng)
             self._detected_biases = bias_detections
 
         # Assess confidence calibration if enabled
-        confidence_assessment = await self._assess_confidence(context)
+        confidence_assessment = await self._assess_confidence(context, rng)
 
         # Evaluate strategies if enabled
         strategy_evaluations = []
         if context.strategy_evaluation_enabled:
-            strategy_evaluations = await self._evaluate_strategies(context)
+            strategy_evaluations = await self._evaluate_strategies(context, rng)
 
         # Extract meta-learning insights if enabled
-        meta_learning_insights = []
-        if context.meta_learning_enabled:
-            meta_learning_insights = await self._extract_meta_learning_insights(context)
+        sections: dict[str, Any] = {}
+        if context.meta_learning_enabled and self.needs_phase("meta_learning_insights"):
+            sections["meta_learning_insights"] = await self._extract_meta_learning_insights(
+                context
+            )
 
         # Calculate overall metrics
         overall_quality = await self._calculate_overall_quality(
@@ -96,18 +152,21 @@ class MetacognitiveMonitoringAnalyzer:
         )
 
         # Generate recommendations and alerts
-        improvement_recommendations = await self._generate_recommendations(
-            context, bias_detections, confidence_assessment, strategy_evaluations
-        )
+        if self.needs_phase("improvement_recommendations"):
+            sections["improvement_recommendations"] = await self._generate_recommendations(
+                context, bias_detections, confidence_assessment, strategy_evaluations
+            )
 
-        intervention_alerts = await self._generate_intervention_alerts(
-            context, bias_detections, confidence_assessment
-        )
+        if self.needs_phase("intervention_alerts"):
+            sections["intervention_alerts"] = await self._generate_intervention_alerts(
+                context, bias_detections, confidence_assessment
+            )
 
         # Identify reasoning patterns
-        reasoning_patterns = await self._identify_reasoning_patterns(
-            context, bias_detections, strategy_evaluations
-        )
+        if self.needs_phase("reasoning_patterns_identified"):
+            sections["reasoning_patterns_identified"] = await self._identify_reasoning_patterns(
+                context, bias_detections, strategy_evaluations
+            )
 
         # Calculate processing time
         monitoring_duration = time.time() - self._processing_start_time
@@ -117,22 +176,21 @@ class MetacognitiveMonitoringAnalyzer:
             reasoning_monitors=reasoning_monitors,
             confidence_assessment=confidence_assessment,
             strategy_evaluations=strategy_evaluations,
-            meta_learning_insights=meta_learning_insights,
             overall_reasoning_quality=overall_quality,
             metacognitive_awareness_level=metacognitive_awareness,
-            improvement_recommendations=improvement_recommendations,
-            intervention_alerts=intervention_alerts,
-            reasoning_patterns_identified=reasoning_patterns,
             monitoring_duration_seconds=monitoring_duration,
             monitors_activated=len(reasoning_monitors),
             biases_corrected=0,  # Will be updated by model validator
             metacognitive_efficiency=metacognitive_efficiency,
-            processing_time_ms=round(monitoring_duration * 1000)
+            processing_time_ms=round(monitoring_duration * 1000),
+            **sections,
         )
 
+    @timed_phase
     async def _setup_reasoning_monitors(
         self,
-        context: MetacognitiveMonitoringContext
+        context: MetacognitiveMonitoringContext,
+        rng: random.Random
     ) -> list[ReasoningMonitor]:
         """Set up monitors for tracking reasoning process"""
 
@@ -155,10 +213,10 @@ class MetacognitiveMonitoringAnalyzer:
                 "reasoning_gaps": 0.3
             },
             current_values={
-                "argument_validity": random.uniform(0.7, 0.95),
-                "premise_consistency": random.uniform(0.75, 0.95),
-                "conclusion_support": random.uniform(0.6, 0.9),
-                "reasoning_gaps": random.uniform(0.1, 0.4)
+                "argument_validity": rng.uniform(0.7, 0.95),
+                "premise_consistency": rng.uniform(0.75, 0.95),
+                "conclusion_support": rng.uniform(0.6, 0.9),
+                "reasoning_gaps": rng.uniform(0.1, 0.4)
             }
         )
         monitors.append(logic_monitor)
@@ -181,10 +239,10 @@ class MetacognitiveMonitoringAnalyzer:
                     "solution_convergence": 0.65
                 },
                 current_values={
-                    "step_completion_rate": random.uniform(0.6, 0.9),
-                    "time_efficiency": random.uniform(0.5, 0.8),
-                    "backtracking_frequency": random.uniform(0.2, 0.5),
-                    "solution_convergence": random.uniform(0.5, 0.85)
+                    "step_completion_rate": rng.uniform(0.6, 0.9),
+                    "time_efficiency": rng.uniform(0.5, 0.8),
+                    "backtracking_frequency": rng.uniform(0.2, 0.5),
+                    "solution_convergence": rng.uniform(0.5, 0.85)
                 }
             )
             monitors.append(progress_monitor)
@@ -207,10 +265,10 @@ class MetacognitiveMonitoringAnalyzer:
                     "critical_thinking_level": 0.75
                 },
                 current_values={
-                    "analysis_depth": random.uniform(0.65, 0.9),
-                    "evidence_quality": random.uniform(0.7, 0.95),
-                    "alternative_consideration": random.uniform(0.6, 0.85),
-                    "critical_thinking_level": random.uniform(0.65, 0.9)
+                    "analysis_depth": rng.uniform(0.65, 0.9),
+                    "evidence_quality": rng.uniform(0.7, 0.95),
+                    "alternative_consideration": rng.uniform(0.6, 0.85),
+                    "critical_thinking_level": rng.uniform(0.65, 0.9)
                 }
             )
             monitors.append(quality_monitor)
@@ -239,22 +297,22 @@ class MetacognitiveMonitoringAnalyzer:
 
         return monitors
 
+    @timed_phase
     async def _detect_biases(
         self,
-        context: MetacognitiveMonitoringContext
+        context: MetacognitiveMonitoringContext,
+        rng: random.Random
     ) -> list[BiasDetection]:
         """Detect cognitive biases in the reasoning process"""
 
         biases = []
-        reasoning_text = context.reasoning_target.lower()
+        signalled = BIAS_PHRASES.scan(context.reasoning_target).matched()
 
         # Confirmation bias detection
-        if any(phrase in reasoning_text for phrase in [
-            "as expected", "confirms my", "proves that", "obviously", "clearly shows"
-        ]):
+        if BiasType.CONFIRMATION_BIAS in signalled:
             confirmation_bias = BiasDetection(
                 bias_type=BiasType.CONFIRMATION_BIAS,
-                confidence_level=random.uniform(0.65, 0.85),
+                confidence_level=rng.uniform(0.65, 0.85),
                 evidence=[
                     "Strong confirmation language detected",
                     "Limited consideration of contradictory evidence",
@@ -272,12 +330,10 @@ class MetacognitiveMonitoringAnalyzer:
             biases.append(confirmation_bias)
 
         # Anchoring bias detection
-        if any(phrase in reasoning_text for phrase in [
-            "initial", "first impression", "baseline", "starting point", "originally"
-        ]):
+        if BiasType.ANCHORING_BIAS in signalled:
             anchoring_bias = BiasDetection(
                 bias_type=BiasType.ANCHORING_BIAS,
-                confidence_level=random.uniform(0.6, 0.8),
+                confidence_level=rng.uniform(0.6, 0.8),
                 evidence=[
                     "Heavy reliance on initial information",
                     "Insufficient adjustment from starting point",
@@ -295,12 +351,10 @@ class MetacognitiveMonitoringAnalyzer:
             biases.append(anchoring_bias)
 
         # Availability heuristic detection
-        if any(phrase in reasoning_text for phrase in [
-            "recent", "memorable", "vivid", "striking example", "comes to mind"
-        ]):
+        if BiasType.AVAILABILITY_HEURISTIC in signalled:
             availability_bias = BiasDetection(
                 bias_type=BiasType.AVAILABILITY_HEURISTIC,
-                confidence_level=random.uniform(0.55, 0.75),
+                confidence_level=rng.uniform(0.55, 0.75),
                 evidence=[
                     "Overemphasis on recent or memorable events",
                     "Probability judgments based on ease of recall",
@@ -318,12 +372,10 @@ class MetacognitiveMonitoringAnalyzer:
             biases.append(availability_bias)
 
         # Overconfidence bias detection
-        if any(phrase in reasoning_text for phrase in [
-            "certain", "definitely", "no doubt", "guaranteed", "impossible to be wrong"
-        ]):
+        if BiasType.OVERCONFIDENCE_BIAS in signalled:
             overconfidence_bias = BiasDetection(
                 bias_type=BiasType.OVERCONFIDENCE_BIAS,
-                confidence_level=random.uniform(0.7, 0.9),
+                confidence_level=rng.uniform(0.7, 0.9),
                 evidence=[
                     "Excessive certainty in conclusions",
                     "Underestimation of uncertainty",
@@ -343,57 +395,48 @@ class MetacognitiveMonitoringAnalyzer:
 
         return biases
 
+    @timed_phase
     async def _assess_confidence(
         self,
-        context: MetacognitiveMonitoringContext
+        context: MetacognitiveMonitoringContext,
+        rng: random.Random
     ) -> ConfidenceAssessment:
         """Assess and calibrate confidence levels"""
 
         # Simulate stated confidence based on reasoning language
-        reasoning_text = context.reasoning_target.lower()
-
         # Count confidence indicators
-        high_confidence_words = sum(1 for word in [
-            "certain", "definitely", "clearly", "obviously", "undoubtedly"
-        ] if word in reasoning_text)
-
-        low_confidence_words = sum(1 for word in [
-            "maybe", "perhaps", "possibly", "might", "could be"
-        ] if word in reasoning_text)
+        indicators = CONFIDENCE_WORDS.scan(context.reasoning_target).categories
+        high_confidence_words = indicators["high"]
+        low_confidence_words = indicators["low"]
 
         # Calculate stated confidence
-        if high_confidence_words > low_confidence_words:
-            stated_confidence = min(0.95, 0.7 + (high_confidence_words * 0.05))
-        elif low_confidence_words > high_confidence_words:
-            stated_confidence = max(0.3, 0.6 - (low_confidence_words * 0.05))
-        else:
-            stated_confidence = 0.65
+        stated_confidence = stated_confidence_level(high_confidence_words, low_confidence_words)
 
         # Calibrate confidence based on method
         calibration_factors = []
 
         if context.calibration_method == ConfidenceCalibration.EVIDENCE_BASED:
             # Adjust based on evidence quality
-            evidence_adjustment = random.uniform(-0.15, 0.1)
+            evidence_adjustment = rng.uniform(-0.15, 0.1)
             calibration_factors.append("Quality and quantity of supporting evidence")
             calibration_factors.append("Strength of logical arguments")
 
         elif context.calibration_method == ConfidenceCalibration.HISTORICAL_PERFORMANCE:
             # Adjust based on past accuracy
-            historical_adjustment = random.uniform(-0.1, 0.05)
+            historical_adjustment = rng.uniform(-0.1, 0.05)
             evidence_adjustment = historical_adjustment
             calibration_factors.append("Historical accuracy in similar domains")
             calibration_factors.append("Past calibration performance")
 
         elif context.calibration_method == ConfidenceCalibration.PEER_COMPARISON:
             # Adjust based on peer benchmarks
-            peer_adjustment = random.uniform(-0.12, 0.08)
+            peer_adjustment = rng.uniform(-0.12, 0.08)
             evidence_adjustment = peer_adjustment
             calibration_factors.append("Comparison with peer assessments")
             calibration_factors.append("Expert consensus levels")
 
         else:
-            evidence_adjustment = random.uniform(-0.1, 0.05)
+            evidence_adjustment = rng.uniform(-0.1, 0.05)
             calibration_factors.append("General calibration heuristics")
 
         # Add complexity adjustment
@@ -432,26 +475,26 @@ class MetacognitiveMonitoringAnalyzer:
             reliability_score=reliability_score
         )
 
+    @timed_phase
     async def _evaluate_strategies(
         self,
-        context: MetacognitiveMonitoringContext
+        context: MetacognitiveMonitoringContext,
+        rng: random.Random
     ) -> list[StrategyEvaluation]:
         """Evaluate reasoning strategies used"""
 
         evaluations = []
 
         # Analyze reasoning text for strategy indicators
-        reasoning_text = context.reasoning_target.lower()
+        applied = STRATEGY_PHRASES.scan(context.reasoning_target).matched()
 
         # Analytical strategy evaluation
-        if any(phrase in reasoning_text for phrase in [
-            "analyze", "break down", "component", "systematic", "step by step"
-        ]):
+        if "analytical" in applied:
             analytical_eval = StrategyEvaluation(
                 strategy_name="Analytical Decomposition",
                 strategy_description="Breaking down complex problems into manageable components for systematic analysis",
-                effectiveness_score=random.uniform(0.7, 0.9),
-                efficiency_score=random.uniform(0.65, 0.85),
+                effectiveness_score=rng.uniform(0.7, 0.9),
+                efficiency_score=rng.uniform(0.65, 0.85),
                 appropriateness_score=0.85 if context.complexity_level.value in ["complex", "very_complex"] else 0.7,
                 strengths=[
                     "Systematic approach reduces complexity",
@@ -479,14 +522,12 @@ class MetacognitiveMonitoringAnalyzer:
             self._strategy_scores["analytical"] = analytical_eval.effectiveness_score
 
         # Creative strategy evaluation
-        if any(phrase in reasoning_text for phrase in [
-            "creative", "innovative", "novel", "brainstorm", "imagine"
-        ]):
+        if "creative" in applied:
             creative_eval = StrategyEvaluation(
                 strategy_name="Creative Exploration",
                 strategy_description="Using divergent thinking and creative approaches to generate novel solutions",
-                effectiveness_score=random.uniform(0.65, 0.85),
-                efficiency_score=random.uniform(0.5, 0.75),
+                effectiveness_score=rng.uniform(0.65, 0.85),
+                efficiency_score=rng.uniform(0.5, 0.75),
                 appropriateness_score=0.8 if "novel" in context.reasoning_target else 0.6,
                 strengths=[
                     "Generates innovative solutions",
@@ -514,14 +555,12 @@ class MetacognitiveMonitoringAnalyzer:
             self._strategy_scores["creative"] = creative_eval.effectiveness_score
 
         # Evidence-based strategy evaluation
-        if any(phrase in reasoning_text for phrase in [
-            "evidence", "data", "research", "study", "empirical"
-        ]):
+        if "evidence_based" in applied:
             evidence_eval = StrategyEvaluation(
                 strategy_name="Evidence-Based Reasoning",
                 strategy_description="Making decisions based on empirical evidence and data-driven insights",
-                effectiveness_score=random.uniform(0.75, 0.95),
-                efficiency_score=random.uniform(0.6, 0.8),
+                effectiveness_score=rng.uniform(0.75, 0.95),
+                efficiency_score=rng.uniform(0.6, 0.8),
                 appropriateness_score=0.9,
                 strengths=[
                     "High reliability of conclusions",
@@ -551,6 +590,7 @@ class MetacognitiveMonitoringAnalyzer:
 
         return evaluations
 
+    @timed_phase
     async def _extract_meta_learning_insights(
         self,
         context: MetacognitiveMonitoringContext
@@ -654,6 +694,7 @@ class MetacognitiveMonitoringAnalyzer:
 
         return insights
 
+    @timed_phase
     async def _calculate_overall_quality(
         self,
         biases: list[BiasDetection],
@@ -686,6 +727,7 @@ class MetacognitiveMonitoringAnalyzer:
         # Ensure quality is within bounds
         return max(0.0, min(1.0, quality))
 
+    @timed_phase
     async def _calculate_metacognitive_awareness(
         self,
         context: MetacognitiveMonitoringContext,
@@ -713,6 +755,7 @@ class MetacognitiveMonitoringAnalyzer:
 
         return min(1.0, awareness)
 
+    @timed_phase
     async def _calculate_efficiency(
         self,
         context: MetacognitiveMonitoringContext,
@@ -739,6 +782,7 @@ class MetacognitiveMonitoringAnalyzer:
 
         return max(0.0, min(1.0, efficiency))
 
+    @timed_phase
     async def _generate_recommendations(
         self,
         context: MetacognitiveMonitoringContext,
@@ -797,6 +841,7 @@ class MetacognitiveMonitoringAnalyzer:
 
         return recommendations[:10]  # Limit to 10 recommendations
 
+    @timed_phase
     async def _generate_intervention_alerts(
         self,
         context: MetacognitiveMonitoringContext,
@@ -830,6 +875,7 @@ class MetacognitiveMonitoringAnalyzer:
 
         return alerts[:5]  # Limit to 5 most important alerts
 
+    @timed_phase
     async def _identify_reasoning_patterns(
         self,
         context: MetacognitiveMonitoringContext,
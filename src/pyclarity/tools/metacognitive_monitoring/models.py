@@ -8,7 +8,7 @@ strategy evaluation.
 
 import uuid
 from datetime import datetime
-from enum import Enum
+from enum import Enum, StrEnum
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -91,6 +91,12 @@ class MonitoringFrequency(str, Enum):
     MILESTONE = "milestone"
 
 
+class MonitorEventType(StrEnum):
+    """Kinds of events emitted while monitoring a reasoning stream"""
+    ALERT = "alert"
+    SUMMARY = "summary"
+
+
 class BiasDetection(BaseModel):
     """Detection of a specific cognitive bias"""
 
@@ -510,6 +516,11 @@ class MetacognitiveMonitoringContext(BaseModel):
         description="Threshold for triggering interventions"
     )
 
+    random_seed: int | None = Field(
+        None,
+        description="Seed for reproducible monitoring; derived from the input when omitted"
+    )
+
     @field_validator('reasoning_target')
     @classmethod
     def validate_reasoning_target(cls, v):
@@ -666,3 +677,104 @@ class MetacognitiveMonitoringResult(BaseModel):
         return len(self.intervention_alerts) > 0 or any(
             bias.severity == "high" for bias in self.bias_detections
         )
+
+
+class InterventionAlert(BaseModel):
+    """Threshold crossing raised while reasoning is still being produced"""
+
+    alert_type: str = Field(
+        ...,
+        description="What crossed its threshold: 'bias' or 'confidence'"
+    )
+
+    bias_type: BiasType | None = Field(
+        None,
+        description="Bias signalled, for bias alerts"
+    )
+
+    score: float = Field(
+        ...,
+        ge=0.0,
+        le=1.0,
+        description="Signal strength that crossed the intervention threshold"
+    )
+
+    chunk_index: int = Field(
+        ...,
+        ge=0,
+        description="Chunk whose text crossed the threshold"
+    )
+
+    words_processed: int = Field(
+        ...,
+        ge=0,
+        description="Words of reasoning seen when the alert was raised"
+    )
+
+    message: str = Field(
+        ...,
+        description="Human-readable alert, in the format of intervention_alerts"
+    )
+
+
+class StreamMonitorState(BaseModel):
+    """Running statistics of a monitored reasoning stream"""
+
+    chunks_processed: int = Field(0, ge=0, description="Chunks fed so far")
+
+    words_processed: int = Field(0, ge=0, description="Words fed so far")
+
+    bias_occurrences: dict[str, int] = Field(
+        default_factory=dict,
+        description="Bias phrase occurrences per bias type"
+    )
+
+    bias_scores: dict[str, float] = Field(
+        default_factory=dict,
+        description="Signal strength per bias type, rising with each occurrence"
+    )
+
+    high_confidence_markers: int = Field(
+        0,
+        ge=0,
+        description="Distinct words expressing certainty"
+    )
+
+    low_confidence_markers: int = Field(
+        0,
+        ge=0,
+        description="Distinct words expressing doubt"
+    )
+
+    stated_confidence: float = Field(
+        0.65,
+        ge=0.0,
+        le=1.0,
+        description="Confidence the reasoning expresses so far"
+    )
+
+    strategies_detected: list[str] = Field(
+        default_factory=list,
+        description="Reasoning strategies applied so far"
+    )
+
+    intervention_alerts: list[str] = Field(
+        default_factory=list,
+        description="Messages of every alert raised so far"
+    )
+
+
+class MonitorEvent(BaseModel):
+    """Incremental output from monitoring a reasoning stream"""
+
+    event_type: MonitorEventType = Field(..., description="Kind of event")
+
+    sequence: int = Field(..., ge=0, description="Position of this event in the stream")
+
+    alert: InterventionAlert | None = Field(
+        None, description="Threshold crossing (alert events)"
+    )
+
+    state: StreamMonitorState | None = Field(
+        None, description="Final statistics of the stream (summary event)"
+    )
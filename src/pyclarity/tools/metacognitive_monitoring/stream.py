@@ -0,0 +1,169 @@
+"""
+Reasoning Stream Monitoring
+
+Incremental metacognitive monitoring of reasoning while it is produced,
+for example the steps emitted by sequential thinking.
+
+Each chunk is scanned once for bias phrases, confidence words and strategy
+indicators. The end of the previous chunk is rescanned with it, so a phrase
+split across chunks is still counted exactly once. Running statistics are
+updated in time proportional to the chunk, and an alert is raised the
+moment a signal first crosses the intervention threshold.
+"""
+
+from collections import Counter
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+
+from .analyzer import BIAS_PHRASES, CONFIDENCE_WORDS, STRATEGY_PHRASES, stated_confidence_level
+from .models import (
+    BiasType,
+    InterventionAlert,
+    MonitorEvent,
+    MonitorEventType,
+    StreamMonitorState,
+)
+
+# Stated confidence that needs evidence-based reasoning behind it
+UNSUPPORTED_CONFIDENCE_LEVEL = 0.8
+
+
+def bias_signal(occurrences: int) -> float:
+    """Signal strength of a bias; each further occurrence halves the remaining doubt."""
+    return 1.0 - 0.5 ** occurrences
+
+
+class ReasoningStreamMonitor:
+    """
+    Monitors reasoning text chunk by chunk.
+
+    Args:
+        intervention_threshold: Signal strength at which an alert is raised
+
+    Raises:
+        ValueError: If the threshold is outside [0, 1]
+    """
+
+    def __init__(self, intervention_threshold: float = 0.7) -> None:
+        if not 0.0 <= intervention_threshold <= 1.0:
+            raise ValueError("Intervention threshold must be between 0 and 1")
+        self.intervention_threshold = intervention_threshold
+
+        self._overlap = max(c.max_length for c in (BIAS_PHRASES, CONFIDENCE_WORDS, STRATEGY_PHRASES)) - 1
+        self._tail = ""
+        self._chunks = 0
+        self._words = 0
+        self._bias_occurrences: Counter = Counter()
+        self._confidence_markers: dict[str, set[str]] = {"high": set(), "low": set()}
+        self._strategies: dict[str, None] = {}
+        self._alerted: set[BiasType | str] = set()
+        self._alerts: list[InterventionAlert] = []
+
+    def feed(self, chunk: str) -> list[InterventionAlert]:
+        """Add a chunk of reasoning; returns the alerts it raised."""
+        buffer = self._tail + chunk
+        after = len(self._tail)
+
+        words = len(chunk.split())
+        if self._tail and chunk and not self._tail[-1].isspace() and not chunk[0].isspace():
+            words -= 1  # A word split across chunks was already counted
+        self._words += max(words, 0)
+
+        self._bias_occurrences.update(BIAS_PHRASES.scan(buffer, after).occurrences)
+        confidence = CONFIDENCE_WORDS.scan(buffer, after).keywords
+        for level, markers in CONFIDENCE_WORDS.catalog.items():
+            self._confidence_markers[level].update(m for m in markers if confidence[m])
+        for strategy in STRATEGY_PHRASES.scan(buffer, after).matched():
+            self._strategies.setdefault(strategy)
+
+        self._tail = buffer[-self._overlap:] if self._overlap > 0 else ""
+        alerts = self._check_thresholds()
+        self._chunks += 1
+        return alerts
+
+    def _alert(self, key: BiasType | str, **fields) -> InterventionAlert:
+        alert = InterventionAlert(chunk_index=self._chunks, words_processed=self._words, **fields)
+        self._alerted.add(key)
+        self._alerts.append(alert)
+        return alert
+
+    def _check_thresholds(self) -> list[InterventionAlert]:
+        alerts = []
+        for bias_type, occurrences in self._bias_occurrences.items():
+            score = bias_signal(occurrences)
+            if occurrences and score >= self.intervention_threshold and bias_type not in self._alerted:
+                alerts.append(self._alert(
+                    bias_type,
+                    alert_type="bias",
+                    bias_type=bias_type,
+                    score=score,
+                    message=(
+                        f"BIAS ALERT: {bias_type.value} signalled {occurrences} times "
+                        f"within {self._words} words ({score:.0%} signal)"
+                    ),
+                ))
+
+        stated = round(self.stated_confidence, 3)  # 0.7 + 2 * 0.05 must reach 0.8
+        if (
+            stated >= max(self.intervention_threshold, UNSUPPORTED_CONFIDENCE_LEVEL)
+            and "evidence_based" not in self._strategies
+            and "confidence" not in self._alerted
+        ):
+            alerts.append(self._alert(
+                "confidence",
+                alert_type="confidence",
+                score=stated,
+                message=f"UNSUPPORTED CONFIDENCE: {stated:.0%} stated confidence without evidence-based reasoning",
+            ))
+        return alerts
+
+    @property
+    def stated_confidence(self) -> float:
+        """Confidence the reasoning expresses so far."""
+        return stated_confidence_level(
+            len(self._confidence_markers["high"]), len(self._confidence_markers["low"])
+        )
+
+    @property
+    def alerts(self) -> list[InterventionAlert]:
+        """Every alert raised so far, oldest first."""
+        return list(self._alerts)
+
+    @property
+    def state(self) -> StreamMonitorState:
+        """Snapshot of the running statistics."""
+        return StreamMonitorState(
+            chunks_processed=self._chunks,
+            words_processed=self._words,
+            bias_occurrences={b.value: n for b, n in self._bias_occurrences.items() if n},
+            bias_scores={b.value: round(bias_signal(n), 3) for b, n in self._bias_occurrences.items() if n},
+            high_confidence_markers=len(self._confidence_markers["high"]),
+            low_confidence_markers=len(self._confidence_markers["low"]),
+            stated_confidence=round(self.stated_confidence, 3),
+            strategies_detected=list(self._strategies),
+            intervention_alerts=[alert.message for alert in self._alerts],
+        )
+
+    async def watch(self, chunks: Iterable[str] | AsyncIterable[str]) -> AsyncIterator[MonitorEvent]:
+        """
+        Monitor a stream of chunks, yielding each alert as soon as it is raised.
+
+        Yields:
+            MonitorEvent for each alert, then a summary with the final statistics
+        """
+        sequence = 0
+
+        def event(event_type: MonitorEventType, **payload) -> MonitorEvent:
+            nonlocal sequence
+            sequence += 1
+            return MonitorEvent(event_type=event_type, sequence=sequence - 1, **payload)
+
+        if isinstance(chunks, AsyncIterable):
+            async for chunk in chunks:
+                for alert in self.feed(chunk):
+                    yield event(MonitorEventType.ALERT, alert=alert)
+        else:
+            for chunk in chunks:
+                for alert in self.feed(chunk):
+                    yield event(MonitorEventType.ALERT, alert=alert)
+
+        yield event(MonitorEventType.SUMMARY, state=self.state)
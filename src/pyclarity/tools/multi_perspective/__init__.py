@@ -5,7 +5,7 @@ Analyzes scenarios from multiple stakeholder viewpoints to identify
 synergies, conflicts, and create comprehensive integration strategies.
 """
 
-from .analyzer import MultiPerspectiveAnalyzer
+from .analyzer import MultiPerspectiveAnalyzer, ViewpointBackend
 from .models import (
     ComplexityLevel,
     ConflictSeverity,
@@ -38,4 +38,5 @@ __all__ = [
     "MultiPerspectiveResult",
     # Main class
     "MultiPerspectiveAnalyzer",
+    "ViewpointBackend",
 ]
@@ -6,9 +6,11 @@ synergies, conflicts, and integration opportunities.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Protocol
 
-from ..base import BaseCognitiveAnalyzer
+from ..base import BaseCognitiveAnalyzer, timed_phase
+from ..similarity import shared_elements
+from .index import PerspectiveIndex, scenario_terms
 from .models import (
     ComplexityLevel,
     ConflictSeverity,
@@ -23,6 +25,18 @@ from .models import (
 )
 
 
+class ViewpointBackend(Protocol):
+    """Pluggable model backend that analyzes a batch of perspectives per request."""
+
+    async def analyze_viewpoints(
+        self,
+        perspectives: list[Perspective],
+        context: MultiPerspectiveContext
+    ) -> list[ViewpointAnalysis]:
+        """Return one viewpoint analysis per perspective, in the same order."""
+        ...
+
+
 class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
     """
     Analyzer for multi-perspective analysis.
@@ -31,6 +45,33 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
     synergies, conflicts, and create comprehensive integration strategies.
     """
 
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        viewpoint_backend: ViewpointBackend | None = None,
+        backend_batch_size: int = 16
+    ) -> None:
+        """Initialize the multi-perspective analyzer.
+
+        Args:
+            max_concurrency: Maximum viewpoint analyses (or backend batches) in flight.
+            viewpoint_backend: Optional model backend used instead of the built-in heuristics.
+            backend_batch_size: Perspectives sent to the backend per request.
+        """
+        super().__init__(
+            tool_name="Multi-Perspective Analysis",
+            tool_description="Analyzes scenarios from multiple stakeholder viewpoints",
+            version="1.0.0"
+        )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if backend_batch_size < 1:
+            raise ValueError("backend_batch_size must be at least 1")
+
+        self.max_concurrency = max_concurrency
+        self.viewpoint_backend = viewpoint_backend
+        self.backend_batch_size = backend_batch_size
+
     # Domain-specific perspective templates
     DOMAIN_PERSPECTIVES = {
         "business": [
@@ -70,10 +111,7 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
         perspectives = await self._identify_perspectives(context)
 
         # Analyze each perspective
-        viewpoint_analyses = []
-        for perspective in perspectives:
-            analysis = await self._analyze_viewpoint(perspective, context)
-            viewpoint_analyses.append(analysis)
+        viewpoint_analyses = await self._analyze_viewpoints(perspectives, context)
 
         # Identify synergies and conflicts
         synergies_conflicts = await self._identify_synergies_conflicts(
@@ -168,6 +206,7 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
             confidence_score=confidence_score
         )
 
+    @timed_phase
     async def _identify_perspectives(
         self,
         context: MultiPerspectiveContext
@@ -254,41 +293,67 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
 
         return perspectives
 
-    async def _analyze_viewpoint(
+    @timed_phase
+    async def _analyze_viewpoints(
         self,
-        perspective: Perspective,
+        perspectives: list[Perspective],
         context: MultiPerspectiveContext
-    ) -> ViewpointAnalysis:
-        """Analyze scenario from a specific perspective."""
-        # Evaluate priorities based on perspective type
-        priorities = await self._evaluate_priorities(perspective, context)
+    ) -> list[ViewpointAnalysis]:
+        """Analyze all perspectives concurrently, preserving perspective order."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        if self.viewpoint_backend is not None:
+            backend = self.viewpoint_backend
+            batches = [
+                perspectives[start:start + self.backend_batch_size]
+                for start in range(0, len(perspectives), self.backend_batch_size)
+            ]
 
-        # Assess constraints from this viewpoint
-        constraints = await self._assess_constraints(perspective, context)
+            async def run_batch(batch: list[Perspective]) -> list[ViewpointAnalysis]:
+                async with semaphore:
+                    analyses = await backend.analyze_viewpoints(batch, context)
+                if len(analyses) != len(batch):
+                    raise ValueError(
+                        f"Viewpoint backend returned {len(analyses)} analyses "
+                        f"for {len(batch)} perspectives"
+                    )
+                return analyses
 
-        # Identify opportunities
-        opportunities = await self._identify_opportunities(perspective, context)
+            results = await asyncio.gather(*(run_batch(batch) for batch in batches))
+            return [analysis for batch in results for analysis in batch]
 
-        # Determine risks
-        risks = await self._determine_risks(perspective, context)
+        async def run(perspective: Perspective) -> ViewpointAnalysis:
+            async with semaphore:
+                return await self._analyze_viewpoint(perspective, context)
 
-        # Generate preferred approach
-        preferred_approach = await self._generate_preferred_approach(
-            perspective,
-            priorities,
-            constraints
-        )
+        return list(await asyncio.gather(*(run(p) for p in perspectives)))
 
-        # Identify acceptable compromises
-        acceptable_compromises = await self._identify_compromises(
-            perspective,
-            context
+    async def _analyze_viewpoint(
+        self,
+        perspective: Perspective,
+        context: MultiPerspectiveContext
+    ) -> ViewpointAnalysis:
+        """Analyze scenario from a specific perspective."""
+        # Priorities, constraints, opportunities, risks and compromises
+        # are independent of each other
+        (
+            priorities,
+            constraints,
+            opportunities,
+            risks,
+            acceptable_compromises,
+        ) = await asyncio.gather(
+            self._evaluate_priorities(perspective, context),
+            self._assess_constraints(perspective, context),
+            self._identify_opportunities(perspective, context),
+            self._determine_risks(perspective, context),
+            self._identify_compromises(perspective, context),
         )
 
-        # Determine deal breakers
-        deal_breakers = await self._identify_deal_breakers(
-            perspective,
-            priorities
+        # Approach and deal breakers build on priorities and constraints
+        preferred_approach, deal_breakers = await asyncio.gather(
+            self._generate_preferred_approach(perspective, priorities, constraints),
+            self._identify_deal_breakers(perspective, priorities),
         )
 
         # Calculate alignment score
@@ -321,6 +386,7 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
             alignment_score=alignment_score
         )
 
+    @timed_phase
     async def _identify_synergies_conflicts(
         self,
         perspectives: list[Perspective],
@@ -329,27 +395,28 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
     ) -> list[SynergyConflict]:
         """Identify synergies and conflicts between perspectives."""
         synergies_conflicts = []
+        index = PerspectiveIndex(analyses)
 
-        # Compare each pair of perspectives
+        # Compare only pairs that share comparable terms
         for i in range(len(perspectives)):
-            for j in range(i + 1, len(perspectives)):
+            for j in index.candidate_pairs(i):
                 perspective_a = perspectives[i]
                 perspective_b = perspectives[j]
-                analysis_a = analyses[i]
-                analysis_b = analyses[j]
 
                 # Check for synergies
                 synergies = self._find_synergies(
-                    analysis_a,
-                    analysis_b,
+                    index,
+                    i,
+                    j,
                     perspective_a,
                     perspective_b
                 )
 
                 # Check for conflicts
                 conflicts = self._find_conflicts(
-                    analysis_a,
-                    analysis_b,
+                    index,
+                    i,
+                    j,
                     perspective_a,
                     perspective_b
                 )
@@ -390,6 +457,7 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
 
         return synergies_conflicts
 
+    @timed_phase
     async def _develop_integration_strategies(
         self,
         perspectives: list[Perspective],
@@ -500,6 +568,7 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
 
         return strategies
 
+    @timed_phase
     async def _find_common_ground(
         self,
         analyses: list[ViewpointAnalysis],
@@ -509,18 +578,12 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
         common_ground = []
 
         # Check shared priorities
-        all_priorities = [set(a.priorities) for a in analyses]
-        if all_priorities:
-            shared_priorities = set.intersection(*all_priorities)
-            for priority in shared_priorities:
-                common_ground.append(f"Shared priority: {priority}")
+        for priority in shared_elements([a.priorities for a in analyses]):
+            common_ground.append(f"Shared priority: {priority}")
 
         # Check aligned success criteria
-        all_success = [set(p.success_criteria) for p in perspectives]
-        if all_success:
-            shared_success = set.intersection(*all_success)
-            for criterion in shared_success:
-                common_ground.append(f"Agreed success metric: {criterion}")
+        for criterion in shared_elements([p.success_criteria for p in perspectives]):
+            common_ground.append(f"Agreed success metric: {criterion}")
 
         # Add universal agreements
         common_ground.extend([
@@ -532,6 +595,7 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
 
         return common_ground[:8]  # Top 8 areas
 
+    @timed_phase
     async def _identify_critical_divergences(
         self,
         analyses: list[ViewpointAnalysis],
@@ -556,6 +620,7 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
 
         return divergences[:6]  # Top 6 divergences
 
+    @timed_phase
     async def _create_negotiation_framework(
         self,
         perspectives: list[Perspective],
@@ -593,6 +658,7 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
             ]
         }
 
+    @timed_phase
     async def _develop_communication_strategies(
         self,
         perspectives: list[Perspective],
@@ -620,6 +686,7 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
 
         return communications
 
+    @timed_phase
     async def _identify_win_win_opportunities(
         self,
         perspectives: list[Perspective],
@@ -637,10 +704,9 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
             )
 
         # Find overlapping opportunities
-        all_opportunities = [set(a.opportunities) for a in analyses]
-        if len(all_opportunities) > 1:
-            shared_opps = set.intersection(*all_opportunities)
-            for opp in list(shared_opps)[:2]:
+        if len(analyses) > 1:
+            shared_opps = shared_elements([a.opportunities for a in analyses])
+            for opp in shared_opps[:2]:
                 opportunities.append(f"Shared opportunity: {opp}")
 
         # Add creative win-wins
@@ -652,6 +718,7 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
 
         return opportunities[:7]  # Top 7 opportunities
 
+    @timed_phase
     async def _create_implementation_roadmap(
         self,
         strategies: list[IntegrationStrategy],
@@ -682,6 +749,7 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
 
         return roadmap
 
+    @timed_phase
     async def _assess_feasibility(
         self,
         strategies: list[IntegrationStrategy],
@@ -714,6 +782,7 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
 
         return assessment
 
+    @timed_phase
     async def _generate_overall_assessment(
         self,
         perspectives: list[Perspective],
@@ -749,6 +818,7 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
 
         return assessment
 
+    @timed_phase
     def _calculate_confidence(
         self,
         perspectives: list[Perspective],
@@ -912,9 +982,10 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
         score = 0.5  # Base score
 
         # Check if concerns are addressed
-        scenario_lower = context.scenario.lower()
+        words = scenario_terms(context.scenario)
         for concern in perspective.primary_concerns:
-            if any(word in concern.lower() for word in scenario_lower.split()):
+            concern_lower = concern.lower()
+            if any(word in concern_lower for word in words):
                 score += 0.1
 
         # Adjust for flexibility
@@ -924,8 +995,9 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
 
     def _find_synergies(
         self,
-        analysis_a: ViewpointAnalysis,
-        analysis_b: ViewpointAnalysis,
+        index: PerspectiveIndex,
+        position_a: int,
+        position_b: int,
         perspective_a: Perspective,
         perspective_b: Perspective
     ) -> list[str]:
@@ -933,15 +1005,14 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
         synergies = []
 
         # Check shared priorities
-        shared_priorities = set(analysis_a.priorities) & set(analysis_b.priorities)
-        for priority in shared_priorities:
+        for priority in index.shared_priorities(position_a, position_b)[:2]:
             synergies.append(
                 f"Both {perspective_a.stakeholder_name} and {perspective_b.stakeholder_name} "
                 f"prioritize {priority}"
             )
 
         # Check complementary strengths
-        if analysis_a.opportunities and analysis_b.constraints:
+        if index.has_opportunities[position_a] and index.has_constraints[position_b]:
             synergies.append(
                 f"{perspective_a.stakeholder_name} strengths can address "
                 f"{perspective_b.stakeholder_name} constraints"
@@ -951,8 +1022,9 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
 
     def _find_conflicts(
         self,
-        analysis_a: ViewpointAnalysis,
-        analysis_b: ViewpointAnalysis,
+        index: PerspectiveIndex,
+        position_a: int,
+        position_b: int,
         perspective_a: Perspective,
         perspective_b: Perspective
     ) -> list[dict[str, Any]]:
@@ -960,23 +1032,21 @@ class MultiPerspectiveAnalyzer(BaseCognitiveAnalyzer):
         conflicts = []
 
         # Check opposing priorities
-        if analysis_a.priorities and analysis_b.priorities:
-            if "speed" in str(analysis_a.priorities).lower() and "quality" in str(analysis_b.priorities).lower():
-                conflicts.append({
-                    "description": f"{perspective_a.stakeholder_name} prioritizes speed while "
-                                 f"{perspective_b.stakeholder_name} prioritizes quality",
-                    "impact": "Timeline vs quality trade-off required",
-                    "severity": ConflictSeverity.MODERATE
-                })
+        if index.has_speed[position_a] and index.has_quality[position_b]:
+            conflicts.append({
+                "description": f"{perspective_a.stakeholder_name} prioritizes speed while "
+                             f"{perspective_b.stakeholder_name} prioritizes quality",
+                "impact": "Timeline vs quality trade-off required",
+                "severity": ConflictSeverity.MODERATE
+            })
 
         # Check deal breaker conflicts
-        for deal_breaker in analysis_a.deal_breakers:
-            if any(comp in deal_breaker for comp in analysis_b.acceptable_compromises):
-                conflicts.append({
-                    "description": f"{perspective_a.stakeholder_name}'s deal breaker conflicts with "
-                                 f"{perspective_b.stakeholder_name}'s approach",
-                    "impact": "Fundamental misalignment requiring resolution",
-                    "severity": ConflictSeverity.HIGH
-                })
+        for _ in range(min(index.deal_breaker_conflicts(position_a, position_b), 2)):
+            conflicts.append({
+                "description": f"{perspective_a.stakeholder_name}'s deal breaker conflicts with "
+                             f"{perspective_b.stakeholder_name}'s approach",
+                "impact": "Fundamental misalignment requiring resolution",
+                "severity": ConflictSeverity.HIGH
+            })
 
         return conflicts[:2]
@@ -0,0 +1,125 @@
+"""
+Perspective Comparison Index
+
+Precomputes per-perspective features used by the pairwise synergy/conflict
+scan so that each pair comparison reduces to set intersections over interned
+term IDs, and pairs that share no comparable terms are never visited.
+"""
+
+from functools import lru_cache
+
+from .models import ViewpointAnalysis
+
+
+@lru_cache(maxsize=256)
+def scenario_terms(scenario: str) -> tuple[str, ...]:
+    """Return the distinct lowercase words of a scenario, in order of appearance."""
+    return tuple(dict.fromkeys(scenario.lower().split()))
+
+
+class PerspectiveIndex:
+    """
+    Feature index over a list of viewpoint analyses.
+
+    Holds interned priority and compromise IDs per analysis, posting lists
+    mapping each term ID to the analyses that contain it, and the compromise
+    IDs each deal breaker collides with. Positions match the order of the
+    analyses passed in.
+    """
+
+    def __init__(self, analyses: list[ViewpointAnalysis]) -> None:
+        self._term_ids: dict[str, int] = {}
+        self.terms: list[str] = []
+
+        self.priority_ids: list[tuple[int, ...]] = []
+        self.priority_sets: list[frozenset[int]] = []
+        self.compromise_ids: list[frozenset[int]] = []
+        self.has_speed: list[bool] = []
+        self.has_quality: list[bool] = []
+        self.has_opportunities: list[bool] = []
+        self.has_constraints: list[bool] = []
+
+        # term ID -> positions of analyses containing it
+        self.priority_postings: dict[int, list[int]] = {}
+        self.compromise_postings: dict[int, list[int]] = {}
+
+        for position, analysis in enumerate(analyses):
+            priority_ids = tuple(dict.fromkeys(self._intern(p) for p in analysis.priorities))
+            compromise_ids = frozenset(self._intern(c) for c in analysis.acceptable_compromises)
+            self.priority_ids.append(priority_ids)
+            self.priority_sets.append(frozenset(priority_ids))
+            self.compromise_ids.append(compromise_ids)
+
+            for term_id in priority_ids:
+                self.priority_postings.setdefault(term_id, []).append(position)
+            for term_id in compromise_ids:
+                self.compromise_postings.setdefault(term_id, []).append(position)
+
+            lowered = [p.lower() for p in analysis.priorities]
+            self.has_speed.append(any("speed" in p for p in lowered))
+            self.has_quality.append(any("quality" in p for p in lowered))
+            self.has_opportunities.append(bool(analysis.opportunities))
+            self.has_constraints.append(bool(analysis.constraints))
+
+        # Deal breaker -> compromise IDs it contains. Each distinct
+        # (deal breaker, compromise) pair is substring-checked exactly once.
+        compromise_vocab = list(self.compromise_postings)
+        self.deal_breaker_hits: list[list[frozenset[int]]] = []
+        hit_cache: dict[str, frozenset[int]] = {}
+        for analysis in analyses:
+            hits = []
+            for deal_breaker in analysis.deal_breakers:
+                if deal_breaker not in hit_cache:
+                    hit_cache[deal_breaker] = frozenset(
+                        term_id for term_id in compromise_vocab
+                        if self.terms[term_id] in deal_breaker
+                    )
+                hits.append(hit_cache[deal_breaker])
+            self.deal_breaker_hits.append(hits)
+
+        self._quality_positions = [i for i, flag in enumerate(self.has_quality) if flag]
+        self._constraint_positions = [i for i, flag in enumerate(self.has_constraints) if flag]
+
+    def _intern(self, term: str) -> int:
+        """Return the stable integer ID for a term, assigning one if new."""
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            term_id = len(self.terms)
+            self._term_ids[term] = term_id
+            self.terms.append(term)
+        return term_id
+
+    def candidate_pairs(self, position: int) -> list[int]:
+        """
+        Return positions after ``position`` that can yield a synergy or conflict.
+
+        A later analysis is a candidate if it shares a priority, if this
+        analysis' opportunities can meet its constraints, if its quality focus
+        opposes this analysis' speed focus, or if one of its acceptable
+        compromises collides with one of this analysis' deal breakers.
+        """
+        candidates: set[int] = set()
+
+        for term_id in self.priority_ids[position]:
+            candidates.update(self.priority_postings[term_id])
+        if self.has_opportunities[position]:
+            candidates.update(self._constraint_positions)
+        if self.has_speed[position]:
+            candidates.update(self._quality_positions)
+        for hits in self.deal_breaker_hits[position]:
+            for term_id in hits:
+                candidates.update(self.compromise_postings[term_id])
+
+        return sorted(c for c in candidates if c > position)
+
+    def shared_priorities(self, position_a: int, position_b: int) -> list[str]:
+        """Return priorities shared by two analyses, in the first one's order."""
+        other = self.priority_sets[position_b]
+        return [self.terms[term_id] for term_id in self.priority_ids[position_a] if term_id in other]
+
+    def deal_breaker_conflicts(self, position_a: int, position_b: int) -> int:
+        """Count deal breakers of ``position_a`` that collide with compromises of ``position_b``."""
+        compromises = self.compromise_ids[position_b]
+        if not compromises:
+            return 0
+        return sum(1 for hits in self.deal_breaker_hits[position_a] if hits & compromises)
@@ -21,7 +21,9 @@ from .models import (
     # Main models
     ProgrammingParadigmsContext,
     ProgrammingParadigmsResult,
+    SourceTreeMetrics,
 )
+from .source import FileMetrics, SourceTree, analyze_source, analyze_source_tree
 
 __all__ = [
     # Enums
@@ -35,9 +37,15 @@ __all__ = [
     "ParadigmComparison",
     "ParadigmMix",
     "CodeStructureAnalysis",
+    "SourceTreeMetrics",
     # Main models
     "ProgrammingParadigmsContext",
     "ProgrammingParadigmsResult",
     # Main class
     "ProgrammingParadigmsAnalyzer",
+    # Static analysis
+    "FileMetrics",
+    "SourceTree",
+    "analyze_source",
+    "analyze_source_tree",
 ]
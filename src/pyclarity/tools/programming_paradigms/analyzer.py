@@ -9,8 +9,13 @@ paradigms with selection criteria, optimization guidance, and paradigm combinati
 import asyncio
 import time
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..base import BaseCognitiveAnalyzer, timed_phase
+from ..catalogs import CatalogView, load_catalog
+from ..keywords import KeywordClassifier
 from .models import (
     CodeStructureAnalysis,
     ParadigmAnalysis,
@@ -18,20 +23,66 @@ from .models import (
     ParadigmComparison,
     ParadigmMix,
     ParadigmProfile,
-    ProblemDomain,
     ProgrammingParadigm,
     ProgrammingParadigmsContext,
     ProgrammingParadigmsResult,
+    SourceTreeMetrics,
 )
-
-
-class ProgrammingParadigmsAnalyzer:
+from .source import DETECTION_THRESHOLD, analyze_source_tree
+
+PARADIGM_CATALOG_PATH = Path(__file__).with_name("paradigms.json")
+
+# Words in a codebase description that indicate each paradigm
+PARADIGM_INDICATORS = KeywordClassifier({
+    ProgrammingParadigm.OBJECT_ORIENTED: [
+        "class", "object", "inheritance", "polymorphism", "encapsulation", "method", "interface"
+    ],
+    ProgrammingParadigm.FUNCTIONAL: [
+        "function", "lambda", "map", "filter", "reduce", "immutable", "pure", "compose"
+    ],
+    ProgrammingParadigm.PROCEDURAL: [
+        "procedure", "function", "subroutine", "global", "sequential", "step by step"
+    ],
+    ProgrammingParadigm.REACTIVE: [
+        "observable", "stream", "event", "reactive", "async", "subscription"
+    ],
+    ProgrammingParadigm.CONCURRENT: [
+        "thread", "parallel", "concurrent", "lock", "synchronization", "atomic"
+    ]
+})
+
+
+@lru_cache(maxsize=1)
+def paradigm_profile_catalog() -> CatalogView[ProgrammingParadigm, ParadigmProfile]:
+    """Paradigm profiles, shared by every analyzer in the process."""
+    return CatalogView(
+        load_catalog(PARADIGM_CATALOG_PATH), ProgrammingParadigm, ParadigmProfile.model_validate
+    )
+
+
+class ProgrammingParadigmsAnalyzer(BaseCognitiveAnalyzer):
     """Programming paradigms cognitive tool analyzer"""
 
+    # Paradigm suitability and scores are always computed; the remaining
+    # result sections run only when requested
+    phase_dependencies = {
+        "paradigm_comparisons": (),
+        "paradigm_mixes": (),
+        "code_structure_analysis": (),
+        "implementation_roadmap": (),
+        "learning_path_recommendations": (),
+        "risk_considerations": (),
+        "success_factors": (),
+        "alternatives_analysis": (),
+    }
+
     def __init__(self):
         """Initialize the programming paradigms analyzer"""
-        self.tool_name = "Programming Paradigms"
-        self.version = "1.0.0"
+        super().__init__(
+            tool_name="Programming Paradigms",
+            tool_description="Recommends programming paradigms for a problem and its constraints",
+            version="1.0.0"
+        )
 
         # Internal state for processing
         self._processing_start_time = 0.0
@@ -41,245 +92,7 @@ class ProgrammingParadigmsAnalyzer:
 
     def _initialize_paradigm_profiles(self):
         """Initialize profiles for different programming paradigms"""
-        self.paradigm_profiles = {
-            ProgrammingParadigm.OBJECT_ORIENTED: ParadigmProfile(
-                paradigm=ProgrammingParadigm.OBJECT_ORIENTED,
-                description="Organizes code around objects that contain data and methods",
-                key_characteristics=[
-                    ParadigmCharacteristic.ENCAPSULATION,
-                    ParadigmCharacteristic.INHERITANCE,
-                    ParadigmCharacteristic.POLYMORPHISM,
-                    ParadigmCharacteristic.ABSTRACTION
-                ],
-                strengths=[
-                    "Code reusability through inheritance",
-                    "Natural modeling of real-world entities",
-                    "Encapsulation provides data protection",
-                    "Polymorphism enables flexible interfaces"
-                ],
-                weaknesses=[
-                    "Can lead to complex inheritance hierarchies",
-                    "Potential for tight coupling",
-                    "May have performance overhead",
-                    "Learning curve for proper design"
-                ],
-                suitable_domains=[
-                    ProblemDomain.ENTERPRISE_SOFTWARE,
-                    ProblemDomain.WEB_DEVELOPMENT,
-                    ProblemDomain.GAME_DEVELOPMENT,
-                    ProblemDomain.USER_INTERFACES
-                ],
-                languages=["Java", "C++", "C#", "Python", "JavaScript", "Ruby"],
-                concepts=["Classes", "Objects", "Inheritance", "Polymorphism", "Encapsulation"],
-                best_practices=[
-                    "Favor composition over inheritance",
-                    "Use interfaces for loose coupling",
-                    "Apply SOLID principles",
-                    "Keep classes focused and cohesive"
-                ],
-                antipatterns=[
-                    "God objects",
-                    "Deep inheritance hierarchies",
-                    "Circular dependencies",
-                    "Feature envy"
-                ],
-                learning_curve="moderate",
-                performance_profile={
-                    "memory": "moderate",
-                    "cpu": "moderate",
-                    "scalability": "good"
-                }
-            ),
-
-            ProgrammingParadigm.FUNCTIONAL: ParadigmProfile(
-                paradigm=ProgrammingParadigm.FUNCTIONAL,
-                description="Treats computation as evaluation of mathematical functions",
-                key_characteristics=[
-                    ParadigmCharacteristic.IMMUTABILITY,
-                    ParadigmCharacteristic.PURE_FUNCTIONS,
-                    ParadigmCharacteristic.HIGHER_ORDER_FUNCTIONS,
-                    ParadigmCharacteristic.COMPOSITION
-                ],
-                strengths=[
-                    "Easier reasoning about code behavior",
-                    "Better support for concurrency",
-                    "Reduced side effects",
-                    "Mathematical foundations"
-                ],
-                weaknesses=[
-                    "Learning curve for imperative programmers",
-                    "Can be less intuitive for some problems",
-                    "Potential performance overhead",
-                    "Limited by language support"
-                ],
-                suitable_domains=[
-                    ProblemDomain.DATA_PROCESSING,
-                    ProblemDomain.SCIENTIFIC_COMPUTING,
-                    ProblemDomain.CONCURRENT_SYSTEMS,
-                    ProblemDomain.MACHINE_LEARNING
-                ],
-                languages=["Haskell", "Lisp", "Clojure", "F#", "Scala", "JavaScript"],
-                concepts=["Pure functions", "Immutability", "Higher-order functions", "Recursion"],
-                best_practices=[
-                    "Avoid side effects in pure functions",
-                    "Use immutable data structures",
-                    "Compose functions for complex operations",
-                    "Prefer recursion over iteration"
-                ],
-                antipatterns=[
-                    "Hidden side effects",
-                    "Excessive mutation",
-                    "Deeply nested function calls",
-                    "Ignoring tail recursion optimization"
-                ],
-                learning_curve="steep",
-                performance_profile={
-                    "memory": "high",
-                    "cpu": "variable",
-                    "scalability": "excellent"
-                }
-            ),
-
-            ProgrammingParadigm.PROCEDURAL: ParadigmProfile(
-                paradigm=ProgrammingParadigm.PROCEDURAL,
-                description="Organizes code as a sequence of procedures or functions",
-                key_characteristics=[
-                    ParadigmCharacteristic.MODULARITY,
-                    ParadigmCharacteristic.STATE_MANAGEMENT,
-                    ParadigmCharacteristic.SIDE_EFFECTS
-                ],
-                strengths=[
-                    "Simple and straightforward approach",
-                    "Easy to understand and debug",
-                    "Direct control over program flow",
-                    "Efficient execution"
-                ],
-                weaknesses=[
-                    "Can lead to code duplication",
-                    "Global state management issues",
-                    "Limited reusability",
-                    "Difficult to maintain large codebases"
-                ],
-                suitable_domains=[
-                    ProblemDomain.SYSTEM_PROGRAMMING,
-                    ProblemDomain.EMBEDDED_SYSTEMS,
-                    ProblemDomain.SCIENTIFIC_COMPUTING
-                ],
-                languages=["C", "Pascal", "FORTRAN", "COBOL"],
-                concepts=["Functions", "Procedures", "Global variables", "Local scope"],
-                best_practices=[
-                    "Keep functions small and focused",
-                    "Minimize global variables",
-                    "Use meaningful function names",
-                    "Document function interfaces"
-                ],
-                antipatterns=[
-                    "Spaghetti code",
-                    "Excessive global state",
-                    "Monolithic functions",
-                    "Copy-paste programming"
-                ],
-                learning_curve="easy",
-                performance_profile={
-                    "memory": "low",
-                    "cpu": "excellent",
-                    "scalability": "poor"
-                }
-            ),
-
-            ProgrammingParadigm.REACTIVE: ParadigmProfile(
-                paradigm=ProgrammingParadigm.REACTIVE,
-                description="Focuses on asynchronous data streams and propagation of changes",
-                key_characteristics=[
-                    ParadigmCharacteristic.COMPOSITION,
-                    ParadigmCharacteristic.STATE_MANAGEMENT
-                ],
-                strengths=[
-                    "Excellent for event-driven systems",
-                    "Natural handling of asynchronous operations",
-                    "Composable stream operations",
-                    "Responsive user interfaces"
-                ],
-                weaknesses=[
-                    "Complex debugging of async flows",
-                    "Learning curve for reactive thinking",
-                    "Memory management challenges",
-                    "Potential for callback hell"
-                ],
-                suitable_domains=[
-                    ProblemDomain.USER_INTERFACES,
-                    ProblemDomain.WEB_DEVELOPMENT,
-                    ProblemDomain.CONCURRENT_SYSTEMS
-                ],
-                languages=["JavaScript", "Java", "C#", "Scala", "Swift"],
-                concepts=["Observables", "Streams", "Event handling", "Asynchronous programming"],
-                best_practices=[
-                    "Handle errors in reactive streams",
-                    "Manage subscription lifecycles",
-                    "Use operators for stream transformation",
-                    "Avoid blocking operations in streams"
-                ],
-                antipatterns=[
-                    "Unmanaged subscriptions",
-                    "Blocking operations in streams",
-                    "Complex nested subscriptions",
-                    "Ignoring backpressure"
-                ],
-                learning_curve="steep",
-                performance_profile={
-                    "memory": "moderate",
-                    "cpu": "good",
-                    "scalability": "excellent"
-                }
-            ),
-
-            ProgrammingParadigm.CONCURRENT: ParadigmProfile(
-                paradigm=ProgrammingParadigm.CONCURRENT,
-                description="Handles multiple computations executing simultaneously",
-                key_characteristics=[
-                    ParadigmCharacteristic.IMMUTABILITY,
-                    ParadigmCharacteristic.STATE_MANAGEMENT
-                ],
-                strengths=[
-                    "Utilizes multi-core processors",
-                    "Improved system throughput",
-                    "Better resource utilization",
-                    "Responsive applications"
-                ],
-                weaknesses=[
-                    "Complex synchronization issues",
-                    "Race conditions and deadlocks",
-                    "Difficult debugging",
-                    "Non-deterministic behavior"
-                ],
-                suitable_domains=[
-                    ProblemDomain.SYSTEM_PROGRAMMING,
-                    ProblemDomain.CONCURRENT_SYSTEMS,
-                    ProblemDomain.WEB_DEVELOPMENT,
-                    ProblemDomain.SCIENTIFIC_COMPUTING
-                ],
-                languages=["Go", "Erlang", "Java", "C++", "Rust"],
-                concepts=["Threads", "Locks", "Actors", "Message passing", "Channels"],
-                best_practices=[
-                    "Minimize shared mutable state",
-                    "Use thread-safe data structures",
-                    "Prefer message passing over shared memory",
-                    "Design for immutability"
-                ],
-                antipatterns=[
-                    "Excessive locking",
-                    "Race conditions",
-                    "Deadlocks",
-                    "Thread leaks"
-                ],
-                learning_curve="steep",
-                performance_profile={
-                    "memory": "moderate",
-                    "cpu": "excellent",
-                    "scalability": "excellent"
-                }
-            )
-        }
+        self.paradigm_profiles = paradigm_profile_catalog()
 
     async def analyze(self, context: ProgrammingParadigmsContext) -> ProgrammingParadigmsResult:
         """
@@ -296,67 +109,74 @@ class ProgrammingParadigmsAnalyzer:
         # Phase 1: Analyze paradigm suitability
         paradigm_analyses = await self._analyze_paradigm_suitability(context)
 
+        sections: dict[str, Any] = {}
+
         # Phase 2: Compare paradigms
-        paradigm_comparisons = []
-        if len(paradigm_analyses) > 1:
-            paradigm_comparisons = await self._compare_paradigms(
+        if len(paradigm_analyses) > 1 and self.needs_phase("paradigm_comparisons"):
+            sections["paradigm_comparisons"] = await self._compare_paradigms(
                 context, paradigm_analyses[:5]  # Top 5 paradigms
             )
 
         # Phase 3: Analyze paradigm combinations (if enabled)
-        paradigm_mixes = []
-        if context.include_hybrid_analysis and len(paradigm_analyses) > 1:
-            paradigm_mixes = await self._analyze_paradigm_mixes(
+        if (
+            context.include_hybrid_analysis
+            and len(paradigm_analyses) > 1
+            and self.needs_phase("paradigm_mixes")
+        ):
+            sections["paradigm_mixes"] = await self._analyze_paradigm_mixes(
                 paradigm_analyses[:3]  # Top 3 paradigms
             )
 
         # Phase 4: Code structure analysis (if existing codebase)
-        code_structure_analysis = None
-        if context.existing_codebase:
-            code_structure_analysis = await self._analyze_code_structure(
-                context.existing_codebase, context.target_languages
+        if (context.existing_codebase or context.codebase_path) and self.needs_phase(
+            "code_structure_analysis"
+        ):
+            source_metrics = None
+            if context.codebase_path:
+                source_metrics = await asyncio.to_thread(analyze_source_tree, context.codebase_path)
+            sections["code_structure_analysis"] = await self._analyze_code_structure(
+                context.existing_codebase or "", context.target_languages, source_metrics
             )
 
         # Phase 5: Generate recommendations and roadmap
-        implementation_roadmap = self._generate_implementation_roadmap(
-            context, paradigm_analyses
-        )
+        if self.needs_phase("implementation_roadmap"):
+            sections["implementation_roadmap"] = self._generate_implementation_roadmap(
+                context, paradigm_analyses
+            )
 
-        learning_path_recommendations = self._generate_learning_path(
-            context, paradigm_analyses
-        )
+        if self.needs_phase("learning_path_recommendations"):
+            sections["learning_path_recommendations"] = self._generate_learning_path(
+                context, paradigm_analyses
+            )
 
-        risk_considerations = self._generate_risk_considerations(
-            context, paradigm_analyses
-        )
+        if self.needs_phase("risk_considerations"):
+            sections["risk_considerations"] = self._generate_risk_considerations(
+                context, paradigm_analyses
+            )
 
-        success_factors = self._generate_success_factors(
-            context, paradigm_analyses
-        )
+        if self.needs_phase("success_factors"):
+            sections["success_factors"] = self._generate_success_factors(
+                context, paradigm_analyses
+            )
 
-        alternatives_analysis = self._analyze_alternatives(paradigm_analyses)
+        if self.needs_phase("alternatives_analysis"):
+            sections["alternatives_analysis"] = self._analyze_alternatives(paradigm_analyses)
 
         # Calculate processing time
         processing_time = time.time() - self._processing_start_time
 
         return ProgrammingParadigmsResult(
             paradigm_analyses=paradigm_analyses[:context.max_paradigm_recommendations],
-            paradigm_comparisons=paradigm_comparisons,
-            paradigm_mixes=paradigm_mixes,
-            code_structure_analysis=code_structure_analysis,
             top_recommended_paradigm=paradigm_analyses[0].paradigm.value if paradigm_analyses else None,
             paradigm_suitability_scores={
                 analysis.paradigm.value: analysis.suitability_score
                 for analysis in paradigm_analyses
             },
-            implementation_roadmap=implementation_roadmap,
-            learning_path_recommendations=learning_path_recommendations,
-            risk_considerations=risk_considerations,
-            success_factors=success_factors,
-            alternatives_analysis=alternatives_analysis,
-            processing_time_ms=round(processing_time * 1000)
+            processing_time_ms=round(processing_time * 1000),
+            **sections,
         )
 
+    @timed_phase
     async def _analyze_paradigm_suitability(
         self, context: ProgrammingParadigmsContext
     ) -> list[ParadigmAnalysis]:
@@ -473,6 +293,7 @@ class ProgrammingParadigmsAnalyzer:
             ]
         )
 
+    @timed_phase
     async def _compare_paradigms(
         self,
         context: ProgrammingParadigmsContext,
@@ -585,6 +406,7 @@ class ProgrammingParadigmsAnalyzer:
 
         return opportunities
 
+    @timed_phase
     async def _analyze_paradigm_mixes(
         self, analyses: list[ParadigmAnalysis]
     ) -> list[ParadigmMix]:
@@ -636,38 +458,27 @@ class ProgrammingParadigmsAnalyzer:
             complexity_impact="Moderate to High - requires careful integration planning and team training"
         )]
 
+    @timed_phase
     async def _analyze_code_structure(
-        self, codebase_description: str, languages: list[str]
+        self,
+        codebase_description: str,
+        languages: list[str],
+        source_metrics: SourceTreeMetrics | None = None
     ) -> CodeStructureAnalysis:
         """Analyze existing code structure to identify paradigms"""
+        if source_metrics is not None:
+            return self._measured_code_structure(source_metrics)
+
         # Simulate processing delay
         await asyncio.sleep(0.05)
 
-        description_lower = codebase_description.lower()
         detected_paradigms = []
         paradigm_purity = {}
 
         # Detect paradigms based on description
-        paradigm_indicators = {
-            ProgrammingParadigm.OBJECT_ORIENTED: [
-                "class", "object", "inheritance", "polymorphism", "encapsulation", "method", "interface"
-            ],
-            ProgrammingParadigm.FUNCTIONAL: [
-                "function", "lambda", "map", "filter", "reduce", "immutable", "pure", "compose"
-            ],
-            ProgrammingParadigm.PROCEDURAL: [
-                "procedure", "function", "subroutine", "global", "sequential", "step by step"
-            ],
-            ProgrammingParadigm.REACTIVE: [
-                "observable", "stream", "event", "reactive", "async", "subscription"
-            ],
-            ProgrammingParadigm.CONCURRENT: [
-                "thread", "parallel", "concurrent", "lock", "synchronization", "atomic"
-            ]
-        }
-
-        for paradigm, indicators in paradigm_indicators.items():
-            matches = sum(1 for indicator in indicators if indicator in description_lower)
+        hits = PARADIGM_INDICATORS.scan(codebase_description)
+        for paradigm, indicators in PARADIGM_INDICATORS.catalog.items():
+            matches = hits.categories[paradigm]
             if matches > 0:
                 detected_paradigms.append(paradigm)
                 paradigm_purity[paradigm.value] = min(1.0, matches / len(indicators))
@@ -687,8 +498,8 @@ class ProgrammingParadigmsAnalyzer:
                 "Consistent naming conventions"
             ],
             paradigm_violations=[
-                "Mixed paradigm usage without clear boundaries" if len(detected_paradigms) > 2 else None
-            ],
+                "Mixed paradigm usage without clear boundaries"
+            ] if len(detected_paradigms) > 2 else [],
             improvement_suggestions=[
                 f"Consider strengthening {max(paradigm_purity.keys(), key=paradigm_purity.get).replace('_', ' ')} patterns" if paradigm_purity else "Adopt a clear paradigm structure",
                 "Establish coding standards for paradigm consistency",
@@ -697,11 +508,73 @@ class ProgrammingParadigmsAnalyzer:
             refactoring_opportunities=[
                 "Extract common functionality into reusable components",
                 "Improve paradigm consistency across modules",
-                "Simplify complex inheritance hierarchies" if ProgrammingParadigm.OBJECT_ORIENTED in detected_paradigms else None
-            ],
+            ] + (
+                ["Simplify complex inheritance hierarchies"]
+                if ProgrammingParadigm.OBJECT_ORIENTED in detected_paradigms else []
+            ),
             paradigm_consistency_score=consistency_score
         )
 
+    def _measured_code_structure(self, source_metrics: SourceTreeMetrics) -> CodeStructureAnalysis:
+        """Code structure analysis from static metrics of a source tree"""
+        metrics = source_metrics.metrics
+        paradigm_purity = {
+            paradigm: score
+            for paradigm, score in sorted(
+                source_metrics.paradigm_scores.items(), key=lambda item: item[1], reverse=True
+            )
+            if score >= DETECTION_THRESHOLD
+        }
+        detected_paradigms = [ProgrammingParadigm(paradigm) for paradigm in paradigm_purity]
+        functions = max(metrics["functions"], 1)
+
+        structural_patterns = [
+            f"{source_metrics.files} Python files, {metrics['statements']} statements",
+            f"{metrics['classes']} classes, {metrics['inheriting_classes']} using inheritance",
+            f"{metrics['pure_functions'] / functions:.0%} of {metrics['functions']} functions are pure",
+            f"{metrics['mutation_sites']} mutation sites",
+        ]
+        if metrics["async_functions"] or metrics["awaits"]:
+            structural_patterns.append(
+                f"{metrics['async_functions']} async functions, {metrics['awaits']} await points"
+            )
+        if metrics["thread_primitives"]:
+            structural_patterns.append(f"{metrics['thread_primitives']} uses of thread or process primitives")
+
+        paradigm_violations = []
+        if len(detected_paradigms) > 2:
+            paradigm_violations.append("Mixed paradigm usage without clear boundaries")
+        if source_metrics.consistency < 0.5:
+            paradigm_violations.append(
+                f"Only {source_metrics.consistency:.0%} of statements follow the leading paradigm"
+            )
+        if metrics["syntax_errors"]:
+            paradigm_violations.append(f"{metrics['syntax_errors']} files could not be parsed")
+
+        improvement_suggestions = [
+            f"Consider strengthening {detected_paradigms[0].value.replace('_', ' ')} patterns"
+            if detected_paradigms else "Adopt a clear paradigm structure",
+            "Establish coding standards for paradigm consistency",
+        ]
+        if ProgrammingParadigm.FUNCTIONAL in detected_paradigms and metrics["mutation_sites"]:
+            improvement_suggestions.append("Isolate state mutation at module boundaries")
+
+        refactoring_opportunities = ["Improve paradigm consistency across modules"]
+        if metrics["inheriting_classes"] > metrics["classes"] / 2:
+            refactoring_opportunities.append("Simplify complex inheritance hierarchies")
+
+        return CodeStructureAnalysis(
+            detected_paradigms=detected_paradigms,
+            paradigm_purity=paradigm_purity,
+            structural_patterns=structural_patterns,
+            paradigm_violations=paradigm_violations,
+            improvement_suggestions=improvement_suggestions,
+            refactoring_opportunities=refactoring_opportunities,
+            paradigm_consistency_score=source_metrics.consistency,
+            source_metrics=source_metrics
+        )
+
+    @timed_phase
     def _generate_implementation_roadmap(
         self,
         context: ProgrammingParadigmsContext,
@@ -736,6 +609,7 @@ class ProgrammingParadigmsAnalyzer:
 
         return roadmap
 
+    @timed_phase
     def _generate_learning_path(
         self,
         context: ProgrammingParadigmsContext,
@@ -767,6 +641,7 @@ class ProgrammingParadigmsAnalyzer:
 
         return learning_path
 
+    @timed_phase
     def _generate_risk_considerations(
         self,
         context: ProgrammingParadigmsContext,
@@ -807,6 +682,7 @@ class ProgrammingParadigmsAnalyzer:
 
         return risks[:8]  # Limit to 8 risks
 
+    @timed_phase
     def _generate_success_factors(
         self,
         context: ProgrammingParadigmsContext,
@@ -829,6 +705,7 @@ class ProgrammingParadigmsAnalyzer:
 
         return factors
 
+    @timed_phase
     def _analyze_alternatives(
         self, analyses: list[ParadigmAnalysis]
     ) -> dict[str, str]:
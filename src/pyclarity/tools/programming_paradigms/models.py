@@ -12,6 +12,8 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from ..artifacts import resolve_artifact_path
+
 
 class ComplexityLevel(str, Enum):
     """Problem complexity levels"""
@@ -306,6 +308,43 @@ class ParadigmMix(BaseModel):
     )
 
 
+class SourceTreeMetrics(BaseModel):
+    """Paradigm metrics from static analysis of a source tree"""
+
+    root: str = Field(..., description="Analyzed directory")
+
+    files: int = Field(0, ge=0, description="Python files in the tree")
+
+    changed_files: int = Field(
+        0,
+        ge=0,
+        description="Files new or changed since the previous analysis"
+    )
+
+    parsed_files: int = Field(
+        0,
+        ge=0,
+        description="Files parsed by this analysis; the rest came from the cache"
+    )
+
+    metrics: dict[str, int] = Field(
+        default_factory=dict,
+        description="Metric totals over the tree (classes, pure_functions, mutation_sites, ...)"
+    )
+
+    paradigm_scores: dict[str, float] = Field(
+        default_factory=dict,
+        description="Score of each paradigm computed from the metrics"
+    )
+
+    consistency: float = Field(
+        0.5,
+        ge=0.0,
+        le=1.0,
+        description="Share of statements in files dominated by the tree's leading paradigm"
+    )
+
+
 class CodeStructureAnalysis(BaseModel):
     """Analysis of code structure from paradigm perspective"""
 
@@ -356,6 +395,11 @@ class CodeStructureAnalysis(BaseModel):
         description="Overall paradigm consistency score"
     )
 
+    source_metrics: SourceTreeMetrics | None = Field(
+        None,
+        description="Static analysis metrics when a source tree was analyzed"
+    )
+
 
 class ProgrammingParadigmsContext(BaseModel):
     """Context for programming paradigms analysis"""
@@ -427,6 +471,14 @@ class ProgrammingParadigmsContext(BaseModel):
         max_length=1000
     )
 
+    codebase_path: str | None = Field(
+        None,
+        description=(
+            "Root directory of an existing Python codebase to analyze statically, "
+            "under the artifact root"
+        )
+    )
+
     include_hybrid_analysis: bool = Field(
         True,
         description="Whether to include hybrid paradigm analysis"
@@ -448,6 +500,12 @@ class ProgrammingParadigmsContext(BaseModel):
             raise ValueError("Problem description must be at least 20 characters")
         return v
 
+    @field_validator('codebase_path')
+    @classmethod
+    def validate_codebase_path(cls, v):
+        """Confine the codebase path to the artifact root"""
+        return None if v is None else resolve_artifact_path(v)
+
 
 class ProgrammingParadigmsResult(BaseModel):
     """Result of programming paradigms analysis"""
@@ -0,0 +1,468 @@
+"""
+Source Tree Analysis
+
+Static analysis of a Python source tree for programming-paradigm metrics.
+
+Each file is parsed once into an AST and reduced to counts: classes and
+inheritance, methods and free functions, pure functions, mutation sites,
+async/await usage, thread primitives and functional constructs. Parsing
+runs in a process pool when enough files changed to pay for it; the pool
+starts its workers from a fresh interpreter (forkserver, or spawn where
+that is unavailable) rather than forking the server with its threads.
+
+Re-analysis is incremental. A SourceTree remembers the size, mtime and
+content digest of every file; unchanged files are skipped without being
+read, touched files are re-hashed, and only files whose content changed
+are parsed. Changed files are read, hashed and parsed in bounded batches,
+so memory stays flat however much of the tree changed. Metrics are cached
+by content digest, optionally in a SQLite file shared across processes,
+and the tree's totals are maintained by subtracting a file's old counts
+and adding its new ones.
+"""
+
+import ast
+import hashlib
+import json
+import multiprocessing
+import os
+import sqlite3
+import threading
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from pathlib import Path
+
+from .models import ProgrammingParadigm, SourceTreeMetrics
+
+# Environment variable naming a SQLite file for the shared metrics cache
+SOURCE_CACHE_DB_ENV = "PYCLARITY_SOURCE_CACHE_DB"
+
+# Bumped whenever the metrics computed per file change
+METRICS_VERSION = 1
+
+# Directories that never hold first-party source
+EXCLUDED_DIRS = frozenset({
+    "__pycache__", "node_modules", "site-packages", "venv", "env", "build", "dist"
+})
+
+# Fewer changed files than this are parsed in-process; a pool costs more to start
+PARALLEL_THRESHOLD = 32
+
+# Most changed files, and bytes of their source, held in memory at once
+BATCH_FILES = 512
+BATCH_BYTES = 16 * 1024 * 1024
+
+# Minimum score for a paradigm to count as present in the code
+DETECTION_THRESHOLD = 0.2
+
+MUTATING_METHODS = frozenset({
+    "append", "extend", "insert", "pop", "remove", "clear", "update", "add",
+    "discard", "setdefault", "popitem", "sort", "reverse",
+})
+IMPURE_BUILTINS = frozenset({"print", "open", "input", "exec", "eval"})
+HIGHER_ORDER_FUNCTIONS = frozenset({"map", "filter", "reduce", "partial", "compose"})
+THREAD_PRIMITIVES = frozenset({
+    "Thread", "Lock", "RLock", "Semaphore", "BoundedSemaphore", "Condition", "Barrier",
+    "ThreadPoolExecutor", "ProcessPoolExecutor", "Process", "Pool",
+})
+THREAD_MODULES = frozenset({"threading", "multiprocessing", "concurrent", "_thread"})
+
+
+@dataclass(frozen=True)
+class FileMetrics:
+    """Paradigm metrics of one source file."""
+
+    lines: int = 0
+    statements: int = 0
+    classes: int = 0
+    inheriting_classes: int = 0
+    functions: int = 0           # Every def and async def, methods included
+    methods: int = 0
+    pure_functions: int = 0
+    mutation_sites: int = 0
+    async_functions: int = 0
+    awaits: int = 0              # await, async for and async with
+    thread_primitives: int = 0
+    lambdas: int = 0
+    comprehensions: int = 0
+    higher_order_calls: int = 0
+    syntax_errors: int = 0
+
+    def counts(self) -> Counter:
+        return Counter({f.name: getattr(self, f.name) for f in fields(self)})
+
+
+def _is_mutation(node: ast.AST) -> bool:
+    if isinstance(node, (ast.Assign, ast.AnnAssign, ast.Delete)):
+        targets = node.targets if isinstance(node, (ast.Assign, ast.Delete)) else [node.target]
+        return any(isinstance(t, (ast.Attribute, ast.Subscript)) for t in targets)
+    if isinstance(node, (ast.AugAssign, ast.Global, ast.Nonlocal)):
+        return True
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr in MUTATING_METHODS
+    )
+
+
+def _is_pure(function: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
+    """Returns a value without mutating state or calling I/O builtins."""
+    returns = False
+    for node in ast.walk(function):
+        if _is_mutation(node):
+            return False
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in IMPURE_BUILTINS
+        ):
+            return False
+        if isinstance(node, (ast.Yield, ast.YieldFrom, ast.Await)):
+            return False
+        returns = returns or (isinstance(node, ast.Return) and node.value is not None)
+    return returns
+
+
+def _callee_name(call: ast.Call) -> str | None:
+    if isinstance(call.func, ast.Name):
+        return call.func.id
+    if isinstance(call.func, ast.Attribute):
+        return call.func.attr
+    return None
+
+
+def analyze_source(source: bytes) -> FileMetrics:
+    """Paradigm metrics of a Python module's source."""
+    lines = source.count(b"\n") + (1 if source and not source.endswith(b"\n") else 0)
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return FileMetrics(lines=lines, syntax_errors=1)
+
+    counts: Counter = Counter(lines=lines)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.stmt):
+            counts["statements"] += 1
+        if _is_mutation(node):
+            counts["mutation_sites"] += 1
+
+        if isinstance(node, ast.ClassDef):
+            counts["classes"] += 1
+            bases = [b for b in node.bases if not (isinstance(b, ast.Name) and b.id == "object")]
+            counts["inheriting_classes"] += bool(bases)
+            counts["methods"] += sum(
+                isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)) for child in node.body
+            )
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            counts["functions"] += 1
+            counts["async_functions"] += isinstance(node, ast.AsyncFunctionDef)
+            counts["pure_functions"] += _is_pure(node)
+        elif isinstance(node, (ast.Await, ast.AsyncFor, ast.AsyncWith)):
+            counts["awaits"] += 1
+        elif isinstance(node, ast.Lambda):
+            counts["lambdas"] += 1
+        elif isinstance(node, (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)):
+            counts["comprehensions"] += 1
+        elif isinstance(node, ast.Call) and _callee_name(node) in HIGHER_ORDER_FUNCTIONS:
+            counts["higher_order_calls"] += 1
+        elif isinstance(node, ast.Name) and node.id in THREAD_PRIMITIVES:
+            counts["thread_primitives"] += 1
+        elif isinstance(node, ast.Attribute) and node.attr in THREAD_PRIMITIVES:
+            counts["thread_primitives"] += 1
+        elif isinstance(node, ast.Import):
+            counts["thread_primitives"] += sum(
+                alias.name.split(".")[0] in THREAD_MODULES for alias in node.names
+            )
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            counts["thread_primitives"] += node.module.split(".")[0] in THREAD_MODULES
+    return FileMetrics(**counts)
+
+
+def paradigm_scores(counts: Mapping[str, int]) -> dict[ProgrammingParadigm, float]:
+    """Score in [0, 1] of each paradigm in a file's or a tree's metric counts."""
+    functions = max(counts["functions"], 1)
+    statements = max(counts["statements"], 1)
+    free_functions = counts["functions"] - counts["methods"]
+    functional_constructs = counts["lambdas"] + counts["comprehensions"] + counts["higher_order_calls"]
+
+    scores = {
+        ProgrammingParadigm.OBJECT_ORIENTED: (
+            0.6 * counts["methods"] / functions
+            + 0.4 * counts["inheriting_classes"] / max(counts["classes"], 1)
+        ) if counts["classes"] else 0.0,
+        ProgrammingParadigm.FUNCTIONAL: (
+            0.6 * counts["pure_functions"] / functions
+            + 0.4 * min(1.0, functional_constructs / functions)
+        ),
+        ProgrammingParadigm.PROCEDURAL: (
+            0.5 * max(0, free_functions - counts["pure_functions"]) / functions
+            + 0.5 * min(1.0, 4 * counts["mutation_sites"] / statements)
+        ),
+        ProgrammingParadigm.REACTIVE: (
+            counts["async_functions"] / functions
+            + 0.5 * min(1.0, counts["awaits"] / functions)
+        ),
+        ProgrammingParadigm.CONCURRENT: min(1.0, 20 * counts["thread_primitives"] / statements),
+    }
+    return {paradigm: round(min(1.0, score), 3) for paradigm, score in scores.items()}
+
+
+def _dominant(counts: Mapping[str, int]) -> ProgrammingParadigm | None:
+    scores = paradigm_scores(counts)
+    paradigm = max(scores, key=scores.get)
+    return paradigm if scores[paradigm] >= DETECTION_THRESHOLD else None
+
+
+class SourceMetricsCache:
+    """
+    File metrics keyed by content digest.
+
+    Args:
+        path: SQLite file shared across processes; in-memory only if None
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        self.path = os.fspath(path) if path else None
+        self._metrics: dict[str, FileMetrics] = {}
+        self._lock = threading.Lock()
+        if self.path:
+            with closing(self._connect()) as connection, connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS source_metrics ("
+                    "digest TEXT PRIMARY KEY, metrics TEXT NOT NULL)"
+                )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get_many(self, digests: list[str]) -> dict[str, FileMetrics]:
+        """Cached metrics of whichever digests are known."""
+        with self._lock:
+            found = {d: self._metrics[d] for d in digests if d in self._metrics}
+        missing = [d for d in digests if d not in found]
+        if self.path and missing:
+            with closing(self._connect()) as connection:
+                for start in range(0, len(missing), 500):
+                    batch = missing[start:start + 500]
+                    rows = connection.execute(
+                        "SELECT digest, metrics FROM source_metrics WHERE digest IN "
+                        f"({','.join('?' * len(batch))})",
+                        batch,
+                    ).fetchall()
+                    found.update((d, FileMetrics(**json.loads(m))) for d, m in rows)
+            with self._lock:
+                self._metrics.update(found)
+        return found
+
+    def put_many(self, metrics: dict[str, FileMetrics]) -> None:
+        with self._lock:
+            self._metrics.update(metrics)
+        if self.path and metrics:
+            with closing(self._connect()) as connection, connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO source_metrics (digest, metrics) VALUES (?, ?)",
+                    [(d, json.dumps(m.counts())) for d, m in metrics.items()],
+                )
+
+
+@lru_cache(maxsize=1)
+def default_metrics_cache() -> SourceMetricsCache:
+    """SQLite cache at $PYCLARITY_SOURCE_CACHE_DB if set, else in-memory."""
+    return SourceMetricsCache(os.environ.get(SOURCE_CACHE_DB_ENV))
+
+
+@dataclass
+class _FileState:
+    stat: tuple[int, int]        # Size and mtime in nanoseconds
+    digest: str
+    metrics: FileMetrics
+    dominant: ProgrammingParadigm | None
+
+
+def _digest(source: bytes) -> str:
+    return f"{METRICS_VERSION}:{hashlib.blake2b(source, digest_size=16).hexdigest()}"
+
+
+def _iter_sources(root: Path) -> Iterator[tuple[str, os.stat_result]]:
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in EXCLUDED_DIRS:
+                    stack.append(Path(entry.path))
+            elif entry.name.endswith(".py") and entry.is_file():
+                yield os.path.relpath(entry.path, root), entry.stat()
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """Start method for parse workers that does not fork the calling process."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+class _ParsePool:
+    """Parses sources in-process, or in a worker pool started on first need"""
+
+    def __init__(self, max_workers: int | None) -> None:
+        self.workers = max_workers or os.cpu_count() or 1
+        self._executor: Executor | None = None
+
+    def parse(self, sources: list[bytes]) -> list[FileMetrics]:
+        if len(sources) < PARALLEL_THRESHOLD or self.workers == 1:
+            return [analyze_source(source) for source in sources]
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=_pool_context()
+            )
+        chunksize = max(1, len(sources) // (self.workers * 4))
+        return list(self._executor.map(analyze_source, sources, chunksize=chunksize))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+
+
+class SourceTree:
+    """
+    Incrementally maintained paradigm metrics of a source tree.
+
+    Args:
+        root: Directory to analyze
+        cache: Metrics cache shared between trees
+        max_workers: Worker processes for parsing; None for one per CPU
+
+    Raises:
+        ValueError: If the root is not a directory
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str],
+        cache: SourceMetricsCache | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        self.root = Path(root).resolve()
+        if not self.root.is_dir():
+            raise ValueError(f"Source tree {root} not found or not a directory")
+        self.cache = cache if cache is not None else default_metrics_cache()
+        self.max_workers = max_workers
+        self._files: dict[str, _FileState] = {}
+        self._totals: Counter = Counter()
+        self._dominant: Counter = Counter()  # Statements per file-dominant paradigm
+        self._lock = threading.Lock()
+
+    def _remove(self, path: str) -> None:
+        state = self._files.pop(path)
+        self._totals.subtract(state.metrics.counts())
+        self._dominant[state.dominant] -= state.metrics.statements
+
+    def _add(self, path: str, state: _FileState) -> None:
+        self._files[path] = state
+        self._totals.update(state.metrics.counts())
+        self._dominant[state.dominant] += state.metrics.statements
+
+    def _refresh_batch(
+        self, batch: list[tuple[str, tuple[int, int]]], pool: _ParsePool
+    ) -> tuple[int, int]:
+        """Read, hash and parse one batch of files; returns (changed, parsed) counts."""
+        changed: dict[str, tuple[tuple[int, int], str]] = {}
+        sources: dict[str, bytes] = {}
+        for path, key in batch:
+            try:
+                source = (self.root / path).read_bytes()
+            except OSError:
+                if path in self._files:
+                    self._remove(path)
+                continue
+            digest = _digest(source)
+            state = self._files.get(path)
+            if state is not None and state.digest == digest:
+                state.stat = key
+                continue
+            changed[path] = (key, digest)
+            sources.setdefault(digest, source)
+
+        cached = self.cache.get_many(list(sources))
+        pending = {digest: source for digest, source in sources.items() if digest not in cached}
+        parsed = dict(zip(pending, pool.parse(list(pending.values()))))
+        self.cache.put_many(parsed)
+
+        for path, (key, digest) in changed.items():
+            if path in self._files:
+                self._remove(path)
+            metrics = parsed[digest] if digest in parsed else cached[digest]
+            self._add(path, _FileState(key, digest, metrics, _dominant(metrics.counts())))
+        return len(changed), len(parsed)
+
+    def refresh(self) -> SourceTreeMetrics:
+        """Bring the metrics up to date with the tree, parsing only changed files."""
+        with self._lock, closing(_ParsePool(self.max_workers)) as pool:
+            seen: set[str] = set()
+            batch: list[tuple[str, tuple[int, int]]] = []
+            batch_bytes = changed_files = parsed_files = 0
+            for path, stat in _iter_sources(self.root):
+                seen.add(path)
+                key = (stat.st_size, stat.st_mtime_ns)
+                state = self._files.get(path)
+                if state is not None and state.stat == key:
+                    continue
+                batch.append((path, key))
+                batch_bytes += stat.st_size
+                if len(batch) >= BATCH_FILES or batch_bytes >= BATCH_BYTES:
+                    changed, parsed = self._refresh_batch(batch, pool)
+                    changed_files, parsed_files = changed_files + changed, parsed_files + parsed
+                    batch, batch_bytes = [], 0
+            if batch:
+                changed, parsed = self._refresh_batch(batch, pool)
+                changed_files, parsed_files = changed_files + changed, parsed_files + parsed
+
+            for path in [p for p in self._files if p not in seen]:
+                self._remove(path)
+
+            return self._summary(parsed_files=parsed_files, changed_files=changed_files)
+
+    def _summary(self, parsed_files: int, changed_files: int) -> SourceTreeMetrics:
+        totals = {name: self._totals[name] for name in FileMetrics.__dataclass_fields__}
+        scores = paradigm_scores(totals)
+        dominant = max(scores, key=scores.get)
+        weighted = sum(n for paradigm, n in self._dominant.items() if paradigm is not None)
+        consistency = self._dominant[dominant] / weighted if weighted else 0.5
+        return SourceTreeMetrics(
+            root=str(self.root),
+            files=len(self._files),
+            changed_files=changed_files,
+            parsed_files=parsed_files,
+            metrics=totals,
+            paradigm_scores={paradigm.value: score for paradigm, score in scores.items()},
+            consistency=round(consistency, 3),
+        )
+
+
+@lru_cache(maxsize=16)
+def source_tree(root: str) -> SourceTree:
+    """Metrics of a source tree, kept between analyses in this process."""
+    return SourceTree(root)
+
+
+def analyze_source_tree(root: str | os.PathLike[str]) -> SourceTreeMetrics:
+    """
+    Paradigm metrics of the Python files under a directory.
+
+    Raises:
+        ValueError: If the root is not a directory
+    """
+    path = Path(root).resolve()
+    if not path.is_dir():
+        raise ValueError(f"Source tree {root} not found or not a directory")
+    return source_tree(str(path)).refresh()
@@ -18,12 +18,16 @@ from .models import (
     Hypothesis,
     HypothesisTest,
     HypothesisType,
+    Measurement,
+    MultipleComparisonCorrection,
+    SampleStatistics,
     # Main models
     ScientificMethodContext,
     ScientificMethodResult,
     TestResult,
     TheoryConstruction,
 )
+from .statistics import adjust_p_values, compare_samples
 
 __all__ = [
     # Enums
@@ -32,15 +36,21 @@ __all__ = [
     "EvidenceType",
     "EvidenceQuality",
     "TestResult",
+    "MultipleComparisonCorrection",
     # Supporting models
     "Hypothesis",
     "Evidence",
     "Experiment",
     "HypothesisTest",
     "TheoryConstruction",
+    "Measurement",
+    "SampleStatistics",
     # Main models
     "ScientificMethodContext",
     "ScientificMethodResult",
     # Main class
     "ScientificMethodAnalyzer",
+    # Statistics
+    "compare_samples",
+    "adjust_p_values",
 ]
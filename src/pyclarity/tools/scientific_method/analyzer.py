@@ -12,6 +12,9 @@ import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
+from ..base import BaseCognitiveAnalyzer, request_seed, timed_phase
 from .models import (
     Evidence,
     EvidenceQuality,
@@ -20,20 +23,73 @@ from .models import (
     Hypothesis,
     HypothesisTest,
     HypothesisType,
+    Measurement,
+    SampleStatistics,
     ScientificMethodContext,
     ScientificMethodResult,
     TestResult,
     TheoryConstruction,
 )
-
-
-class ScientificMethodAnalyzer:
+from .statistics import adjust_p_values, compare_samples
+
+# Hypothesis templates are cycled when more hypotheses are requested than types
+HYPOTHESIS_TYPES = [
+    HypothesisType.EXPLANATORY,
+    HypothesisType.PREDICTIVE,
+    HypothesisType.CAUSAL,
+    HypothesisType.CORRELATIONAL,
+]
+
+# Factor families that distinguish repeated hypotheses of the same type
+FACTOR_FOCUSES = [
+    "environmental",
+    "process",
+    "structural",
+    "human",
+    "temporal",
+    "resource",
+]
+
+EVIDENCE_TYPES = [
+    EvidenceType.OBSERVATIONAL,
+    EvidenceType.EXPERIMENTAL,
+    EvidenceType.STATISTICAL,
+    EvidenceType.LITERATURE_REVIEW,
+]
+
+# Evidence quality weights used when testing hypotheses and rating evidence overall
+TEST_QUALITY_SCORES = {EvidenceQuality.HIGH: 0.9, EvidenceQuality.MEDIUM: 0.7}
+STRENGTH_QUALITY_WEIGHTS = {
+    EvidenceQuality.HIGH: 1.0,
+    EvidenceQuality.MEDIUM: 0.7,
+    EvidenceQuality.LOW: 0.4,
+}
+
+
+def _evidence_vectors(
+    evidence: list[Evidence],
+    quality_weights: dict[EvidenceQuality, float],
+    default_weight: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Quality weights and supporting strengths of evidence items as arrays"""
+    count = len(evidence)
+    quality = np.fromiter(
+        (quality_weights.get(e.quality, default_weight) for e in evidence), float, count
+    )
+    strength = np.fromiter((e.supporting_strength for e in evidence), float, count)
+    return quality, strength
+
+
+class ScientificMethodAnalyzer(BaseCognitiveAnalyzer):
     """Scientific method cognitive tool analyzer"""
 
     def __init__(self):
         """Initialize the scientific method analyzer"""
-        self.tool_name = "Scientific Method"
-        self.version = "1.0.0"
+        super().__init__(
+            tool_name="Scientific Method",
+            tool_description="Forms and tests hypotheses against measured evidence",
+            version="1.0.0"
+        )
 
         # Internal state for processing
         self._processing_start_time = 0.0
@@ -42,6 +98,10 @@ class ScientificMethodAnalyzer:
         """
         Analyze a problem using the scientific method.
 
+        Hypotheses are processed as a concurrent pipeline: each one has its
+        evidence collected and experiment designed at the same time, and is
+        tested as soon as its evidence is in.
+
         Args:
             context: Scientific method context with research question and parameters
 
@@ -55,19 +115,16 @@ class ScientificMethodAnalyzer:
         if context.hypothesis_generation_enabled:
             hypotheses = await self._generate_hypotheses(context)
 
-        # Phase 2: Collect and evaluate evidence
-        evidence_collected = []
-        if context.evidence_evaluation_enabled:
-            evidence_collected = await self._collect_evidence(context, hypotheses)
-
-        # Phase 3: Design experiments
-        experiments = []
-        if context.experiment_design_enabled:
-            experiments = await self._design_experiments(context, hypotheses)
+        # Each measurement becomes a data-driven hypothesis backed by its samples
+        measurement_evidence = {}
+        for measurement in context.measurements:
+            hypothesis, evidence = self._create_measurement_hypothesis(measurement)
+            hypotheses.append(hypothesis)
+            measurement_evidence[hypothesis.hypothesis_id] = evidence
 
-        # Phase 4: Test hypotheses
-        hypothesis_tests = await self._test_hypotheses(
-            hypotheses, evidence_collected, context
+        # Phases 2-4: Collect evidence, design experiments and test hypotheses
+        evidence_collected, experiments, hypothesis_tests = await self._run_hypothesis_pipeline(
+            context, hypotheses, measurement_evidence
         )
 
         # Phase 5: Construct theory if enabled
@@ -118,6 +175,7 @@ class ScientificMethodAnalyzer:
             processing_time_ms=round(processing_time * 1000)
         )
 
+    @timed_phase
     async def _generate_hypotheses(
         self, context: ScientificMethodContext
     ) -> list[Hypothesis]:
@@ -125,40 +183,37 @@ class ScientificMethodAnalyzer:
         # Simulate processing delay
         await asyncio.sleep(0.1)
 
-        hypotheses = []
-
-        # Generate different types of hypotheses
-        hypothesis_types = [
-            HypothesisType.EXPLANATORY,
-            HypothesisType.PREDICTIVE,
-            HypothesisType.CAUSAL,
-            HypothesisType.CORRELATIONAL
-        ]
-
-        for i, hyp_type in enumerate(hypothesis_types[:context.max_hypotheses]):
-            hypothesis = await self._create_hypothesis(
+        hypotheses = [
+            self._create_hypothesis(
                 context.research_question,
-                hyp_type,
-                context.domain_knowledge
+                HYPOTHESIS_TYPES[index % len(HYPOTHESIS_TYPES)],
+                context.domain_knowledge,
+                variant=index // len(HYPOTHESIS_TYPES)
             )
-            hypotheses.append(hypothesis)
+            for index in range(context.max_hypotheses)
+        ]
 
         # Add null hypothesis for statistical testing
         if len(hypotheses) > 0:
-            null_hypothesis = await self._create_null_hypothesis(
+            null_hypothesis = self._create_null_hypothesis(
                 hypotheses[0], context
             )
             hypotheses.append(null_hypothesis)
 
         return hypotheses
 
-    async def _create_hypothesis(
+    def _create_hypothesis(
         self,
         research_question: str,
         hypothesis_type: HypothesisType,
-        domain_knowledge: str
+        domain_knowledge: str,
+        variant: int = 0
     ) -> Hypothesis:
-        """Create a specific hypothesis"""
+        """Create a specific hypothesis
+
+        Variants after the first of each type focus on a different family
+        of candidate factors, so competing hypotheses stay distinct.
+        """
 
         # Generate hypothesis based on type
         if hypothesis_type == HypothesisType.EXPLANATORY:
@@ -181,6 +236,11 @@ class ScientificMethodAnalyzer:
             variables = ["variable_a", "variable_b", "relationship_strength"]
             predictions = ["Correlation will be significant", "Relationship will be consistent"]
 
+        if variant > 0:
+            focus = FACTOR_FOCUSES[(variant - 1) % len(FACTOR_FOCUSES)]
+            statement = f"{statement} (candidate {variant + 1}: {focus} factors)"
+            variables = [*variables, f"{focus}_factors"]
+
         # Calculate testability and falsifiability
         testability = 0.8 if "measurable" in statement.lower() else 0.6
         falsifiability = 0.9 if "specific" in statement.lower() else 0.7
@@ -197,7 +257,7 @@ class ScientificMethodAnalyzer:
             related_hypotheses=[]
         )
 
-    async def _create_null_hypothesis(
+    def _create_null_hypothesis(
         self,
         alternative_hypothesis: Hypothesis,
         context: ScientificMethodContext
@@ -216,35 +276,196 @@ class ScientificMethodAnalyzer:
             related_hypotheses=[alternative_hypothesis.hypothesis_id]
         )
 
+    def _create_measurement_hypothesis(
+        self, measurement: Measurement
+    ) -> tuple[Hypothesis, Evidence]:
+        """Create a comparative hypothesis and the evidence holding its samples"""
+        has_baseline = measurement.baseline_observations is not None
+        reference = "its baseline" if has_baseline else "zero"
+        smallest = len(measurement.observations)
+        if has_baseline:
+            smallest = min(smallest, len(measurement.baseline_observations))
+
+        if smallest >= 30:
+            quality = EvidenceQuality.HIGH
+        elif smallest >= 10:
+            quality = EvidenceQuality.MEDIUM
+        else:
+            quality = EvidenceQuality.LOW
+
+        hypothesis = Hypothesis(
+            statement=f"The mean of '{measurement.name}' differs from {reference}",
+            hypothesis_type=HypothesisType.COMPARATIVE,
+            variables=[measurement.name],
+            assumptions=["Observations are independent", "Samples represent the conditions compared"],
+            predictions=[f"Resampling test rejects no difference between '{measurement.name}' and {reference}"],
+            testability=0.9,
+            falsifiability=0.9,
+            theoretical_foundation=measurement.description or "Measured telemetry"
+        )
+        evidence = Evidence(
+            description=f"Measured samples of '{measurement.name}'",
+            evidence_type=EvidenceType.EXPERIMENTAL if has_baseline else EvidenceType.STATISTICAL,
+            quality=quality,
+            source=measurement.name,
+            relevance_score=1.0,
+            reliability_score=0.9,
+            supporting_strength=0.0,  # Determined by the statistical test
+            confidence_level=0.8,
+            methodology_notes="Resampling test and bootstrap interval over the measured samples",
+            observations=measurement.observations,
+            baseline_observations=measurement.baseline_observations
+        )
+        return hypothesis, evidence
+
+    def _compute_sample_statistics(
+        self,
+        evidence: Evidence,
+        context: ScientificMethodContext,
+        rng: np.random.Generator
+    ) -> SampleStatistics:
+        """Run the resampling test and bootstrap interval for measured evidence"""
+        return compare_samples(
+            evidence.observations,
+            evidence.baseline_observations,
+            n_resamples=context.n_resamples,
+            confidence_level=1.0 - context.significance_threshold,
+            rng=rng
+        )
+
+    @timed_phase
+    async def _run_hypothesis_pipeline(
+        self,
+        context: ScientificMethodContext,
+        hypotheses: list[Hypothesis],
+        measurement_evidence: dict[str, Evidence] | None = None
+    ) -> tuple[list[Evidence], list[Experiment], list[HypothesisTest]]:
+        """
+        Collect evidence, design experiments and test all hypotheses concurrently.
+
+        Every hypothesis runs its own pipeline, so the stages of different
+        hypotheses overlap. A null hypothesis is tested against the evidence
+        for the hypothesis it negates, with the direction of support reversed,
+        as soon as that evidence is collected. Hypotheses backed by measured
+        samples are tested statistically in worker threads, and their p-values
+        are corrected for multiple comparisons once all tests finish.
+
+        Returns:
+            Evidence collected, experiments designed and hypothesis tests, in
+            hypothesis order
+        """
+        measurement_evidence = measurement_evidence or {}
+        source_evidence = (
+            self._create_source_evidence(context) if context.evidence_evaluation_enabled else []
+        )
+        seeds = dict(zip(
+            measurement_evidence,
+            np.random.SeedSequence(request_seed(context)).spawn(len(measurement_evidence))
+        ))
+
+        async def collect(hypothesis: Hypothesis) -> list[Evidence]:
+            if hypothesis.hypothesis_id in measurement_evidence:
+                return [measurement_evidence[hypothesis.hypothesis_id]]
+            return await self._collect_evidence(context, hypothesis)
+
+        evidence_tasks = {
+            hypothesis.hypothesis_id: asyncio.create_task(collect(hypothesis))
+            for hypothesis in hypotheses
+        }
+
+        async def test(hypothesis: Hypothesis) -> tuple[list[Evidence], SampleStatistics | None]:
+            if hypothesis.hypothesis_id in measurement_evidence:
+                evidence = await evidence_tasks[hypothesis.hypothesis_id]
+                statistics = await asyncio.to_thread(
+                    self._compute_sample_statistics,
+                    evidence[0],
+                    context,
+                    np.random.default_rng(seeds[hypothesis.hypothesis_id])
+                )
+                return evidence, statistics
+
+            if hypothesis.hypothesis_type == HypothesisType.NULL_HYPOTHESIS:
+                evidence = [
+                    e.model_copy(update={"supporting_strength": -e.supporting_strength})
+                    for related_id in hypothesis.related_hypotheses
+                    if related_id in evidence_tasks
+                    for e in await evidence_tasks[related_id]
+                ]
+            else:
+                evidence = list(await evidence_tasks[hypothesis.hypothesis_id])
+            evidence.extend(
+                e for e in source_evidence
+                if any(var in e.description.lower() for var in hypothesis.variables)
+            )
+
+            # Simulate processing delay
+            await asyncio.sleep(0.1)
+            return evidence, None
+
+        try:
+            experiments, outcomes = await asyncio.gather(
+                asyncio.gather(*(
+                    self._design_experiment(context, hypothesis) for hypothesis in hypotheses
+                )),
+                asyncio.gather(*(test(hypothesis) for hypothesis in hypotheses)),
+            )
+        finally:
+            for task in evidence_tasks.values():
+                task.cancel()
+
+        # Correct data-driven p-values across all hypotheses tested with samples
+        sampled = [index for index, (_, statistics) in enumerate(outcomes) if statistics is not None]
+        adjusted = adjust_p_values(
+            [outcomes[index][1].p_value for index in sampled],
+            context.multiple_comparison_correction
+        )
+        for index, p_value in zip(sampled, adjusted):
+            evidence, statistics = outcomes[index]
+            outcomes[index] = (
+                evidence, statistics.model_copy(update={"adjusted_p_value": float(p_value)})
+            )
+
+        hypothesis_tests = [
+            self._conduct_statistical_test(hypothesis, evidence, statistics, context)
+            if statistics is not None
+            else self._conduct_hypothesis_test(hypothesis, evidence, context)
+            for hypothesis, (evidence, statistics) in zip(hypotheses, outcomes)
+        ]
+
+        evidence_collected = [
+            e for task in evidence_tasks.values() for e in task.result()
+        ] + source_evidence
+
+        return (
+            evidence_collected,
+            [experiment for experiment in experiments if experiment is not None],
+            hypothesis_tests,
+        )
+
     async def _collect_evidence(
         self,
         context: ScientificMethodContext,
-        hypotheses: list[Hypothesis]
+        hypothesis: Hypothesis
     ) -> list[Evidence]:
-        """Collect and evaluate evidence for hypotheses"""
+        """Collect and evaluate evidence for a single hypothesis"""
+        if (
+            not context.evidence_evaluation_enabled
+            or hypothesis.hypothesis_type == HypothesisType.NULL_HYPOTHESIS
+        ):
+            return []
+
         # Simulate processing delay
         await asyncio.sleep(0.1)
 
-        evidence_pieces = []
-
-        # Generate different types of evidence
-        evidence_types = [
-            EvidenceType.OBSERVATIONAL,
-            EvidenceType.EXPERIMENTAL,
-            EvidenceType.STATISTICAL,
-            EvidenceType.LITERATURE_REVIEW
+        return [
+            self._create_evidence(hypothesis, evidence_type, context)
+            for evidence_type in EVIDENCE_TYPES
         ]
 
-        for evidence_type in evidence_types:
-            for i, hypothesis in enumerate(hypotheses[:3]):  # Limit evidence per hypothesis
-                evidence = await self._create_evidence(
-                    hypothesis, evidence_type, context
-                )
-                evidence_pieces.append(evidence)
-
-        # Add evidence from specified sources
-        for source in context.evidence_sources:
-            source_evidence = Evidence(
+    def _create_source_evidence(self, context: ScientificMethodContext) -> list[Evidence]:
+        """Create evidence from the sources specified in the context"""
+        return [
+            Evidence(
                 description=f"Evidence from {source} regarding the research question",
                 evidence_type=EvidenceType.ARCHIVAL_DATA,
                 quality=EvidenceQuality.MEDIUM,
@@ -255,11 +476,10 @@ class ScientificMethodAnalyzer:
                 confidence_level=0.7,
                 limitations=["Source-specific limitations", "Potential bias"]
             )
-            evidence_pieces.append(source_evidence)
-
-        return evidence_pieces
+            for source in context.evidence_sources
+        ]
 
-    async def _create_evidence(
+    def _create_evidence(
         self,
         hypothesis: Hypothesis,
         evidence_type: EvidenceType,
@@ -309,25 +529,24 @@ class ScientificMethodAnalyzer:
             limitations=limitations
         )
 
-    async def _design_experiments(
+    async def _design_experiment(
         self,
         context: ScientificMethodContext,
-        hypotheses: list[Hypothesis]
-    ) -> list[Experiment]:
-        """Design experiments to test hypotheses"""
+        hypothesis: Hypothesis
+    ) -> Experiment | None:
+        """Design an experiment to test a hypothesis, if it needs one"""
+        if (
+            not context.experiment_design_enabled
+            or hypothesis.hypothesis_type == HypothesisType.NULL_HYPOTHESIS
+        ):
+            return None
+
         # Simulate processing delay
         await asyncio.sleep(0.1)
 
-        experiments = []
-
-        for hypothesis in hypotheses[:3]:  # Limit experiments
-            if hypothesis.hypothesis_type != HypothesisType.NULL_HYPOTHESIS:
-                experiment = await self._create_experiment(hypothesis, context)
-                experiments.append(experiment)
-
-        return experiments
+        return self._create_experiment(hypothesis, context)
 
-    async def _create_experiment(
+    def _create_experiment(
         self,
         hypothesis: Hypothesis,
         context: ScientificMethodContext
@@ -355,33 +574,7 @@ class ScientificMethodAnalyzer:
             feasibility_score=feasibility
         )
 
-    async def _test_hypotheses(
-        self,
-        hypotheses: list[Hypothesis],
-        evidence: list[Evidence],
-        context: ScientificMethodContext
-    ) -> list[HypothesisTest]:
-        """Test hypotheses against collected evidence"""
-        # Simulate processing delay
-        await asyncio.sleep(0.1)
-
-        hypothesis_tests = []
-
-        for hypothesis in hypotheses:
-            # Find relevant evidence for this hypothesis
-            relevant_evidence = [
-                e for e in evidence
-                if any(var in e.description.lower() for var in hypothesis.variables)
-            ]
-
-            test_result = await self._conduct_hypothesis_test(
-                hypothesis, relevant_evidence, context
-            )
-            hypothesis_tests.append(test_result)
-
-        return hypothesis_tests
-
-    async def _conduct_hypothesis_test(
+    def _conduct_hypothesis_test(
         self,
         hypothesis: Hypothesis,
         evidence: list[Evidence],
@@ -403,24 +596,16 @@ class ScientificMethodAnalyzer:
             )
 
         # Analyze evidence
-        supporting_evidence = [e for e in evidence if e.supporting_strength > 0.3]
-        opposing_evidence = [e for e in evidence if e.supporting_strength < -0.3]
+        quality, strength = _evidence_vectors(evidence, TEST_QUALITY_SCORES, 0.4)
+        supporting = strength > 0.3
+        opposing = strength < -0.3
 
         # Calculate evidence quality
-        quality_scores = []
-        for e in evidence:
-            if e.quality == EvidenceQuality.HIGH:
-                quality_scores.append(0.9)
-            elif e.quality == EvidenceQuality.MEDIUM:
-                quality_scores.append(0.7)
-            else:
-                quality_scores.append(0.4)
-
-        evidence_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0.5
+        evidence_quality = float(quality.mean())
 
         # Determine test result
-        support_strength = sum(e.supporting_strength for e in supporting_evidence)
-        oppose_strength = abs(sum(e.supporting_strength for e in opposing_evidence))
+        support_strength = float(strength[supporting].sum())
+        oppose_strength = float(abs(strength[opposing].sum()))
 
         if support_strength > oppose_strength and support_strength > 1.0:
             test_result = TestResult.SUPPORTED
@@ -447,14 +632,61 @@ class ScientificMethodAnalyzer:
             confidence_level=confidence,
             statistical_significance=statistical_significance,
             effect_size=support_strength * 0.3 if support_strength > 0 else None,
-            supporting_evidence_count=len(supporting_evidence),
-            opposing_evidence_count=len(opposing_evidence),
+            supporting_evidence_count=int(np.count_nonzero(supporting)),
+            opposing_evidence_count=int(np.count_nonzero(opposing)),
             evidence_quality_score=evidence_quality,
             alternative_explanations=self._generate_alternative_explanations(hypothesis),
             limitations=self._identify_test_limitations(evidence),
             recommendations=self._generate_test_recommendations(test_result, confidence)
         )
 
+    def _conduct_statistical_test(
+        self,
+        hypothesis: Hypothesis,
+        evidence: list[Evidence],
+        statistics: SampleStatistics,
+        context: ScientificMethodContext
+    ) -> HypothesisTest:
+        """Conduct a data-driven test from measured samples"""
+        p_value = (
+            statistics.adjusted_p_value
+            if statistics.adjusted_p_value is not None
+            else statistics.p_value
+        )
+
+        if p_value < context.significance_threshold:
+            test_result = TestResult.SUPPORTED
+            confidence = min(0.99, 1.0 - p_value)
+        else:
+            # Absence of a significant difference is not evidence of no difference
+            test_result = TestResult.INCONCLUSIVE
+            confidence = 0.5
+
+        quality, _ = _evidence_vectors(evidence, TEST_QUALITY_SCORES, 0.4)
+
+        limitations = ["Observational telemetry may be confounded"]
+        if statistics.method == "sign_flip":
+            limitations.append("Sign-flip test assumes a symmetric distribution under the null")
+        if statistics.batch_size > 1:
+            limitations.append(f"Resampled over batch means of {statistics.batch_size} observations")
+
+        return HypothesisTest(
+            hypothesis_id=hypothesis.hypothesis_id,
+            evidence_considered=[e.evidence_id for e in evidence],
+            test_result=test_result,
+            confidence_level=confidence,
+            statistical_significance=p_value,
+            effect_size=statistics.effect_size,
+            supporting_evidence_count=int(test_result == TestResult.SUPPORTED),
+            opposing_evidence_count=0,
+            evidence_quality_score=float(quality.mean()),
+            alternative_explanations=self._generate_alternative_explanations(hypothesis),
+            limitations=limitations,
+            recommendations=self._generate_test_recommendations(test_result, confidence),
+            sample_statistics=statistics
+        )
+
+    @timed_phase
     async def _construct_theory(
         self,
         hypotheses: list[Hypothesis],
@@ -477,10 +709,8 @@ class ScientificMethodAnalyzer:
             return None
 
         # Get corresponding hypotheses
-        supported_hypotheses = [
-            h for h in hypotheses
-            if any(test.hypothesis_id == h.hypothesis_id for test in supported_tests)
-        ]
+        supported_ids = {test.hypothesis_id for test in supported_tests}
+        supported_hypotheses = [h for h in hypotheses if h.hypothesis_id in supported_ids]
 
         # Calculate theory metrics
         explanatory_power = sum(test.confidence_level for test in supported_tests) / len(supported_tests)
@@ -497,7 +727,7 @@ class ScientificMethodAnalyzer:
         return TheoryConstruction(
             theory_name=f"Integrated Theory for {context.research_question[:30]}...",
             theory_statement=f"A comprehensive explanation integrating {len(supported_hypotheses)} validated hypotheses",
-            supporting_hypotheses=[h.hypothesis_id for h in supported_hypotheses],
+            supporting_hypotheses=[h.hypothesis_id for h in supported_hypotheses][:10],  # Limit to 10
             core_principles=core_principles,
             explanatory_power=explanatory_power,
             predictive_power=predictive_power,
@@ -510,6 +740,7 @@ class ScientificMethodAnalyzer:
             theory_confidence=min(explanatory_power, predictive_power)
         )
 
+    @timed_phase
     async def _evaluate_scientific_process(
         self,
         context: ScientificMethodContext,
@@ -523,8 +754,8 @@ class ScientificMethodAnalyzer:
 
         # Calculate scientific rigor
         rigor_factors = [
-            len(hypotheses) / max(1, context.max_hypotheses),  # Hypothesis generation
-            len(evidence) / max(1, len(hypotheses) * 2),  # Evidence collection
+            min(1.0, len(hypotheses) / max(1, context.max_hypotheses)),  # Hypothesis generation
+            min(1.0, len(evidence) / max(1, len(hypotheses) * 2)),  # Evidence collection
             len([e for e in experiments if e.feasibility_score > 0.7]) / max(1, len(experiments)),  # Experiment quality
             len([t for t in hypothesis_tests if t.confidence_level > 0.6]) / max(1, len(hypothesis_tests)),  # Test quality
             1.0 if theory else 0.5  # Theory construction
@@ -542,18 +773,16 @@ class ScientificMethodAnalyzer:
         # Calculate evidence strength
         evidence_strength = 0.0
         if evidence:
-            quality_weights = {EvidenceQuality.HIGH: 1.0, EvidenceQuality.MEDIUM: 0.7, EvidenceQuality.LOW: 0.4}
-            weighted_strength = sum(
-                abs(e.supporting_strength) * quality_weights.get(e.quality, 0.5)
-                for e in evidence
-            )
+            quality_weights, strengths = _evidence_vectors(evidence, STRENGTH_QUALITY_WEIGHTS, 0.5)
+            weighted_strength = float(np.abs(strengths) @ quality_weights)
             evidence_strength = min(1.0, weighted_strength / len(evidence))
 
         # Generate conclusions
         conclusions = []
         well_supported_tests = [t for t in hypothesis_tests if t.test_result == TestResult.SUPPORTED and t.confidence_level > 0.7]
+        hypotheses_by_id = {h.hypothesis_id: h for h in hypotheses}
         for test in well_supported_tests:
-            hypothesis = next((h for h in hypotheses if h.hypothesis_id == test.hypothesis_id), None)
+            hypothesis = hypotheses_by_id.get(test.hypothesis_id)
             if hypothesis:
                 conclusions.append(f"{hypothesis.hypothesis_type.value.title()}: {hypothesis.statement}")
 
@@ -581,9 +810,11 @@ class ScientificMethodAnalyzer:
         if evidence_strength < 0.6:
             recommendations.append("Collect higher quality evidence")
 
-        return rigor_score, methodology_quality, evidence_strength, conclusions, research_areas, recommendations
+        # Keep within the result limits when many hypotheses are tested
+        return rigor_score, methodology_quality, evidence_strength, conclusions[:10], research_areas[:8], recommendations
 
     # Helper methods
+    @timed_phase
     def _calculate_scientific_confidence(
         self, hypothesis_tests: list[HypothesisTest], evidence_strength: float
     ) -> float:
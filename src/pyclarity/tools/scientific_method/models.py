@@ -8,7 +8,7 @@ theory building and validation, and systematic inquiry processes.
 
 import uuid
 from datetime import datetime
-from enum import Enum
+from enum import Enum, StrEnum
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -84,6 +84,15 @@ class TestResult(str, Enum):
     REQUIRES_REFINEMENT = "requires_refinement"
 
 
+class MultipleComparisonCorrection(StrEnum):
+    """Corrections applied to p-values when several hypotheses are tested"""
+
+    NONE = "none"
+    BONFERRONI = "bonferroni"
+    HOLM = "holm"
+    BENJAMINI_HOCHBERG = "benjamini_hochberg"
+
+
 class Hypothesis(BaseModel):
     """A scientific hypothesis to be tested"""
 
@@ -236,6 +245,116 @@ class Evidence(BaseModel):
         max_length=5
     )
 
+    observations: list[float] | None = Field(
+        None,
+        description="Numeric samples backing this evidence (not serialized)",
+        exclude=True
+    )
+
+    baseline_observations: list[float] | None = Field(
+        None,
+        description="Baseline samples the observations are compared against (not serialized)",
+        exclude=True
+    )
+
+
+class Measurement(BaseModel):
+    """Numeric telemetry for a metric, tested as its own hypothesis"""
+
+    name: str = Field(
+        ...,
+        description="Name of the measured metric",
+        min_length=1,
+        max_length=100
+    )
+
+    observations: list[float] = Field(
+        ...,
+        description="Observed samples (e.g. the treatment group)",
+        min_length=2
+    )
+
+    baseline_observations: list[float] | None = Field(
+        None,
+        description="Baseline samples (e.g. the control group); if omitted, the mean is tested against zero",
+        min_length=2
+    )
+
+    description: str | None = Field(
+        None,
+        description="What the metric measures",
+        max_length=300
+    )
+
+
+class SampleStatistics(BaseModel):
+    """Data-driven statistics for a hypothesis backed by numeric samples"""
+
+    method: str = Field(
+        ...,
+        description="Resampling test used (permutation or sign_flip)"
+    )
+
+    sample_size: int = Field(
+        ...,
+        ge=1,
+        description="Number of observations"
+    )
+
+    baseline_size: int | None = Field(
+        None,
+        ge=1,
+        description="Number of baseline observations"
+    )
+
+    mean_difference: float = Field(
+        ...,
+        description="Observed mean minus baseline mean (or zero)"
+    )
+
+    effect_size: float = Field(
+        ...,
+        description="Standardized effect size (Cohen's d)"
+    )
+
+    p_value: float = Field(
+        ...,
+        ge=0.0,
+        le=1.0,
+        description="Two-sided resampling p-value"
+    )
+
+    adjusted_p_value: float | None = Field(
+        None,
+        ge=0.0,
+        le=1.0,
+        description="P-value after multiple-comparison correction"
+    )
+
+    confidence_interval: tuple[float, float] = Field(
+        ...,
+        description="Bootstrap percentile interval for the mean difference"
+    )
+
+    confidence_level: float = Field(
+        ...,
+        gt=0.0,
+        lt=1.0,
+        description="Coverage of the confidence interval"
+    )
+
+    n_resamples: int = Field(
+        ...,
+        ge=1,
+        description="Resamples drawn for the test and the interval"
+    )
+
+    batch_size: int = Field(
+        1,
+        ge=1,
+        description="Observations averaged into each resampled point"
+    )
+
 
 class Experiment(BaseModel):
     """An experiment designed to test a hypothesis"""
@@ -395,6 +514,11 @@ class HypothesisTest(BaseModel):
         max_length=6
     )
 
+    sample_statistics: SampleStatistics | None = Field(
+        None,
+        description="Statistics computed from numeric samples, if the evidence had any"
+    )
+
 
 class TheoryConstruction(BaseModel):
     """Construction of a theory from hypotheses and evidence"""
@@ -525,7 +649,7 @@ class ScientificMethodContext(BaseModel):
     max_hypotheses: int = Field(
         5,
         ge=1,
-        le=20,
+        le=50,
         description="Maximum number of hypotheses to generate"
     )
 
@@ -561,6 +685,29 @@ class ScientificMethodContext(BaseModel):
         description="Confidence threshold for conclusions"
     )
 
+    measurements: list[Measurement] = Field(
+        default_factory=list,
+        description="Numeric telemetry, each tested as a data-driven hypothesis",
+        max_length=100
+    )
+
+    n_resamples: int = Field(
+        10_000,
+        ge=100,
+        le=100_000,
+        description="Resamples for permutation tests and bootstrap intervals"
+    )
+
+    multiple_comparison_correction: MultipleComparisonCorrection = Field(
+        MultipleComparisonCorrection.HOLM,
+        description="Correction applied across data-driven hypothesis tests"
+    )
+
+    random_seed: int | None = Field(
+        None,
+        description="Seed for reproducible resampling; derived from the input when omitted"
+    )
+
     @field_validator('problem')
     @classmethod
     def validate_problem(cls, v):
@@ -0,0 +1,219 @@
+"""
+Scientific Method Statistics
+
+Resampling statistics for hypotheses backed by numeric samples: effect
+sizes, permutation (or sign-flip) tests, bootstrap confidence intervals and
+multiple-comparison correction.
+
+Resamples are drawn as 2-D NumPy arrays, one row per resample, in chunks
+bounded by RESAMPLE_CHUNK_ELEMENTS. Large samples are first reduced to
+batch means (shuffled, equal-sized batches shared by both groups), which
+keeps the resampling cost independent of the number of observations while
+preserving the mean and its sampling variance.
+"""
+
+import math
+from collections.abc import Sequence
+
+import numpy as np
+
+from .models import MultipleComparisonCorrection, SampleStatistics
+
+# Maximum number of points resampled per hypothesis, across both groups
+DEFAULT_MAX_POINTS = 1024
+
+# Elements per resampling array; bounds memory to ~32 MB of float64
+RESAMPLE_CHUNK_ELEMENTS = 1 << 22
+
+# Minimum batches per group when reducing samples to batch means
+MIN_BATCHES = 10
+
+
+def cohens_d(observations: np.ndarray, baseline: np.ndarray | None = None) -> float:
+    """
+    Standardized mean difference.
+
+    Uses the pooled standard deviation for two samples, or the sample
+    standard deviation against a zero mean for one.
+    """
+    if baseline is None:
+        sd = observations.std(ddof=1)
+        return float(observations.mean() / sd) if sd > 0 else 0.0
+
+    n1, n2 = len(observations), len(baseline)
+    pooled_var = (
+        (n1 - 1) * observations.var(ddof=1) + (n2 - 1) * baseline.var(ddof=1)
+    ) / (n1 + n2 - 2)
+    if pooled_var <= 0:
+        return 0.0
+    return float((observations.mean() - baseline.mean()) / math.sqrt(pooled_var))
+
+
+def batch_means(sample: np.ndarray, batch_size: int, rng: np.random.Generator) -> np.ndarray:
+    """Shuffle a sample and average it in equal batches, dropping the remainder."""
+    if batch_size <= 1:
+        return sample
+    usable = len(sample) // batch_size * batch_size
+    return rng.permutation(sample)[:usable].reshape(-1, batch_size).mean(axis=1)
+
+
+def _chunks(n_resamples: int, points: int) -> list[int]:
+    """Split resamples into chunks whose arrays stay under RESAMPLE_CHUNK_ELEMENTS."""
+    per_chunk = max(1, RESAMPLE_CHUNK_ELEMENTS // max(1, points))
+    full, last = divmod(n_resamples, per_chunk)
+    return [per_chunk] * full + ([last] if last else [])
+
+
+def permutation_test(
+    observations: np.ndarray,
+    baseline: np.ndarray,
+    n_resamples: int,
+    rng: np.random.Generator,
+) -> float:
+    """Two-sided permutation p-value for a difference in means."""
+    pooled = np.concatenate([observations, baseline])
+    split, rest = len(observations), len(baseline)
+    total = pooled.sum()
+    observed = abs(observations.mean() - baseline.mean())
+
+    extreme = 0
+    for size in _chunks(n_resamples, len(pooled)):
+        # The first `split` positions of a random partition form a uniform random subset
+        keys = rng.random((size, len(pooled)))
+        selected = np.argpartition(keys, split - 1, axis=1)[:, :split]
+        subset_sums = pooled[selected].sum(axis=1)
+        differences = subset_sums / split - (total - subset_sums) / rest
+        extreme += int(np.count_nonzero(np.abs(differences) >= observed - 1e-12))
+    return (extreme + 1) / (n_resamples + 1)
+
+
+def sign_flip_test(observations: np.ndarray, n_resamples: int, rng: np.random.Generator) -> float:
+    """Two-sided sign-flip p-value for a zero mean (assumes a symmetric null)."""
+    observed = abs(observations.mean())
+
+    extreme = 0
+    for size in _chunks(n_resamples, len(observations)):
+        signs = rng.integers(0, 2, size=(size, len(observations)), dtype=np.int8) * 2 - 1
+        means = (signs * observations).mean(axis=1)
+        extreme += int(np.count_nonzero(np.abs(means) >= observed - 1e-12))
+    return (extreme + 1) / (n_resamples + 1)
+
+
+def _bootstrap_means(sample: np.ndarray, n_resamples: int, rng: np.random.Generator) -> np.ndarray:
+    """Means of n_resamples bootstrap resamples of a sample."""
+    means = np.empty(n_resamples)
+    start = 0
+    for size in _chunks(n_resamples, len(sample)):
+        indices = rng.integers(0, len(sample), size=(size, len(sample)))
+        means[start:start + size] = sample[indices].mean(axis=1)
+        start += size
+    return means
+
+
+def bootstrap_interval(
+    observations: np.ndarray,
+    baseline: np.ndarray | None,
+    n_resamples: int,
+    confidence_level: float,
+    rng: np.random.Generator,
+) -> tuple[float, float]:
+    """Bootstrap percentile interval for the mean (difference)."""
+    differences = _bootstrap_means(observations, n_resamples, rng)
+    if baseline is not None:
+        differences -= _bootstrap_means(baseline, n_resamples, rng)
+    tail = (1.0 - confidence_level) / 2
+    low, high = np.quantile(differences, [tail, 1.0 - tail])
+    return float(low), float(high)
+
+
+def adjust_p_values(
+    p_values: Sequence[float],
+    method: MultipleComparisonCorrection,
+) -> np.ndarray:
+    """
+    Correct p-values for multiple comparisons.
+
+    Args:
+        p_values: Raw p-values, one per hypothesis
+        method: Correction to apply
+
+    Returns:
+        Adjusted p-values, in the input order
+    """
+    p = np.asarray(p_values, dtype=float)
+    m = len(p)
+    if m == 0 or method == MultipleComparisonCorrection.NONE:
+        return p.copy()
+    if method == MultipleComparisonCorrection.BONFERRONI:
+        return np.minimum(1.0, p * m)
+
+    order = np.argsort(p)
+    ranked = p[order]
+    if method == MultipleComparisonCorrection.HOLM:
+        adjusted = np.maximum.accumulate(ranked * (m - np.arange(m)))
+    else:  # BENJAMINI_HOCHBERG
+        adjusted = np.minimum.accumulate((ranked * m / np.arange(1, m + 1))[::-1])[::-1]
+
+    result = np.empty(m)
+    result[order] = np.minimum(1.0, adjusted)
+    return result
+
+
+def compare_samples(
+    observations: Sequence[float],
+    baseline: Sequence[float] | None = None,
+    n_resamples: int = 10_000,
+    confidence_level: float = 0.95,
+    rng: np.random.Generator | None = None,
+    max_points: int = DEFAULT_MAX_POINTS,
+) -> SampleStatistics:
+    """
+    Test whether observations differ from a baseline (or from zero).
+
+    Effect size and mean difference use every observation. The resampling
+    test and interval run on batch means when the samples together exceed
+    ``max_points``.
+
+    Args:
+        observations: Observed samples
+        baseline: Baseline samples, or None for a one-sample test against zero
+        n_resamples: Resamples for the test and the interval
+        confidence_level: Coverage of the bootstrap interval
+        rng: Random generator (a fresh unseeded one by default)
+        max_points: Maximum points resampled across both groups
+
+    Returns:
+        SampleStatistics without a multiple-comparison adjustment
+    """
+    rng = rng or np.random.default_rng()
+    observed = np.asarray(observations, dtype=float)
+    base = None if baseline is None else np.asarray(baseline, dtype=float)
+
+    total = len(observed) + (0 if base is None else len(base))
+    smallest = len(observed) if base is None else min(len(observed), len(base))
+    batch_size = max(1, min(math.ceil(total / max_points), smallest // MIN_BATCHES))
+
+    observed_points = batch_means(observed, batch_size, rng)
+    if base is None:
+        mean_difference = float(observed.mean())
+        p_value = sign_flip_test(observed_points, n_resamples, rng)
+        base_points = None
+    else:
+        mean_difference = float(observed.mean() - base.mean())
+        base_points = batch_means(base, batch_size, rng)
+        p_value = permutation_test(observed_points, base_points, n_resamples, rng)
+
+    return SampleStatistics(
+        method="sign_flip" if base is None else "permutation",
+        sample_size=len(observed),
+        baseline_size=None if base is None else len(base),
+        mean_difference=mean_difference,
+        effect_size=cohens_d(observed, base),
+        p_value=p_value,
+        confidence_interval=bootstrap_interval(
+            observed_points, base_points, n_resamples, confidence_level, rng
+        ),
+        confidence_level=confidence_level,
+        n_resamples=n_resamples,
+        batch_size=batch_size,
+    )
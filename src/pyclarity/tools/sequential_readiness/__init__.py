@@ -21,9 +21,12 @@ from .models import (
     # Main models
     SequentialReadinessContext,
     SequentialReadinessResult,
+    StateSchedule,
     StateTransition,
     TransitionType,
+    WhatIfOutcome,
 )
+from .planner import PlanChange, ReadinessGraph
 
 __all__ = [
     # Enums
@@ -38,9 +41,14 @@ __all__ = [
     "Dependency",
     "ReadinessGap",
     "Intervention",
+    "StateSchedule",
+    "WhatIfOutcome",
     # Main models
     "SequentialReadinessContext",
     "SequentialReadinessResult",
+    # Planner
+    "PlanChange",
+    "ReadinessGraph",
     # Main class
     "SequentialReadinessAnalyzer",
 ]
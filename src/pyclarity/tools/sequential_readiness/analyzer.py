@@ -5,24 +5,32 @@ Analyzes processes requiring progressive readiness through ordered states,
 helping identify sequences, transitions, gaps, and progression strategies.
 """
 
-from typing import Any, Dict, List, Optional
-
-from pyclarity.tools.sequential_readiness.models import (
-    ComplexityLevel,
-    Dependency,
-    GapSeverity,
-    Intervention,
-    InterventionType,
-    ReadinessGap,
+import asyncio
+import math
+
+from ..base import BaseCognitiveAnalyzer, ComplexityLevel, timed_phase
+from .models import (
+    GapAnalysis,
+    ProgressionPlan,
+    ProgressionStrategy,
     ReadinessLevel,
-    ReadinessState,
     SequentialReadinessContext,
     SequentialReadinessResult,
+    State,
+    StateSchedule,
     StateTransition,
     TransitionType,
+    WhatIfOutcome,
 )
+from .planner import REMAINING_WORK, ReadinessGraph, ScheduledState, parse_duration
 
-from ..base import BaseCognitiveAnalyzer
+# Gap analyses reported, least slack first
+MAX_GAP_ANALYSES = 10
+
+# Critical-path milestones listed in the progression plan
+MAX_MILESTONES = 10
+
+_SLACK_EPSILON = 1e-9
 
 
 class SequentialReadinessAnalyzer(BaseCognitiveAnalyzer):
@@ -33,6 +41,8 @@ class SequentialReadinessAnalyzer(BaseCognitiveAnalyzer):
     ensuring prerequisites are met and success conditions are established.
     """
 
+    phase_dependencies = {"what_if_outcomes": ()}
+
     # Domain-specific state templates
     DOMAIN_STATES = {
         "change_management": [
@@ -121,6 +131,14 @@ class SequentialReadinessAnalyzer(BaseCognitiveAnalyzer):
         ],
     }
 
+    def __init__(self) -> None:
+        """Initialize the sequential readiness analyzer."""
+        super().__init__(
+            tool_name="Sequential Readiness",
+            tool_description="Assesses readiness to progress through ordered states",
+            version="1.0.0"
+        )
+
     async def analyze(self, context: SequentialReadinessContext) -> SequentialReadinessResult:
         """
         Perform sequential readiness analysis.
@@ -130,6 +148,10 @@ class SequentialReadinessAnalyzer(BaseCognitiveAnalyzer):
 
         Returns:
             SequentialReadinessResult with complete readiness analysis
+
+        Raises:
+            ValueError: If a transition, status or what-if entry names an unknown
+                state, or the prerequisites form a cycle
         """
         # Identify states based on domain or generate generic
         states = await self._identify_states(context)
@@ -137,118 +159,116 @@ class SequentialReadinessAnalyzer(BaseCognitiveAnalyzer):
         # Analyze transitions between states
         transitions = await self._analyze_transitions(states, context)
 
-        # Assess current readiness
-        current_state_idx = await self._assess_current_state(states, context)
-        current_state = states[current_state_idx]
-
-        # Identify gaps and blockers
-        gaps = await self._identify_gaps(states, current_state_idx, context)
-
-        # Generate interventions
-        interventions = await self._generate_interventions(gaps, states, context)
-
-        # Create progression strategy
-        progression_strategy = await self._create_progression_strategy(
-            states, transitions, current_state_idx, gaps, context
-        )
-
-        # Identify parallel opportunities
-        parallel_opportunities = await self._identify_parallel_opportunities(states, transitions)
-
-        # Calculate overall readiness
-        overall_readiness = await self._calculate_overall_readiness(states, current_state_idx, gaps)
-
-        # Generate recommendations
-        recommendations = await self._generate_recommendations(
-            current_state, gaps, interventions, context
+        # Build the readiness DAG and its critical-path schedule
+        graph = await asyncio.to_thread(
+            ReadinessGraph,
+            {state.name: self._state_duration(state, context) for state in states},
+            self._prerequisite_edges(transitions),
+            {state.name: state.readiness_level for state in states},
         )
+        schedule = graph.schedule()
+        by_name = {entry.name: entry for entry in schedule}
+        critical_path = graph.critical_path()
+        parallel_groups = graph.levels(outstanding_only=True)
 
-        # Identify risks
-        risks = await self._identify_risks(states, transitions, gaps, context)
+        # Identify gaps on the outstanding states with the least slack
+        gaps = await self._identify_gaps(states, graph, by_name)
+        confidence_score = self._calculate_confidence(states, gaps, context)
 
-        # Create monitoring plan
-        monitoring_plan = await self._create_monitoring_plan(
-            states, current_state_idx, progression_strategy
+        # Create progression strategy
+        progression_plan = await self._create_progression_plan(
+            states, transitions, graph, by_name, critical_path, parallel_groups,
+            confidence_score, context
         )
 
-        # Generate overall recommendation
-        overall_recommendation = await self._generate_overall_recommendation(
-            overall_readiness, gaps, risks, context
-        )
+        # Evaluate single-state readiness changes
+        what_if_outcomes = []
+        if context.what_if and self.needs_phase("what_if_outcomes"):
+            what_if_outcomes = await asyncio.to_thread(self._evaluate_what_if, graph, context)
 
-        # Calculate confidence
-        confidence_score = self._calculate_confidence(states, gaps, context)
 
         return SequentialReadinessResult(
             input_scenario=context.scenario,
             identified_states=states,
             state_transitions=transitions,
-            current_state=current_state,
-            readiness_gaps=gaps,
-            recommended_interventions=interventions,
-            progression_strategy=progression_strategy,
-            overall_readiness_percentage=overall_readiness,
-            critical_blockers=[g.description for g in gaps if g.severity == GapSeverity.CRITICAL],
-            success_factors=[
-                f"Strong foundation in {states[0].name}",
-                f"Clear progression path through {len(states)} states",
-                f"Identified {len(interventions)} targeted interventions",
-            ],
-            risk_factors=risks[:5],  # Top 5 risks
-            parallel_opportunities=parallel_opportunities,
-            immediate_actions=recommendations[:3],  # Top 3 actions
-            key_decisions=[
-                f"Priority order for addressing {len(gaps)} gaps",
-                "Resource allocation for interventions",
-                "Timeline for progression milestones",
-            ],
-            monitoring_plan=monitoring_plan,
-            overall_recommendation=overall_recommendation,
+            current_state_assessment=self._assess_current_state(states, graph),
+            gap_analyses=gaps,
+            progression_plan=progression_plan,
+            critical_path=critical_path,
+            dependency_map={state.name: graph.prerequisites(state.name) for state in states},
+            schedule=[self._state_schedule(entry) for entry in schedule],
+            parallel_groups=parallel_groups,
+            total_duration_weeks=graph.total_duration,
+            what_if_outcomes=what_if_outcomes,
+            risk_assessment=self._assess_risks(schedule, critical_path, context),
+            domain_specific_insights=self._generate_insights(
+                graph, schedule, critical_path, parallel_groups, context
+            ),
+            visual_representation={
+                "type": "dag",
+                "levels": graph.levels(),
+                "critical_path": critical_path,
+                "edges": [[t.from_state, t.to_state] for t in transitions],
+            },
+            key_decisions=self._identify_key_decisions(graph, critical_path, parallel_groups),
+            monitoring_plan=self._create_monitoring_plan(graph, critical_path),
+            overall_recommendation=self._generate_overall_recommendation(
+                graph, schedule, critical_path, context
+            ),
             confidence_score=confidence_score,
         )
 
-    async def _identify_states(self, context: SequentialReadinessContext) -> list[ReadinessState]:
-        """Identify relevant states for the process."""
-        # Check for domain-specific states
-        if context.domain_context:
-            for domain, template_states in self.DOMAIN_STATES.items():
-                if domain in context.domain_context.lower():
-                    return await self._create_states_from_template(template_states, context)
-
+    @timed_phase
+    async def _identify_states(self, context: SequentialReadinessContext) -> list[State]:
+        """Identify relevant states for the process and apply the current status."""
         # Use predefined states if provided
         if context.predefined_states:
-            return context.predefined_states
-
-        # Generate generic states based on complexity
-        return await self._generate_generic_states(context)
+            states = list(context.predefined_states)
+        else:
+            states = None
+            # Check for domain-specific states
+            if context.domain_context:
+                for domain, template_states in self.DOMAIN_STATES.items():
+                    if domain in context.domain_context.lower():
+                        states = self._create_states_from_template(template_states, context)
+                        break
+            # Generate generic states based on complexity
+            if states is None:
+                states = self._generate_generic_states(context)
+
+        status = context.current_status or {}
+        known = {state.name for state in states}
+        unknown = sorted(set(status) - known)
+        if unknown:
+            raise ValueError(f"Current status names unknown states: {', '.join(unknown)}")
+        return [
+            state.model_copy(update={"readiness_level": status[state.name]})
+            if state.name in status else state
+            for state in states
+        ]
 
-    async def _create_states_from_template(
+    def _create_states_from_template(
         self, template: list[tuple], context: SequentialReadinessContext
-    ) -> list[ReadinessState]:
+    ) -> list[State]:
         """Create states from domain template."""
-        states = []
-        for idx, (name, desc, criteria) in enumerate(template):
-            state = ReadinessState(
-                state_id=f"state_{idx}",
+        return [
+            State(
                 name=name,
                 description=desc,
-                required_capabilities=criteria[:3],
-                success_criteria=criteria,
-                prerequisites=[f"state_{idx - 1}"] if idx > 0 else [],
+                indicators=criteria,
+                prerequisites=[template[idx - 1][0]] if idx > 0 else [],
                 typical_duration=self._estimate_duration(context.complexity_level),
-                readiness_level=ReadinessLevel.NOT_STARTED,
             )
-            states.append(state)
-        return states
+            for idx, (name, desc, criteria) in enumerate(template)
+        ]
 
-    async def _generate_generic_states(
-        self, context: SequentialReadinessContext
-    ) -> list[ReadinessState]:
+    def _generate_generic_states(self, context: SequentialReadinessContext) -> list[State]:
         """Generate generic sequential states."""
         num_states = {
             ComplexityLevel.SIMPLE: 3,
             ComplexityLevel.MODERATE: 5,
             ComplexityLevel.COMPLEX: 7,
+            ComplexityLevel.VERY_COMPLEX: 7,
         }.get(context.complexity_level, 5)
 
         state_names = [
@@ -261,382 +281,410 @@ class SequentialReadinessAnalyzer(BaseCognitiveAnalyzer):
             "Excellence",
         ][:num_states]
 
-        states = []
-        for idx, name in enumerate(state_names):
-            state = ReadinessState(
-                state_id=f"state_{idx}",
+        return [
+            State(
                 name=name,
                 description=f"{name} phase of {context.scenario}",
-                required_capabilities=[f"Capability {i + 1} for {name}" for i in range(2)],
-                success_criteria=[f"Success criterion {i + 1} for {name}" for i in range(3)],
-                prerequisites=[f"state_{idx - 1}"] if idx > 0 else [],
+                indicators=[f"Success criterion {i + 1} for {name}" for i in range(3)],
+                prerequisites=[state_names[idx - 1]] if idx > 0 else [],
                 typical_duration=self._estimate_duration(context.complexity_level),
-                readiness_level=ReadinessLevel.NOT_STARTED,
             )
-            states.append(state)
-
-        return states
+            for idx, name in enumerate(state_names)
+        ]
 
+    @timed_phase
     async def _analyze_transitions(
-        self, states: list[ReadinessState], context: SequentialReadinessContext
+        self, states: list[State], context: SequentialReadinessContext
     ) -> list[StateTransition]:
-        """Analyze transitions between states."""
-        transitions = []
-
-        for i in range(len(states) - 1):
-            from_state = states[i]
-            to_state = states[i + 1]
-
-            transition = StateTransition(
-                from_state=from_state.state_id,
-                to_state=to_state.state_id,
-                transition_type=TransitionType.SEQUENTIAL,
-                requirements=await self._generate_transition_requirements(from_state, to_state),
-                dependencies=[
-                    Dependency(
-                        dependency_id=f"dep_{i}",
-                        description=f"Complete {from_state.name}",
-                        type="completion",
-                        required_state=from_state.state_id,
-                        criticality="high",
-                    )
-                ],
-                risks=await self._identify_transition_risks(from_state, to_state, context),
-                estimated_duration=self._estimate_duration(context.complexity_level),
-                success_rate=0.8,
-                strategies=[
-                    f"Gradual transition from {from_state.name}",
-                    f"Pilot approach for {to_state.name}",
-                    "Continuous monitoring and adjustment",
-                ],
-            )
-            transitions.append(transition)
+        """
+        Collect transitions between states.
 
+        Explicit transitions are kept as given. Prerequisites that name another
+        state add a sequential transition; if no state names another at all,
+        the states are taken to follow each other in list order.
+        """
+        transitions = list(context.state_transitions or [])
+        names = {state.name for state in states}
+        for transition in transitions:
+            for name in (transition.from_state, transition.to_state):
+                if name not in names:
+                    raise ValueError(f"Transition names unknown state: {name}")
+
+        pairs = [
+            (prerequisite, state.name)
+            for state in states
+            for prerequisite in state.prerequisites
+            if prerequisite in names
+        ]
+        if not pairs and not transitions:
+            pairs = [(a.name, b.name) for a, b in zip(states, states[1:])]
+
+        by_name = {state.name: state for state in states}
+        covered = {(t.from_state, t.to_state) for t in transitions}
+        for from_name, to_name in dict.fromkeys(pairs):
+            if (from_name, to_name) not in covered:
+                transitions.append(
+                    self._sequential_transition(by_name[from_name], by_name[to_name], context)
+                )
         return transitions
 
-    async def _assess_current_state(
-        self, states: list[ReadinessState], context: SequentialReadinessContext
-    ) -> int:
-        """Assess which state the process is currently in."""
-        # Simple heuristic based on scenario description
-        scenario_lower = context.scenario.lower()
-
-        if any(word in scenario_lower for word in ["starting", "beginning", "initial"]):
-            return 0
-        elif any(word in scenario_lower for word in ["implementing", "rolling out"]):
-            return min(2, len(states) - 1)
-        elif any(word in scenario_lower for word in ["optimizing", "improving"]):
-            return min(len(states) - 2, len(states) - 1)
-        else:
-            return 1  # Default to second state
-
-    async def _identify_gaps(
-        self, states: list[ReadinessState], current_idx: int, context: SequentialReadinessContext
-    ) -> list[ReadinessGap]:
-        """Identify readiness gaps."""
-        gaps = []
+    def _sequential_transition(
+        self, from_state: State, to_state: State, context: SequentialReadinessContext
+    ) -> StateTransition:
+        """Build a sequential transition between two states."""
+        risks = [
+            f"Premature transition from {from_state.name}",
+            f"Resource availability for {to_state.name}",
+        ]
+        if context.complexity_level in (ComplexityLevel.COMPLEX, ComplexityLevel.VERY_COMPLEX):
+            risks.append("Complex dependencies may cause delays")
+        return StateTransition(
+            from_state=from_state.name,
+            to_state=to_state.name,
+            transition_type=TransitionType.SEQUENTIAL,
+            requirements=[
+                f"Complete all {from_state.name} indicators",
+                f"Prepare resources for {to_state.name}",
+            ],
+            risks=risks,
+            strategies=[
+                f"Gradual transition from {from_state.name}",
+                f"Pilot approach for {to_state.name}",
+            ],
+        )
 
-        # Check gaps for progressing to next state
-        if current_idx < len(states) - 1:
-            next_state = states[current_idx + 1]
-            current_state = states[current_idx]
-
-            # Capability gaps
-            for capability in next_state.required_capabilities:
-                gap = ReadinessGap(
-                    gap_id=f"gap_cap_{len(gaps)}",
-                    description=f"Missing capability: {capability}",
-                    current_state=current_state.state_id,
-                    target_state=next_state.state_id,
-                    gap_type="capability",
-                    severity=GapSeverity.MODERATE,
-                    impact=f"Cannot progress to {next_state.name}",
-                    root_causes=[
-                        "Insufficient preparation",
-                        "Resource constraints",
-                        "Knowledge gaps",
-                    ],
-                    estimated_effort="Medium",
-                )
-                gaps.append(gap)
-
-        # Add constraint-based gaps
-        if context.key_constraints:
-            for constraint in context.key_constraints[:2]:
-                gap = ReadinessGap(
-                    gap_id=f"gap_constraint_{len(gaps)}",
-                    description=f"Constraint impact: {constraint}",
-                    current_state=states[current_idx].state_id,
-                    target_state=states[min(current_idx + 1, len(states) - 1)].state_id,
-                    gap_type="constraint",
-                    severity=GapSeverity.MINOR,
-                    impact="Slows progression",
-                    root_causes=[constraint],
-                    estimated_effort="Low",
-                )
-                gaps.append(gap)
+    @staticmethod
+    def _prerequisite_edges(transitions: list[StateTransition]) -> list[tuple[str, str]]:
+        """Transitions that order their states; parallel ones do not."""
+        return [
+            (t.from_state, t.to_state)
+            for t in transitions
+            if t.transition_type != TransitionType.PARALLEL
+        ]
 
-        return gaps
+    def _state_duration(self, state: State, context: SequentialReadinessContext) -> float:
+        """Weeks a state takes from a standing start."""
+        weeks = parse_duration(state.typical_duration)
+        if weeks is None:
+            weeks = parse_duration(self._estimate_duration(context.complexity_level))
+        return weeks
+
+    @staticmethod
+    def _state_schedule(entry: ScheduledState) -> StateSchedule:
+        """Convert a planner schedule entry to the result model."""
+        return StateSchedule(
+            state_name=entry.name,
+            duration_weeks=entry.duration,
+            remaining_weeks=entry.remaining,
+            earliest_start=entry.earliest_start,
+            earliest_finish=entry.earliest_finish,
+            latest_start=entry.latest_start,
+            latest_finish=entry.latest_finish,
+            slack_weeks=entry.slack,
+            is_critical=entry.remaining > 0 and entry.slack <= _SLACK_EPSILON,
+            level=entry.level,
+        )
 
-    async def _generate_interventions(
+    @timed_phase
+    def _assess_current_state(self, states: list[State], graph: ReadinessGraph) -> str:
+        """Describe the current position in the plan."""
+        ready = sum(REMAINING_WORK[s.readiness_level] == 0 for s in states)
+        in_progress = [
+            s.name for s in states
+            if s.readiness_level not in (ReadinessLevel.NOT_STARTED, ReadinessLevel.READY,
+                                         ReadinessLevel.EXCEEDED)
+        ]
+        available = graph.available_states()
+        assessment = f"{ready} of {len(states)} states are ready"
+        if in_progress:
+            assessment += f"; {len(in_progress)} in progress ({', '.join(in_progress[:5])})"
+        if available:
+            assessment += f". Can progress now: {', '.join(available[:5])}"
+            if len(available) > 5:
+                assessment += f" and {len(available) - 5} more"
+        return assessment + "."
+
+    @timed_phase
+    async def _identify_gaps(
         self,
-        gaps: list[ReadinessGap],
-        states: list[ReadinessState],
-        context: SequentialReadinessContext,
-    ) -> list[Intervention]:
-        """Generate interventions to address gaps."""
-        interventions = []
-
-        for gap in gaps:
-            if gap.gap_type == "capability":
-                intervention = Intervention(
-                    intervention_id=f"int_{len(interventions)}",
-                    name=f"Build {gap.description.replace('Missing capability: ', '')}",
-                    description=f"Intervention to address: {gap.description}",
-                    type=InterventionType.TRAINING,
-                    target_gaps=[gap.gap_id],
-                    implementation_steps=[
-                        "Assess current capability level",
-                        "Design targeted training program",
-                        "Implement with pilot group",
-                        "Measure effectiveness",
-                        "Scale to full implementation",
-                    ],
-                    required_resources=[
-                        "Training materials",
-                        "Subject matter experts",
-                        "Practice environment",
-                    ],
-                    estimated_duration="2-4 weeks",
-                    success_metrics=[
-                        "Capability assessment scores",
-                        "Practical application success",
-                        "Stakeholder confidence",
-                    ],
-                    risk_mitigation=[
-                        "Provide multiple learning formats",
-                        "Include hands-on practice",
-                        "Offer ongoing support",
-                    ],
-                )
-            else:  # constraint type
-                intervention = Intervention(
-                    intervention_id=f"int_{len(interventions)}",
-                    name=f"Mitigate {gap.description}",
-                    description="Strategy to work within constraint",
-                    type=InterventionType.PROCESS_CHANGE,
-                    target_gaps=[gap.gap_id],
-                    implementation_steps=[
-                        "Analyze constraint impact",
-                        "Identify workarounds",
-                        "Implement adjustments",
-                        "Monitor effectiveness",
-                    ],
-                    required_resources=["Process analysis", "Change management support"],
-                    estimated_duration="1-2 weeks",
-                    success_metrics=["Constraint impact reduced", "Progress maintained"],
-                    risk_mitigation=["Regular constraint review", "Flexible approach"],
-                )
-
-            interventions.append(intervention)
+        states: list[State],
+        graph: ReadinessGraph,
+        schedule: dict[str, ScheduledState],
+    ) -> list[GapAnalysis]:
+        """Analyze gaps for the outstanding states with the least slack."""
+        outstanding = sorted(
+            (s for s in states if schedule[s.name].remaining > 0),
+            key=lambda s: (schedule[s.name].slack, schedule[s.name].earliest_start),
+        )[:MAX_GAP_ANALYSES]
 
-        return interventions
+        gaps = []
+        for state in outstanding:
+            entry = schedule[state.name]
+            fraction = REMAINING_WORK[state.readiness_level]
+            missing = state.indicators[-math.ceil(len(state.indicators) * fraction):]
+            missing += [
+                f"Prerequisite not ready: {name}"
+                for name in graph.prerequisites(state.name)
+                if schedule[name].remaining > 0
+            ]
+            actions = [f"Remove blocker: {blocker}" for blocker in state.blockers[:2]]
+            actions += [f"Leverage enabler: {enabler}" for enabler in state.enablers[:2]]
+            actions.append(f"Work toward {state.name} indicators: {', '.join(state.indicators[:2])}")
+
+            if entry.slack <= _SLACK_EPSILON:
+                priority = "high"
+            elif entry.slack < entry.remaining:
+                priority = "medium"
+            else:
+                priority = "low"
+
+            gaps.append(
+                GapAnalysis(
+                    state_name=state.name,
+                    current_readiness=state.readiness_level,
+                    target_readiness=ReadinessLevel.READY,
+                    gap_size="large" if fraction >= 0.7 else "medium" if fraction >= 0.4 else "small",
+                    missing_elements=missing,
+                    recommended_actions=actions,
+                    estimated_effort=f"{entry.remaining:.1f} weeks",
+                    priority=priority,
+                )
+            )
+        return gaps
 
-    async def _create_progression_strategy(
+    @timed_phase
+    async def _create_progression_plan(
         self,
-        states: list[ReadinessState],
+        states: list[State],
         transitions: list[StateTransition],
-        current_idx: int,
-        gaps: list[ReadinessGap],
+        graph: ReadinessGraph,
+        schedule: dict[str, ScheduledState],
+        critical_path: list[str],
+        parallel_groups: list[list[str]],
+        confidence: float,
         context: SequentialReadinessContext,
-    ) -> str:
-        """Create overall progression strategy."""
-        remaining_states = len(states) - current_idx - 1
-        critical_gaps = [g for g in gaps if g.severity == GapSeverity.CRITICAL]
-
-        if critical_gaps:
-            strategy = (
-                f"Address {len(critical_gaps)} critical gaps before progression. "
-                f"Focus on capability building and risk mitigation. "
-            )
-        elif remaining_states <= 2:
-            strategy = (
-                f"Near completion with {remaining_states} states remaining. "
-                f"Maintain momentum and ensure quality standards. "
-            )
-        else:
-            strategy = (
-                f"Systematic progression through {remaining_states} remaining states. "
-                f"Implement phased approach with regular checkpoints. "
-            )
-
-        strategy += (
-            f"Timeline estimate: {remaining_states * 4} to {remaining_states * 8} weeks. "
-            f"Success depends on addressing {len(gaps)} identified gaps."
+    ) -> ProgressionPlan:
+        """Create the progression plan from the dependency levels and critical path."""
+        width = max((len(group) for group in parallel_groups), default=0)
+        transition_types = {t.transition_type for t in transitions}
+        time_bound = any(
+            word in key.lower()
+            for key in (context.constraints or {})
+            for word in ("time", "deadline", "schedule")
         )
 
-        return strategy
-
-    async def _identify_parallel_opportunities(
-        self, states: list[ReadinessState], transitions: list[StateTransition]
-    ) -> list[str]:
-        """Identify opportunities for parallel progress."""
-        opportunities = []
-
-        # Look for independent capabilities
-        for i, state in enumerate(states[:-1]):
-            if len(state.required_capabilities) > 2:
-                opportunities.append(
-                    f"Parallel capability development in {state.name}: "
-                    f"Train multiple teams simultaneously"
-                )
-
-        # Look for non-dependent preparations
-        if len(states) > 3:
-            opportunities.append("Begin preparation for future states while completing current")
-
-        return opportunities[:3]  # Top 3 opportunities
+        if TransitionType.ITERATIVE in transition_types:
+            strategy = ProgressionStrategy.ITERATIVE
+            rationale = "Iterative transitions mean some states will be revisited"
+        elif TransitionType.CONDITIONAL in transition_types:
+            strategy = ProgressionStrategy.ADAPTIVE
+            rationale = "Conditional transitions depend on external factors"
+        elif width <= 1:
+            strategy = ProgressionStrategy.LINEAR
+            rationale = "Every outstanding state depends on the one before it"
+        elif time_bound:
+            strategy = ProgressionStrategy.ACCELERATED
+            rationale = f"Time is constrained and up to {width} states can progress at once"
+        else:
+            strategy = ProgressionStrategy.PARALLEL
+            rationale = f"Up to {width} independent states can progress at once"
+        total = graph.total_duration
+        rationale += f"; the critical path through {len(critical_path)} states takes {total:.1f} weeks."
+
+        phases = [
+            {
+                "phase": index + 1,
+                "states": group,
+                "start_week": round(min(schedule[name].earliest_start for name in group), 1),
+                "finish_week": round(max(schedule[name].earliest_finish for name in group), 1),
+            }
+            for index, group in enumerate(parallel_groups)
+        ]
 
-    async def _calculate_overall_readiness(
-        self, states: list[ReadinessState], current_idx: int, gaps: list[ReadinessGap]
-    ) -> float:
-        """Calculate overall readiness percentage."""
-        # Base progress on current state
-        base_progress = (current_idx / len(states)) * 100
+        milestones = [
+            f"{name} ready by week {schedule[name].earliest_finish:.1f}"
+            for name in critical_path[:MAX_MILESTONES - 1]
+        ]
+        if len(critical_path) >= MAX_MILESTONES:
+            last = critical_path[-1]
+            milestones.append(f"{last} ready by week {schedule[last].earliest_finish:.1f}")
+
+        by_name = {state.name: state for state in states}
+        final_states = [state for state in states if not any(
+            t.from_state == state.name for t in transitions
+        )]
+        success_criteria = [state.indicators[0] for state in final_states[:5]]
+        success_criteria += list(context.success_factors or [])
+        if context.target_outcome:
+            success_criteria.append(context.target_outcome)
+
+        risk_mitigation = [
+            f"Address {blocker} before it delays {name}"
+            for name in critical_path
+            for blocker in by_name[name].blockers[:1]
+        ][:5]
+        risk_mitigation += [
+            f"Plan around {key}: {value}" for key, value in (context.constraints or {}).items()
+        ]
 
-        # Adjust for gaps
-        gap_penalty = len(gaps) * 2  # 2% penalty per gap
-        critical_penalty = sum(10 for g in gaps if g.severity == GapSeverity.CRITICAL)
+        return ProgressionPlan(
+            strategy=strategy,
+            rationale=rationale,
+            phases=phases,
+            milestones=milestones,
+            timeline=f"{total:.1f} weeks until every state is ready",
+            success_criteria=success_criteria or ["All states reach readiness"],
+            risk_mitigation=risk_mitigation,
+            confidence_level=confidence,
+        )
 
-        overall = max(0, base_progress - gap_penalty - critical_penalty)
-        return min(100, overall)
+    def _evaluate_what_if(
+        self, graph: ReadinessGraph, context: SequentialReadinessContext
+    ) -> list[WhatIfOutcome]:
+        """Re-plan for each requested readiness change, one state at a time."""
+        outcomes = []
+        for name, level in context.what_if.items():
+            change = graph.what_if(name, level)
+            outcomes.append(
+                WhatIfOutcome(
+                    state_name=name,
+                    readiness_level=level,
+                    total_duration_weeks=change.total_duration,
+                    duration_change_weeks=change.total_duration - change.previous_duration,
+                    critical_path=change.critical_path,
+                    affected_states=change.affected_states,
+                )
+            )
+        return outcomes
 
-    async def _generate_recommendations(
+    @timed_phase
+    def _assess_risks(
         self,
-        current_state: ReadinessState,
-        gaps: list[ReadinessGap],
-        interventions: list[Intervention],
+        schedule: list[ScheduledState],
+        critical_path: list[str],
         context: SequentialReadinessContext,
-    ) -> list[str]:
-        """Generate immediate action recommendations."""
-        recommendations = []
-
-        # Address critical gaps first
-        critical_gaps = [g for g in gaps if g.severity == GapSeverity.CRITICAL]
-        if critical_gaps:
-            recommendations.append(f"Immediately address {len(critical_gaps)} critical gaps")
-
-        # Focus on current state completion
-        recommendations.append(f"Complete remaining criteria for {current_state.name}")
-
-        # Prepare for next transition
-        if interventions:
-            recommendations.append(f"Initiate {interventions[0].name} intervention")
-
-        # Consider constraints
-        if context.key_constraints:
-            recommendations.append(f"Develop mitigation plan for: {context.key_constraints[0]}")
+    ) -> str:
+        """Summarize schedule risk."""
+        outstanding = [entry for entry in schedule if entry.remaining > 0]
+        if not outstanding:
+            return "Low risk: every state is ready."
+
+        critical_share = len(critical_path) / len(outstanding)
+        if critical_share > 0.6:
+            level = "High"
+            detail = "most outstanding states are on the critical path, so any slip delays the plan"
+        elif critical_share > 0.3:
+            level = "Moderate"
+            detail = "a sizeable share of outstanding states has no slack"
+        else:
+            level = "Low"
+            detail = "most outstanding states have slack to absorb delays"
 
-        return recommendations
+        assessment = (
+            f"{level} risk: {len(critical_path)} of {len(outstanding)} outstanding states "
+            f"are critical; {detail}."
+        )
+        if context.constraints:
+            assessment += f" Constraints to watch: {', '.join(context.constraints)}."
+        return assessment
 
-    async def _identify_risks(
+    @timed_phase
+    def _generate_insights(
         self,
-        states: list[ReadinessState],
-        transitions: list[StateTransition],
-        gaps: list[ReadinessGap],
+        graph: ReadinessGraph,
+        schedule: list[ScheduledState],
+        critical_path: list[str],
+        parallel_groups: list[list[str]],
         context: SequentialReadinessContext,
     ) -> list[str]:
-        """Identify key risks to progression."""
-        risks = []
-
-        # Gap-related risks
-        if len(gaps) > 5:
-            risks.append(f"High number of gaps ({len(gaps)}) may delay progression")
-
-        # Transition risks
-        for transition in transitions[:2]:  # Next 2 transitions
-            if transition.risks:
-                risks.extend(transition.risks[:2])
-
-        # Constraint risks
-        if context.key_constraints:
-            risks.append(f"Constraint risk: {context.key_constraints[0]}")
-
-        # Complexity risks
-        if context.complexity_level == ComplexityLevel.COMPLEX:
-            risks.append("High complexity increases failure probability")
-
-        return risks
+        """Generate insights from the schedule."""
+        insights = []
+        sequential = sum(entry.remaining for entry in schedule)
+        total = graph.total_duration
+        if sequential > total + _SLACK_EPSILON:
+            insights.append(
+                f"Working in parallel finishes in {total:.1f} weeks instead of "
+                f"{sequential:.1f} weeks one state at a time"
+            )
+        week, peak = graph.peak_parallelism()
+        if len(peak) > 1:
+            insights.append(f"Up to {len(peak)} states are in progress at once, from week {week:.1f}")
+        if critical_path:
+            insights.append(
+                f"The critical path runs {' -> '.join(critical_path[:6])}"
+                + (" -> ..." if len(critical_path) > 6 else "")
+            )
+        if len(parallel_groups) > 1:
+            insights.append(f"Outstanding work spans {len(parallel_groups)} dependency levels")
+        if context.domain_context:
+            insights.append(f"States follow the {context.domain_context} progression")
+        return insights
 
-    async def _create_monitoring_plan(
-        self, states: list[ReadinessState], current_idx: int, strategy: str
+    @timed_phase
+    def _identify_key_decisions(
+        self,
+        graph: ReadinessGraph,
+        critical_path: list[str],
+        parallel_groups: list[list[str]],
     ) -> list[str]:
+        """Identify decisions needed for progression."""
+        decisions = []
+        if critical_path:
+            decisions.append(f"Whether to add resources to critical state {critical_path[0]}")
+        if any(len(group) > 1 for group in parallel_groups):
+            decisions.append("How to staff states that can progress in parallel")
+        available = graph.available_states()
+        if available:
+            decisions.append(f"Which of {len(available)} available states to start first")
+        decisions.append("Readiness threshold required before each transition")
+        return decisions
+
+    @timed_phase
+    def _create_monitoring_plan(self, graph: ReadinessGraph, critical_path: list[str]) -> list[str]:
         """Create monitoring plan for progression."""
         plan = []
-
-        # Current state monitoring
-        current = states[current_idx]
-        plan.append(f"Weekly assessment of {current.name} success criteria")
-
-        # Transition readiness
-        if current_idx < len(states) - 1:
-            next_state = states[current_idx + 1]
-            plan.append(f"Bi-weekly readiness review for {next_state.name}")
-
-        # Gap closure tracking
-        plan.append("Track gap closure progress with metrics dashboard")
-
-        # Risk monitoring
-        plan.append("Monthly risk assessment and mitigation review")
-
-        # Stakeholder communication
+        if critical_path:
+            plan.append(f"Weekly readiness review of critical states, starting with {critical_path[0]}")
+        plan.append("Re-plan whenever a state's readiness changes to track critical path shifts")
+        plan.append("Track slack on non-critical states and escalate when it runs out")
         plan.append("Regular stakeholder updates on progression status")
-
         return plan
 
-    async def _generate_overall_recommendation(
+    @timed_phase
+    def _generate_overall_recommendation(
         self,
-        readiness: float,
-        gaps: list[ReadinessGap],
-        risks: list[str],
+        graph: ReadinessGraph,
+        schedule: list[ScheduledState],
+        critical_path: list[str],
         context: SequentialReadinessContext,
     ) -> str:
         """Generate overall recommendation."""
-        if readiness >= 80:
-            recommendation = (
-                "Strong readiness position. Proceed with confidence while "
-                "maintaining vigilance on identified risks. "
-            )
-        elif readiness >= 60:
-            recommendation = (
-                "Moderate readiness level. Focus on gap closure before aggressive progression. "
-            )
-        else:
-            recommendation = (
-                "Significant readiness gaps exist. Prioritize foundational "
-                "improvements before attempting progression. "
-            )
+        if not critical_path:
+            return "Every state is ready. Focus on sustaining readiness and capturing lessons learned."
 
-        # Add specific guidance
-        critical_gaps = [g for g in gaps if g.severity == GapSeverity.CRITICAL]
-        if critical_gaps:
+        available = graph.available_states()
+        recommendation = (
+            f"Expect {graph.total_duration:.1f} weeks to full readiness. "
+            f"Protect the critical path starting at {critical_path[0]}"
+        )
+        if len(available) > 1:
+            recommendation += " and progress the other available states alongside it"
+        recommendation += ". "
+        slack = [entry for entry in schedule if entry.remaining > 0 and entry.slack > _SLACK_EPSILON]
+        if slack:
             recommendation += (
-                f"Critical: Address {len(critical_gaps)} blocking issues immediately. "
+                f"Non-critical states ({len(slack)}) have slack and can be rescheduled "
+                "to level resources. "
             )
+        if context.constraints:
+            recommendation += "Revisit the plan if constraints tighten. "
+        return recommendation.strip()
 
-        if len(risks) > 3:
-            recommendation += "Implement comprehensive risk mitigation plan. "
-
-        recommendation += (
-            "Success requires systematic approach with regular checkpoints and adaptive strategies."
-        )
-
-        return recommendation
-
+    @timed_phase
     def _calculate_confidence(
         self,
-        states: list[ReadinessState],
-        gaps: list[ReadinessGap],
+        states: list[State],
+        gaps: list[GapAnalysis],
         context: SequentialReadinessContext,
     ) -> float:
         """Calculate confidence in the assessment."""
@@ -650,12 +698,15 @@ class SequentialReadinessAnalyzer(BaseCognitiveAnalyzer):
         if context.domain_context:
             confidence += 0.05
 
+        if context.current_status:
+            confidence += 0.05
+
         # Reduce for high complexity
-        if context.complexity_level == ComplexityLevel.COMPLEX:
+        if context.complexity_level in (ComplexityLevel.COMPLEX, ComplexityLevel.VERY_COMPLEX):
             confidence -= 0.1
 
-        # Reduce for many gaps
-        if len(gaps) > 10:
+        # Reduce for many large gaps
+        if sum(g.gap_size == "large" for g in gaps) > 5:
             confidence -= 0.1
 
         return max(0.5, min(0.95, confidence))
@@ -666,34 +717,6 @@ class SequentialReadinessAnalyzer(BaseCognitiveAnalyzer):
             ComplexityLevel.SIMPLE: "1-2 weeks",
             ComplexityLevel.MODERATE: "2-4 weeks",
             ComplexityLevel.COMPLEX: "4-8 weeks",
+            ComplexityLevel.VERY_COMPLEX: "6-12 weeks",
         }
         return durations.get(complexity, "2-4 weeks")
-
-    async def _generate_transition_requirements(
-        self, from_state: ReadinessState, to_state: ReadinessState
-    ) -> list[str]:
-        """Generate requirements for state transition."""
-        return [
-            f"Complete all {from_state.name} success criteria",
-            f"Prepare resources for {to_state.name}",
-            f"Stakeholder alignment on {to_state.name} objectives",
-            "Risk mitigation measures in place",
-        ]
-
-    async def _identify_transition_risks(
-        self,
-        from_state: ReadinessState,
-        to_state: ReadinessState,
-        context: SequentialReadinessContext,
-    ) -> list[str]:
-        """Identify risks in state transition."""
-        risks = [
-            f"Premature transition from {from_state.name}",
-            f"Resource availability for {to_state.name}",
-            "Change resistance from stakeholders",
-        ]
-
-        if context.complexity_level == ComplexityLevel.COMPLEX:
-            risks.append("Complex dependencies may cause delays")
-
-        return risks
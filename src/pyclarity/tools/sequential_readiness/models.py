@@ -9,7 +9,7 @@ domain with sequential dependencies.
 from enum import Enum
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from ..base import ComplexityLevel
 
@@ -257,6 +257,30 @@ class Intervention(BaseModel):
     priority: int = Field(description="Priority of the intervention (1-10)", ge=1, le=10)
 
 
+class StateSchedule(BaseModel):
+    """Critical-path schedule of a state's remaining work, in weeks from now."""
+    state_name: str = Field(description="Name of the state")
+    duration_weeks: float = Field(description="Weeks the state takes from a standing start", ge=0.0)
+    remaining_weeks: float = Field(description="Weeks of work left at the current readiness", ge=0.0)
+    earliest_start: float = Field(description="Earliest week the remaining work can start", ge=0.0)
+    earliest_finish: float = Field(description="Earliest week the state can be ready", ge=0.0)
+    latest_start: float = Field(description="Latest start that does not delay the plan")
+    latest_finish: float = Field(description="Latest finish that does not delay the plan")
+    slack_weeks: float = Field(description="Weeks the state can slip without delaying the plan", ge=0.0)
+    is_critical: bool = Field(description="Whether the state has no slack")
+    level: int = Field(description="Dependency depth; states on one level can progress in parallel", ge=0)
+
+
+class WhatIfOutcome(BaseModel):
+    """Plan after changing a single state's readiness."""
+    state_name: str = Field(description="State whose readiness was changed")
+    readiness_level: ReadinessLevel = Field(description="Readiness level assumed for the state")
+    total_duration_weeks: float = Field(description="Weeks until every state is ready", ge=0.0)
+    duration_change_weeks: float = Field(description="Change from the current plan (negative is faster)")
+    critical_path: list[str] = Field(description="Critical path under the change")
+    affected_states: list[str] = Field(description="States whose schedule moved")
+
+
 class SequentialReadinessContext(BaseModel):
     """Input for Sequential Readiness Framework analysis."""
 
@@ -299,6 +323,30 @@ class SequentialReadinessContext(BaseModel):
         description="Critical success factors for progression"
     )
 
+    complexity_level: ComplexityLevel = Field(
+        ComplexityLevel.MODERATE,
+        description="Complexity of the process; sets generic state counts and default durations"
+    )
+
+    state_transitions: list[StateTransition] | None = Field(
+        None,
+        description="Explicit transitions between states; non-parallel ones become prerequisites"
+    )
+
+    what_if: dict[str, ReadinessLevel] | None = Field(
+        None,
+        description="Readiness changes to evaluate one at a time against the current plan"
+    )
+
+    @model_validator(mode="after")
+    def validate_state_names(self) -> "SequentialReadinessContext":
+        """Validate that predefined state names are unique."""
+        if self.predefined_states:
+            names = [state.name for state in self.predefined_states]
+            if len(set(names)) != len(names):
+                raise ValueError("State names must be unique")
+        return self
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -360,6 +408,27 @@ class SequentialReadinessResult(BaseModel):
         description="Dependencies between states"
     )
 
+    schedule: list[StateSchedule] = Field(
+        default_factory=list,
+        description="Critical-path schedule of every state, in plan order"
+    )
+
+    parallel_groups: list[list[str]] = Field(
+        default_factory=list,
+        description="Outstanding states grouped by dependency level; each group can progress in parallel"
+    )
+
+    total_duration_weeks: float | None = Field(
+        None,
+        ge=0.0,
+        description="Weeks until every state is ready, working in parallel where possible"
+    )
+
+    what_if_outcomes: list[WhatIfOutcome] = Field(
+        default_factory=list,
+        description="Plan under each requested readiness change"
+    )
+
     risk_assessment: str = Field(
         description="Overall risk assessment for the progression"
     )
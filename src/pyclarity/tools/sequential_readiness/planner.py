@@ -0,0 +1,342 @@
+"""
+Readiness Graph Planner
+
+Represents readiness states as a DAG: each state has a duration and
+prerequisite states, and the schedule is the classic critical-path method
+over the work that remains. The forward (earliest start) and backward
+(longest remaining chain) passes are kept incrementally, so changing one
+state's readiness only revisits the descendants and ancestors whose times
+actually move.
+
+Dependency levels are antichains: no state in a level is a prerequisite of
+another, so each level can be worked on in parallel.
+"""
+
+import heapq
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+from .models import ReadinessLevel
+
+# Fraction of a state's duration still outstanding at each readiness level
+REMAINING_WORK = {
+    ReadinessLevel.NOT_STARTED: 1.0,
+    ReadinessLevel.INITIATED: 0.8,
+    ReadinessLevel.PROGRESSING: 0.5,
+    ReadinessLevel.NEARLY_READY: 0.2,
+    ReadinessLevel.READY: 0.0,
+    ReadinessLevel.EXCEEDED: 0.0,
+}
+
+# Weeks per duration unit
+DURATION_UNITS = {"day": 1 / 7, "week": 1.0, "month": 52 / 12, "year": 52.0}
+
+_DURATION_PATTERN = re.compile(
+    r"(\d+(?:\.\d+)?)(?:\s*(?:-|–|to)\s*(\d+(?:\.\d+)?))?\s*(day|week|month|year)s?",
+    re.IGNORECASE,
+)
+
+# Slack below this many weeks counts as critical
+_EPSILON = 1e-9
+
+
+def parse_duration(text: str | None) -> float | None:
+    """
+    Parse a duration such as '2-4 weeks' or '3 months' into weeks.
+
+    Ranges resolve to their midpoint. Returns None if no duration is found.
+    """
+    if not text:
+        return None
+    match = _DURATION_PATTERN.search(text)
+    if match is None:
+        return None
+    low = float(match.group(1))
+    high = float(match.group(2)) if match.group(2) else low
+    return (low + high) / 2 * DURATION_UNITS[match.group(3).lower()]
+
+
+@dataclass(frozen=True)
+class ScheduledState:
+    """A state's position in the remaining-work schedule, in weeks from now."""
+
+    name: str
+    duration: float
+    remaining: float
+    earliest_start: float
+    earliest_finish: float
+    latest_start: float
+    latest_finish: float
+    slack: float
+    level: int
+
+
+@dataclass(frozen=True)
+class PlanChange:
+    """Effect of changing one state's readiness."""
+
+    state: str
+    readiness: ReadinessLevel
+    previous_duration: float  # Weeks of remaining work before the change
+    total_duration: float     # Weeks of remaining work after it
+    critical_path: list[str]
+    affected_states: list[str]  # States whose earliest start or remaining chain moved
+
+
+class ReadinessGraph:
+    """
+    Readiness states and their prerequisites, with an incremental schedule.
+
+    Args:
+        durations: Weeks each state takes from a standing start
+        edges: (prerequisite, dependent) state name pairs
+        readiness: Current readiness per state (default: not started)
+
+    Raises:
+        ValueError: If an edge names an unknown state or the prerequisites form a cycle
+    """
+
+    def __init__(
+        self,
+        durations: Mapping[str, float],
+        edges: Iterable[tuple[str, str]],
+        readiness: Mapping[str, ReadinessLevel] | None = None,
+    ) -> None:
+        self.names = list(durations)
+        self._index = {name: i for i, name in enumerate(self.names)}
+        n = len(self.names)
+        self._duration = [float(durations[name]) for name in self.names]
+        self._preds: list[list[int]] = [[] for _ in range(n)]
+        self._succs: list[list[int]] = [[] for _ in range(n)]
+        for source, target in dict.fromkeys(edges):
+            s, t = self._lookup(source), self._lookup(target)
+            self._preds[t].append(s)
+            self._succs[s].append(t)
+
+        self._order = self._topological_order()
+        self._position = [0] * n
+        for position, i in enumerate(self._order):
+            self._position[i] = position
+        self._level = [0] * n
+        for i in self._order:
+            for s in self._succs[i]:
+                self._level[s] = max(self._level[s], self._level[i] + 1)
+        self._sinks = [i for i in range(n) if not self._succs[i]]
+
+        readiness = readiness or {}
+        self._readiness = [readiness.get(name, ReadinessLevel.NOT_STARTED) for name in self.names]
+        self._remaining = [
+            d * REMAINING_WORK[level] for d, level in zip(self._duration, self._readiness)
+        ]
+        self._start = [0.0] * n
+        self._tail = [0.0] * n
+        for i in self._order:
+            self._start[i] = self._earliest_start(i)
+        for i in reversed(self._order):
+            self._tail[i] = self._longest_tail(i)
+
+    def _lookup(self, name: str) -> int:
+        """Index of a state, raising ValueError for unknown names."""
+        try:
+            return self._index[name]
+        except KeyError:
+            raise ValueError(f"Unknown readiness state: {name}") from None
+
+    def _topological_order(self) -> list[int]:
+        """Kahn's algorithm, stable in insertion order."""
+        indegree = [len(p) for p in self._preds]
+        ready = [i for i, d in enumerate(indegree) if d == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            i = heapq.heappop(ready)
+            order.append(i)
+            for s in self._succs[i]:
+                indegree[s] -= 1
+                if indegree[s] == 0:
+                    heapq.heappush(ready, s)
+        if len(order) != len(self.names):
+            cycle = sorted(self.names[i] for i, d in enumerate(indegree) if d > 0)
+            raise ValueError(f"Readiness prerequisites form a cycle through: {', '.join(cycle)}")
+        return order
+
+    def _earliest_start(self, i: int) -> float:
+        return max((self._start[p] + self._remaining[p] for p in self._preds[i]), default=0.0)
+
+    def _longest_tail(self, i: int) -> float:
+        return self._remaining[i] + max((self._tail[s] for s in self._succs[i]), default=0.0)
+
+    @property
+    def total_duration(self) -> float:
+        """Weeks until every state is ready, working in parallel where possible."""
+        return max((self._start[i] + self._remaining[i] for i in self._sinks), default=0.0)
+
+    def readiness(self, name: str) -> ReadinessLevel:
+        """Current readiness of a state."""
+        return self._readiness[self._lookup(name)]
+
+    def prerequisites(self, name: str) -> list[str]:
+        """Direct prerequisite states of a state."""
+        return [self.names[p] for p in self._preds[self._lookup(name)]]
+
+    def set_readiness(self, name: str, level: ReadinessLevel) -> list[str]:
+        """
+        Change one state's readiness and update the schedule incrementally.
+
+        Earliest starts are re-propagated to descendants and remaining chains
+        to ancestors, each stopping wherever a value does not change.
+
+        Returns:
+            States whose earliest start or remaining chain moved, in plan order
+        """
+        i = self._lookup(name)
+        self._readiness[i] = level
+        remaining = self._duration[i] * REMAINING_WORK[level]
+        if remaining == self._remaining[i]:
+            return []
+        self._remaining[i] = remaining
+
+        changed = {i}
+        # Forward pass over descendants, in topological order
+        queue, queued = [self._position[s] for s in self._succs[i]], set(self._succs[i])
+        heapq.heapify(queue)
+        while queue:
+            n = self._order[heapq.heappop(queue)]
+            start = self._earliest_start(n)
+            if start == self._start[n]:
+                continue
+            self._start[n] = start
+            changed.add(n)
+            for s in self._succs[n]:
+                if s not in queued:
+                    queued.add(s)
+                    heapq.heappush(queue, self._position[s])
+
+        # Backward pass over ancestors, in reverse topological order
+        queue, queued = [-self._position[i]], {i}
+        while queue:
+            n = self._order[-heapq.heappop(queue)]
+            tail = self._longest_tail(n)
+            if tail == self._tail[n]:
+                continue
+            self._tail[n] = tail
+            changed.add(n)
+            for p in self._preds[n]:
+                if p not in queued:
+                    queued.add(p)
+                    heapq.heappush(queue, -self._position[p])
+
+        return [self.names[n] for n in sorted(changed, key=self._position.__getitem__)]
+
+    def what_if(self, name: str, level: ReadinessLevel) -> PlanChange:
+        """Evaluate a readiness change for one state, leaving the graph as it was."""
+        original = self.readiness(name)
+        previous = self.total_duration
+        affected = self.set_readiness(name, level)
+        try:
+            return PlanChange(
+                state=name,
+                readiness=level,
+                previous_duration=previous,
+                total_duration=self.total_duration,
+                critical_path=self.critical_path(),
+                affected_states=affected,
+            )
+        finally:
+            self.set_readiness(name, original)
+
+    def _slack(self, i: int, total: float) -> float:
+        return max(0.0, total - self._start[i] - self._tail[i])
+
+    def critical_path(self) -> list[str]:
+        """
+        The longest chain of remaining work, without states already ready.
+
+        Follows zero-slack states from the earliest-starting one, each step
+        taking the first successor that starts as its predecessor finishes.
+        """
+        total = self.total_duration
+        if total <= 0:
+            return []
+        current = next(
+            i for i in self._order
+            if not self._preds[i] and self._slack(i, total) <= _EPSILON
+        )
+        path = [current]
+        while True:
+            finish = self._start[current] + self._remaining[current]
+            following = [
+                s for s in self._succs[current]
+                if self._slack(s, total) <= _EPSILON and abs(self._start[s] - finish) <= _EPSILON
+            ]
+            if not following:
+                return [self.names[i] for i in path if self._remaining[i] > 0]
+            current = min(following, key=self._position.__getitem__)
+            path.append(current)
+
+    def levels(self, outstanding_only: bool = False) -> list[list[str]]:
+        """
+        States grouped by dependency depth.
+
+        Each level is an antichain, so its states can progress in parallel.
+
+        Args:
+            outstanding_only: Leave out states with no remaining work
+        """
+        grouped: dict[int, list[str]] = {}
+        for i in self._order:
+            if outstanding_only and self._remaining[i] <= 0:
+                continue
+            grouped.setdefault(self._level[i], []).append(self.names[i])
+        return [grouped[level] for level in sorted(grouped)]
+
+    def peak_parallelism(self) -> tuple[float, list[str]]:
+        """
+        Largest set of states in progress at once under the earliest schedule.
+
+        States whose work windows overlap cannot depend on each other, so
+        the set is an antichain. Returns its start week and state names.
+        """
+        events = []
+        for i in range(len(self.names)):
+            if self._remaining[i] > 0:
+                events.append((self._start[i], 1, i))
+                events.append((self._start[i] + self._remaining[i], 0, i))
+        events.sort()  # Finishes sort before starts at the same week
+
+        active: set[int] = set()
+        best: tuple[float, list[int]] = (0.0, [])
+        for week, starting, i in events:
+            if starting:
+                active.add(i)
+                if len(active) > len(best[1]):
+                    best = (week, sorted(active, key=self._position.__getitem__))
+            else:
+                active.discard(i)
+        return best[0], [self.names[i] for i in best[1]]
+
+    def available_states(self) -> list[str]:
+        """Outstanding states whose prerequisites are all ready."""
+        return [
+            self.names[i] for i in self._order
+            if self._remaining[i] > 0 and all(self._remaining[p] <= 0 for p in self._preds[i])
+        ]
+
+    def schedule(self) -> list[ScheduledState]:
+        """Every state's schedule, in plan order."""
+        total = self.total_duration
+        return [
+            ScheduledState(
+                name=self.names[i],
+                duration=self._duration[i],
+                remaining=self._remaining[i],
+                earliest_start=self._start[i],
+                earliest_finish=self._start[i] + self._remaining[i],
+                latest_start=total - self._tail[i],
+                latest_finish=total - self._tail[i] + self._remaining[i],
+                slack=self._slack(i, total),
+                level=self._level[i],
+            )
+            for i in self._order
+        ]
@@ -12,6 +12,8 @@ from .models import (
     SequentialThinkingContext,
     SequentialThinkingResult,
     ThoughtBranch,
+    ThoughtEvent,
+    ThoughtEventType,
     ThoughtRevision,
     ThoughtStep,
     ThoughtStepStatus,
@@ -24,10 +26,12 @@ __all__ = [
     "ThoughtStepType",
     "BranchStrategy",
     "ThoughtStepStatus",
+    "ThoughtEventType",
     # Models
     "ThoughtStep",
     "ThoughtRevision",
     "ThoughtBranch",
+    "ThoughtEvent",
     "SequentialThinkingContext",
     "SequentialThinkingResult",
     # Main class
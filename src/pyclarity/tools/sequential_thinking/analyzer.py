@@ -9,14 +9,18 @@ progression, branching capabilities, and revision tracking.
 import asyncio
 import random
 import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
+from pyclarity.tools.base import BaseCognitiveAnalyzer, timed_phase
 from pyclarity.tools.sequential_thinking.models import (
     BranchStrategy,
     SequentialThinkingContext,
     SequentialThinkingResult,
     ThoughtBranch,
+    ThoughtEvent,
+    ThoughtEventType,
     ThoughtRevision,
     ThoughtStep,
     ThoughtStepStatus,
@@ -35,6 +39,13 @@ MAX_BRANCH_STEPS = 5
 CONFIDENCE_VARIATION = 0.04
 MIN_CONFIDENCE_CHANGE = 0.05
 MAX_CONFIDENCE_CHANGE = 0.15
+ALTERNATIVE_STEP_TYPES = (
+    ThoughtStepType.HYPOTHESIS_FORMATION,
+    ThoughtStepType.EVIDENCE_GATHERING,
+    ThoughtStepType.LOGICAL_DEDUCTION,
+    ThoughtStepType.VALIDATION,
+    ThoughtStepType.CONCLUSION,
+)
 
 
 @dataclass
@@ -49,13 +60,16 @@ class OutputData:
     recommendations: list[str]
 
 
-class SequentialThinkingAnalyzer:
+class SequentialThinkingAnalyzer(BaseCognitiveAnalyzer):
     """Sequential thinking cognitive tool analyzer."""
 
     def __init__(self):
         """Initialize the sequential thinking analyzer."""
-        self.tool_name = "Sequential Thinking"
-        self.version = "2.0.0"
+        super().__init__(
+            tool_name="Sequential Thinking",
+            tool_description="Breaks problems into revisable, branching reasoning steps",
+            version="2.0.0"
+        )
 
         # Internal state for processing
         self._current_step_number = 1
@@ -73,24 +87,75 @@ class SequentialThinkingAnalyzer:
         -------
             SequentialThinkingResult with complete reasoning chain and analysis
         """
-        self._processing_start_time = time.time()
+        async for event in self.analyze_stream(context):
+            if event.event_type == ThoughtEventType.RESULT:
+                return event.result
+
+        raise RuntimeError("Sequential thinking stream ended without a result")
+
+    async def analyze_stream(
+        self, context: SequentialThinkingContext
+    ) -> AsyncIterator[ThoughtEvent]:
+        """
+        Analyze a problem, yielding each step, branch and revision as it is produced.
+
+        Steps are generated lazily, so the first event is available as soon as
+        the first step exists and consumers may stop iterating to cancel the
+        remaining work. The final event carries the complete result.
+
+        Args:
+            context: Sequential thinking context with problem and parameters
+
+        Yields
+        ------
+            ThoughtEvent for each step, branch and revision, then the result
+        """
+        processing_start_time = time.time()
+        self._processing_start_time = processing_start_time
+        rng = self.request_rng(context)
+        sequence = 0
+
+        def event(event_type: ThoughtEventType, summary: str, **payload) -> ThoughtEvent:
+            nonlocal sequence
+            sequence += 1
+            return ThoughtEvent(
+                event_type=event_type, sequence=sequence - 1, summary=summary, **payload
+            )
 
         # Initialize processing state
         self._current_step_number = 1
         self._completed_step_ids = set()
 
         # Generate main reasoning chain
-        reasoning_chain = await self._generate_reasoning_chain(context)
+        reasoning_chain: list[ThoughtStep] = []
+        async for step in self._iter_reasoning_chain(context, reasoning_chain, rng):
+            yield event(
+                ThoughtEventType.STEP,
+                f"Step {step.step_number} ({step.step_type.value})",
+                step=step,
+            )
 
         # Explore branches if enabled
         branches_explored = []
         if context.enable_branching:
-            branches_explored = await self._handle_branching(context, reasoning_chain)
+            async for branch in self._iter_branches(context, reasoning_chain, rng):
+                branches_explored.append(branch)
+                yield event(
+                    ThoughtEventType.BRANCH,
+                    f"Branch '{branch.branch_name}' ({len(branch.steps)} steps)",
+                    branch=branch,
+                )
 
         # Apply revisions if enabled
         revisions_made = []
         if context.allow_revisions:
-            revisions_made = await self._apply_revisions(reasoning_chain, context)
+            async for revision in self._iter_revisions(reasoning_chain, context, rng):
+                revisions_made.append(revision)
+                yield event(
+                    ThoughtEventType.REVISION,
+                    f"Revision: {revision.revision_reason}",
+                    revision=revision,
+                )
 
         # Merge branches if using convergent strategy
         if branches_explored and context.branch_strategy == BranchStrategy.CONVERGENT_SYNTHESIS:
@@ -117,17 +182,17 @@ class SequentialThinkingAnalyzer:
         )
 
         # Set processing time
-        result.processing_time_ms = round((time.time() - self._processing_start_time) * 1000)
+        result.processing_time_ms = round((time.time() - processing_start_time) * 1000)
 
-        return result
-
-    async def _generate_reasoning_chain(
-        self, context: SequentialThinkingContext
-    ) -> list[ThoughtStep]:
-        """Generate the main reasoning chain."""
-        reasoning_chain = []
-        current_step_types = set()
+        yield event(ThoughtEventType.RESULT, "Analysis complete", result=result)
 
+    async def _iter_reasoning_chain(
+        self,
+        context: SequentialThinkingContext,
+        reasoning_chain: list[ThoughtStep],
+        rng: random.Random,
+    ) -> AsyncIterator[ThoughtStep]:
+        """Generate the main reasoning chain lazily, appending and yielding each step."""
         for step_num in range(1, context.reasoning_depth + 1):
             # Determine next step type
             if context.step_types_priority and step_num <= len(context.step_types_priority):
@@ -137,28 +202,28 @@ class SequentialThinkingAnalyzer:
 
             # Generate step content
             step = await self._generate_reasoning_step(
-                step_num, step_type, context, reasoning_chain
+                step_num, step_type, context, reasoning_chain, rng
             )
 
             reasoning_chain.append(step)
-            current_step_types.add(step_type)
             self._completed_step_ids.add(step.step_id)
+            yield step
 
             # Break early if we reach a conclusion
             if step_type == ThoughtStepType.CONCLUSION:
                 break
 
-            # Small delay to simulate processing
-            await asyncio.sleep(0.05)
-
         # Ensure final step is a conclusion
         if reasoning_chain and reasoning_chain[-1].step_type != ThoughtStepType.CONCLUSION:
             conclusion_step = await self._generate_reasoning_step(
-                len(reasoning_chain) + 1, ThoughtStepType.CONCLUSION, context, reasoning_chain
+                len(reasoning_chain) + 1,
+                ThoughtStepType.CONCLUSION,
+                context,
+                reasoning_chain,
+                rng,
             )
             reasoning_chain.append(conclusion_step)
-
-        return reasoning_chain
+            yield conclusion_step
 
     async def _generate_reasoning_step(
         self,
@@ -166,6 +231,7 @@ class SequentialThinkingAnalyzer:
         step_type: ThoughtStepType,
         context: SequentialThinkingContext,
         preceding_steps: list[ThoughtStep],
+        rng: random.Random,
     ) -> ThoughtStep:
         """Generate a single reasoning step."""
         # Generate dependencies based on step type and preceding steps
@@ -181,20 +247,18 @@ class SequentialThinkingAnalyzer:
             ):
                 dependencies.append(preceding_steps[-2].step_id)
 
-        # Generate step content based on type
-        content = await self._generate_step_content(step_type, context, preceding_steps)
-
-        # Calculate confidence based on step type and context
-        confidence = await self._calculate_step_confidence(step_type, preceding_steps, context)
-
-        # Generate supporting evidence
-        evidence = await self._generate_supporting_evidence(step_type, context, preceding_steps)
-
-        # Identify assumptions
-        assumptions = await self._identify_step_assumptions(step_type, content, context)
+        # Content, confidence and evidence are independent of each other
+        content, confidence, evidence = await asyncio.gather(
+            self._generate_step_content(step_type, context, preceding_steps),
+            self._calculate_step_confidence(step_type, preceding_steps, context, rng),
+            self._generate_supporting_evidence(step_type, context, preceding_steps),
+        )
 
-        # Identify potential errors
-        potential_errors = await self._identify_potential_errors(step_type, content, context)
+        # Assumptions and potential errors are both derived from the content
+        assumptions, potential_errors = await asyncio.gather(
+            self._identify_step_assumptions(step_type, content, context),
+            self._identify_potential_errors(step_type, content, context),
+        )
 
         return ThoughtStep(
             step_number=step_number,
@@ -355,6 +419,7 @@ class SequentialThinkingAnalyzer:
         step_type: ThoughtStepType,
         preceding_steps: list[ThoughtStep],
         context: SequentialThinkingContext,
+        rng: random.Random,
     ) -> float:
         """Calculate confidence score for a reasoning step."""
         # Base confidence varies by step type
@@ -383,8 +448,8 @@ class SequentialThinkingAnalyzer:
         else:
             confidence_momentum = 0.0
 
-        # Add small random variation for realism (not for cryptographic purposes)
-        random_variation = (random.random() - 0.5) * CONFIDENCE_VARIATION
+        # Add small random variation for realism
+        random_variation = (rng.random() - 0.5) * CONFIDENCE_VARIATION
 
         final_confidence = base_confidence + evidence_bonus + confidence_momentum + random_variation
         return max(0.0, min(1.0, final_confidence))
@@ -481,77 +546,88 @@ class SequentialThinkingAnalyzer:
 
         return potential_errors.get(step_type, ["Standard analytical limitations apply"])[:2]
 
-    async def _handle_branching(
-        self, context: SequentialThinkingContext, main_chain: list[ThoughtStep]
-    ) -> list[ThoughtBranch]:
-        """Handle reasoning branch exploration."""
-        if not context.enable_branching or context.max_branches <= 1:
-            return []
+    async def _iter_branches(
+        self,
+        context: SequentialThinkingContext,
+        main_chain: list[ThoughtStep],
+        rng: random.Random,
+    ) -> AsyncIterator[ThoughtBranch]:
+        """
+        Explore alternative branches as a concurrent beam search.
 
-        branches_explored = []
+        Every candidate branch is extended by one step per round, all branches
+        concurrently. After each round only the ``beam_width`` branches with
+        the highest running confidence are kept, so wall time grows with
+        branch length rather than with ``max_branches``. Branches are yielded
+        as they complete.
+        """
+        if not context.enable_branching or context.max_branches <= 1:
+            return
 
-        # Identify branch points (usually after hypothesis formation or evidence gathering)
-        branch_points = [
-            step
-            for step in main_chain
-            if step.step_type
+        # Branch from hypothesis formation or evidence gathering steps
+        if not any(
+            step.step_type
             in [ThoughtStepType.HYPOTHESIS_FORMATION, ThoughtStepType.EVIDENCE_GATHERING]
-        ]
-
-        if not branch_points:
-            return []
-
-        # Create alternative branches
-        num_branches = min(context.max_branches, len(branch_points) + 1)
-
-        for i in range(num_branches):
-            branch = await self._create_alternative_branch(
-                f"alternative_hypothesis_{i + 1}", main_chain, context
+            for step in main_chain
+        ):
+            return
+
+        # Each branch draws from its own generator so concurrent expansion stays reproducible
+        beam = []
+        for i in range(context.max_branches):
+            branch_rng = random.Random(rng.getrandbits(64))  # noqa: S311
+            branch = ThoughtBranch(
+                branch_name=f"Alternative Hypothesis {i + 1}",
+                branch_description=f"Alternative reasoning path exploring different hypothesis about {context.problem[:50]}...",
+                parent_step_id=main_chain[0].step_id if main_chain else None,
+            )
+            target_length = branch_rng.randint(MIN_BRANCH_STEPS, MAX_BRANCH_STEPS)
+            beam.append((branch, branch_rng, target_length))
+
+        capacity = context.beam_width
+        while beam and capacity > 0:
+            await asyncio.gather(
+                *(
+                    self._extend_branch(branch, branch_rng, context)
+                    for branch, branch_rng, _ in beam
+                )
             )
-            branches_explored.append(branch)
-
-        return branches_explored
-
-    async def _create_alternative_branch(
-        self, branch_name: str, main_chain: list[ThoughtStep], context: SequentialThinkingContext
-    ) -> ThoughtBranch:
-        """Create an alternative reasoning branch."""
-        branch = ThoughtBranch(
-            branch_name=branch_name.replace("_", " ").title(),
-            branch_description=f"Alternative reasoning path exploring different hypothesis about {context.problem[:50]}...",
-            parent_step_id=main_chain[0].step_id if main_chain else None,
-        )
-
-        # Generate 3-5 alternative steps (not for cryptographic purposes)
-        num_steps = random.randint(MIN_BRANCH_STEPS, MAX_BRANCH_STEPS)  # noqa: S311
-        alternative_step_types = [
-            ThoughtStepType.HYPOTHESIS_FORMATION,
-            ThoughtStepType.EVIDENCE_GATHERING,
-            ThoughtStepType.LOGICAL_DEDUCTION,
-            ThoughtStepType.VALIDATION,
-            ThoughtStepType.CONCLUSION,
-        ]
-
-        for i, step_type in enumerate(alternative_step_types[:num_steps]):
-            step = await self._generate_reasoning_step(i + 1, step_type, context, branch.steps)
-            step.branch_id = branch.branch_id
-            # Slightly lower confidence for alternative branches
-            step.confidence_score *= 0.9
-            branch.steps.append(step)
 
-        # Calculate branch confidence
+            # Prune to the most confident branches that still fit in the beam
+            beam.sort(key=lambda candidate: candidate[0].branch_confidence, reverse=True)
+            for branch, _, _ in beam[capacity:]:
+                branch.is_active = False
+            beam = beam[:capacity]
+
+            completed = [candidate for candidate in beam if len(candidate[0].steps) >= candidate[2]]
+            for candidate in completed:
+                beam.remove(candidate)
+                capacity -= 1
+                yield candidate[0]
+
+    async def _extend_branch(
+        self, branch: ThoughtBranch, rng: random.Random, context: SequentialThinkingContext
+    ) -> None:
+        """Add the next alternative step to a branch and refresh its confidence."""
+        step_type = ALTERNATIVE_STEP_TYPES[len(branch.steps)]
+        step = await self._generate_reasoning_step(
+            len(branch.steps) + 1, step_type, context, branch.steps, rng
+        )
+        step.branch_id = branch.branch_id
+        # Slightly lower confidence for alternative branches
+        step.confidence_score *= 0.9
+        branch.steps.append(step)
         branch.calculate_branch_confidence()
 
-        return branch
-
-    async def _apply_revisions(
-        self, reasoning_chain: list[ThoughtStep], context: SequentialThinkingContext
-    ) -> list[ThoughtRevision]:
-        """Apply revisions to reasoning steps."""
+    async def _iter_revisions(
+        self,
+        reasoning_chain: list[ThoughtStep],
+        context: SequentialThinkingContext,
+        rng: random.Random,
+    ) -> AsyncIterator[ThoughtRevision]:
+        """Apply revisions lazily, yielding each once applied to its step."""
         if not context.allow_revisions:
-            return []
-
-        revisions_made = []
+            return
 
         # Identify steps that might benefit from revision (lower confidence steps)
         candidates_for_revision = [
@@ -565,8 +641,7 @@ class SequentialThinkingAnalyzer:
         max_revisions = min(2, len(candidates_for_revision))
 
         for step in candidates_for_revision[:max_revisions]:
-            revision = await self._create_revision(step, context)
-            revisions_made.append(revision)
+            revision = await self._create_revision(step, context, rng)
 
             # Apply revision to the step
             step.content = revision.revised_content
@@ -575,10 +650,10 @@ class SequentialThinkingAnalyzer:
             step.revision_notes = revision.revision_reason
             step.updated_at = datetime.now(UTC)
 
-        return revisions_made
+            yield revision
 
     async def _create_revision(
-        self, step: ThoughtStep, context: SequentialThinkingContext
+        self, step: ThoughtStep, context: SequentialThinkingContext, rng: random.Random
     ) -> ThoughtRevision:
         """Create a revision for a reasoning step."""
         # Generate improved content
@@ -589,9 +664,10 @@ class SequentialThinkingAnalyzer:
             original_content=step.content,
             revised_content=improved_content,
             revision_reason="Enhanced analysis with additional perspectives and evidence",
-            confidence_change=random.uniform(MIN_CONFIDENCE_CHANGE, MAX_CONFIDENCE_CHANGE),  # noqa: S311
+            confidence_change=rng.uniform(MIN_CONFIDENCE_CHANGE, MAX_CONFIDENCE_CHANGE),
         )
 
+    @timed_phase
     async def _merge_branches(
         self,
         main_chain: list[ThoughtStep],
@@ -618,6 +694,7 @@ class SequentialThinkingAnalyzer:
 
         return main_chain
 
+    @timed_phase
     async def _calculate_final_confidence(
         self, reasoning_chain: list[ThoughtStep], branches: list[ThoughtBranch]
     ) -> float:
@@ -651,6 +728,7 @@ class SequentialThinkingAnalyzer:
         final_confidence = main_chain_confidence + branch_bonus + revision_bonus + diversity_bonus
         return min(1.0, max(0.0, final_confidence))
 
+    @timed_phase
     def _calculate_reasoning_quality(
         self,
         steps: list[ThoughtStep],
@@ -802,6 +880,7 @@ class SequentialThinkingAnalyzer:
             recommendations=recommendations,
         )
 
+    @timed_phase
     async def _generate_output(
         self,
         context: SequentialThinkingContext,
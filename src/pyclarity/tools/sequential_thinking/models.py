@@ -7,7 +7,7 @@ branches, revisions, and reasoning chains.
 
 import uuid
 from datetime import datetime
-from enum import Enum
+from enum import Enum, StrEnum
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -85,6 +85,15 @@ class ThoughtStepStatus(str, Enum):
     MERGED = "merged"
 
 
+class ThoughtEventType(StrEnum):
+    """Kinds of events emitted while streaming a sequential analysis"""
+
+    STEP = "step"
+    BRANCH = "branch"
+    REVISION = "revision"
+    RESULT = "result"
+
+
 class ThoughtStep(BaseModel):
     """Individual step in sequential reasoning chain"""
 
@@ -300,7 +309,14 @@ class SequentialThinkingContext(BaseModel):
     )
 
     max_branches: int = Field(
-        3, ge=1, le=5, description="Maximum number of simultaneous branches to explore"
+        3, ge=1, le=50, description="Maximum number of candidate branches to explore"
+    )
+
+    beam_width: int = Field(
+        3,
+        ge=1,
+        le=5,
+        description="Number of highest-confidence branches kept after each expansion step",
     )
 
     convergence_threshold: float = Field(
@@ -325,6 +341,10 @@ class SequentialThinkingContext(BaseModel):
         default_factory=list, description="Criteria for validating reasoning steps", max_length=6
     )
 
+    random_seed: int | None = Field(
+        None, description="Seed for reproducible analysis; derived from the input when omitted"
+    )
+
     @field_validator("problem")
     @classmethod
     def validate_problem(cls, v):
@@ -515,3 +535,27 @@ class SequentialThinkingResult(BaseModel):
 
         # Sort by timestamp
         return sorted(events, key=lambda x: x["timestamp"])
+
+
+class ThoughtEvent(BaseModel):
+    """Incremental output from a streamed sequential thinking analysis"""
+
+    event_type: ThoughtEventType = Field(..., description="Kind of event")
+
+    sequence: int = Field(..., ge=0, description="Position of this event in the stream")
+
+    summary: str = Field(..., description="Short human-readable description of the event")
+
+    step: ThoughtStep | None = Field(None, description="Reasoning step produced (step events)")
+
+    branch: ThoughtBranch | None = Field(
+        None, description="Alternative branch explored (branch events)"
+    )
+
+    revision: ThoughtRevision | None = Field(
+        None, description="Revision applied to an earlier step (revision events)"
+    )
+
+    result: SequentialThinkingResult | None = Field(
+        None, description="Complete analysis result (final result event)"
+    )
@@ -0,0 +1,197 @@
+"""
+Text Similarity Utilities
+
+Lightweight vectorized text similarity shared by the perspective-based tools.
+
+Texts are hashed into fixed-width TF-IDF vectors over word unigrams and
+bigrams, built with NumPy scatter-adds from (row, bucket) index arrays, so
+comparing P texts costs one (P x d) @ (d x P) product instead of repeated
+pairwise string scans.
+"""
+
+import re
+import unicodedata
+import zlib
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
+
+DEFAULT_N_FEATURES = 1024
+DEFAULT_GROUPING_THRESHOLD = 0.5
+DEFAULT_MATCH_THRESHOLD = 0.85
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=65536)
+def _bucket(feature: str, n_features: int) -> int:
+    """Map a feature to a stable hash bucket (independent of PYTHONHASHSEED)."""
+    return zlib.crc32(feature.encode("utf-8")) % n_features
+
+
+def normalize_text(text: str) -> str:
+    """Compatibility-normalized, case-folded text, so equivalent spellings compare equal."""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into case-folded word tokens, in any script."""
+    return _TOKEN_PATTERN.findall(normalize_text(text))
+
+
+class HashedTfidfVectorizer:
+    """
+    Stateless hashed TF-IDF vectorizer.
+
+    IDF weights are computed over the batch being transformed, so related
+    texts should be vectorized together. Rows are L2-normalized, making the
+    dot product of two rows their cosine similarity.
+    """
+
+    def __init__(
+        self,
+        n_features: int = DEFAULT_N_FEATURES,
+        ngram_range: tuple[int, int] = (1, 2),
+        use_idf: bool = True,
+    ) -> None:
+        if n_features < 1:
+            raise ValueError("n_features must be at least 1")
+        if not 1 <= ngram_range[0] <= ngram_range[1]:
+            raise ValueError("ngram_range must satisfy 1 <= min_n <= max_n")
+        self.n_features = n_features
+        self.ngram_range = ngram_range
+        self.use_idf = use_idf
+
+    def _feature_buckets(self, text: str) -> list[int]:
+        tokens = tokenize(text)
+        min_n, max_n = self.ngram_range
+        buckets = []
+        for n in range(min_n, max_n + 1):
+            for start in range(len(tokens) - n + 1):
+                feature = " ".join(tokens[start:start + n])
+                buckets.append(_bucket(feature, self.n_features))
+        return buckets
+
+    def transform(self, texts: Sequence[str]) -> np.ndarray:
+        """Vectorize texts into an L2-normalized (len(texts), n_features) array."""
+        rows: list[int] = []
+        cols: list[int] = []
+        for row, text in enumerate(texts):
+            buckets = self._feature_buckets(text)
+            rows.extend([row] * len(buckets))
+            cols.extend(buckets)
+
+        matrix = np.zeros((len(texts), self.n_features), dtype=np.float64)
+        if not rows:
+            return matrix
+        np.add.at(matrix, (np.asarray(rows), np.asarray(cols)), 1.0)
+
+        if self.use_idf:
+            document_frequency = np.count_nonzero(matrix, axis=0)
+            idf = np.log((1.0 + len(texts)) / (1.0 + document_frequency)) + 1.0
+            matrix *= idf
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+
+def cosine_similarity_matrix(
+    vectors_a: np.ndarray,
+    vectors_b: np.ndarray | None = None,
+) -> np.ndarray:
+    """Cosine similarity between rows of L2-normalized vector arrays."""
+    if vectors_b is None:
+        vectors_b = vectors_a
+    return vectors_a @ vectors_b.T
+
+
+def cluster_texts(
+    texts: Sequence[str],
+    threshold: float = DEFAULT_GROUPING_THRESHOLD,
+    vectorizer: HashedTfidfVectorizer | None = None,
+) -> list[list[int]]:
+    """
+    Group texts by similarity with single-pass leader clustering.
+
+    Each text joins the cluster whose centroid is most similar to it if that
+    similarity reaches ``threshold``; otherwise it starts a new cluster.
+    Cost is O(P * k * d) for P texts and k clusters.
+
+    Returns:
+        Clusters as lists of text indices, ordered by first member
+    """
+    if not texts:
+        return []
+
+    vectors = (vectorizer or HashedTfidfVectorizer()).transform(texts)
+    clusters: list[list[int]] = []
+    sums = np.zeros_like(vectors)
+    centroids = np.zeros_like(vectors)
+
+    for index, vector in enumerate(vectors):
+        if clusters:
+            similarities = centroids[:len(clusters)] @ vector
+            best = int(np.argmax(similarities))
+            if similarities[best] >= threshold:
+                clusters[best].append(index)
+                sums[best] += vector
+                norm = np.linalg.norm(sums[best])
+                centroids[best] = sums[best] / norm if norm > 0 else sums[best]
+                continue
+
+        slot = len(clusters)
+        clusters.append([index])
+        sums[slot] = vector
+        centroids[slot] = vector
+
+    return clusters
+
+
+def shared_elements(
+    groups: Sequence[Sequence[str]],
+    threshold: float = DEFAULT_MATCH_THRESHOLD,
+    vectorizer: HashedTfidfVectorizer | None = None,
+) -> list[str]:
+    """
+    Find elements of the first group with a similar element in every other group.
+
+    Elements found verbatim (up to case and Unicode normalization) in every
+    group always match. The rest are vectorized once; the first group's
+    rows are compared against every element in one matrix product, and the
+    best match per group is taken with a segmented max.
+
+    Returns:
+        Distinct matching elements of the first group, in their original order
+    """
+    if not groups or not groups[0]:
+        return []
+    distinct: dict[str, str] = {}
+    for element in groups[0]:
+        distinct.setdefault(normalize_text(element).strip(), element)
+    keys, first = list(distinct), list(distinct.values())
+    if len(groups) == 1:
+        return first
+    if any(not group for group in groups[1:]):
+        return []
+
+    exact = set(keys).intersection(*({normalize_text(e).strip() for e in group} for group in groups[1:]))
+    if len(exact) == len(keys):
+        return first
+
+    elements = first + [element for group in groups[1:] for element in group]
+    vectors = (vectorizer or HashedTfidfVectorizer()).transform(elements)
+
+    first_count = len(first)
+
+    similarities = cosine_similarity_matrix(vectors[:first_count], vectors[first_count:])
+    offsets = np.cumsum([0] + [len(group) for group in groups[1:-1]])
+    best_per_group = np.maximum.reduceat(similarities, offsets, axis=1)
+    matched = np.all(best_per_group >= threshold - 1e-9, axis=1)
+
+    return [
+        element
+        for element, key, similar in zip(first, keys, matched, strict=True)
+        if similar or key in exact
+    ]
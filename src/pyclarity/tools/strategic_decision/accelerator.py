@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from ..base import request_seed
 from .acceleration_engine import AccelerationEngine
 from .models import (
     AccelerationAnalysis,
@@ -469,11 +470,11 @@ class ScenarioModeler:
     async def _run_monte_carlo(self, context: DecisionContext) -> MonteCarloResults:
         """Run Monte Carlo simulation."""
         # Simulate outcome distribution
-        np.random.seed(42)  # For reproducible results
+        rng = np.random.default_rng(request_seed(context))  # Reproducible per decision
         simulations = 10000
 
         # Generate random outcomes based on normal distribution
-        outcomes = np.random.normal(7.8, 1.2, simulations)
+        outcomes = rng.normal(7.8, 1.2, simulations)
         outcomes = np.clip(outcomes, 0, 10)  # Clip to valid range
 
         mean_outcome = np.mean(outcomes)
@@ -9,8 +9,12 @@ import asyncio
 import re
 import time
 from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from ..base import BaseCognitiveAnalyzer, timed_phase
+from ..catalogs import CatalogView, load_catalog
 from .models import (
     ArgumentAnalysis,
     ArgumentStructure,
@@ -28,8 +32,16 @@ from .models import (
     StructuredArgumentationResult,
 )
 
+FALLACY_CATALOG_PATH = Path(__file__).with_name("fallacies.json")
 
-class StructuredArgumentationAnalyzer:
+
+@lru_cache(maxsize=1)
+def fallacy_pattern_catalog() -> CatalogView[LogicalFallacy, dict[str, Any]]:
+    """Fallacy detection patterns, shared by every analyzer in the process."""
+    return CatalogView(load_catalog(FALLACY_CATALOG_PATH), LogicalFallacy, dict)
+
+
+class StructuredArgumentationAnalyzer(BaseCognitiveAnalyzer):
     """
     Structured Argumentation Analyzer for logic analysis and construction.
 
@@ -41,56 +53,33 @@ class StructuredArgumentationAnalyzer:
     - Counterargument analysis
     """
 
+    # The argument structure and quality analysis are always computed; the
+    # remaining result sections run only when requested
+    phase_dependencies = {
+        "counterargument_analysis": (),
+        "debate_structure": (),
+        "logic_quality_scores": ("counterargument_analysis",),
+        "improvement_roadmap": ("counterargument_analysis",),
+        "logical_consistency_report": (),
+        "evidence_assessment": (),
+        "recommended_strengthening": ("counterargument_analysis",),
+        "fallacy_summary": (),
+    }
+
     def __init__(self):
         """Initialize the Structured Argumentation Analyzer"""
+        super().__init__(
+            tool_name="Structured Argumentation",
+            tool_description="Analyzes argument structure, logic chains and fallacies",
+            version="1.0.0"
+        )
         self._initialize_fallacy_patterns()
         self._initialize_argument_templates()
         self._initialize_evidence_patterns()
 
     def _initialize_fallacy_patterns(self):
         """Initialize patterns for detecting logical fallacies"""
-        self.fallacy_patterns = {
-            LogicalFallacy.AD_HOMINEM: {
-                "keywords": ["you're wrong because you", "can't trust them because", "coming from someone who", "you people"],
-                "pattern": r"(?:you|they|he|she).{0,30}(?:wrong|can't trust|bad|stupid|evil)",
-                "severity": "high"
-            },
-            LogicalFallacy.STRAW_MAN: {
-                "keywords": ["so you're saying", "your position is that", "you want to", "you believe"],
-                "pattern": r"so you(?:'re| are) saying.{10,100}",
-                "severity": "high"
-            },
-            LogicalFallacy.FALSE_DICHOTOMY: {
-                "keywords": ["either...or", "only two options", "you must choose", "it's either"],
-                "pattern": r"(?:either|only).{0,50}(?:or|two|choice)",
-                "severity": "medium"
-            },
-            LogicalFallacy.SLIPPERY_SLOPE: {
-                "keywords": ["if we allow this", "this will lead to", "slippery slope", "next thing you know"],
-                "pattern": r"if.{0,20}(?:then|will lead|result in).{20,100}",
-                "severity": "medium"
-            },
-            LogicalFallacy.CIRCULAR_REASONING: {
-                "keywords": ["because it is", "by definition", "obviously", "it's true because"],
-                "pattern": r"(?:because|since|as).{10,50}(?:it is|obviously|by definition)",
-                "severity": "high"
-            },
-            LogicalFallacy.APPEAL_TO_AUTHORITY: {
-                "keywords": ["expert says", "according to", "famous person", "studies show"],
-                "pattern": r"(?:expert|authority|famous).{0,30}says?",
-                "severity": "medium"
-            },
-            LogicalFallacy.APPEAL_TO_EMOTION: {
-                "keywords": ["think of the children", "imagine if", "how would you feel", "heartbreaking"],
-                "pattern": r"(?:think|imagine|feel|heart).{0,30}(?:children|family|tragic|sad)",
-                "severity": "medium"
-            },
-            LogicalFallacy.HASTY_GENERALIZATION: {
-                "keywords": ["all", "every", "always", "never", "everyone"],
-                "pattern": r"(?:all|every|always|never|everyone).{10,100}",
-                "severity": "medium"
-            }
-        }
+        self.fallacy_patterns = fallacy_pattern_catalog()
 
     def _initialize_argument_templates(self):
         """Initialize templates for different argument types"""
@@ -165,44 +154,54 @@ class StructuredArgumentationAnalyzer:
             context.include_evidence_evaluation
         )
 
+        sections: dict[str, Any] = {}
+
         # Phase 3: Generate counterarguments if requested
         counterargument_analysis = None
-        if context.include_counterargument_analysis:
+        if context.include_counterargument_analysis and self.needs_phase("counterargument_analysis"):
             counterargument_analysis = await self._analyze_counterarguments(
                 argument_structure, context.max_counterarguments
             )
+        sections["counterargument_analysis"] = counterargument_analysis
 
         # Phase 4: Detect debate structure if multiple positions
-        debate_structure = await self._analyze_debate_structure(
-            context.argument_text, argument_structure
-        )
+        if self.needs_phase("debate_structure"):
+            sections["debate_structure"] = await self._analyze_debate_structure(
+                context.argument_text, argument_structure
+            )
 
         # Phase 5: Calculate quality scores
-        logic_quality_scores = await self._calculate_logic_quality_scores(
-            argument_analysis, counterargument_analysis
-        )
+        if self.needs_phase("logic_quality_scores"):
+            sections["logic_quality_scores"] = await self._calculate_logic_quality_scores(
+                argument_analysis, counterargument_analysis
+            )
 
         # Phase 6: Generate improvement roadmap
-        improvement_roadmap = await self._generate_improvement_roadmap(
-            argument_analysis, counterargument_analysis
-        )
+        if self.needs_phase("improvement_roadmap"):
+            sections["improvement_roadmap"] = await self._generate_improvement_roadmap(
+                argument_analysis, counterargument_analysis
+            )
 
         # Phase 7: Generate reports and assessments
-        logical_consistency_report = await self._generate_consistency_report(
-            argument_structure, argument_analysis
-        )
+        if self.needs_phase("logical_consistency_report"):
+            sections["logical_consistency_report"] = await self._generate_consistency_report(
+                argument_structure, argument_analysis
+            )
 
-        evidence_assessment = await self._assess_evidence_quality(
-            argument_structure.supporting_evidence
-        )
+        if self.needs_phase("evidence_assessment"):
+            sections["evidence_assessment"] = await self._assess_evidence_quality(
+                argument_structure.supporting_evidence
+            )
 
-        recommended_strengthening = await self._recommend_strengthening(
-            argument_analysis, counterargument_analysis
-        )
+        if self.needs_phase("recommended_strengthening"):
+            sections["recommended_strengthening"] = await self._recommend_strengthening(
+                argument_analysis, counterargument_analysis
+            )
 
-        fallacy_summary = await self._summarize_fallacies(
-            argument_analysis.detected_fallacies
-        )
+        if self.needs_phase("fallacy_summary"):
+            sections["fallacy_summary"] = await self._summarize_fallacies(
+                argument_analysis.detected_fallacies
+            )
 
         processing_time = int((time.time() - start_time) * 1000)
 
@@ -217,18 +216,12 @@ class StructuredArgumentationAnalyzer:
         return StructuredArgumentationResult(
             argument_structure=argument_structure,
             argument_analysis=argument_analysis,
-            counterargument_analysis=counterargument_analysis,
-            debate_structure=debate_structure,
-            logic_quality_scores=logic_quality_scores,
-            improvement_roadmap=improvement_roadmap,
-            logical_consistency_report=logical_consistency_report,
-            evidence_assessment=evidence_assessment,
-            recommended_strengthening=recommended_strengthening,
-            fallacy_summary=fallacy_summary,
             processing_metrics=processing_metrics,
-            processing_time_ms=processing_time
+            processing_time_ms=processing_time,
+            **sections,
         )
 
+    @timed_phase
     async def _parse_argument_structure(
         self,
         argument_text: str,
@@ -574,6 +567,7 @@ class StructuredArgumentationAnalyzer:
 
         return chain_strength
 
+    @timed_phase
     async def _analyze_argument_quality(
         self,
         argument: ArgumentStructure,
@@ -810,6 +804,7 @@ class StructuredArgumentationAnalyzer:
         else:
             return StrengthLevel.VERY_WEAK
 
+    @timed_phase
     async def _analyze_counterarguments(
         self,
         argument: ArgumentStructure,
@@ -890,6 +885,7 @@ class StructuredArgumentationAnalyzer:
             ]
         )
 
+    @timed_phase
     async def _analyze_debate_structure(
         self,
         text: str,
@@ -930,6 +926,7 @@ class StructuredArgumentationAnalyzer:
             }
         )
 
+    @timed_phase
     async def _calculate_logic_quality_scores(
         self,
         analysis: ArgumentAnalysis,
@@ -952,6 +949,7 @@ class StructuredArgumentationAnalyzer:
 
         return scores
 
+    @timed_phase
     async def _generate_improvement_roadmap(
         self,
         analysis: ArgumentAnalysis,
@@ -997,6 +995,7 @@ class StructuredArgumentationAnalyzer:
 
         return roadmap
 
+    @timed_phase
     async def _generate_consistency_report(
         self,
         argument: ArgumentStructure,
@@ -1027,6 +1026,7 @@ class StructuredArgumentationAnalyzer:
 
         return report
 
+    @timed_phase
     async def _assess_evidence_quality(self, evidence: list[Evidence]) -> list[str]:
         """Assess the quality of evidence provided"""
         if not evidence:
@@ -1064,6 +1064,7 @@ class StructuredArgumentationAnalyzer:
 
         return assessment
 
+    @timed_phase
     async def _recommend_strengthening(
         self,
         analysis: ArgumentAnalysis,
@@ -1111,6 +1112,7 @@ class StructuredArgumentationAnalyzer:
 
         return recommendations[:12]  # Limit recommendations
 
+    @timed_phase
     async def _summarize_fallacies(self, fallacies: list[FallacyDetection]) -> dict[str, int]:
         """Summarize detected fallacies by type"""
         if not fallacies:
@@ -24,6 +24,7 @@ from .models import (
     TripleConstraintContext,
     TripleConstraintResult,
 )
+from .optimizer import ConstraintFrontier, pareto_frontier
 
 __all__ = [
     # Enums
@@ -42,6 +43,9 @@ __all__ = [
     # Main models
     "TripleConstraintContext",
     "TripleConstraintResult",
+    # Optimizer
+    "ConstraintFrontier",
+    "pareto_frontier",
     # Main class
     "TripleConstraintAnalyzer",
 ]
@@ -1,26 +1,39 @@
 """
 Triple Constraint Analyzer
 
-Analyzes trade-offs between three competing dimensions and identifies
+Analyzes trade-offs between competing dimensions and identifies
 optimal strategies for constraint management and balance.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional
+from typing import Any
 
-from ..base import BaseCognitiveAnalyzer
+import numpy as np
+
+from ..base import BaseCognitiveAnalyzer, request_seed, timed_phase
 from .models import (
-    ComplexityLevel,
     Constraint,
     ConstraintDimension,
     ConstraintPriority,
+    ConstraintSet,
+    OptimizationRecommendation,
     OptimizationStrategy,
     Scenario,
-    Tradeoff,
-    TradeoffImpact,
+    TradeOffAnalysis,
     TripleConstraintContext,
     TripleConstraintResult,
 )
+from .optimizer import (
+    COMPETING_ELASTICITY,
+    ConstraintFrontier,
+    pareto_frontier,
+    resolve_focus,
+    score_frontier,
+    top_allocations,
+)
+
+# Trade-off analyses reported, strongest conflicts first
+MAX_TRADEOFF_ANALYSES = 5
 
 
 class TripleConstraintAnalyzer(BaseCognitiveAnalyzer):
@@ -31,6 +44,10 @@ class TripleConstraintAnalyzer(BaseCognitiveAnalyzer):
     identifying optimal balance strategies.
     """
 
+    # The Pareto search feeds the required recommendations and assessments
+    # and always runs; only the visual representation is optional
+    phase_dependencies = {"visual_representation": ()}
+
     # Domain-specific constraint sets
     DOMAIN_CONSTRAINTS = {
         "project_management": [
@@ -55,6 +72,32 @@ class TripleConstraintAnalyzer(BaseCognitiveAnalyzer):
         ]
     }
 
+    # Dimension pairs that compete by default
+    COMPETING_PAIRS = [
+        (ConstraintDimension.TIME, ConstraintDimension.QUALITY),
+        (ConstraintDimension.COST, ConstraintDimension.QUALITY),
+        (ConstraintDimension.SPEED, ConstraintDimension.QUALITY),
+        (ConstraintDimension.SCOPE, ConstraintDimension.TIME),
+        (ConstraintDimension.FEATURES, ConstraintDimension.USABILITY)
+    ]
+
+    STRATEGY_LABELS = {
+        OptimizationStrategy.BALANCED: "Balanced",
+        OptimizationStrategy.PRIORITIZE_A: "Prioritize First Constraint",
+        OptimizationStrategy.PRIORITIZE_B: "Prioritize Second Constraint",
+        OptimizationStrategy.PRIORITIZE_C: "Prioritize Third Constraint",
+        OptimizationStrategy.MINIMIZE_TRADE_OFFS: "Minimal Trade-off",
+        OptimizationStrategy.MAXIMIZE_VALUE: "Maximum Value",
+    }
+
+    def __init__(self) -> None:
+        """Initialize the triple constraint analyzer."""
+        super().__init__(
+            tool_name="Triple Constraint",
+            tool_description="Analyzes trade-offs between competing constraints",
+            version="1.0.0"
+        )
+
     async def analyze(
         self,
         context: TripleConstraintContext
@@ -67,218 +110,163 @@ class TripleConstraintAnalyzer(BaseCognitiveAnalyzer):
 
         Returns:
             TripleConstraintResult with complete constraint analysis
+
+        Raises:
+            ValueError: If the optimization focus or a trade-off matrix entry
+                names an unknown constraint
         """
         # Identify or generate constraints
         constraints = await self._identify_constraints(context)
+        strategy, focus_index = resolve_focus(context.optimization_focus, constraints)
 
         # Analyze current state
-        current_state = await self._analyze_current_state(
-            constraints,
-            context
-        )
-
-        # Identify trade-offs
-        tradeoffs = await self._identify_tradeoffs(
-            constraints,
-            context
-        )
-
-        # Generate optimization scenarios
-        scenarios = await self._generate_scenarios(
-            constraints,
-            tradeoffs,
-            context
-        )
-
-        # Select optimal scenario
-        optimal_scenario = await self._select_optimal_scenario(
-            scenarios,
-            context
-        )
+        current_state = await self._analyze_current_state(constraints, context)
 
-        # Develop implementation strategy
-        implementation_plan = await self._develop_implementation_plan(
-            optimal_scenario,
-            constraints,
-            context
-        )
-
-        # Identify risk mitigation
-        risk_mitigation = await self._identify_risk_mitigation(
-            optimal_scenario,
-            tradeoffs,
-            context
-        )
+        # Build the trade-off matrix and report its strongest conflicts
+        elasticity = self._elasticity_matrix(constraints, context)
+        tradeoffs = self._identify_tradeoffs(constraints, elasticity)
 
-        # Create monitoring metrics
-        monitoring_metrics = await self._create_monitoring_metrics(
+        # Search the constraint space for Pareto-optimal allocations
+        frontier = await asyncio.to_thread(
+            pareto_frontier,
             constraints,
-            optimal_scenario
+            elasticity,
+            context.resource_budget,
+            np.random.default_rng(request_seed(context)),
+            context.candidate_allocations,
         )
-
-        # Generate communication plan
-        communication_plan = await self._generate_communication_plan(
-            optimal_scenario,
-            constraints,
-            context
-        )
-
-        # Calculate success probability
-        success_probability = self._calculate_success_probability(
-            optimal_scenario,
-            constraints,
-            context
+        scenarios = self._generate_scenarios(
+            constraints, frontier, strategy, focus_index, context
         )
+        recommendations = self._create_recommendations(constraints, scenarios)
 
-        # Generate overall assessment
-        overall_assessment = await self._generate_overall_assessment(
-            constraints,
-            optimal_scenario,
-            success_probability,
-            context
-        )
+        confidence_score = self._calculate_confidence(frontier, context)
 
-        # Calculate confidence
-        confidence_score = self._calculate_confidence(
-            constraints,
-            scenarios,
-            context
-        )
+        sections: dict[str, Any] = {}
+        if self.needs_phase("visual_representation"):
+            sections["visual_representation"] = self._visual_representation(
+                constraints, scenarios, frontier
+            )
 
         return TripleConstraintResult(
             input_scenario=context.scenario,
-            identified_constraints=constraints,
+            identified_constraints=self._constraint_set(constraints),
+            constraints=constraints,
             current_state_analysis=current_state,
-            tradeoff_analysis=tradeoffs,
-            optimization_scenarios=scenarios,
-            recommended_scenario=optimal_scenario,
-            implementation_plan=implementation_plan,
-            risk_mitigation_strategies=risk_mitigation,
-            monitoring_metrics=monitoring_metrics,
-            stakeholder_communication=communication_plan,
-            success_probability=success_probability,
-            overall_assessment=overall_assessment,
-            confidence_score=confidence_score
+            trade_off_analyses=tradeoffs,
+            optimization_recommendations=recommendations,
+            scenarios=scenarios,
+            pareto_frontier_size=len(frontier.progress),
+            feasible_allocations=frontier.feasible,
+            domain_specific_insights=self._generate_insights(
+                constraints, tradeoffs, frontier, context
+            ),
+            key_decisions=self._identify_key_decisions(constraints, tradeoffs, scenarios),
+            success_metrics=self._create_monitoring_metrics(constraints),
+            overall_assessment=self._generate_overall_assessment(
+                constraints, scenarios, frontier, context
+            ),
+            confidence_score=confidence_score,
+            **sections,
         )
 
+    @timed_phase
     async def _identify_constraints(
         self,
         context: TripleConstraintContext
     ) -> list[Constraint]:
-        """Identify the three constraints for analysis."""
+        """Identify the constraints for analysis."""
         # Use predefined if available
         if context.predefined_constraints:
-            return context.predefined_constraints
-
-        # Check domain-specific
-        if context.domain:
-            for domain, template in self.DOMAIN_CONSTRAINTS.items():
-                if domain in context.domain.lower():
-                    return await self._create_constraints_from_template(
-                        template,
-                        context
-                    )
-
-        # Generate generic constraints
-        return await self._generate_generic_constraints(context)
+            constraints = context.predefined_constraints
+        else:
+            constraints = self._generic_constraints()
+            # Check domain-specific
+            if context.domain_context:
+                for domain, template in self.DOMAIN_CONSTRAINTS.items():
+                    if domain in context.domain_context.lower():
+                        constraints = self._create_constraints_from_template(template)
+                        break
+
+        # Apply flexibility overrides by constraint name or dimension
+        overrides = {k.lower(): v for k, v in (context.constraints_flexibility or {}).items()}
+        return [
+            c.model_copy(update={"flexibility": overrides.get(
+                c.name.lower(), overrides.get(c.dimension.value, c.flexibility)
+            )})
+            for c in constraints
+        ]
 
-    async def _create_constraints_from_template(
+    def _create_constraints_from_template(
         self,
-        template: list[tuple],
-        context: TripleConstraintContext
+        template: list[tuple[ConstraintDimension, str]]
     ) -> list[Constraint]:
         """Create constraints from domain template."""
-        constraints = []
-
-        for dimension, description in template:
-            constraint = Constraint(
+        return [
+            Constraint(
                 dimension=dimension,
-                description=description,
+                name=dimension.value,
                 current_value=50.0,  # Default midpoint
                 target_value=80.0,   # Default target
-                min_acceptable=30.0, # Default minimum
-                max_possible=100.0,  # Default maximum
-                priority=ConstraintPriority.HIGH,
                 flexibility=0.5,
-                impact_factors=[
-                    "Resource availability",
-                    "External dependencies",
-                    "Stakeholder expectations"
-                ]
+                priority=ConstraintPriority.HIGH,
             )
-            constraints.append(constraint)
-
-        return constraints
+            for dimension, _ in template
+        ]
 
-    async def _generate_generic_constraints(
-        self,
-        context: TripleConstraintContext
-    ) -> list[Constraint]:
+    def _generic_constraints(self) -> list[Constraint]:
         """Generate generic triple constraints."""
         # Default to classic project triangle
         return [
             Constraint(
                 dimension=ConstraintDimension.QUALITY,
-                description="Quality or scope of deliverables",
+                name="quality",
                 current_value=60.0,
                 target_value=90.0,
-                min_acceptable=50.0,
-                max_possible=100.0,
-                priority=ConstraintPriority.HIGH,
                 flexibility=0.3,
-                impact_factors=["Standards", "Requirements", "Expectations"]
+                priority=ConstraintPriority.HIGH,
             ),
             Constraint(
                 dimension=ConstraintDimension.TIME,
-                description="Timeline and schedule",
+                name="time",
                 current_value=40.0,
                 target_value=80.0,
-                min_acceptable=30.0,
-                max_possible=100.0,
-                priority=ConstraintPriority.MEDIUM,
                 flexibility=0.5,
-                impact_factors=["Resources", "Dependencies", "Complexity"]
+                priority=ConstraintPriority.MEDIUM,
             ),
             Constraint(
                 dimension=ConstraintDimension.COST,
-                description="Budget and resources",
+                name="cost",
                 current_value=70.0,
                 target_value=60.0,
-                min_acceptable=40.0,
-                max_possible=100.0,
-                priority=ConstraintPriority.MEDIUM,
                 flexibility=0.4,
-                impact_factors=["Market rates", "Efficiency", "Scope"]
-            )
+                priority=ConstraintPriority.MEDIUM,
+            ),
         ]
 
+    @timed_phase
     async def _analyze_current_state(
         self,
         constraints: list[Constraint],
         context: TripleConstraintContext
     ) -> str:
         """Analyze current state of constraints."""
-        # Identify constraint status
-        over_constraints = [
-            c for c in constraints
-            if c.current_value > c.target_value
-        ]
-        under_constraints = [
-            c for c in constraints
-            if c.current_value < c.min_acceptable
-        ]
-
         analysis = "Current state analysis:\n"
 
-        if over_constraints:
-            analysis += f"- {len(over_constraints)} constraint(s) exceeding targets\n"
-            for c in over_constraints:
-                analysis += f"  • {c.dimension}: {c.current_value:.0f}% (target: {c.target_value:.0f}%)\n"
+        achieved = [c for c in constraints if c.current_value == c.target_value]
+        if achieved:
+            analysis += f"- {len(achieved)} constraint(s) already at target\n"
 
-        if under_constraints:
-            analysis += f"- {len(under_constraints)} constraint(s) below minimum\n"
-            for c in under_constraints:
-                analysis += f"  • {c.dimension}: {c.current_value:.0f}% (min: {c.min_acceptable:.0f}%)\n"
+        # Largest relative gaps first
+        open_gaps = sorted(
+            (c for c in constraints if c.current_value != c.target_value),
+            key=lambda c: abs(c.gap) / max(c.target_value, c.current_value),
+            reverse=True,
+        )
+        if open_gaps:
+            analysis += f"- {len(open_gaps)} constraint(s) away from target\n"
+            for c in open_gaps[:5]:
+                analysis += f"  • {c.name}: {c.current_value:.0f} (target: {c.target_value:.0f})\n"
 
         # Overall balance assessment
         variance = max(c.current_value for c in constraints) - min(c.current_value for c in constraints)
@@ -291,418 +279,335 @@ class TripleConstraintAnalyzer(BaseCognitiveAnalyzer):
 
         return analysis
 
-    async def _identify_tradeoffs(
+    def _constraint_index(self, constraints: list[Constraint], key: str) -> int:
+        """Index of the constraint with this name or dimension."""
+        key = key.lower()
+        for index, constraint in enumerate(constraints):
+            if key in (constraint.name.lower(), constraint.dimension.value):
+                return index
+        raise ValueError(f"Unknown constraint in trade-off matrix: {key}")
+
+    @timed_phase
+    def _elasticity_matrix(
         self,
         constraints: list[Constraint],
         context: TripleConstraintContext
-    ) -> list[Tradeoff]:
-        """Identify trade-offs between constraints."""
-        tradeoffs = []
+    ) -> np.ndarray:
+        """
+        Trade-off matrix between constraints.
 
-        # Analyze each pair of constraints
-        for i in range(len(constraints)):
-            for j in range(i + 1, len(constraints)):
-                constraint_a = constraints[i]
-                constraint_b = constraints[j]
-
-                # Determine relationship
-                if self._are_competing(constraint_a, constraint_b):
-                    tradeoff = Tradeoff(
-                        constraint_a=constraint_a.dimension,
-                        constraint_b=constraint_b.dimension,
-                        relationship_type="inverse",
-                        description=f"Improving {constraint_a.dimension} typically reduces {constraint_b.dimension}",
-                        impact_factor=0.7,
-                        examples=[
-                            f"Increasing {constraint_a.dimension} by 20% may reduce {constraint_b.dimension} by 15%",
-                            "Historical data shows strong negative correlation"
-                        ],
-                        mitigation_strategies=[
-                            "Find creative solutions that benefit both",
-                            "Optimize processes to reduce impact",
-                            "Accept controlled trade-off"
-                        ]
-                    )
-                else:
-                    tradeoff = Tradeoff(
-                        constraint_a=constraint_a.dimension,
-                        constraint_b=constraint_b.dimension,
-                        relationship_type="complementary",
-                        description=f"{constraint_a.dimension} and {constraint_b.dimension} can be improved together",
-                        impact_factor=0.3,
-                        examples=[
-                            "Process improvements benefit both dimensions",
-                            "Synergies exist between these constraints"
-                        ],
-                        mitigation_strategies=[
-                            "Leverage synergies",
-                            "Coordinate improvements"
-                        ]
-                    )
-
-                tradeoffs.append(tradeoff)
+        Competing dimension pairs lose COMPETING_ELASTICITY of each other's
+        gap per unit of effort; context.trade_off_matrix entries override.
+        """
+        elasticity = np.eye(len(constraints))
+        dimensions = np.array([c.dimension.value for c in constraints])
+        for dimension_a, dimension_b in self.COMPETING_PAIRS:
+            a = dimensions == dimension_a.value
+            b = dimensions == dimension_b.value
+            pairs = np.outer(a, b) | np.outer(b, a)
+            elasticity[pairs] = -COMPETING_ELASTICITY
+
+        for source, row in (context.trade_off_matrix or {}).items():
+            i = self._constraint_index(constraints, source)
+            for target, value in row.items():
+                j = self._constraint_index(constraints, target)
+                if i != j:
+                    elasticity[i, j] = value
+
+        return elasticity
+
+    @timed_phase
+    def _identify_tradeoffs(
+        self,
+        constraints: list[Constraint],
+        elasticity: np.ndarray
+    ) -> list[TradeOffAnalysis]:
+        """Summarize the strongest conflicts in the trade-off matrix."""
+        # Mean of both directions, over the upper triangle only
+        conflict = -np.triu((elasticity + elasticity.T) / 2, k=1)
+        rows, cols = np.nonzero(conflict > 0)
+        strongest = np.argsort(-conflict[rows, cols], kind="stable")[:MAX_TRADEOFF_ANALYSES]
 
+        tradeoffs = []
+        for i, j in zip(rows[strongest], cols[strongest]):
+            a, b = constraints[i].name, constraints[j].name
+            tradeoffs.append(TradeOffAnalysis(
+                relationship=f"Improving {a} reduces {b}",
+                impact_score=float(min(1.0, conflict[i, j])),
+                examples=[
+                    f"Closing the {a} gap costs {-elasticity[i, j]:.0%} of the {b} gap",
+                    f"Closing the {b} gap costs {-elasticity[j, i]:.0%} of the {a} gap",
+                ],
+                mitigation_options=[
+                    f"Sequence work on {a} and {b} rather than pushing both at once",
+                    f"Agree in advance how far {b} may regress",
+                ],
+            ))
         return tradeoffs
 
-    async def _generate_scenarios(
+    @timed_phase
+    def _generate_scenarios(
         self,
         constraints: list[Constraint],
-        tradeoffs: list[Tradeoff],
+        frontier: ConstraintFrontier,
+        strategy: OptimizationStrategy,
+        focus_index: int | None,
         context: TripleConstraintContext
     ) -> list[Scenario]:
-        """Generate optimization scenarios."""
-        scenarios = []
+        """Turn the best frontier allocations for the focus into scenarios."""
+        if not len(frontier.progress):
+            return []
+
+        scores = score_frontier(frontier, constraints, strategy, focus_index)
+        chosen = top_allocations(scores, frontier.allocations, context.max_scenarios)
+        label = self.STRATEGY_LABELS[strategy]
+        if focus_index is not None and strategy == OptimizationStrategy.MAXIMIZE_VALUE:
+            label = f"Focus on {constraints[focus_index].name}"
 
-        # Scenario 1: Balanced approach
-        balanced_targets = {}
-        for c in constraints:
-            balanced_targets[c.dimension] = (c.target_value + c.current_value) / 2
-
-        scenarios.append(Scenario(
-            scenario_id="balanced",
-            name="Balanced Optimization",
-            description="Moderate improvements across all constraints",
-            target_values=balanced_targets,
-            strategy=OptimizationStrategy.BALANCED,
-            expected_outcomes=[
-                "Steady progress on all fronts",
-                "Lower risk of failure",
-                "Stakeholder satisfaction"
-            ],
-            required_changes=[
-                "Incremental process improvements",
-                "Resource reallocation",
-                "Stakeholder alignment"
-            ],
-            timeline="Medium-term (3-6 months)",
-            resource_requirements="Moderate",
-            risk_level="Low",
-            success_probability=0.75
-        ))
-
-        # Scenario 2: Priority focus
-        priority_constraint = max(constraints, key=lambda c: c.priority.value)
-        priority_targets = {}
-        for c in constraints:
-            if c == priority_constraint:
-                priority_targets[c.dimension] = c.target_value
-            else:
-                priority_targets[c.dimension] = c.current_value * 0.9
-
-        scenarios.append(Scenario(
-            scenario_id="priority",
-            name="Priority Constraint Focus",
-            description=f"Maximize {priority_constraint.dimension} at controlled cost to others",
-            target_values=priority_targets,
-            strategy=OptimizationStrategy.MAXIMIZE_ONE,
-            expected_outcomes=[
-                f"Significant improvement in {priority_constraint.dimension}",
-                "Some degradation in other areas",
-                "Clear strategic direction"
-            ],
-            required_changes=[
-                f"Resource concentration on {priority_constraint.dimension}",
-                "Accept trade-offs",
-                "Clear communication of priorities"
-            ],
-            timeline="Short-term (1-3 months)",
-            resource_requirements="Focused",
-            risk_level="Medium",
-            success_probability=0.65
-        ))
-
-        # Scenario 3: Sequential optimization
-        sequential_targets = {}
-        for idx, c in enumerate(constraints):
-            # Improve constraints one at a time
-            if idx == 0:
-                sequential_targets[c.dimension] = c.target_value * 0.8
-            else:
-                sequential_targets[c.dimension] = c.current_value
-
-        scenarios.append(Scenario(
-            scenario_id="sequential",
-            name="Sequential Optimization",
-            description="Improve constraints one at a time in priority order",
-            target_values=sequential_targets,
-            strategy=OptimizationStrategy.SEQUENTIAL,
-            expected_outcomes=[
-                "Clear milestones",
-                "Easier to manage",
-                "Learn and adapt between phases"
-            ],
-            required_changes=[
-                "Phased approach",
-                "Milestone planning",
-                "Iterative improvements"
-            ],
-            timeline="Long-term (6-12 months)",
-            resource_requirements="Sustained",
-            risk_level="Low",
-            success_probability=0.70
-        ))
+        scenarios = []
+        for rank, index in enumerate(chosen, start=1):
+            allocation = frontier.allocations[index]
+            progress = frontier.progress[index]
+            achieved = {
+                c.name: round(float(c.current_value + p * c.gap), 2)
+                for c, p in zip(constraints, progress)
+            }
+            leads = ", ".join(
+                f"{constraints[i].name} {allocation[i]:.0%}"
+                for i in np.argsort(-allocation, kind="stable")[:2]
+            )
 
+            scenarios.append(Scenario(
+                name=f"{label} #{rank} ({leads})",
+                strategy=strategy,
+                adjustments={
+                    c.name: round(achieved[c.name] - c.current_value, 2) for c in constraints
+                },
+                expected_outcomes={
+                    "achieved_values": achieved,
+                    "gap_progress": {
+                        c.name: round(float(p), 3) for c, p in zip(constraints, progress)
+                    },
+                    "effort_allocation": {
+                        c.name: round(float(a), 3) for c, a in zip(constraints, allocation)
+                    },
+                    "score": round(float(scores[index]), 4),
+                },
+                risk_level=self._risk_level(progress, frontier),
+                implementation_effort=self._implementation_effort(progress),
+            ))
         return scenarios
 
-    async def _select_optimal_scenario(
+    def _risk_level(self, progress: np.ndarray, frontier: ConstraintFrontier) -> str:
+        """Risk from the worst regression; critical when no allocation was feasible."""
+        if not frontier.feasible:
+            return "critical"
+        worst = -float(progress.min())
+        if worst <= 0:
+            return "low"
+        return "medium" if worst < 0.25 else "high"
+
+    def _implementation_effort(self, progress: np.ndarray) -> str:
+        """Effort from the average gap closed."""
+        closed = float(np.clip(progress, 0.0, 1.0).mean())
+        if closed < 0.3:
+            return "low"
+        if closed < 0.6:
+            return "medium"
+        return "high" if closed < 0.9 else "very_high"
+
+    @timed_phase
+    def _create_recommendations(
         self,
-        scenarios: list[Scenario],
-        context: TripleConstraintContext
-    ) -> Scenario:
-        """Select optimal scenario based on context."""
-        # Score scenarios based on multiple criteria
-        scenario_scores = {}
-
+        constraints: list[Constraint],
+        scenarios: list[Scenario]
+    ) -> list[OptimizationRecommendation]:
+        """Create one recommendation per scenario."""
+        recommendations = []
         for scenario in scenarios:
-            score = 0
-
-            # Success probability weight
-            score += scenario.success_probability * 30
-
-            # Risk tolerance matching
-            if context.risk_tolerance == "high" and scenario.risk_level == "Medium":
-                score += 10
-            elif context.risk_tolerance == "low" and scenario.risk_level == "Low":
-                score += 15
-
-            # Timeline matching
-            if context.timeline_flexibility == "high" and "Long-term" in scenario.timeline:
-                score += 10
-            elif context.timeline_flexibility == "low" and "Short-term" in scenario.timeline:
-                score += 15
-
-            # Strategy preference
-            if scenario.strategy == OptimizationStrategy.BALANCED:
-                score += 10  # Generally preferred
-
-            scenario_scores[scenario.scenario_id] = score
-
-        # Select highest scoring scenario
-        optimal_id = max(scenario_scores, key=scenario_scores.get)
-        return next(s for s in scenarios if s.scenario_id == optimal_id)
+            allocation = scenario.expected_outcomes["effort_allocation"]
+            progress = scenario.expected_outcomes["gap_progress"]
+            achieved = scenario.expected_outcomes["achieved_values"]
+
+            action_steps = [
+                f"Allocate {share:.0%} of effort to {name}"
+                for name, share in sorted(allocation.items(), key=lambda item: -item[1])
+                if share >= 0.05
+            ] or ["Spread effort evenly across constraints"]
+            risks = [
+                f"{name} regresses by {-value:.0%} of its gap"
+                for name, value in progress.items()
+                if value < 0
+            ]
+            mean_progress = float(np.clip(list(progress.values()), 0.0, 1.0).mean())
+
+            recommendations.append(OptimizationRecommendation(
+                strategy=scenario.strategy,
+                rationale=(
+                    f"{scenario.name} is Pareto-optimal: no sampled allocation "
+                    "improves one constraint without worsening another"
+                ),
+                action_steps=action_steps,
+                expected_outcomes=[
+                    f"{c.name}: {c.current_value:g} -> {achieved[c.name]:g} (target {c.target_value:g})"
+                    for c in constraints
+                ],
+                risks=risks,
+                confidence_level=round(
+                    max(0.0, min(1.0, 0.5 + 0.4 * mean_progress - 0.05 * len(risks))), 3
+                ),
+            ))
+        return recommendations
+
+    @timed_phase
+    def _constraint_set(self, constraints: list[Constraint]) -> ConstraintSet | None:
+        """Normalized three-dimension view of the constraints, when there are three."""
+        if len(constraints) != 3:
+            return None
+        scales = [max(c.current_value, c.target_value) or 1.0 for c in constraints]
+        return ConstraintSet(
+            dimension_a=constraints[0].name,
+            dimension_b=constraints[1].name,
+            dimension_c=constraints[2].name,
+            current_values=[c.current_value / s for c, s in zip(constraints, scales)],
+            target_values=[c.target_value / s for c, s in zip(constraints, scales)],
+        )
 
-    async def _develop_implementation_plan(
+    @timed_phase
+    def _generate_insights(
         self,
-        scenario: Scenario,
         constraints: list[Constraint],
+        tradeoffs: list[TradeOffAnalysis],
+        frontier: ConstraintFrontier,
         context: TripleConstraintContext
     ) -> list[str]:
-        """Develop implementation plan for selected scenario."""
-        plan = []
-
-        # Phase 1: Preparation
-        plan.append("Phase 1 - Preparation (Weeks 1-2):")
-        plan.append("• Stakeholder alignment on chosen approach")
-        plan.append("• Resource allocation and team formation")
-        plan.append("• Baseline metrics establishment")
-
-        # Phase 2: Initial changes
-        plan.append("\nPhase 2 - Initial Implementation (Weeks 3-6):")
-        for change in scenario.required_changes[:2]:
-            plan.append(f"• {change}")
-        plan.append("• Monitor early indicators")
-
-        # Phase 3: Full implementation
-        plan.append("\nPhase 3 - Full Implementation (Weeks 7-12):")
-        plan.append("• Scale successful initiatives")
-        plan.append("• Address emerging challenges")
-        plan.append("• Continuous optimization")
-
-        # Phase 4: Stabilization
-        plan.append("\nPhase 4 - Stabilization (Weeks 13-16):")
-        plan.append("• Lock in improvements")
-        plan.append("• Document learnings")
-        plan.append("• Plan next optimization cycle")
-
-        return plan
-
-    async def _identify_risk_mitigation(
-        self,
-        scenario: Scenario,
-        tradeoffs: list[Tradeoff],
-        context: TripleConstraintContext
-    ) -> list[str]:
-        """Identify risk mitigation strategies."""
-        strategies = []
-
-        # Scenario-specific risks
-        if scenario.risk_level == "Medium":
-            strategies.append("Implement phased rollout with go/no-go gates")
-            strategies.append("Maintain rollback capability")
-
-        # Trade-off risks
-        for tradeoff in tradeoffs:
-            if tradeoff.relationship_type == "inverse":
-                strategies.extend(tradeoff.mitigation_strategies[:2])
-
-        # General risk mitigation
-        strategies.extend([
-            "Regular stakeholder communication",
-            "Continuous monitoring of all constraints",
-            "Flexibility to adjust approach based on results",
-            "Maintain contingency resources"
-        ])
-
-        return list(set(strategies))[:6]  # Top 6 unique strategies
-
-    async def _create_monitoring_metrics(
-        self,
-        constraints: list[Constraint],
-        scenario: Scenario
-    ) -> list[str]:
-        """Create monitoring metrics for constraint management."""
-        metrics = []
-
-        # Constraint-specific metrics
-        for constraint in constraints:
-            metrics.append(
-                f"{constraint.dimension} performance: "
-                f"Current vs Target ({scenario.target_values[constraint.dimension]:.0f}%)"
+        """Generate insights from the constraint space."""
+        insights = [
+            f"{len(frontier.progress)} Pareto-optimal allocations among "
+            f"{frontier.candidates} evaluated ({frontier.feasible} feasible) "
+            f"across {len(constraints)} constraint dimensions"
+        ]
+        if not frontier.feasible:
+            insights.append(
+                "No allocation respects every flexibility limit; scenarios show "
+                "the least-violating options"
             )
-
-        # Balance metrics
-        metrics.append("Constraint balance index: Variance between dimensions")
-
-        # Progress metrics
-        metrics.append("Implementation progress: % of plan completed")
-        metrics.append("Resource utilization: Actual vs planned")
-
-        # Outcome metrics
-        metrics.append("Stakeholder satisfaction scores")
-        metrics.append("Risk materialization tracking")
-
-        return metrics
-
-    async def _generate_communication_plan(
+        if tradeoffs:
+            insights.append(f"Strongest conflict: {tradeoffs[0].relationship.lower()}")
+        critical = [c.name for c in constraints if c.priority == ConstraintPriority.CRITICAL]
+        if critical:
+            insights.append(f"Critical constraints held without regression: {', '.join(critical)}")
+        if context.domain_context:
+            insights.append(f"Constraint template and trade-offs tuned for {context.domain_context}")
+        return insights
+
+    @timed_phase
+    def _visual_representation(
         self,
-        scenario: Scenario,
         constraints: list[Constraint],
-        context: TripleConstraintContext
-    ) -> list[str]:
-        """Generate stakeholder communication plan."""
-        plan = []
-
-        # Key messages
-        plan.append(f"Key message: {scenario.name} - {scenario.description}")
-
-        # Stakeholder-specific communication
-        if context.primary_stakeholders:
-            for stakeholder in context.primary_stakeholders[:3]:
-                plan.append(f"For {stakeholder}: Focus on relevant constraint impacts")
-        else:
-            plan.append("For executives: Strategic rationale and expected outcomes")
-            plan.append("For teams: Implementation details and support needed")
-            plan.append("For customers: Timeline and quality expectations")
-
-        # Communication frequency
-        plan.append("Weekly status updates during implementation")
-        plan.append("Monthly executive briefings")
-        plan.append("Immediate escalation for significant deviations")
-
-        return plan
+        scenarios: list[Scenario],
+        frontier: ConstraintFrontier
+    ) -> dict[str, Any]:
+        """Data for plotting current, target and recommended values."""
+        return {
+            "dimensions": [c.name for c in constraints],
+            "current": [c.current_value for c in constraints],
+            "target": [c.target_value for c in constraints],
+            "recommended": (
+                [scenarios[0].expected_outcomes["achieved_values"][c.name] for c in constraints]
+                if scenarios else None
+            ),
+            "frontier_size": len(frontier.progress),
+        }
 
-    def _calculate_success_probability(
+    @timed_phase
+    def _identify_key_decisions(
         self,
-        scenario: Scenario,
         constraints: list[Constraint],
-        context: TripleConstraintContext
-    ) -> float:
-        """Calculate probability of successful implementation."""
-        base_probability = scenario.success_probability
-
-        # Adjust for constraint flexibility
-        avg_flexibility = sum(c.flexibility for c in constraints) / len(constraints)
-        base_probability += (avg_flexibility - 0.5) * 0.2
-
-        # Adjust for context factors
-        if context.organizational_readiness == "high":
-            base_probability += 0.1
-        elif context.organizational_readiness == "low":
-            base_probability -= 0.1
+        tradeoffs: list[TradeOffAnalysis],
+        scenarios: list[Scenario]
+    ) -> list[str]:
+        """Identify decisions needed to manage the constraints."""
+        decisions = []
+        if scenarios:
+            decisions.append(
+                f"Choose among {len(scenarios)} Pareto-optimal scenarios, led by {scenarios[0].name}"
+            )
+        decisions.extend(
+            f"Decide the acceptable cost: {tradeoff.relationship.lower()}"
+            for tradeoff in tradeoffs[:3]
+        )
+        flexible = [c.name for c in constraints if c.flexibility >= 0.5]
+        if flexible:
+            decisions.append(f"Confirm which flexible constraints may slip: {', '.join(flexible)}")
+        return decisions
 
-        # Ensure within bounds
-        return max(0.2, min(0.95, base_probability))
+    @timed_phase
+    def _create_monitoring_metrics(self, constraints: list[Constraint]) -> list[str]:
+        """Create monitoring metrics for constraint management."""
+        metrics = [
+            f"{c.name}: current {c.current_value:g} vs target {c.target_value:g}"
+            + (f" {c.unit}" if c.unit else "")
+            for c in constraints
+        ]
+        metrics.append("Effort spent per constraint vs planned allocation")
+        metrics.append("Regression on flexible constraints vs agreed limits")
+        return metrics
 
-    async def _generate_overall_assessment(
+    @timed_phase
+    def _generate_overall_assessment(
         self,
         constraints: list[Constraint],
-        scenario: Scenario,
-        success_probability: float,
+        scenarios: list[Scenario],
+        frontier: ConstraintFrontier,
         context: TripleConstraintContext
     ) -> str:
         """Generate overall assessment of constraint optimization approach."""
-        assessment = f"Triple constraint analysis for '{context.scenario}' reveals "
-
-        # Constraint balance
-        variance = max(c.current_value for c in constraints) - min(c.current_value for c in constraints)
-        if variance > 40:
-            assessment += "significant imbalance requiring strategic intervention. "
-        else:
-            assessment += "manageable constraint tensions. "
-
-        # Recommended approach
-        assessment += f"The {scenario.name} approach offers the best balance of "
-        assessment += f"risk ({scenario.risk_level}) and reward, with {success_probability*100:.0f}% "
-        assessment += "probability of success. "
-
-        # Key success factors
-        assessment += "Success depends on: "
-        if scenario.strategy == OptimizationStrategy.BALANCED:
-            assessment += "maintaining discipline across all constraints, "
-        elif scenario.strategy == OptimizationStrategy.MAXIMIZE_ONE:
-            assessment += "clear prioritization and stakeholder buy-in, "
+        assessment = (
+            f"Constraint analysis for '{context.scenario}' covers "
+            f"{len(constraints)} dimensions. "
+        )
+        if not scenarios:
+            return assessment + "No scenario could be derived from the constraint space."
+
+        best = scenarios[0]
+        progress = best.expected_outcomes["gap_progress"]
+        closed = sum(1 for value in progress.values() if value >= 1.0)
+        assessment += (
+            f"The recommended scenario, {best.name}, closes {closed} of "
+            f"{len(constraints)} gaps with {best.risk_level} risk and "
+            f"{best.implementation_effort.replace('_', ' ')} implementation effort. "
+        )
+        if frontier.feasible:
+            assessment += (
+                f"It was selected from {len(frontier.progress)} Pareto-optimal allocations."
+            )
         else:
-            assessment += "effective phase management, "
-
-        assessment += "proactive risk mitigation, and continuous monitoring. "
-
-        # Timeline expectation
-        assessment += f"Expected timeline: {scenario.timeline}."
-
+            assessment += (
+                "No allocation stays within every flexibility limit, so targets "
+                "or resources need renegotiation."
+            )
         return assessment
 
+    @timed_phase
     def _calculate_confidence(
         self,
-        constraints: list[Constraint],
-        scenarios: list[Scenario],
+        frontier: ConstraintFrontier,
         context: TripleConstraintContext
     ) -> float:
         """Calculate confidence in the analysis."""
-        confidence = 0.7  # Base confidence
+        confidence = 0.6  # Base confidence
 
         # Quality of input
         if context.predefined_constraints:
             confidence += 0.1
-
-        if context.domain:
-            confidence += 0.05
-
-        # Analysis completeness
-        if len(scenarios) >= 3:
+        if context.trade_off_matrix:
+            confidence += 0.1
+        if context.domain_context:
             confidence += 0.05
 
-        # Context factors
-        if context.organizational_readiness:
-            confidence += 0.05
+        # Feasibility of the constraint space
+        if frontier.feasible:
+            confidence += 0.1
 
         return min(0.95, confidence)
-
-    def _are_competing(
-        self,
-        constraint_a: Constraint,
-        constraint_b: Constraint
-    ) -> bool:
-        """Determine if two constraints compete."""
-        competing_pairs = [
-            (ConstraintDimension.TIME, ConstraintDimension.QUALITY),
-            (ConstraintDimension.COST, ConstraintDimension.QUALITY),
-            (ConstraintDimension.SPEED, ConstraintDimension.QUALITY),
-            (ConstraintDimension.SCOPE, ConstraintDimension.TIME),
-            (ConstraintDimension.FEATURES, ConstraintDimension.USABILITY)
-        ]
-
-        for pair in competing_pairs:
-            if (constraint_a.dimension in pair and constraint_b.dimension in pair):
-                return True
-
-        return False
@@ -349,6 +349,40 @@ class TripleConstraintContext(BaseModel):
         default_factory=list, description="Criteria for successful constraint balance"
     )
 
+    predefined_constraints: list[Constraint] | None = Field(
+        None,
+        min_length=2,
+        max_length=32,
+        description="Constraints to optimize, any number of dimensions (default: domain template)",
+    )
+
+    optimization_focus: str | None = Field(
+        None,
+        description="Strategy (e.g. 'balanced', 'maximize_value') or constraint name to rank scenarios by",
+    )
+
+    trade_off_matrix: dict[str, dict[str, float]] | None = Field(
+        None,
+        description="Gap fraction of the inner constraint gained (+) or lost (-) per unit of effort on the outer one",
+    )
+
+    resource_budget: float = Field(
+        0.75,
+        gt=0.0,
+        le=2.0,
+        description="Effort available, as a fraction of what closing every gap independently would take",
+    )
+
+    max_scenarios: int = Field(3, ge=1, le=20, description="Scenarios to return")
+
+    candidate_allocations: int = Field(
+        4096, ge=64, le=20_000, description="Effort allocations sampled by the optimizer"
+    )
+
+    random_seed: int | None = Field(
+        None, description="Seed for allocation sampling, derived from the input when omitted"
+    )
+
     @model_validator(mode="after")
     def validate_flexibility_values(self) -> TripleConstraintContext:
         """Validate flexibility values if provided."""
@@ -360,6 +394,21 @@ class TripleConstraintContext(BaseModel):
                     )
         return self
 
+    @model_validator(mode="after")
+    def validate_optimizer_inputs(self) -> TripleConstraintContext:
+        """Validate constraint names and trade-off matrix entries."""
+        if self.predefined_constraints is not None:
+            names = [c.name.lower() for c in self.predefined_constraints]
+            if len(set(names)) != len(names):
+                raise ValueError("Constraint names must be unique")
+        for source, row in (self.trade_off_matrix or {}).items():
+            for target, value in row.items():
+                if not -1.0 <= value <= 1.0:
+                    raise ValueError(
+                        f"Trade-off from '{source}' to '{target}' must be between -1.0 and 1.0, got {value}"
+                    )
+        return self
+
     @property
     def has_constraints(self) -> bool:
         """Check if constraints are defined."""
@@ -416,8 +465,24 @@ class TripleConstraintResult(BaseModel):
 
     input_scenario: str = Field(min_length=1, description="The analyzed scenario")
 
-    identified_constraints: ConstraintSet = Field(
-        description="The three competing constraints identified"
+    identified_constraints: ConstraintSet | None = Field(
+        None, description="The three competing constraints, normalized (set when there are exactly three)"
+    )
+
+    constraints: list[Constraint] = Field(
+        default_factory=list, description="Every constraint dimension that was optimized"
+    )
+
+    scenarios: list[Scenario] = Field(
+        default_factory=list, description="Top Pareto-optimal scenarios for the optimization focus"
+    )
+
+    pareto_frontier_size: int | None = Field(
+        None, ge=0, description="Pareto-optimal allocations found"
+    )
+
+    feasible_allocations: int | None = Field(
+        None, ge=0, description="Sampled allocations that respect every constraint's flexibility"
     )
 
     current_state_analysis: str = Field(
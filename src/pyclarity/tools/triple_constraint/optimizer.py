@@ -0,0 +1,240 @@
+"""
+Constraint-Space Optimizer
+
+Treats N competing constraints as a vector space. Effort allocations are
+sampled on the simplex and mapped through a trade-off (elasticity) matrix
+to the fraction of each constraint's gap they close. Infeasible outcomes
+are dropped, and the rest are reduced to their Pareto frontier and ranked
+by the optimization focus. Every step is vectorized over the candidate
+allocations.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .models import Constraint, ConstraintPriority, OptimizationStrategy
+
+# Allocations sampled per optimization
+DEFAULT_CANDIDATES = 4096
+
+# Elements per comparison array in the Pareto filter
+PARETO_CHUNK_ELEMENTS = 1 << 22
+
+# Gap fraction lost on each side of a competing pair per unit of effort
+COMPETING_ELASTICITY = 0.4
+
+PRIORITY_WEIGHTS = {
+    ConstraintPriority.CRITICAL: 4.0,
+    ConstraintPriority.HIGH: 3.0,
+    ConstraintPriority.MEDIUM: 2.0,
+    ConstraintPriority.LOW: 1.0,
+    ConstraintPriority.FLEXIBLE: 0.5,
+}
+
+# Focus values that select a strategy rather than a constraint
+_STRATEGY_FOCUS = {strategy.value: strategy for strategy in OptimizationStrategy}
+_PRIORITIZED_INDEX = {
+    OptimizationStrategy.PRIORITIZE_A: 0,
+    OptimizationStrategy.PRIORITIZE_B: 1,
+    OptimizationStrategy.PRIORITIZE_C: 2,
+}
+
+
+@dataclass(frozen=True)
+class ConstraintFrontier:
+    """Pareto-optimal allocations and the gap progress they achieve."""
+
+    allocations: np.ndarray  # (frontier size, n) effort shares, rows sum to 1
+    progress: np.ndarray     # (frontier size, n) fraction of each gap closed
+    candidates: int          # Allocations evaluated
+    feasible: int            # Allocations within every constraint's flexibility
+
+
+def regression_limits(constraints: list[Constraint]) -> np.ndarray:
+    """Largest gap fraction each constraint may lose; critical constraints may not regress."""
+    return np.array([
+        0.0 if c.priority == ConstraintPriority.CRITICAL else c.flexibility
+        for c in constraints
+    ])
+
+
+def sample_allocations(n: int, count: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Effort allocations over n constraints.
+
+    The equal split and every single-constraint focus are always included;
+    the rest are drawn uniformly from the simplex.
+    """
+    fixed = np.vstack([np.full((1, n), 1.0 / n), np.eye(n)])
+    sampled = rng.dirichlet(np.ones(n), size=max(0, count - len(fixed)))
+    return np.vstack([fixed, sampled])
+
+
+def gap_progress(allocations: np.ndarray, elasticity: np.ndarray, budget: float) -> np.ndarray:
+    """
+    Fraction of each gap closed by each allocation, capped at the target.
+
+    Args:
+        allocations: (k, n) effort shares
+        elasticity: (n, n) matrix; entry [i, j] is the gap fraction of j
+            gained (or lost, if negative) per unit of effort on i
+        budget: Effort available, as a fraction of what closing every gap
+            independently would take
+
+    Returns:
+        (k, n) gap progress; negative values are regressions
+    """
+    n = allocations.shape[1]
+    return np.minimum(1.0, (allocations * (budget * n)) @ elasticity)
+
+
+def _dominated_by(points: np.ndarray, front: np.ndarray) -> np.ndarray:
+    """Rows of points weakly dominated by any row of front."""
+    dominated = np.zeros(len(points), dtype=bool)
+    step = max(1, PARETO_CHUNK_ELEMENTS // max(1, front.size))
+    for start in range(0, len(points), step):
+        block = points[start:start + step, None, :]
+        dominated[start:start + step] = np.all(front[None, :, :] >= block, axis=2).any(axis=1)
+    return dominated
+
+
+def pareto_mask(points: np.ndarray, batch_size: int = 256) -> np.ndarray:
+    """
+    Boolean mask of the rows no other row dominates (higher is better).
+
+    Rows are visited in batches by decreasing sum. A row can only be
+    dominated by rows with a larger sum, so the rows of a batch that no
+    other batch row dominates are on the frontier; every remaining row
+    they dominate is then discarded.
+    """
+    order = np.argsort(-points.sum(axis=1), kind="stable")
+    remaining, ranked = order, points[order]
+    mask = np.zeros(len(points), dtype=bool)
+    while len(remaining):
+        batch = ranked[:batch_size]
+        # Strict domination within the batch; identical rows keep the first
+        ge = np.all(batch[None, :, :] >= batch[:, None, :], axis=2)
+        gt = np.any(batch[None, :, :] > batch[:, None, :], axis=2)
+        earlier = np.tri(len(batch), k=-1, dtype=bool)
+        beaten = (ge & (gt | earlier)).any(axis=1)
+        front = batch[~beaten]
+        mask[remaining[:batch_size][~beaten]] = True
+
+        rest, rest_ranked = remaining[batch_size:], ranked[batch_size:]
+        keep = ~_dominated_by(rest_ranked, front)
+        remaining, ranked = rest[keep], rest_ranked[keep]
+    return mask
+
+
+def pareto_frontier(
+    constraints: list[Constraint],
+    elasticity: np.ndarray,
+    budget: float,
+    rng: np.random.Generator,
+    candidates: int = DEFAULT_CANDIDATES,
+) -> ConstraintFrontier:
+    """
+    Sample allocations and keep the feasible, Pareto-optimal ones.
+
+    Args:
+        constraints: Constraints spanning the space
+        elasticity: (n, n) trade-off matrix, see gap_progress
+        budget: Effort available, see gap_progress
+        rng: Random generator for sampling
+        candidates: Allocations to evaluate
+
+    Returns:
+        The frontier. If no allocation respects every flexibility limit, it
+        is built from the least-violating percentile instead.
+    """
+    allocations = sample_allocations(len(constraints), candidates, rng)
+    progress = gap_progress(allocations, elasticity, budget)
+    violation = np.maximum(0.0, -regression_limits(constraints) - progress).sum(axis=1)
+    feasible = violation == 0
+    selected = feasible if feasible.any() else violation <= np.quantile(violation, 0.01)
+    allocations, progress = allocations[selected], progress[selected]
+    front = pareto_mask(progress)
+    return ConstraintFrontier(
+        allocations=allocations[front],
+        progress=progress[front],
+        candidates=len(feasible),
+        feasible=int(feasible.sum()),
+    )
+
+
+def resolve_focus(
+    focus: str | None,
+    constraints: list[Constraint],
+) -> tuple[OptimizationStrategy, int | None]:
+    """
+    Interpret an optimization focus.
+
+    Args:
+        focus: A strategy name, a constraint name or dimension, or None for balanced
+        constraints: Constraints being optimized
+
+    Returns:
+        The strategy and, when one constraint is prioritized, its index
+
+    Raises:
+        ValueError: If the focus names neither a strategy nor a constraint
+    """
+    if focus is None:
+        return OptimizationStrategy.BALANCED, None
+
+    key = focus.strip().lower()
+    if key in _STRATEGY_FOCUS:
+        strategy = _STRATEGY_FOCUS[key]
+        index = _PRIORITIZED_INDEX.get(strategy)
+        if index is not None and index >= len(constraints):
+            raise ValueError(f"Focus {focus!r} needs at least {index + 1} constraints")
+        return strategy, index
+
+    for index, constraint in enumerate(constraints):
+        if key in (constraint.name.lower(), constraint.dimension.value):
+            return OptimizationStrategy.MAXIMIZE_VALUE, index
+
+    raise ValueError(f"Unknown optimization focus: {focus}")
+
+
+def score_frontier(
+    frontier: ConstraintFrontier,
+    constraints: list[Constraint],
+    strategy: OptimizationStrategy,
+    focus_index: int | None = None,
+) -> np.ndarray:
+    """Score frontier points for a strategy; higher is better."""
+    progress = frontier.progress
+    weights = np.array([PRIORITY_WEIGHTS[c.priority] for c in constraints])
+    value = progress @ weights / weights.sum()
+
+    if focus_index is not None:
+        # Lexicographic: the focused constraint first, weighted value as tie-breaker
+        return progress[:, focus_index] * 10.0 + value
+    if strategy == OptimizationStrategy.MAXIMIZE_VALUE:
+        return value
+    if strategy == OptimizationStrategy.MINIMIZE_TRADE_OFFS:
+        regression = np.minimum(progress, 0.0).sum(axis=1)
+        return regression * 10.0 + progress.mean(axis=1)
+    # Balanced: raise the weakest constraint first
+    return progress.min(axis=1) * 10.0 + progress.mean(axis=1)
+
+
+def top_allocations(
+    scores: np.ndarray,
+    allocations: np.ndarray,
+    limit: int,
+    resolution: float = 0.1,
+) -> np.ndarray:
+    """Indices of the best-scoring allocations, at most one per grid cell of effort shares."""
+    chosen: list[int] = []
+    seen: set[tuple[int, ...]] = set()
+    for index in np.argsort(-scores, kind="stable"):
+        key = tuple(np.rint(allocations[index] / resolution).astype(int))
+        if key not in seen:
+            seen.add(key)
+            chosen.append(int(index))
+            if len(chosen) == limit:
+                break
+    return np.array(chosen, dtype=int)
@@ -11,6 +11,7 @@ import time
 from collections import defaultdict
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..base import BaseCognitiveAnalyzer, timed_phase
 from .models import (
     DiagramAnalysis,
     PatternRecognition,
@@ -25,7 +26,7 @@ from .models import (
 )
 
 
-class VisualReasoningAnalyzer:
+class VisualReasoningAnalyzer(BaseCognitiveAnalyzer):
     """
     Visual Reasoning Analyzer for spatial and diagrammatic thinking.
 
@@ -36,8 +37,28 @@ class VisualReasoningAnalyzer:
     - Visual problem-solving approaches
     """
 
+    # Visual elements are always processed; every other result section runs
+    # only when requested or when a requested section consumes it
+    phase_dependencies = {
+        "spatial_mapping": (),
+        "spatial_relationships": (),
+        "patterns_identified": (),
+        "diagram_analysis": ("spatial_mapping", "patterns_identified"),
+        "visual_problem_solving": ("diagram_analysis",),
+        "key_insights": ("patterns_identified", "spatial_relationships", "diagram_analysis"),
+        "recommendations": ("patterns_identified", "diagram_analysis"),
+        "confidence_scores": ("patterns_identified", "spatial_mapping", "diagram_analysis"),
+        "visual_reasoning_techniques": ("patterns_identified", "spatial_mapping"),
+        "processing_metrics": ("patterns_identified", "spatial_relationships", "key_insights"),
+    }
+
     def __init__(self):
         """Initialize the Visual Reasoning Analyzer"""
+        super().__init__(
+            tool_name="Visual Reasoning",
+            tool_description="Analyzes spatial relationships, visual patterns and diagrams",
+            version="1.0.0"
+        )
         self.pattern_recognition_threshold = 0.6
         self.spatial_analysis_precision = 0.1
         self.max_relationship_distance = 100.0
@@ -61,74 +82,89 @@ class VisualReasoningAnalyzer:
         spatial_mapping = None
         spatial_relationships = {}
         if context.include_spatial_analysis:
-            spatial_mapping = await self._create_spatial_mapping(
-                visual_elements, context.coordinate_system
-            )
-            spatial_relationships = await self._analyze_spatial_relationships(visual_elements)
+            if self.needs_phase("spatial_mapping"):
+                spatial_mapping = await self._create_spatial_mapping(
+                    visual_elements, context.coordinate_system
+                )
+            if self.needs_phase("spatial_relationships"):
+                spatial_relationships = await self._analyze_spatial_relationships(visual_elements)
 
         # Phase 3: Pattern recognition if requested
         patterns_identified = []
-        if context.include_pattern_recognition:
+        if context.include_pattern_recognition and self.needs_phase("patterns_identified"):
             patterns_identified = await self._recognize_visual_patterns(
                 visual_elements, context.max_patterns, context.confidence_threshold
             )
 
+        sections: dict[str, Any] = {
+            "spatial_mapping": spatial_mapping,
+            "spatial_relationships": spatial_relationships,
+            "patterns_identified": patterns_identified,
+        }
+
         # Phase 4: Diagram analysis
-        diagram_analysis = await self._analyze_diagram(
-            visual_elements, context.representation_type, spatial_mapping, patterns_identified
-        )
+        diagram_analysis = None
+        if self.needs_phase("diagram_analysis"):
+            diagram_analysis = await self._analyze_diagram(
+                visual_elements, context.representation_type, spatial_mapping, patterns_identified
+            )
+        sections["diagram_analysis"] = diagram_analysis
 
         # Phase 5: Visual problem solving if requested
-        visual_problem_solving = None
-        if context.include_problem_solving and context.problem_description:
-            visual_problem_solving = await self._solve_visually(
+        if (
+            context.include_problem_solving
+            and context.problem_description
+            and self.needs_phase("visual_problem_solving")
+        ):
+            sections["visual_problem_solving"] = await self._solve_visually(
                 context.problem_description, visual_elements,
                 context.representation_type, diagram_analysis
             )
 
         # Phase 6: Generate insights and recommendations
-        key_insights = await self._generate_insights(
-            visual_elements, patterns_identified, spatial_relationships, diagram_analysis
-        )
+        key_insights = []
+        if self.needs_phase("key_insights"):
+            key_insights = await self._generate_insights(
+                visual_elements, patterns_identified, spatial_relationships, diagram_analysis
+            )
+            sections["key_insights"] = key_insights
 
-        recommendations = await self._generate_recommendations(
-            context, visual_elements, patterns_identified, diagram_analysis
-        )
+        if self.needs_phase("recommendations"):
+            sections["recommendations"] = await self._generate_recommendations(
+                context, visual_elements, patterns_identified, diagram_analysis
+            )
 
         # Phase 7: Calculate confidence scores and metrics
-        confidence_scores = await self._calculate_confidence_scores(
-            visual_elements, patterns_identified, spatial_mapping, diagram_analysis
-        )
+        if self.needs_phase("confidence_scores"):
+            sections["confidence_scores"] = await self._calculate_confidence_scores(
+                visual_elements, patterns_identified, spatial_mapping, diagram_analysis
+            )
 
-        visual_reasoning_techniques = await self._identify_techniques_used(
-            context, patterns_identified, spatial_mapping
-        )
+        if self.needs_phase("visual_reasoning_techniques"):
+            sections["visual_reasoning_techniques"] = await self._identify_techniques_used(
+                context, patterns_identified, spatial_mapping
+            )
 
         processing_time = int((time.time() - start_time) * 1000)
 
-        processing_metrics = {
-            'elements_processed': len(visual_elements),
-            'patterns_analyzed': len(patterns_identified),
-            'spatial_relationships_found': sum(len(rels) for rels in spatial_relationships.values()),
-            'analysis_depth': len(key_insights),
-            'processing_phases': 7
-        }
+        if self.needs_phase("processing_metrics"):
+            sections["processing_metrics"] = {
+                'elements_processed': len(visual_elements),
+                'patterns_analyzed': len(patterns_identified),
+                'spatial_relationships_found': sum(
+                    len(rels) for rels in spatial_relationships.values()
+                ),
+                'analysis_depth': len(key_insights),
+                'processing_phases': 7
+            }
 
         return VisualReasoningResult(
             visual_elements=visual_elements,
-            spatial_mapping=spatial_mapping,
-            patterns_identified=patterns_identified,
-            diagram_analysis=diagram_analysis,
-            visual_problem_solving=visual_problem_solving,
-            spatial_relationships=spatial_relationships,
-            key_insights=key_insights,
-            recommendations=recommendations,
-            visual_reasoning_techniques=visual_reasoning_techniques,
-            confidence_scores=confidence_scores,
-            processing_metrics=processing_metrics,
-            processing_time_ms=processing_time
+            processing_time_ms=processing_time,
+            **sections,
         )
 
+    @timed_phase
     async def _process_visual_elements(self, elements_data: list[dict[str, Any]]) -> list[VisualElement]:
         """Process raw visual elements data into VisualElement objects"""
         visual_elements = []
@@ -165,6 +201,7 @@ class VisualReasoningAnalyzer:
 
         return visual_elements
 
+    @timed_phase
     async def _create_spatial_mapping(
         self,
         elements: list[VisualElement],
@@ -199,6 +236,7 @@ class VisualReasoningAnalyzer:
             scale_factor=1.0
         )
 
+    @timed_phase
     async def _analyze_spatial_relationships(
         self,
         elements: list[VisualElement]
@@ -264,6 +302,7 @@ class VisualReasoningAnalyzer:
 
         return None
 
+    @timed_phase
     async def _recognize_visual_patterns(
         self,
         elements: list[VisualElement],
@@ -543,6 +582,7 @@ class VisualReasoningAnalyzer:
 
         return None
 
+    @timed_phase
     async def _analyze_diagram(
         self,
         elements: list[VisualElement],
@@ -601,6 +641,7 @@ class VisualReasoningAnalyzer:
             confidence_score=confidence
         )
 
+    @timed_phase
     async def _solve_visually(
         self,
         problem_description: str,
@@ -652,6 +693,7 @@ class VisualReasoningAnalyzer:
             solution_confidence=solution_confidence
         )
 
+    @timed_phase
     async def _generate_insights(
         self,
         elements: list[VisualElement],
@@ -713,6 +755,7 @@ class VisualReasoningAnalyzer:
 
         return insights[:15]  # Limit to max insights
 
+    @timed_phase
     async def _generate_recommendations(
         self,
         context: VisualReasoningContext,
@@ -763,6 +806,7 @@ class VisualReasoningAnalyzer:
 
         return recommendations[:12]  # Limit recommendations
 
+    @timed_phase
     async def _calculate_confidence_scores(
         self,
         elements: list[VisualElement],
@@ -793,6 +837,7 @@ class VisualReasoningAnalyzer:
 
         return scores
 
+    @timed_phase
     async def _identify_techniques_used(
         self,
         context: VisualReasoningContext,
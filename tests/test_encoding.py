@@ -0,0 +1,122 @@
+"""Test the response encoding used by the MCP server."""
+
+import json
+
+import pytest
+from fastmcp import Client, FastMCP
+from pydantic import BaseModel, Field
+
+from pyclarity.server.encoding import (
+    compress_payload,
+    decompress_payload,
+    encode_result,
+    summarize,
+    tool_result,
+)
+
+
+class SampleResult(BaseModel):
+    """Small result model standing in for an analyzer result"""
+
+    summary: str
+    confidence: float = 0.5
+    notes: str | None = None
+    steps: list[str] = Field(default_factory=list)
+    details: dict[str, int] = Field(default_factory=dict)
+
+
+@pytest.fixture
+def sample_result():
+    return SampleResult(
+        summary="Scale the data platform",
+        confidence=0.8,
+        steps=[f"step {index}" for index in range(200)],
+        details={"a": 1, "b": 2},
+    )
+
+
+class TestEncodeResult:
+    """Test suite for encode_result"""
+
+    def test_full_keeps_every_field(self, sample_result):
+        data = encode_result(sample_result)
+
+        assert data == sample_result.model_dump(mode="json")
+
+    def test_standard_drops_defaults_and_none(self):
+        data = encode_result(SampleResult(summary="Minimal"), verbosity="standard")
+
+        assert data == {"summary": "Minimal"}
+
+    def test_summary_keeps_scalars_and_counts(self, sample_result):
+        data = encode_result(sample_result, verbosity="summary")
+
+        assert data == {
+            "summary": "Scale the data platform",
+            "confidence": 0.8,
+            "counts": {"steps": 200, "details": 2},
+        }
+
+    def test_compression_respects_threshold(self, sample_result):
+        small = encode_result(sample_result, compress=True)
+        assert "encoding" not in small
+
+        envelope = encode_result(sample_result, compress=True, compression_threshold=64)
+        assert envelope["encoding"] == "gzip+base64"
+        assert envelope["original_size"] > len(envelope["data"])
+        assert decompress_payload(envelope) == sample_result.model_dump(mode="json")
+
+    def test_invalid_verbosity_rejected(self, sample_result):
+        with pytest.raises(ValueError):
+            encode_result(sample_result, verbosity="verbose")
+
+    def test_fields_projection(self, sample_result):
+        data = encode_result(sample_result, fields=["summary", "steps"], verbosity="summary")
+
+        assert data == {"summary": "Scale the data platform", "counts": {"steps": 200}}
+
+    def test_unknown_field_rejected(self, sample_result):
+        with pytest.raises(ValueError):
+            encode_result(sample_result, fields=["summary", "missing"])
+
+
+class TestToolResult:
+    """Test suite for pre-serialized MCP tool results"""
+
+    def test_text_and_structured_content_match(self, sample_result):
+        response = {"tool": "Sample", "analysis": encode_result(sample_result), "success": True}
+
+        result = tool_result(response)
+
+        assert result.structured_content == response
+        assert json.loads(result.content[0].text) == response
+
+    @pytest.mark.asyncio
+    async def test_fastmcp_passes_result_through(self):
+        mcp = FastMCP("test")
+
+        @mcp.tool()
+        async def sample() -> dict:
+            return tool_result({"label": "ünïcode", "success": True})
+
+        async with Client(mcp) as client:
+            result = await client.call_tool("sample", {})
+
+        assert result.content[0].text == '{"label":"ünïcode","success":true}'
+        assert result.structured_content == {"label": "ünïcode", "success": True}
+
+
+class TestPayloadHelpers:
+    """Test suite for summarize and the compression envelope"""
+
+    def test_summarize_without_collections(self):
+        assert summarize({"name": "x", "score": 1}) == {"name": "x", "score": 1}
+
+    def test_compress_round_trip(self):
+        data = {"items": list(range(10)), "label": "ünïcode"}
+
+        assert decompress_payload(compress_payload(data)) == data
+
+    def test_unknown_encoding_rejected(self):
+        with pytest.raises(ValueError):
+            decompress_payload({"encoding": "zstd", "data": ""})
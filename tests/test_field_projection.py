@@ -0,0 +1,138 @@
+"""Test result field projection through the MCP server."""
+
+import pytest
+from fastmcp import Client
+
+from pyclarity.server.mcp_server import create_server
+from pyclarity.tools.collaborative_reasoning import CollaborativeReasoningAnalyzer
+from pyclarity.tools.decision_framework import DecisionFrameworkAnalyzer
+from pyclarity.tools.sequential_readiness import SequentialReadinessAnalyzer
+from pyclarity.tools.structured_argumentation import StructuredArgumentationAnalyzer
+from pyclarity.tools.triple_constraint import TripleConstraintAnalyzer
+from pyclarity.tools.visual_reasoning import VisualReasoningAnalyzer
+
+CRITERIA = ["Cost", "Performance", "Reliability"]
+
+
+def decision_arguments(**overrides) -> dict:
+    arguments = {
+        "decision_problem": "Select the best hosting platform for our e-commerce workload",
+        "criteria": [{"name": name, "weight": 1 / 3, "type": "benefit"} for name in CRITERIA],
+        "options": [
+            {
+                "name": f"Option {index + 1}",
+                "scores": {name: ((index + offset) % 5) / 5 for offset, name in enumerate(CRITERIA)},
+            }
+            for index in range(4)
+        ],
+    }
+    arguments.update(overrides)
+    return arguments
+
+
+def fail(*args, **kwargs):
+    raise AssertionError("phase should not run")
+
+
+PROJECTED_TOOLS = [
+    (
+        "visual_reasoning",
+        {
+            "problem": "Map the request flow between the gateway and the services",
+            "visual_elements": [
+                {"id": "gateway", "type": "rectangle", "position": [0, 0], "size": [2, 1]},
+                {"id": "orders", "type": "rectangle", "position": [4, 0], "size": [2, 1]},
+                {"id": "billing", "type": "rectangle", "position": [4, 3], "size": [2, 1]},
+            ],
+        },
+        ["patterns_identified"],
+        VisualReasoningAnalyzer,
+        ["_analyze_diagram", "_solve_visually", "_calculate_confidence_scores"],
+    ),
+    (
+        "structured_argumentation",
+        {
+            "problem": "Remote work improves productivity",
+            "premises": [
+                "Employees save an hour a day because commutes disappear",
+                "Fewer office interruptions leave longer stretches of focused work",
+            ],
+        },
+        ["fallacy_summary"],
+        StructuredArgumentationAnalyzer,
+        ["_analyze_counterarguments", "_generate_improvement_roadmap"],
+    ),
+    (
+        "collaborative_reasoning",
+        {"problem": "Choose a rollout plan for the new billing system"},
+        ["stakeholder_buy_in_assessment"],
+        CollaborativeReasoningAnalyzer,
+        ["_generate_insights"],
+    ),
+    (
+        "triple_constraint_optimization",
+        {"scenario": "Ship the mobile app redesign before the holiday season", "random_seed": 7},
+        ["optimization_recommendations"],
+        TripleConstraintAnalyzer,
+        ["_visual_representation"],
+    ),
+    (
+        "sequential_readiness_assessment",
+        {
+            "scenario": "Migrate the data warehouse to a managed cloud service",
+            "what_if": {"Assessment": "ready"},
+        },
+        ["critical_path"],
+        SequentialReadinessAnalyzer,
+        ["_evaluate_what_if"],
+    ),
+]
+
+
+class TestFieldProjection:
+    """Test suite for the fields argument of MCP tools"""
+
+    @pytest.mark.asyncio
+    async def test_decision_framework_skips_unrequested_phases(self, monkeypatch):
+        monkeypatch.setattr(DecisionFrameworkAnalyzer, "_perform_sensitivity_analysis", fail)
+        monkeypatch.setattr(DecisionFrameworkAnalyzer, "_generate_monitoring_metrics", fail)
+
+        async with Client(create_server()) as client:
+            result = await client.call_tool(
+                "decision_framework",
+                decision_arguments(fields=["recommended_option", "option_rankings"]),
+            )
+
+        response = result.structured_content
+        assert response["success"], response.get("error")
+        assert response["methods_used"] == ["weighted_scoring"]
+        analysis = response["analysis"]
+        assert set(analysis) == {"recommended_option", "option_rankings"}
+        assert analysis["recommended_option"] == analysis["option_rankings"][0]["option"]
+
+    @pytest.mark.asyncio
+    async def test_decision_framework_returns_full_result_by_default(self):
+        async with Client(create_server()) as client:
+            result = await client.call_tool("decision_framework", decision_arguments())
+
+        response = result.structured_content
+        assert response["success"], response.get("error")
+        assert response["analysis"]["decision_rationale"]
+        assert response["analysis"]["monitoring_metrics"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("tool", "arguments", "fields", "analyzer_class", "skipped"), PROJECTED_TOOLS
+    )
+    async def test_tool_skips_unrequested_phases(
+        self, monkeypatch, tool, arguments, fields, analyzer_class, skipped
+    ):
+        for method in skipped:
+            monkeypatch.setattr(analyzer_class, method, fail)
+
+        async with Client(create_server()) as client:
+            result = await client.call_tool(tool, {**arguments, "fields": fields})
+
+        response = result.structured_content
+        assert response["success"], response.get("error")
+        assert set(response["analysis"]) == set(fields)
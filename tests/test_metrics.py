@@ -0,0 +1,89 @@
+"""Test the server metrics recorded around tool handlers."""
+
+import asyncio
+
+import pytest
+from fastmcp import Client
+
+from pyclarity.server.mcp_server import create_server
+from pyclarity.server.metrics import ServerMetrics
+from pyclarity.server.tool_handlers import CognitiveToolHandler
+
+
+class TestServerMetrics:
+    """Test suite for per-tool counters, gauges and histograms"""
+
+    @pytest.mark.asyncio
+    async def test_calls_are_counted_by_outcome(self):
+        metrics = ServerMetrics(loop_lag_interval=None)
+        seen_in_flight = []
+
+        async def handler(succeed: bool | None) -> dict:
+            seen_in_flight.append(metrics.in_flight("tool"))
+            if succeed is None:
+                raise RuntimeError("handler crashed")
+            return {"success": succeed}
+
+        measured = metrics.instrument("tool", handler)
+        await measured(True)
+        await measured(True)
+        await measured(False)
+        with pytest.raises(RuntimeError):
+            await measured(None)
+
+        assert seen_in_flight == [1, 1, 1, 1]
+        assert metrics.in_flight("tool") == 0
+        assert metrics.requests("tool") == 2
+        assert metrics.requests("tool", "error") == 2
+        assert metrics.latency("tool").count == 4
+
+    @pytest.mark.asyncio
+    async def test_render_uses_prometheus_text_format(self):
+        metrics = ServerMetrics(loop_lag_interval=None)
+
+        async def handler() -> dict:
+            return {"success": True}
+
+        await metrics.instrument('odd "tool"\n', handler)()
+        text = metrics.render()
+
+        assert 'pyclarity_tool_requests_total{tool="odd \\"tool\\"\\n",outcome="success"} 1' in text
+        assert 'pyclarity_tool_duration_seconds_bucket{tool="odd \\"tool\\"\\n",le="+Inf"} 1' in text
+        assert "# TYPE pyclarity_tool_duration_seconds histogram" in text
+        assert 'pyclarity_cache_hits_total{cache="problem_decompositions"}' in text
+        assert "pyclarity_event_loop_lag_seconds_count 0" in text
+
+    @pytest.mark.asyncio
+    async def test_event_loop_lag_is_probed_once_serving(self):
+        metrics = ServerMetrics(loop_lag_interval=0.01)
+
+        async def handler() -> dict:
+            return {"success": True}
+
+        await metrics.instrument("tool", handler)()
+        await asyncio.sleep(0.05)
+        metrics._lag_task.cancel()
+
+        assert "pyclarity_event_loop_lag_seconds_count 0" not in metrics.render()
+
+    @pytest.mark.asyncio
+    async def test_handler_records_every_tool(self):
+        metrics = ServerMetrics(loop_lag_interval=None)
+        handler = CognitiveToolHandler(metrics=metrics)
+
+        response = await handler.handle_triple_constraint(scenario="Ship the MVP this quarter")
+        await handler.handle_metacognitive_stream("stream", "As expected, it works")
+
+        assert response["success"]
+        assert metrics.requests("triple_constraint") == 1
+        assert metrics.requests("metacognitive_stream") == 1
+
+    @pytest.mark.asyncio
+    async def test_metrics_resource_for_stdio_clients(self):
+        async with Client(create_server()) as client:
+            await client.call_tool(
+                "metacognitive_stream", {"stream_id": "s", "chunk": "As expected", "finish": True}
+            )
+            contents = await client.read_resource("pyclarity://metrics")
+
+        assert 'pyclarity_tool_requests_total{tool="metacognitive_stream",outcome="success"} 1' in contents[0].text
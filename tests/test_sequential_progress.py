@@ -0,0 +1,56 @@
+"""Test progress streaming of sequential thinking through the handler and MCP server."""
+
+import pytest
+from fastmcp import Client
+
+from pyclarity.server.mcp_server import create_server
+from pyclarity.server.tool_handlers import CognitiveToolHandler
+from pyclarity.tools.sequential_thinking.models import ThoughtEventType
+
+PROBLEM = "How should we migrate a monolith to services without downtime?"
+
+
+class TestSequentialProgress:
+    """Test suite for streamed step, branch and revision events"""
+
+    @pytest.mark.asyncio
+    async def test_default_strategy_is_valid(self):
+        handler = CognitiveToolHandler()
+
+        response = await handler.handle_sequential_thinking(problem=PROBLEM)
+
+        assert response["success"], response.get("error")
+
+    @pytest.mark.asyncio
+    async def test_handler_forwards_events_before_result(self):
+        handler = CognitiveToolHandler()
+        events = []
+
+        async def on_event(event) -> None:
+            events.append(event)
+
+        response = await handler.handle_sequential_thinking(problem=PROBLEM, on_event=on_event)
+
+        assert response["success"], response.get("error")
+        assert events
+        assert all(event.event_type != ThoughtEventType.RESULT for event in events)
+        assert [event.sequence for event in events] == list(range(len(events)))
+        steps = [event for event in events if event.event_type == ThoughtEventType.STEP]
+        assert len(steps) == len(response["analysis"]["reasoning_chain"])
+
+    @pytest.mark.asyncio
+    async def test_mcp_client_receives_progress(self):
+        notifications = []
+
+        async def progress_handler(progress: float, total: float | None, message: str | None):
+            notifications.append((progress, message))
+
+        async with Client(create_server(), progress_handler=progress_handler) as client:
+            result = await client.call_tool("sequential_thinking", {"problem": PROBLEM})
+
+        assert result.structured_content["success"]
+        assert notifications
+        assert [progress for progress, _ in notifications] == list(
+            range(1, len(notifications) + 1)
+        )
+        assert all(message for _, message in notifications)
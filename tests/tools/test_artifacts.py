@@ -0,0 +1,42 @@
+"""Test the allowlisted root for client-supplied artifact paths."""
+
+import os
+
+import pytest
+
+from pyclarity.tools.artifacts import artifact_root, resolve_artifact_path
+
+
+@pytest.fixture
+def root(tmp_path, monkeypatch):
+    directory = tmp_path / "artifacts"
+    (directory / "logs").mkdir(parents=True)
+    monkeypatch.setenv("PYCLARITY_ARTIFACT_ROOT", str(directory))
+    return directory.resolve()
+
+
+class TestArtifactPaths:
+    """Test suite for resolving paths inside the artifact root"""
+
+    def test_paths_inside_root_are_resolved(self, root):
+        assert resolve_artifact_path(root / "logs" / "api.log") == str(root / "logs" / "api.log")
+        assert resolve_artifact_path("logs/api.log") == str(root / "logs" / "api.log")
+        assert resolve_artifact_path(".") == str(root)
+
+    @pytest.mark.parametrize("path", ["/etc/passwd", "../secrets.txt", "logs/../../secrets.txt"])
+    def test_paths_outside_root_are_rejected(self, root, path):
+        with pytest.raises(ValueError, match="outside the artifact root"):
+            resolve_artifact_path(path)
+
+    def test_symlinks_out_of_root_are_rejected(self, root, tmp_path):
+        (tmp_path / "secrets.txt").write_text("token")
+        os.symlink(tmp_path / "secrets.txt", root / "logs" / "link.log")
+
+        with pytest.raises(ValueError, match="outside the artifact root"):
+            resolve_artifact_path("logs/link.log")
+
+    def test_root_defaults_to_working_directory(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("PYCLARITY_ARTIFACT_ROOT", raising=False)
+        monkeypatch.chdir(tmp_path)
+
+        assert artifact_root() == tmp_path.resolve()
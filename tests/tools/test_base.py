@@ -0,0 +1,304 @@
+"""Test trusted model construction and boundary validation in tools.base."""
+
+import pytest
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
+
+from pyclarity.tools import base
+from pyclarity.tools.base import (
+    BaseCognitiveAnalyzer,
+    Histogram,
+    enable_phase_metrics,
+    phase_histograms,
+    project_fields,
+    record_phases,
+    request_seed,
+    requested_fields,
+    strict_validation,
+    timed_phase,
+    trusted_construct,
+    validated_dump,
+)
+from pyclarity.tools.metacognitive_monitoring import (
+    MetacognitiveMonitoringAnalyzer,
+    MetacognitiveMonitoringContext,
+)
+
+
+class Sample(BaseModel):
+    name: str = Field(..., min_length=3)
+    score: float = Field(0.5, ge=0.0, le=1.0)
+    tags: list[str] = Field(default_factory=list)
+
+    @field_validator("name")
+    @classmethod
+    def strip_name(cls, v):
+        return v.strip()
+
+
+class SampleWithTotal(BaseModel):
+    parts: list[int]
+    total: int = 0
+
+    @model_validator(mode="after")
+    def sum_parts(self):
+        self.total = sum(self.parts)
+        return self
+
+
+class SampleWithPrivate(BaseModel):
+    name: str
+    _cache: dict = PrivateAttr(default_factory=dict)
+
+
+class SampleGroup(BaseModel):
+    samples: list[Sample]
+    labels: dict[str, str] = Field(default_factory=dict)
+
+
+class PhasedAnalyzer(BaseCognitiveAnalyzer):
+    phase_dependencies = {
+        "summary": ("details",),
+        "details": ("raw",),
+        "raw": (),
+        "extras": (),
+    }
+
+    async def analyze(self, context):
+        return {phase: self.needs_phase(phase) for phase in self.phase_dependencies}
+
+
+class TestTrustedConstruct:
+    """Test suite for trusted_construct"""
+
+    def test_skips_validation_and_applies_defaults(self):
+        first = trusted_construct(Sample, name="  ab ")
+        second = trusted_construct(Sample, name="valid name")
+
+        assert first.name == "  ab "
+        assert first.score == 0.5
+        assert first.tags == []
+        assert first.tags is not second.tags
+        assert first.model_fields_set == {"name"}
+
+    def test_matches_validated_construction(self):
+        values = {"name": "valid name", "score": 0.75, "tags": ["a"]}
+
+        assert trusted_construct(Sample, **values) == Sample(**values)
+
+    def test_strict_mode_validates(self):
+        with strict_validation():
+            with pytest.raises(ValidationError):
+                trusted_construct(Sample, name="ab")
+            assert trusted_construct(Sample, name=" padded ").name == "padded"
+
+    def test_after_validators_fill_derived_fields(self):
+        model = trusted_construct(SampleWithTotal, parts=[1, 2, 3])
+
+        assert model.total == 6
+        assert model == SampleWithTotal(parts=[1, 2, 3])
+
+    def test_private_attributes_fall_back_to_model_construct(self):
+        model = trusted_construct(SampleWithPrivate, name="x")
+
+        assert model.name == "x"
+        assert model._cache == {}
+
+
+class TestValidatedDump:
+    """Test suite for validated_dump"""
+
+    def test_returns_plain_dict(self):
+        model = trusted_construct(Sample, name="valid name", tags=["a"])
+
+        assert validated_dump(model) == {"name": "valid name", "score": 0.5, "tags": ["a"]}
+
+    def test_rejects_invalid_trusted_model(self):
+        model = trusted_construct(Sample, name="valid name", score=3.0)
+
+        with pytest.raises(ValidationError):
+            validated_dump(model)
+
+    def test_projected_dump_validates_whole_model(self):
+        model = trusted_construct(Sample, name="valid name", score=3.0)
+
+        with pytest.raises(ValidationError):
+            validated_dump(model, include={"name"})
+        assert validated_dump(Sample(name="valid name"), include={"name"}) == {"name": "valid name"}
+
+    def test_model_is_dumped_once(self, monkeypatch):
+        model = trusted_construct(Sample, name="valid name")
+        dumps = []
+        original = Sample.model_dump
+
+        def counting_dump(self, **options):
+            dumps.append(options)
+            return original(self, **options)
+
+        monkeypatch.setattr(Sample, "model_dump", counting_dump)
+
+        assert validated_dump(model, include={"score"}, mode="json") == {"score": 0.5}
+        assert dumps == [{"mode": "json"}]
+
+    def test_rejects_invalid_nested_trusted_model(self):
+        group = SampleGroup(samples=[trusted_construct(Sample, name="valid name", score=3.0)])
+
+        with pytest.raises(ValidationError):
+            validated_dump(group)
+
+    def test_checks_only_trusted_models(self, monkeypatch):
+        validated = []
+        original = Sample.model_validate.__func__
+
+        def counting_validate(cls, data, **options):
+            validated.append(data["name"])
+            return original(cls, data, **options)
+
+        monkeypatch.setattr(Sample, "model_validate", classmethod(counting_validate))
+        group = SampleGroup(
+            samples=[Sample(name="built normally"), trusted_construct(Sample, name="trusted")]
+        )
+
+        validated_dump(group)
+        validated_dump(group)
+
+        assert validated == ["trusted"]
+
+    def test_strict_models_are_not_checked_again(self):
+        with strict_validation():
+            model = trusted_construct(Sample, name="valid name")
+        object.__setattr__(model, "score", 3.0)
+
+        assert validated_dump(model)["score"] == 3.0
+
+
+class TestFieldProjection:
+    """Test suite for project_fields and phase dependencies"""
+
+    @pytest.mark.asyncio
+    async def test_all_phases_run_without_projection(self):
+        assert requested_fields() is None
+        assert all((await PhasedAnalyzer().analyze(None)).values())
+
+    @pytest.mark.asyncio
+    async def test_projection_runs_transitive_dependencies_only(self):
+        with project_fields(["summary"]):
+            assert requested_fields() == {"summary"}
+            phases = await PhasedAnalyzer().analyze(None)
+
+        assert phases == {"summary": True, "details": True, "raw": True, "extras": False}
+        assert requested_fields() is None
+
+    def test_unknown_fields_are_rejected_before_analysis(self):
+        with pytest.raises(ValueError, match="Unknown result fields: missing"):
+            with project_fields(["name", "missing"], Sample):
+                pytest.fail("projection should not start")
+
+        assert requested_fields() is None
+
+
+class SeededSample(BaseModel):
+    problem: str
+    random_seed: int | None = None
+
+
+class TestRequestRandomness:
+    """Test suite for per-request seeded randomness"""
+
+    def test_seed_is_derived_from_the_input(self):
+        assert request_seed(Sample(name="same input")) == request_seed(Sample(name="same input"))
+        assert request_seed(Sample(name="same input")) != request_seed(Sample(name="other input"))
+        assert request_seed(SeededSample(problem="anything", random_seed=7)) == 7
+
+    def test_request_rng_is_private_and_reproducible(self):
+        analyzer = PhasedAnalyzer()
+        context = SeededSample(problem="reproducible")
+
+        first, second = analyzer.request_rng(context), analyzer.request_rng(context)
+
+        assert first is not second
+        assert [first.random() for _ in range(3)] == [second.random() for _ in range(3)]
+
+    @pytest.mark.asyncio
+    async def test_identical_inputs_give_identical_results(self):
+        analyzer = MetacognitiveMonitoringAnalyzer()
+        context = MetacognitiveMonitoringContext(
+            reasoning_target="We should clearly ship the initial plan this week."
+        )
+        volatile = {"reasoning_monitors", "monitoring_duration_seconds", "processing_time_ms"}
+
+        first = (await analyzer.analyze(context)).model_dump(exclude=volatile)
+        second = (await analyzer.analyze(context)).model_dump(exclude=volatile)
+        reseeded = (await analyzer.analyze(context.model_copy(update={"random_seed": 1}))).model_dump(exclude=volatile)
+
+        assert first == second
+        assert first != reseeded
+
+
+class TimedAnalyzer(BaseCognitiveAnalyzer):
+    def __init__(self):
+        super().__init__(tool_name="Timed")
+
+    @timed_phase
+    def _prepare(self, value):
+        return value + 1
+
+    @timed_phase
+    async def _score(self, value):
+        return value * 2
+
+    async def analyze(self, context):
+        with self.phase("total"):
+            return await self._score(self._prepare(self._prepare(context)))
+
+
+class TestPhaseTiming:
+    """Test suite for phase spans, per-call timings and histograms"""
+
+    @pytest.fixture(autouse=True)
+    def isolated_metrics(self, monkeypatch):
+        monkeypatch.setattr(base, "_phase_metrics_enabled", False)
+        monkeypatch.setattr(base, "_phase_histograms", {})
+
+    @pytest.mark.asyncio
+    async def test_disabled_phases_run_untimed(self):
+        assert await TimedAnalyzer().analyze(1) == 6
+        assert phase_histograms() == {}
+
+    @pytest.mark.asyncio
+    async def test_record_phases_sums_repeats(self):
+        with record_phases() as timings:
+            assert await TimedAnalyzer().analyze(1) == 6
+
+        assert set(timings) == {"prepare", "score", "total"}
+        assert all(ms >= 0.0 for ms in timings.values())
+        assert timings["total"] >= timings["score"]
+        assert phase_histograms() == {}
+
+    @pytest.mark.asyncio
+    async def test_metrics_feed_histograms_per_tool(self):
+        enable_phase_metrics()
+        for value in range(3):
+            await TimedAnalyzer().analyze(value)
+
+        histograms = phase_histograms()
+        assert set(histograms) == {("Timed", "prepare"), ("Timed", "score"), ("Timed", "total")}
+        assert histograms[("Timed", "prepare")].count == 6
+        assert histograms[("Timed", "total")].count == 3
+
+    def test_histogram_buckets_and_quantiles(self):
+        histogram = Histogram(buckets=(1.0, 10.0, 100.0))
+        for value in (0.5, 1.0, 5.0, 5.0, 50.0, 500.0):
+            histogram.observe(value)
+
+        assert histogram.cumulative_counts() == [(1.0, 2), (10.0, 4), (100.0, 5), (float("inf"), 6)]
+        assert histogram.count == 6 and histogram.sum == 561.5
+        assert histogram.quantile(0.5) == 5.5
+        assert histogram.quantile(1.0) == 100.0
+        assert Histogram().quantile(0.5) == 0.0
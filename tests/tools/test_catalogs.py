@@ -0,0 +1,167 @@
+"""Test the compiled, memory-mapped knowledge catalogs shared by analyzers."""
+
+import json
+import mmap
+import os
+from pathlib import Path
+
+import pytest
+
+from pyclarity.tools import catalogs
+from pyclarity.tools.catalogs import (
+    Catalog,
+    CatalogView,
+    compile_catalog,
+    load_catalog,
+)
+from pyclarity.tools.debugging_approaches.analyzer import DebuggingApproachesAnalyzer
+from pyclarity.tools.debugging_approaches.models import DebuggingStrategy, ErrorCategory
+from pyclarity.tools.design_patterns.analyzer import DesignPatternsAnalyzer
+from pyclarity.tools.programming_paradigms.analyzer import ProgrammingParadigmsAnalyzer
+from pyclarity.tools.programming_paradigms.models import ParadigmProfile, ProgrammingParadigm
+from pyclarity.tools.structured_argumentation.analyzer import StructuredArgumentationAnalyzer
+from pyclarity.tools.structured_argumentation.models import LogicalFallacy
+
+ENTRIES = {
+    "alpha": {"weight": 0.5, "tags": ["first", "ünïcode"]},
+    "beta": {"weight": 2, "tags": []},
+    "gamma": None,
+}
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "compiled"
+    monkeypatch.setenv("PYCLARITY_CATALOG_DIR", str(directory))
+    return directory
+
+
+def write_source(path, entries=ENTRIES, version=1):
+    path.write_text(json.dumps({"catalog": "test", "version": version, "entries": entries}))
+    return path
+
+
+class TestCatalog:
+    """Test suite for compiling and opening catalogs"""
+
+    def test_round_trip_through_memory_map(self, tmp_path, cache_dir):
+        source = write_source(tmp_path / "things.json")
+
+        catalog = load_catalog(source)
+
+        assert dict(catalog) == ENTRIES
+        assert catalog.version == 1
+        assert isinstance(catalog._buffer, mmap.mmap)
+        (compiled,) = cache_dir.glob("things-*.bin")
+        assert compiled.read_bytes() == compile_catalog(source)
+        assert load_catalog(source) is catalog
+
+    def test_changed_source_is_recompiled(self, tmp_path, cache_dir):
+        source = write_source(tmp_path / "things.json")
+        load_catalog.__wrapped__(source)
+
+        write_source(source, {"alpha": {"weight": 1.0}}, version=2)
+        catalog = load_catalog.__wrapped__(source)
+
+        assert dict(catalog) == {"alpha": {"weight": 1.0}}
+        assert catalog.version == 2
+        assert len(list(cache_dir.glob("things-*.bin"))) == 1
+
+    def test_unchanged_source_is_only_stat(self, tmp_path, cache_dir, monkeypatch):
+        source = write_source(tmp_path / "things.json")
+        load_catalog.__wrapped__(source)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("source should not be read")
+
+        monkeypatch.setattr(Path, "read_bytes", fail)
+
+        assert dict(load_catalog.__wrapped__(source)) == ENTRIES
+
+    def test_touched_source_is_restamped_without_recompiling(self, tmp_path, cache_dir, monkeypatch):
+        source = write_source(tmp_path / "things.json")
+        first = load_catalog.__wrapped__(source)
+        os.utime(source, ns=(first.source_mtime_ns + 10**9, first.source_mtime_ns + 10**9))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("source should not be recompiled")
+
+        monkeypatch.setattr(catalogs, "_compile", fail)
+        catalog = load_catalog.__wrapped__(source)
+
+        assert dict(catalog) == ENTRIES
+        assert catalog.digest == first.digest
+        assert catalog.source_mtime_ns == source.stat().st_mtime_ns
+
+    def test_corrupt_compiled_file_is_replaced(self, tmp_path, cache_dir):
+        source = write_source(tmp_path / "things.json")
+        load_catalog.__wrapped__(source)
+        (compiled,) = cache_dir.glob("things-*.bin")
+        compiled.write_bytes(b"not a catalog")
+
+        assert dict(load_catalog.__wrapped__(source)) == ENTRIES
+
+    def test_unwritable_cache_falls_back_to_memory(self, tmp_path, monkeypatch):
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        monkeypatch.setenv("PYCLARITY_CATALOG_DIR", str(blocker / "compiled"))
+        source = write_source(tmp_path / "things.json")
+
+        catalog = load_catalog.__wrapped__(source)
+
+        assert dict(catalog) == ENTRIES
+        assert isinstance(catalog._buffer, bytes)
+
+    def test_invalid_sources_are_rejected(self, tmp_path):
+        source = tmp_path / "broken.json"
+        source.write_text(json.dumps({"version": 1, "entries": ["not", "a", "mapping"]}))
+        with pytest.raises(ValueError, match="entries"):
+            compile_catalog(source)
+
+        source.write_text(json.dumps({"entries": {}}))
+        with pytest.raises(ValueError, match="version"):
+            compile_catalog(source)
+
+        with pytest.raises(ValueError, match="format"):
+            Catalog(b"\0" * 64)
+
+    def test_view_decodes_each_entry_once(self, tmp_path):
+        catalog = Catalog(compile_catalog(write_source(tmp_path / "things.json")))
+        calls = []
+
+        def decode(value):
+            calls.append(value)
+            return value
+
+        view = CatalogView(catalog, str.upper, decode)
+
+        assert list(view) == ["ALPHA", "BETA", "GAMMA"]
+        assert view.decoded_count == 0
+        assert view["BETA"] is view["BETA"]
+        assert calls == [ENTRIES["beta"]]
+        assert "alpha" not in view
+
+
+class TestAnalyzerCatalogs:
+    """Test suite for the built-in catalogs of the analyzers"""
+
+    def test_catalogs_are_shared_between_analyzers(self):
+        assert ProgrammingParadigmsAnalyzer().paradigm_profiles is ProgrammingParadigmsAnalyzer().paradigm_profiles
+        assert DesignPatternsAnalyzer().pattern_index is DesignPatternsAnalyzer().pattern_index
+
+    def test_catalog_entries_are_typed(self):
+        profiles = ProgrammingParadigmsAnalyzer().paradigm_profiles
+        strategies = DebuggingApproachesAnalyzer().strategy_profiles
+        fallacies = StructuredArgumentationAnalyzer().fallacy_patterns
+
+        assert set(profiles) <= set(ProgrammingParadigm)
+        assert isinstance(profiles[ProgrammingParadigm.FUNCTIONAL], ParadigmProfile)
+        assert set(strategies) == set(DebuggingStrategy)
+        assert all(
+            isinstance(category, ErrorCategory)
+            for profile in strategies.values()
+            for category in profile["error_categories"]
+        )
+        assert set(fallacies) <= set(LogicalFallacy)
+        assert fallacies[LogicalFallacy.STRAW_MAN]["severity"] == "high"
+        assert len(DesignPatternsAnalyzer().pattern_catalog) == 6
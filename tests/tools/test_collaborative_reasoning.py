@@ -346,4 +346,46 @@ class TestCollaborativeReasoningAnalyzer:
         simple_args = sum(len(p.key_arguments) for p in simple_result.persona_perspectives)
         complex_args = sum(len(p.key_arguments) for p in complex_result.persona_perspectives)
         
-        assert complex_args >= simple_args
\ No newline at end of file
+        assert complex_args >= simple_args
+
+class TestDialogueEngine:
+    """Test suite for the round-based dialogue engine"""
+
+    async def test_dialogue_stops_on_convergence(self, collaborative_analyzer, simple_context):
+        """Test dialogue ends once rounds stop changing positions"""
+        simple_context.allow_persona_evolution = False
+        simple_context.max_dialogue_rounds = 6
+
+        result = await collaborative_analyzer.analyze(simple_context)
+
+        assert len(result.dialogue_records) == 2
+
+    async def test_dialogue_runs_all_rounds_without_early_stop(self, collaborative_analyzer, simple_context):
+        """Test convergence stopping can be disabled"""
+        simple_context.allow_persona_evolution = False
+        simple_context.stop_on_convergence = False
+        simple_context.max_dialogue_rounds = 4
+
+        result = await collaborative_analyzer.analyze(simple_context)
+
+        assert len(result.dialogue_records) == 4
+
+    async def test_backend_serves_each_round_in_one_call(self, simple_context):
+        """Test a dialogue backend is called once per round for all personas"""
+        calls = []
+
+        class RecordingBackend:
+            async def generate_round_messages(self, perspectives, round_num, context):
+                calls.append((round_num, len(perspectives)))
+                return [f"{p.persona_name} speaks in round {round_num + 1}" for p in perspectives]
+
+        simple_context.max_dialogue_rounds = 3
+        simple_context.stop_on_convergence = False
+        analyzer = CollaborativeReasoningAnalyzer(dialogue_backend=RecordingBackend())
+
+        result = await analyzer.analyze(simple_context)
+
+        assert calls == [(0, 3), (1, 3), (2, 3)]
+        first_round = result.dialogue_records[0]
+        assert first_round.exchanges[0]["message"] == "Data Analyst speaks in round 1"
+        assert len({exchange["timestamp"] for exchange in first_round.exchanges}) == 1
@@ -0,0 +1,162 @@
+"""Test Debugging Approaches cognitive tool.
+
+Adapted to match the actual PyClarity implementation.
+"""
+
+import pytest
+
+from pyclarity.tools.debugging_approaches import (
+    DebuggingApproachesAnalyzer,
+    DebuggingApproachesContext,
+    ErrorCategory,
+    LogScanner,
+    scan_logs,
+)
+from pyclarity.tools.debugging_approaches.logs import mask_message, normalize_frame
+
+
+def python_trace(timestamp, line, order_id):
+    return [
+        f"{timestamp} ERROR [worker-{line % 4}] app.views: checkout failed for order {order_id}",
+        "Traceback (most recent call last):",
+        f'  File "/srv/app/views.py", line {line}, in checkout',
+        "    total = pricing.total(cart)",
+        f'  File "/srv/app/pricing.py", line {line + 7}, in total',
+        "    return sum(item.price for item in cart.items)",
+        f"AttributeError: 'NoneType' object has no attribute 'price' (order {order_id})",
+    ]
+
+
+def java_trace(timestamp, line):
+    return [
+        f"{timestamp} WARN com.shop.Api: request failed",
+        'java.lang.NullPointerException: Cannot invoke "Order.id()" because "o" is null',
+        f"\tat com.shop.OrderService.place(OrderService.java:{line})",
+        f"\tat com.shop.Api.lambda$post${line % 3}(Api.java:{line + 10})",
+        "Caused by: java.lang.IllegalStateException: cart closed",
+        "\t... 12 more",
+    ]
+
+
+def make_log(repeats=30):
+    lines = []
+    for i in range(repeats):
+        timestamp = f"2024-05-01 10:{i:02d}:00,000"
+        lines.append(f"{timestamp} INFO app: handled request {i} in {i + 3}ms")
+        lines.extend(python_trace(timestamp, 40 + i, 1000 + i))
+        if i % 3 == 0:
+            lines.extend(java_trace(timestamp, 20 + i))
+        if i % 2 == 0:
+            lines.append(f"{timestamp} ERROR db.pool: Connection to 10.0.0.{i % 9}:5432 timed out after {100 + i}ms")
+    return lines
+
+
+class TestLogScanner:
+    """Test suite for single-pass log ingestion"""
+
+    def test_signatures_and_frames_are_normalized(self):
+        assert mask_message("timed out after 503ms for '3f2a' at 0x7ffe12") == mask_message(
+            "timed out after 1200ms for 'b9' at 0xdeadbeef"
+        )
+        assert normalize_frame("com.shop.Api.lambda$post$3(Api.java:42)") == "com.shop.Api.lambda$post$N(Api.java)"
+        assert normalize_frame("handler (/app/server.js:10:5)") == "handler (/app/server.js)"
+
+    def test_stack_traces_cluster_by_fingerprint(self):
+        scanner = LogScanner()
+        scanner.feed(make_log())
+
+        digest = scanner.digest()
+        by_type = {c.exception_type: c for c in digest.clusters}
+
+        assert digest.stack_traces == 40
+        # The error line before each traceback belongs to the trace
+        assert digest.error_events == 55
+        python = by_type["AttributeError"]
+        assert python.count == 30
+        assert python.frames == ["app.pricing.total", "app.views.checkout"]
+        assert python.first_seen == "2024-05-01 10:00:00,000"
+        assert python.last_seen == "2024-05-01 10:29:00,000"
+        assert python.first_location == "<stream>:2"
+        java = by_type["java.lang.NullPointerException"]
+        assert java.count == 10
+        assert java.frames[0] == "com.shop.OrderService.place(OrderService.java)"
+        timeouts = [c for c in digest.clusters if c.kind == "error"]
+        assert len(timeouts) == 1 and timeouts[0].count == 15
+        assert digest.clusters[0] is python
+
+    def test_memory_is_bounded(self):
+        scanner = LogScanner(max_clusters=8)
+        lines = []
+        for i in range(2000):
+            lines.append(f"ERROR unique failure {'x' * (i % 50)}{chr(65 + i % 26)} variant")
+            lines.append("ERROR disk full on /var/lib/data")
+        scanner.feed(lines)
+
+        digest = scanner.digest(limit=3)
+
+        assert digest.tracked_clusters == 8
+        assert digest.evicted_clusters > 0
+        top = digest.clusters[0]
+        assert top.signature == "ERROR disk full on /var/lib/data"
+        assert top.count - top.error_bound <= 2000 <= top.count
+
+    def test_memory_mapped_file_matches_line_stream(self, tmp_path):
+        path = tmp_path / "app.log"
+        path.write_text("\n".join(make_log()))
+
+        digest = scan_logs([path], limit=5)
+        scanner = LogScanner()
+        scanner.feed(path.read_bytes().splitlines(keepends=True), source=str(path))
+
+        assert digest == scanner.digest(limit=5)
+        assert digest.lines_scanned == len(make_log())
+        assert digest.bytes_scanned == path.stat().st_size
+
+    def test_missing_file_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="not found"):
+            scan_logs([tmp_path / "missing.log"])
+
+
+class TestDebuggingApproachesAnalyzer:
+    """Test suite for log-driven debugging analysis"""
+
+    @pytest.mark.asyncio
+    async def test_logs_feed_classification_and_hypotheses(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PYCLARITY_ARTIFACT_ROOT", str(tmp_path))
+        path = tmp_path / "api.log"
+        path.write_text("\n".join(line for i in range(12) for line in java_trace(f"2024-05-01 11:{i:02d}:00", i)))
+        context = DebuggingApproachesContext(
+            problem_description="Order placement fails for some customers after the release",
+            system_context="Java order service behind a public REST API",
+            log_paths=[str(path)],
+            max_log_clusters=3,
+        )
+
+        result = await DebuggingApproachesAnalyzer().analyze(context)
+
+        classification = result.error_classification
+        assert result.log_digest.stack_traces == 12
+        assert classification.error_category == ErrorCategory.RUNTIME_ERROR
+        assert classification.error_message.startswith("java.lang.NullPointerException")
+        assert classification.stack_trace.startswith("com.shop.OrderService.place")
+        assert classification.frequency == "frequent"
+        hypothesis = result.debugging_session.hypotheses[0]
+        assert "com.shop.OrderService.place" in hypothesis.description
+        assert hypothesis.supporting_evidence[0].startswith("12 occurrences (100% of logged errors)")
+
+    def test_symptoms_or_logs_are_required(self):
+        with pytest.raises(ValueError, match="symptom or log path"):
+            DebuggingApproachesContext(
+                problem_description="Order placement fails for some customers",
+                system_context="Java order service behind a public REST API",
+            )
+
+    def test_log_paths_outside_artifact_root_are_rejected(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PYCLARITY_ARTIFACT_ROOT", str(tmp_path / "logs"))
+
+        with pytest.raises(ValueError, match="outside the artifact root"):
+            DebuggingApproachesContext(
+                problem_description="Order placement fails for some customers after the release",
+                system_context="Java order service behind a public REST API",
+                log_paths=["/etc/passwd"],
+            )
@@ -23,6 +23,7 @@ from pyclarity.tools.decision_framework.models import (
     ComplexityLevel
 )
 from pyclarity.tools.decision_framework.analyzer import DecisionFrameworkAnalyzer
+from pyclarity.tools.base import project_fields
 
 
 # ============================================================================
@@ -548,4 +549,58 @@ class TestDecisionFrameworkAnalyzer:
         result = await decision_analyzer.analyze(context)
         
         # Should complete successfully with normalized weights
-        assert result.recommended_option is not None
\ No newline at end of file
+        assert result.recommended_option is not None
+
+# ============================================================================
+# Field Projection Tests
+# ============================================================================
+
+class TestFieldProjection:
+    """Test that field projections skip unrequested analysis phases"""
+
+    @pytest.fixture
+    def projection_context(self):
+        names = ["Cost", "Performance", "Reliability"]
+        return DecisionFrameworkContext(
+            problem="Select the best hosting platform for our e-commerce workload",
+            criteria=[
+                DecisionCriteria(name=name, weight=1 / 3, criteria_type=CriteriaType.BENEFIT)
+                for name in names
+            ],
+            options=[
+                DecisionOption(
+                    name=f"Option {index + 1}",
+                    scores={name: ((index + offset) % 5) / 5 for offset, name in enumerate(names)},
+                    risks=["Vendor lock-in"],
+                )
+                for index in range(4)
+            ],
+            include_sensitivity_analysis=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_unrequested_phases_are_skipped(self, decision_analyzer, projection_context, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("phase should not run")
+
+        monkeypatch.setattr(decision_analyzer, "_perform_sensitivity_analysis", fail)
+        monkeypatch.setattr(decision_analyzer, "_generate_monitoring_metrics", fail)
+
+        with project_fields(["recommended_option", "option_rankings", "key_insights"]):
+            result = await decision_analyzer.analyze(projection_context)
+
+        assert result.recommended_option == result.option_rankings[0]["option"]
+        assert result.key_insights
+        assert result.risk_assessments  # key_insights depends on the risk phase
+        assert result.decision_rationale  # required fields are always computed
+        assert result.monitoring_metrics is None
+        assert result.sensitivity_analysis is None
+        assert result.confidence_factors is None
+
+    @pytest.mark.asyncio
+    async def test_full_result_without_projection(self, decision_analyzer, projection_context):
+        result = await decision_analyzer.analyze(projection_context)
+
+        assert result.decision_rationale
+        assert result.sensitivity_analysis is not None
+        assert result.confidence_factors
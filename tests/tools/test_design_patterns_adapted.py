@@ -0,0 +1,179 @@
+"""Test Design Patterns cognitive tool.
+
+Adapted to match the actual PyClarity implementation.
+"""
+
+import json
+
+import pytest
+
+from pyclarity.server.tool_handlers import CognitiveToolHandler
+from pyclarity.tools.base import project_fields
+from pyclarity.tools.design_patterns import (
+    DesignPattern,
+    DesignPatternsAnalyzer,
+    DesignPatternsContext,
+    PatternCategory,
+    PatternComplexity,
+    PatternIndex,
+    load_pattern_catalog,
+)
+from pyclarity.tools.design_patterns.index import index_terms, normalize_term
+
+
+def make_pattern(pattern_id, name, intent, applicability=(), category=PatternCategory.ENTERPRISE):
+    return DesignPattern(
+        pattern_id=pattern_id,
+        name=name,
+        category=category,
+        description=f"{name} pattern for distributed enterprise systems",
+        intent=intent,
+        applicability=list(applicability),
+        complexity=PatternComplexity.MEDIUM,
+    )
+
+
+class TestPatternIndex:
+    """Test suite for the inverted pattern index"""
+
+    def test_terms_are_normalized(self):
+        assert normalize_term("creating") == normalize_term("creates") == normalize_term("create")
+        assert normalize_term("classes") == normalize_term("class") == "class"
+        assert index_terms("How should we notify the Observers?") == ["notify", "observ"]
+        assert index_terms("Beobachter benachrichtigen 观察者") == ["beobacht", "benachrichtigen", "观察者"]
+
+    def test_builtin_catalog_ranking(self):
+        index = DesignPatternsAnalyzer().pattern_index
+
+        assert index.search("Swap algorithms at runtime and avoid conditionals")[0][0] == "strategy"
+        assert index.search("Legacy class with an incompatible interface")[0][0] == "adapter"
+        assert index.search("Notify dependents when state changes")[0][0] == "observer"
+        assert index.search("zebra quantum") == []
+
+    def test_fit_is_bounded_and_sorted(self):
+        results = DesignPatternsAnalyzer().pattern_index.search(
+            "Create objects and notify observers through an adapter interface"
+        )
+
+        fits = [fit for _, fit in results]
+        assert fits == sorted(fits, reverse=True)
+        assert all(0.0 < fit < 1.0 for fit in fits)
+
+    def test_large_catalog_query_cost(self):
+        patterns = [
+            make_pattern(
+                f"pattern_{i}",
+                f"Enterprise Pattern {i}",
+                f"Coordinate workload {i} across regional clusters and queues",
+                [f"Capability {i} required"],
+            )
+            for i in range(2000)
+        ]
+        patterns.append(make_pattern(
+            "circuit_breaker",
+            "Circuit Breaker",
+            "Stop calling a failing remote service until it recovers",
+            ["Remote calls can fail", "Cascading failures"],
+        ))
+        index = PatternIndex(patterns)
+
+        results = index.search("Cascading failures when a remote service is failing", limit=5)
+
+        assert len(index) == 2001
+        assert results[0][0] == "circuit_breaker"
+
+
+class TestExternalCatalogs:
+    """Test suite for loading pattern catalogs from files"""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PYCLARITY_CATALOG_DIR", str(tmp_path / "compiled"))
+
+    def test_external_patterns_are_indexed(self, tmp_path):
+        catalog = tmp_path / "cloud.json"
+        patterns = [
+            make_pattern(
+                "circuit_breaker",
+                "Circuit Breaker",
+                "Stop calling a failing remote service until it recovers",
+                ["Remote calls can fail", "Cascading failures"],
+            ),
+            make_pattern(
+                "strategy",
+                "Strategy",
+                "Choose a pricing policy per tenant at runtime",
+                category=PatternCategory.BEHAVIORAL,
+            ),
+        ]
+        catalog.write_text(json.dumps({
+            "catalog": "cloud",
+            "version": 1,
+            "entries": {pattern.pattern_id: pattern.model_dump(mode="json") for pattern in patterns},
+        }))
+
+        analyzer = DesignPatternsAnalyzer(catalog_paths=[catalog])
+
+        assert len(analyzer.pattern_catalog) == 7
+        assert analyzer.pattern_catalog["strategy"].intent.startswith("Choose a pricing")
+        assert analyzer.pattern_index.search("Cascading failures in remote calls")[0][0] == "circuit_breaker"
+
+    def test_invalid_catalog_is_rejected(self, tmp_path):
+        catalog = tmp_path / "broken.json"
+        catalog.write_text(json.dumps({"patterns": [{"name": "unversioned"}]}))
+
+        with pytest.raises(ValueError, match="'entries' object"):
+            load_pattern_catalog(catalog)
+
+    @pytest.mark.asyncio
+    async def test_recommendations_use_the_index(self):
+        context = DesignPatternsContext(
+            problem="Checkout must swap pricing algorithms at runtime without conditionals",
+            system_description="Order service with many pricing rules per market",
+            requirements=["Runtime algorithm selection"],
+            max_recommendations=2,
+        )
+
+        result = await DesignPatternsAnalyzer().analyze(context)
+
+        assert result.top_recommended_pattern == "Strategy"
+        assert result.pattern_recommendations[0].fit_score > 0.6
+        assert result.pattern_catalog_size == 6
+
+    @pytest.mark.asyncio
+    async def test_unrequested_sections_are_skipped(self, monkeypatch):
+        analyzer = DesignPatternsAnalyzer()
+        context = DesignPatternsContext(
+            problem="Checkout must swap pricing algorithms at runtime without conditionals",
+            system_description="Order service with many pricing rules per market",
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("phase should not run")
+
+        monkeypatch.setattr(analyzer, "_analyze_pattern_combinations", fail)
+        monkeypatch.setattr(analyzer, "_generate_improvement_suggestions", fail)
+
+        with project_fields(["top_recommended_pattern", "architectural_decisions"]):
+            result = await analyzer.analyze(context)
+
+        assert result.top_recommended_pattern == "Strategy"
+        assert result.architectural_decisions
+        assert not result.pattern_combinations
+        assert not result.improvement_suggestions
+
+    @pytest.mark.asyncio
+    async def test_unknown_field_fails_before_analysis(self, monkeypatch):
+        handler = CognitiveToolHandler()
+
+        async def fail(context):
+            raise AssertionError("analysis should not run")
+
+        monkeypatch.setattr(handler.analyzers["design_patterns"], "analyze", fail)
+
+        response = await handler.handle_design_patterns(
+            problem="Swap pricing algorithms at runtime", fields=["top_recommended_pattern", "missing"]
+        )
+
+        assert not response["success"]
+        assert response["error"] == "Unknown result fields: missing"
@@ -33,6 +33,7 @@ from pyclarity.tools.impact_propagation.models import (
     ComplexityLevel
 )
 from pyclarity.tools.impact_propagation.analyzer import ImpactPropagationAnalyzer
+from pyclarity.tools.base import project_fields
 
 
 @pytest.fixture
@@ -437,6 +438,25 @@ class TestImpactPropagationAnalyzer:
             assert isinstance(result.visualization_data["nodes"], list)
             assert isinstance(result.visualization_data["edges"], list)
 
+    async def test_field_projection_skips_unrequested_phases(self, impact_analyzer, monkeypatch):
+        """Test that projected fields skip the timeline and visualization phases"""
+        def fail(*args, **kwargs):
+            raise AssertionError("phase should not run")
+
+        monkeypatch.setattr(impact_analyzer, "_project_timeline", fail)
+        monkeypatch.setattr(impact_analyzer, "_generate_visualization_data", fail)
+        context = ImpactPropagationContext(
+            scenario="Network topology change affecting data flow",
+            analysis_depth=3
+        )
+
+        with project_fields(["key_insights"], ImpactPropagationResult):
+            result = await impact_analyzer.analyze(context)
+
+        assert result.key_insights
+        assert result.timeline_projection == {}
+        assert result.visualization_data is None
+
 
 async def test_full_workflow_integration(self, impact_analyzer):
         """Test complete impact propagation workflow"""
@@ -0,0 +1,261 @@
+"""Test Iterative Validation cognitive tool.
+
+Adapted to match the actual PyClarity implementation.
+"""
+
+import asyncio
+
+import pytest
+
+from pyclarity.server.tool_handlers import CognitiveToolHandler
+from pyclarity.tools.iterative_validation.analyzer import IterativeValidationAnalyzer
+from pyclarity.tools.iterative_validation.models import (
+    ComplexityLevel,
+    ConfidenceLevel,
+    IterativeValidationContext,
+)
+from pyclarity.tools.iterative_validation.sessions import (
+    InMemoryValidationSessionStore,
+    SQLiteValidationSessionStore,
+)
+
+
+class TestValidationCycleEngine:
+    """Test suite for early stopping, candidate search and resumption"""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create analyzer instance"""
+        return IterativeValidationAnalyzer()
+
+    def make_context(self, **overrides):
+        values = dict(
+            scenario="Validate the pricing model for our new analytics product",
+            complexity_level=ComplexityLevel.MODERATE,
+            max_iterations=6,
+        )
+        values.update(overrides)
+        return IterativeValidationContext(**values)
+
+    @pytest.mark.asyncio
+    async def test_stops_when_target_confidence_is_exceeded(self, analyzer):
+        context = self.make_context(
+            complexity_level=ComplexityLevel.SIMPLE,
+            target_confidence=ConfidenceLevel.MEDIUM,
+        )
+
+        result = await analyzer.analyze(context)
+
+        # HIGH results satisfy a MEDIUM target, not only an exact match
+        assert len(result.validation_cycles) == 1
+        assert "Target confidence 'medium'" in result.stop_reason
+
+    @pytest.mark.asyncio
+    async def test_stops_on_plateau(self, analyzer):
+        result = await analyzer.analyze(self.make_context(target_confidence=None))
+
+        assert len(result.validation_cycles) == 3
+        assert result.stop_reason.startswith("Converged")
+
+        unbounded = await analyzer.analyze(
+            self.make_context(target_confidence=None, convergence_patience=None)
+        )
+        assert len(unbounded.validation_cycles) == 6
+        assert unbounded.stop_reason is None
+
+    @pytest.mark.asyncio
+    async def test_candidate_search_keeps_best_refinement(self, analyzer):
+        single = await analyzer.analyze(self.make_context(convergence_patience=None))
+        searched = await analyzer.analyze(
+            self.make_context(convergence_patience=None, candidate_refinements=3)
+        )
+
+        def rates(result):
+            return [c.test_results.raw_data["completion_rate"] for c in result.validation_cycles]
+
+        assert all(s >= r for s, r in zip(rates(searched), rates(single)))
+        assert rates(searched)[-1] > rates(single)[-1]
+        assert searched.current_hypothesis.statement.startswith("Focused:")
+        assert searched.current_hypothesis == searched.validation_cycles[-1].hypothesis
+
+    @pytest.mark.asyncio
+    async def test_resume_reuses_previous_cycles(self, analyzer, monkeypatch):
+        first = await analyzer.analyze(
+            self.make_context(max_iterations=2, convergence_patience=None)
+        )
+
+        calls = []
+        original = analyzer._run_cycle
+
+        async def tracking_run_cycle(cycle_num, *args):
+            calls.append(cycle_num)
+            return await original(cycle_num, *args)
+
+        monkeypatch.setattr(analyzer, "_run_cycle", tracking_run_cycle)
+        context = self.make_context(
+            max_iterations=4,
+            convergence_patience=None,
+            previous_cycles=first.validation_cycles,
+        )
+        resumed = await analyzer.analyze(context)
+
+        assert calls == [3, 4]
+        assert resumed.validation_cycles[:2] == first.validation_cycles
+        assert sorted(resumed.confidence_progression) == [1, 2, 3, 4]
+        assert len(resumed.cumulative_learnings) == 4 * len(first.validation_cycles[0].learnings)
+        assert len(context.previous_cycles) == 2
+
+        calls.clear()
+        finished = await analyzer.analyze(
+            self.make_context(max_iterations=2, previous_cycles=first.validation_cycles)
+        )
+        assert calls == []
+        assert finished.validation_cycles == first.validation_cycles
+
+
+class TestValidationSessions:
+    """Test suite for server-side validation sessions"""
+
+    @pytest.fixture(params=["memory", "sqlite"])
+    def store(self, request, tmp_path):
+        """Create a session store of each kind"""
+        if request.param == "memory":
+            return InMemoryValidationSessionStore()
+        return SQLiteValidationSessionStore(tmp_path / "sessions.db")
+
+    def make_context(self, **overrides):
+        values = dict(
+            scenario="Validate the pricing model for our new analytics product",
+            max_iterations=6,
+            target_confidence=None,
+            convergence_patience=None,
+            session_id="pricing",
+        )
+        values.update(overrides)
+        return IterativeValidationContext(**values)
+
+    @pytest.mark.asyncio
+    async def test_each_call_appends_one_cycle(self, store):
+        analyzer = IterativeValidationAnalyzer(session_store=store)
+
+        results = [await analyzer.analyze(self.make_context()) for _ in range(6)]
+
+        assert [r.convergence_stats.cycle_count for r in results] == [1, 2, 3, 4, 5, 6]
+        assert [r.validation_cycles[-1].cycle_number for r in results] == [1, 2, 3, 4, 5, 6]
+        # Only the recent window is loaded and returned
+        assert len(results[-1].validation_cycles) == 5
+
+        history = await store.history("pricing")
+        assert [c.cycle_number for c in history] == [1, 2, 3, 4, 5, 6]
+
+        # Matches running every cycle in a single call
+        unstored = await IterativeValidationAnalyzer().analyze(self.make_context(session_id=None))
+        assert history == unstored.validation_cycles
+        assert results[-1].convergence_stats == unstored.convergence_stats
+        assert results[-1].confidence_score == unstored.confidence_score
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_advance_in_turn(self, store):
+        analyzer = IterativeValidationAnalyzer(session_store=store)
+        for _ in range(3):
+            await analyzer.analyze(self.make_context())
+
+        results = await asyncio.gather(*(analyzer.analyze(self.make_context()) for _ in range(3)))
+
+        assert sorted(r.convergence_stats.cycle_count for r in results) == [4, 5, 6]
+        history = await store.history("pricing")
+        assert [c.cycle_number for c in history] == [1, 2, 3, 4, 5, 6]
+        assert (await store.load("pricing", 0)).stats.cycle_count == 6
+
+    def test_stale_append_from_another_process_is_rejected(self, tmp_path):
+        path = tmp_path / "sessions.db"
+        analyzer = IterativeValidationAnalyzer(session_store=SQLiteValidationSessionStore(path))
+        asyncio.run(analyzer.analyze(self.make_context()))
+        stale = asyncio.run(SQLiteValidationSessionStore(path).load("pricing", 1))
+        asyncio.run(analyzer.analyze(self.make_context()))
+
+        with pytest.raises(ValueError, match="advanced concurrently"):
+            SQLiteValidationSessionStore(path)._append("pricing", stale.recent_cycles, stale.stats)
+
+    @pytest.mark.asyncio
+    async def test_stopped_session_runs_no_more_cycles(self, store):
+        analyzer = IterativeValidationAnalyzer(session_store=store)
+        context = self.make_context(convergence_patience=2)
+
+        results = [await analyzer.analyze(context) for _ in range(5)]
+
+        assert [r.convergence_stats.cycle_count for r in results] == [1, 2, 3, 3, 3]
+        assert results[-1].stop_reason.startswith("Converged")
+        assert len(await store.history("pricing")) == 3
+
+    @pytest.mark.asyncio
+    async def test_previous_cycles_seed_new_session_only(self, store):
+        seed = await IterativeValidationAnalyzer().analyze(
+            self.make_context(session_id=None, max_iterations=2)
+        )
+        analyzer = IterativeValidationAnalyzer(session_store=store)
+        context = self.make_context(previous_cycles=seed.validation_cycles)
+
+        result = await analyzer.analyze(context)
+
+        assert result.convergence_stats.cycle_count == 3
+        assert len(await store.history("pricing")) == 3
+        with pytest.raises(ValueError):
+            await analyzer.analyze(context)
+
+        assert await store.delete("pricing")
+        assert await store.load("pricing", 4) is None
+
+    @pytest.mark.asyncio
+    async def test_memory_store_evicts_least_recently_used(self):
+        store = InMemoryValidationSessionStore(max_sessions=2)
+        analyzer = IterativeValidationAnalyzer(session_store=store)
+        for session_id in ("first", "second"):
+            await analyzer.analyze(self.make_context(session_id=session_id))
+        await store.load("first", 1)
+
+        await analyzer.analyze(self.make_context(session_id="third"))
+
+        assert await store.load("second", 1) is None
+        assert (await store.load("first", 1)).stats.cycle_count == 1
+        assert (await store.load("third", 1)).stats.cycle_count == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_store_keeps_sessions_being_advanced(self):
+        store = InMemoryValidationSessionStore(max_sessions=1)
+        analyzer = IterativeValidationAnalyzer(session_store=store)
+        await analyzer.analyze(self.make_context(session_id="first"))
+
+        async with store.lock("first"):
+            await analyzer.analyze(self.make_context(session_id="second"))
+            assert await store.load("first", 1) is not None
+
+        await analyzer.analyze(self.make_context(session_id="second"))
+        assert await store.load("first", 1) is None
+        assert (await store.load("second", 1)).stats.cycle_count == 2
+
+    def test_memory_store_needs_room_for_a_session(self):
+        with pytest.raises(ValueError, match="max_sessions"):
+            InMemoryValidationSessionStore(max_sessions=0)
+
+
+class TestIterativeValidationHandler:
+    """Test suite for the iterative validation tool handler"""
+
+    @pytest.mark.asyncio
+    async def test_finish_deletes_session(self):
+        handler = CognitiveToolHandler()
+        store = handler.analyzers["iterative_validation"].session_store
+        arguments = dict(
+            scenario="Validate the pricing model for our new analytics product",
+            session_id="pricing",
+        )
+
+        response = await handler.handle_iterative_validation(**arguments)
+        assert response["success"], response.get("error")
+        assert (await store.load("pricing", 1)).stats.cycle_count == 1
+
+        response = await handler.handle_iterative_validation(**arguments, finish=True)
+        assert response["success"], response.get("error")
+        assert response["analysis"]["convergence_stats"]["cycle_count"] == 2
+        assert await store.load("pricing", 1) is None
@@ -0,0 +1,113 @@
+"""Test the single-pass keyword classifier shared by analyzers."""
+
+import random
+
+import pytest
+
+from pyclarity.tools.debugging_approaches.analyzer import (
+    ERROR_CATEGORY_KEYWORDS,
+    DebuggingApproachesAnalyzer,
+)
+from pyclarity.tools.debugging_approaches.models import ErrorCategory
+from pyclarity.tools.keywords import KeywordClassifier
+from pyclarity.tools.metacognitive_monitoring.analyzer import BIAS_PHRASES
+from pyclarity.tools.metacognitive_monitoring.models import BiasType
+from pyclarity.tools.programming_paradigms.analyzer import PARADIGM_INDICATORS
+
+CATALOG = {
+    "memory": ["memory", "heap", "stack", "stack overflow", "out of memory"],
+    "config": ["config", "configuration", "environment"],
+    "deploy": ["environment", "deployment", "deploy"],
+}
+
+
+def naive_counts(catalog, text):
+    """Distinct keywords and overlapping occurrences per category, one scan per keyword."""
+    text = text.lower()
+    categories, occurrences = {}, {}
+    for category, keywords in catalog.items():
+        found = [k for k in keywords if k in text]
+        categories[category] = len(found)
+        occurrences[category] = sum(
+            sum(1 for i in range(len(text)) if text.startswith(k, i)) for k in found
+        )
+    return categories, occurrences
+
+
+class TestKeywordClassifier:
+    """Test suite for single-pass keyword matching"""
+
+    def test_matches_naive_substring_scans(self):
+        classifier = KeywordClassifier(CATALOG)
+        rng = random.Random(7)
+        vocabulary = [k for keywords in CATALOG.values() for k in keywords] + ["the", "over", "stac", "conf", " "]
+
+        for _ in range(200):
+            text = "".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 30)))
+            hits = classifier.scan(text.upper())
+            assert (hits.categories, hits.occurrences) == naive_counts(CATALOG, text)
+
+    def test_overlapping_and_shared_keywords(self):
+        hits = KeywordClassifier(CATALOG).scan("Stack overflow after the configuration deployment")
+
+        assert hits.keywords["stack"] == hits.keywords["stack overflow"] == 1
+        assert hits.keywords["config"] == hits.keywords["configuration"] == 1
+        assert hits.keywords["deploy"] == hits.keywords["deployment"] == 1
+        assert hits.categories == {"memory": 2, "config": 2, "deploy": 2}
+        assert "environment" not in hits.keywords
+
+    def test_first_category_follows_catalog_order(self):
+        classifier = KeywordClassifier(CATALOG)
+
+        assert classifier.classify("wrong environment") == "config"
+        assert classifier.scan("wrong environment").matched() == ["config", "deploy"]
+        assert classifier.classify("all good", default="none") == "none"
+
+    def test_empty_keyword_is_rejected(self):
+        with pytest.raises(ValueError, match="Empty keyword"):
+            KeywordClassifier({"broken": ["ok", ""]})
+
+    def test_one_megabyte_in_a_single_pass(self):
+        rng = random.Random(3)
+        words = ["request", "handled", "user", "timeout", "latency", "deadlock", "value", "cache"]
+        text = " ".join(rng.choice(words) for _ in range(130_000))[:1_000_000]
+
+        hits = ERROR_CATEGORY_KEYWORDS.scan(text)
+
+        assert hits.first() == ErrorCategory.PERFORMANCE_ERROR
+        assert hits.occurrences[ErrorCategory.CONCURRENCY_ERROR] == text.count("deadlock")
+
+
+class TestAnalyzerKeywords:
+    """Test suite for the analyzers' keyword catalogs"""
+
+    @pytest.mark.parametrize(
+        ("text", "category"),
+        [
+            ("Parser reports a syntax error", ErrorCategory.SYNTAX_ERROR),
+            ("Requests hit a timeout behind a slow proxy", ErrorCategory.PERFORMANCE_ERROR),
+            ("Out of memory in the heap", ErrorCategory.MEMORY_ERROR),
+            ("Wrong environment variable", ErrorCategory.CONFIGURATION_ERROR),
+            ("Fails only after deployment", ErrorCategory.ENVIRONMENT_ERROR),
+            ("Totals are off by one", ErrorCategory.LOGIC_ERROR),
+        ],
+    )
+    def test_error_category(self, text, category):
+        assert DebuggingApproachesAnalyzer()._determine_error_category(text, [], {}) == category
+
+    def test_components_and_paradigms(self):
+        analyzer = DebuggingApproachesAnalyzer()
+
+        assert analyzer._identify_affected_components("Login query is slow", "") == [
+            "database", "authentication"
+        ]
+        assert analyzer._identify_affected_components("It broke", "") == ["unknown"]
+        hits = PARADIGM_INDICATORS.scan("Immutable data passed through map and filter functions")
+        assert hits.matched()[0].value == "functional"
+
+    def test_bias_phrases(self):
+        signalled = BIAS_PHRASES.scan("As expected, the initial numbers are definitely right").matched()
+
+        assert signalled == [
+            BiasType.CONFIRMATION_BIAS, BiasType.ANCHORING_BIAS, BiasType.OVERCONFIDENCE_BIAS
+        ]
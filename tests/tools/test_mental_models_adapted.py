@@ -3,6 +3,7 @@
 Adapted to match the actual PyClarity implementation.
 """
 
+
 import pytest
 from pyclarity.tools.mental_models.models import (
     MentalModelContext,
@@ -12,7 +13,7 @@ from pyclarity.tools.mental_models.models import (
     MentalModelInsight,
     MentalModelAssumption
 )
-from pyclarity.tools.mental_models.analyzer import MentalModelsAnalyzer
+from pyclarity.tools.mental_models.analyzer import MentalModelsAnalyzer, decompose_problem
 
 
 class TestMentalModelsAnalyzer:
@@ -174,3 +175,46 @@ class TestMentalModelsAnalyzer:
             "How does this system fundamentally work?",
             MentalModelType.FIRST_PRINCIPLES
         )
+
+    @pytest.mark.asyncio
+    async def test_multi_model_analysis(self, analyzer, complex_context):
+        """Test applying several models concurrently in one call"""
+        models = [
+            MentalModelType.OPPORTUNITY_COST,
+            MentalModelType.PARETO_PRINCIPLE,
+            MentalModelType.OCCAMS_RAZOR,
+        ]
+        context = complex_context.model_copy(update={"additional_models": models})
+
+        result = await analyzer.analyze(context)
+
+        assert result.model_applied == MentalModelType.FIRST_PRINCIPLES
+        assert result.models_applied == [MentalModelType.FIRST_PRINCIPLES, *models]
+        assert [r.model_applied for r in result.model_results] == result.models_applied
+
+        # Every model contributes to the combined result
+        assert result.fundamental_elements and result.trade_offs and result.critical_factors
+        assert result.simplified_explanation
+        assert len(result.recommendations) == 8
+        assert {rec for r in result.model_results for rec in r.recommendations[:2]} <= set(result.recommendations)
+        scores = [insight.relevance_score for insight in result.key_insights]
+        assert scores == sorted(scores, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_models_share_one_decomposition(self, analyzer, complex_context):
+        """Test models build on the same, once-computed problem decomposition"""
+        decompose_problem.cache_clear()
+        context = complex_context.model_copy(update={
+            "model_type": MentalModelType.PARETO_PRINCIPLE,
+            "additional_models": [MentalModelType.FIRST_PRINCIPLES, MentalModelType.PARETO_PRINCIPLE],
+        })
+
+        result = await analyzer.analyze(context)
+        single = await analyzer.analyze(complex_context)
+
+        assert result.models_applied == [MentalModelType.PARETO_PRINCIPLE, MentalModelType.FIRST_PRINCIPLES]
+        assert decompose_problem.cache_info().misses == 1
+        assert single.model_results == [] and single.models_applied == [MentalModelType.FIRST_PRINCIPLES]
+        assert result.fundamental_elements == single.fundamental_elements == [
+            "Capacity limits", "Resource allocation", "Distribution patterns", "State management"
+        ]
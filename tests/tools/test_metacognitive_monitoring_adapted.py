@@ -4,6 +4,7 @@ Adapted to match the actual PyClarity implementation.
 """
 
 import pytest
+from pyclarity.server.tool_handlers import CognitiveToolHandler
 from pyclarity.tools.metacognitive_monitoring.models import (
     MetacognitiveMonitoringContext,
     MetacognitiveMonitoringResult,
@@ -19,6 +20,7 @@ from pyclarity.tools.metacognitive_monitoring.models import (
     ConfidenceCalibration
 )
 from pyclarity.tools.metacognitive_monitoring.analyzer import MetacognitiveMonitoringAnalyzer
+from pyclarity.tools.metacognitive_monitoring import MonitorEventType, ReasoningStreamMonitor
 
 
 class TestMetacognitiveMonitoringAnalyzer:
@@ -186,4 +188,93 @@ class TestMetacognitiveMonitoringAnalyzer:
         assert len(result.meta_learning_insights) >= 0
         
         # Should have comprehensive analysis
-        assert len(result.improvement_recommendations) >= 1
\ No newline at end of file
+        assert len(result.improvement_recommendations) >= 1
+
+class TestReasoningStreamMonitor:
+    """Test suite for incremental monitoring of streamed reasoning"""
+
+    REASONING = (
+        "As expected, the initial estimate holds. The baseline clearly shows the trend "
+        "and confirms my view. It is definitely right and certainly final."
+    )
+
+    def test_chunking_does_not_change_statistics(self):
+        whole = ReasoningStreamMonitor()
+        whole.feed(self.REASONING)
+        streamed = ReasoningStreamMonitor()
+        for i in range(0, len(self.REASONING), 3):
+            streamed.feed(self.REASONING[i:i + 3])
+
+        expected, actual = whole.state, streamed.state
+        assert actual.bias_occurrences == expected.bias_occurrences == {
+            "confirmation_bias": 3, "anchoring_bias": 2, "overconfidence_bias": 2
+        }
+        assert actual.words_processed == expected.words_processed == len(self.REASONING.split())
+        assert actual.stated_confidence == expected.stated_confidence
+        assert {a.bias_type for a in streamed.alerts} == {a.bias_type for a in whole.alerts}
+
+    def test_alerts_fire_when_threshold_is_crossed(self):
+        monitor = ReasoningStreamMonitor(intervention_threshold=0.7)
+
+        assert monitor.feed("As expected, the numbers line up.") == []
+        (alert,) = monitor.feed(" This confirms my reading.")
+
+        assert alert.bias_type == BiasType.CONFIRMATION_BIAS
+        assert alert.chunk_index == 1 and alert.score == 0.75
+        assert monitor.feed(" As expected again.") == []  # Raised once per bias
+
+    def test_unsupported_confidence_alert(self):
+        supported = ReasoningStreamMonitor()
+        supported.feed("The empirical evidence from the study is clear. ")
+        assert supported.feed("It is definitely and undoubtedly correct.") == []
+
+        unsupported = ReasoningStreamMonitor()
+        alerts = unsupported.feed("It is definitely and undoubtedly correct.")
+        assert [a.alert_type for a in alerts] == ["confidence"]
+
+    @pytest.mark.asyncio
+    async def test_watch_streams_sequential_thinking_steps(self):
+        async def steps():
+            for text in ("Initial assessment of the", " baseline: obviously fine.", " It confirms my plan."):
+                yield text
+
+        events = [event async for event in ReasoningStreamMonitor().watch(steps())]
+
+        assert [e.event_type for e in events] == [
+            MonitorEventType.ALERT, MonitorEventType.ALERT, MonitorEventType.SUMMARY
+        ]
+        assert [e.alert.bias_type for e in events[:2]] == [
+            BiasType.ANCHORING_BIAS, BiasType.CONFIRMATION_BIAS
+        ]
+        assert events[-1].state.chunks_processed == 3
+
+    def test_threshold_is_validated(self):
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            ReasoningStreamMonitor(intervention_threshold=1.5)
+
+
+class TestMetacognitiveMonitoringHandler:
+    """Test suite for the metacognitive monitoring tool handler"""
+
+    @pytest.mark.asyncio
+    async def test_defaults_are_valid(self):
+        handler = CognitiveToolHandler()
+
+        response = await handler.handle_metacognitive_monitoring(
+            problem="Decide whether to migrate the billing service to event sourcing",
+            reasoning_target="Event sourcing is obviously the right choice for billing",
+            fields=["overall_reasoning_quality", "bias_detections"],
+        )
+
+        assert response["success"], response.get("error")
+        assert set(response["analysis"]) == {"overall_reasoning_quality", "bias_detections"}
+
+    @pytest.mark.asyncio
+    async def test_reasoning_target_defaults_to_problem(self):
+        handler = CognitiveToolHandler()
+
+        response = await handler.handle_metacognitive_monitoring(
+            problem="Decide whether to migrate the billing service to event sourcing"
+        )
+
+        assert response["success"], response.get("error")
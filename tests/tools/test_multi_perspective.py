@@ -643,5 +643,170 @@ class TestMultiPerspectiveLogic:
         print(f"   Success probability: {resolutions[0].success_probability:.0%}")
 
 
+class TestPerspectiveIndex:
+    """Test the pairwise comparison index used by MultiPerspectiveAnalyzer"""
+
+    @staticmethod
+    def _analysis(perspective_id, priorities, compromises=None, deal_breakers=None,
+                  constraints=None, opportunities=None):
+        from pyclarity.tools.multi_perspective import ViewpointAnalysis
+
+        return ViewpointAnalysis(
+            perspective_id=perspective_id,
+            priorities=priorities,
+            constraints=constraints or [],
+            opportunities=opportunities or [],
+            risks=[],
+            preferred_approach="Balanced approach",
+            acceptable_compromises=compromises or [],
+            deal_breakers=deal_breakers or [],
+            emotional_factors=[],
+            communication_preferences=[],
+            influence_dynamics="Moderate influence",
+            alignment_score=0.5
+        )
+
+    def test_candidate_pairs_skip_unrelated_perspectives(self):
+        """Test that pairs without shared terms are never compared"""
+        from pyclarity.tools.multi_perspective.index import PerspectiveIndex
+
+        index = PerspectiveIndex([
+            self._analysis("a", ["Cost control"]),
+            self._analysis("b", ["User delight"]),
+            self._analysis("c", ["Cost control", "Speed to market"]),
+            self._analysis("d", ["Quality standards"]),
+        ])
+
+        assert index.candidate_pairs(0) == [2]
+        assert index.candidate_pairs(1) == []
+        assert index.candidate_pairs(2) == [3]  # speed vs quality
+        assert index.shared_priorities(0, 2) == ["Cost control"]
+
+    def test_deal_breaker_conflicts_use_compromise_index(self):
+        """Test deal breakers collide with compromises they contain"""
+        from pyclarity.tools.multi_perspective.index import PerspectiveIndex
+
+        index = PerspectiveIndex([
+            self._analysis("a", ["Safety"], deal_breakers=["Any phased delivery of safety fixes"]),
+            self._analysis("b", ["Growth"], compromises=["phased delivery"]),
+            self._analysis("c", ["Growth"], compromises=["budget cuts"]),
+        ])
+
+        assert index.candidate_pairs(0) == [1]
+        assert index.deal_breaker_conflicts(0, 1) == 1
+        assert index.deal_breaker_conflicts(0, 2) == 0
+
+    @pytest.mark.asyncio
+    async def test_large_stakeholder_analysis(self):
+        """Test synergy/conflict detection over many perspectives"""
+        from pyclarity.tools.multi_perspective import (
+            MultiPerspectiveAnalyzer,
+            MultiPerspectiveContext,
+            Perspective,
+            StakeholderType,
+        )
+
+        stakeholder_types = list(StakeholderType)
+        perspectives = [
+            Perspective(
+                perspective_id=f"perspective_{i}",
+                stakeholder_type=stakeholder_types[i % len(stakeholder_types)],
+                stakeholder_name=f"Stakeholder {i}",
+                description="Stakeholder group",
+                primary_concerns=[f"Concern {i % 7}", f"Speed of delivery {i % 3}"],
+                success_criteria=["Successful rollout"],
+                influence_level=0.5,
+                flexibility=0.4 + (i % 5) * 0.1
+            )
+            for i in range(60)
+        ]
+        context = MultiPerspectiveContext(
+            scenario="Rollout balancing quality and cost",
+            predefined_perspectives=perspectives
+        )
+
+        result = await MultiPerspectiveAnalyzer().analyze(context)
+
+        assert len(result.viewpoint_analyses) == 60
+        ids = [sc.item_id for sc in result.synergies_conflicts]
+        assert len(ids) == len(set(ids))
+        assert any(sc.type == "synergy" for sc in result.synergies_conflicts)
+
+
+class TestConcurrentViewpointAnalysis:
+    """Test concurrent per-perspective viewpoint analysis"""
+
+    @staticmethod
+    def _perspectives(count):
+        from pyclarity.tools.multi_perspective import Perspective, StakeholderType
+
+        return [
+            Perspective(
+                perspective_id=f"perspective_{i}",
+                stakeholder_type=StakeholderType.BUSINESS,
+                stakeholder_name=f"Stakeholder {i}",
+                description="Stakeholder group",
+                primary_concerns=[f"Concern {i}"],
+                success_criteria=["Successful rollout"],
+                influence_level=0.5,
+                flexibility=0.5
+            )
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_viewpoints_follow_perspective_order(self):
+        """Test results are assembled in perspective order under bounded concurrency"""
+        from pyclarity.tools.multi_perspective import (
+            MultiPerspectiveAnalyzer,
+            MultiPerspectiveContext,
+        )
+
+        perspectives = self._perspectives(10)
+        analyzer = MultiPerspectiveAnalyzer(max_concurrency=3)
+        analyses = await analyzer._analyze_viewpoints(
+            perspectives,
+            MultiPerspectiveContext(scenario="Launch a new product line")
+        )
+
+        assert [a.perspective_id for a in analyses] == [p.perspective_id for p in perspectives]
+
+    @pytest.mark.asyncio
+    async def test_backend_receives_batched_requests(self):
+        """Test a configured viewpoint backend is called once per batch"""
+        from pyclarity.tools.multi_perspective import (
+            MultiPerspectiveAnalyzer,
+            MultiPerspectiveContext,
+        )
+
+        heuristic = MultiPerspectiveAnalyzer()
+        batches = []
+
+        class RecordingBackend:
+            async def analyze_viewpoints(self, perspectives, context):
+                batches.append([p.perspective_id for p in perspectives])
+                return [await heuristic._analyze_viewpoint(p, context) for p in perspectives]
+
+        perspectives = self._perspectives(5)
+        analyzer = MultiPerspectiveAnalyzer(
+            viewpoint_backend=RecordingBackend(),
+            backend_batch_size=2
+        )
+        analyses = await analyzer._analyze_viewpoints(
+            perspectives,
+            MultiPerspectiveContext(scenario="Launch a new product line")
+        )
+
+        assert sorted(len(batch) for batch in batches) == [1, 2, 2]
+        assert [a.perspective_id for a in analyses] == [p.perspective_id for p in perspectives]
+
+    def test_invalid_concurrency_rejected(self):
+        """Test max_concurrency must be positive"""
+        from pyclarity.tools.multi_perspective import MultiPerspectiveAnalyzer
+
+        with pytest.raises(ValueError):
+            MultiPerspectiveAnalyzer(max_concurrency=0)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
\ No newline at end of file
@@ -0,0 +1,192 @@
+"""Test Programming Paradigms cognitive tool.
+
+Adapted to match the actual PyClarity implementation.
+"""
+
+import os
+
+import pytest
+
+from pyclarity.tools.programming_paradigms import (
+    ProgrammingParadigm,
+    ProgrammingParadigmsAnalyzer,
+    ProgrammingParadigmsContext,
+    SourceTree,
+    analyze_source,
+)
+from pyclarity.tools.programming_paradigms import source as source_module
+from pyclarity.tools.programming_paradigms.source import SourceMetricsCache
+
+OBJECT_ORIENTED = b'''
+class Shape:
+    def area(self):
+        raise NotImplementedError
+
+
+class Square(Shape):
+    def __init__(self, side):
+        self.side = side
+
+    def area(self):
+        return self.side * self.side
+
+    def grow(self, amount):
+        self.side += amount
+'''
+
+FUNCTIONAL = b'''
+from functools import reduce
+
+
+def total(values):
+    return reduce(lambda a, b: a + b, values, 0)
+
+
+def squares(values):
+    return [v * v for v in values]
+
+
+def evens(values):
+    return list(filter(lambda v: v % 2 == 0, values))
+'''
+
+CONCURRENT = b'''
+import threading
+
+lock = threading.Lock()
+results = []
+
+
+async def fetch(client, url):
+    async with client.get(url) as response:
+        return await response.text()
+
+
+def worker(item):
+    with lock:
+        results.append(item)
+'''
+
+
+def write_tree(root, files):
+    for name, source in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(source)
+
+
+class TestSourceAnalysis:
+    """Test suite for static source-tree metrics"""
+
+    def test_file_metrics(self):
+        oo = analyze_source(OBJECT_ORIENTED)
+        functional = analyze_source(FUNCTIONAL)
+        concurrent = analyze_source(CONCURRENT)
+
+        assert (oo.classes, oo.inheriting_classes, oo.methods, oo.functions) == (2, 1, 4, 4)
+        assert oo.pure_functions == 1 and oo.mutation_sites == 2
+        assert functional.pure_functions == 3 and functional.mutation_sites == 0
+        assert (functional.lambdas, functional.comprehensions, functional.higher_order_calls) == (2, 1, 2)
+        assert (concurrent.async_functions, concurrent.awaits) == (1, 2)
+        assert concurrent.thread_primitives == 2
+        assert analyze_source(b"def broken(:\n").syntax_errors == 1
+
+    def test_refresh_parses_only_changed_files(self, tmp_path):
+        write_tree(tmp_path, {
+            "shapes.py": OBJECT_ORIENTED,
+            "pkg/numbers.py": FUNCTIONAL,
+            "pkg/copy_of_numbers.py": FUNCTIONAL,
+            ".venv/ignored.py": CONCURRENT,
+            "node_modules/ignored.py": CONCURRENT,
+        })
+        tree = SourceTree(tmp_path, cache=SourceMetricsCache())
+
+        first = tree.refresh()
+        assert (first.files, first.changed_files, first.parsed_files) == (3, 3, 2)
+
+        unchanged = tree.refresh()
+        assert (unchanged.changed_files, unchanged.parsed_files) == (0, 0)
+        assert unchanged.metrics == first.metrics
+
+        (tmp_path / "pkg" / "jobs.py").write_bytes(CONCURRENT)
+        (tmp_path / "pkg" / "copy_of_numbers.py").unlink()
+        os.utime(tmp_path / "shapes.py", ns=(1, 1))  # Touched but identical
+        updated = tree.refresh()
+
+        assert (updated.files, updated.changed_files, updated.parsed_files) == (3, 1, 1)
+        expected = SourceTree(tmp_path, cache=SourceMetricsCache()).refresh()
+        assert updated.metrics == expected.metrics
+        assert updated.consistency == expected.consistency
+
+    def test_cache_is_shared_through_sqlite(self, tmp_path):
+        write_tree(tmp_path / "src", {"numbers.py": FUNCTIONAL, "shapes.py": OBJECT_ORIENTED})
+        database = tmp_path / "metrics.db"
+
+        cold = SourceTree(tmp_path / "src", cache=SourceMetricsCache(database)).refresh()
+        warm = SourceTree(tmp_path / "src", cache=SourceMetricsCache(database)).refresh()
+
+        assert cold.parsed_files == 2
+        assert warm.parsed_files == 0
+        assert warm.metrics == cold.metrics
+
+    def test_process_pool_matches_in_process(self, tmp_path, monkeypatch):
+        write_tree(tmp_path, {
+            f"module_{i}.py": (OBJECT_ORIENTED, FUNCTIONAL, CONCURRENT)[i % 3] + f"\nN = {i}\n".encode()
+            for i in range(12)
+        })
+        serial = SourceTree(tmp_path, cache=SourceMetricsCache(), max_workers=1).refresh()
+        monkeypatch.setattr(source_module, "PARALLEL_THRESHOLD", 4)
+
+        parallel = SourceTree(tmp_path, cache=SourceMetricsCache(), max_workers=2).refresh()
+
+        assert parallel.parsed_files == 12
+        assert parallel.metrics == serial.metrics
+        assert source_module._pool_context().get_start_method() in ("forkserver", "spawn")
+
+    def test_changed_files_are_processed_in_bounded_batches(self, tmp_path, monkeypatch):
+        write_tree(tmp_path, {
+            f"module_{i}.py": (OBJECT_ORIENTED, FUNCTIONAL, CONCURRENT)[i % 3] + f"\nN = {i}\n".encode()
+            for i in range(7)
+        })
+        expected = SourceTree(tmp_path, cache=SourceMetricsCache()).refresh()
+        batch_sizes = []
+        parse = source_module._ParsePool.parse
+
+        def recording_parse(pool, sources):
+            batch_sizes.append(len(sources))
+            return parse(pool, sources)
+
+        monkeypatch.setattr(source_module, "BATCH_FILES", 3)
+        monkeypatch.setattr(source_module._ParsePool, "parse", recording_parse)
+        batched = SourceTree(tmp_path, cache=SourceMetricsCache()).refresh()
+
+        assert batch_sizes == [3, 3, 1]
+        assert (batched.changed_files, batched.parsed_files) == (7, 7)
+        assert batched.metrics == expected.metrics
+
+    def test_missing_tree_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="not found"):
+            SourceTree(tmp_path / "missing")
+
+
+class TestProgrammingParadigmsAnalyzer:
+    """Test suite for paradigm analysis of an existing codebase"""
+
+    @pytest.mark.asyncio
+    async def test_codebase_path_feeds_code_structure(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PYCLARITY_ARTIFACT_ROOT", str(tmp_path))
+        write_tree(tmp_path, {f"numbers_{i}.py": FUNCTIONAL for i in range(3)} | {"shapes.py": OBJECT_ORIENTED})
+        context = ProgrammingParadigmsContext(
+            problem_description="Add customer account management screens to the web application",
+            project_type="Web application",
+            codebase_path=str(tmp_path),
+        )
+
+        result = await ProgrammingParadigmsAnalyzer().analyze(context)
+
+        structure = result.code_structure_analysis
+        assert structure.source_metrics.files == 4
+        assert structure.detected_paradigms[0] == ProgrammingParadigm.FUNCTIONAL
+        assert structure.paradigm_purity["functional"] == structure.source_metrics.paradigm_scores["functional"]
+        assert structure.paradigm_consistency_score == structure.source_metrics.consistency
+        assert any("functions are pure" in pattern for pattern in structure.structural_patterns)
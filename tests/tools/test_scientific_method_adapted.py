@@ -0,0 +1,202 @@
+"""Test Scientific Method cognitive tool.
+
+Adapted to match the actual PyClarity implementation.
+"""
+
+import numpy as np
+import pytest
+
+from pyclarity.server.tool_handlers import CognitiveToolHandler
+from pyclarity.tools.scientific_method.analyzer import ScientificMethodAnalyzer
+from pyclarity.tools.scientific_method.models import (
+    HypothesisType,
+    MultipleComparisonCorrection,
+    ScientificMethodContext,
+)
+from pyclarity.tools.scientific_method.models import (
+    TestResult as HypothesisTestResult,
+)
+from pyclarity.tools.scientific_method.statistics import adjust_p_values, compare_samples
+
+
+class TestScientificMethodPipeline:
+    """Test suite for the concurrent hypothesis pipeline"""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create analyzer instance"""
+        return ScientificMethodAnalyzer()
+
+    def make_context(self, **overrides):
+        values = dict(
+            problem="Checkout latency spikes every evening under peak load",
+            research_question="Why does checkout latency spike in the evening?",
+            domain_knowledge="Distributed services with shared caches and queues",
+            evidence_sources=["APM traces"],
+        )
+        values.update(overrides)
+        return ScientificMethodContext(**values)
+
+    @pytest.mark.asyncio
+    async def test_every_hypothesis_is_processed(self, analyzer):
+        result = await analyzer.analyze(self.make_context(max_hypotheses=6))
+
+        hypotheses = result.hypotheses_generated
+        assert len(hypotheses) == 7
+        assert len({h.statement for h in hypotheses}) == 7
+        assert hypotheses[-1].hypothesis_type == HypothesisType.NULL_HYPOTHESIS
+
+        assert [t.hypothesis_id for t in result.hypothesis_tests] == [h.hypothesis_id for h in hypotheses]
+        assert [e.hypothesis_tested for e in result.experiments_designed] == [
+            h.hypothesis_id for h in hypotheses[:-1]
+        ]
+        assert len(result.evidence_collected) == 6 * 4 + 1
+
+    @pytest.mark.asyncio
+    async def test_null_hypothesis_weighs_evidence_against_it(self, analyzer):
+        result = await analyzer.analyze(self.make_context(max_hypotheses=1))
+
+        alternative_test, null_test = result.hypothesis_tests
+        assert alternative_test.test_result == HypothesisTestResult.SUPPORTED
+        assert null_test.test_result == HypothesisTestResult.NOT_SUPPORTED
+        assert null_test.opposing_evidence_count == alternative_test.supporting_evidence_count
+
+    @pytest.mark.asyncio
+    async def test_many_hypotheses_overlap(self, analyzer):
+        result = await analyzer.analyze(self.make_context(max_hypotheses=40))
+
+        assert result.hypotheses_tested == 41
+        assert len(result.areas_needing_research) <= 8
+        assert len(result.conclusions_supported) <= 10
+        assert 0.0 <= result.scientific_rigor_score <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_disabled_stages_are_skipped(self, analyzer):
+        result = await analyzer.analyze(
+            self.make_context(evidence_evaluation_enabled=False, experiment_design_enabled=False)
+        )
+
+        assert result.evidence_collected == []
+        assert result.experiments_designed == []
+        assert all(t.test_result == HypothesisTestResult.INCONCLUSIVE for t in result.hypothesis_tests)
+
+
+class TestStatistics:
+    """Test suite for the resampling statistics backend"""
+
+    def test_holm_and_benjamini_hochberg(self):
+        p_values = [0.01, 0.04, 0.03]
+
+        holm = adjust_p_values(p_values, MultipleComparisonCorrection.HOLM)
+        bh = adjust_p_values(p_values, MultipleComparisonCorrection.BENJAMINI_HOCHBERG)
+        bonferroni = adjust_p_values(p_values, MultipleComparisonCorrection.BONFERRONI)
+
+        np.testing.assert_allclose(holm, [0.03, 0.06, 0.06])
+        np.testing.assert_allclose(bh, [0.03, 0.04, 0.04])
+        np.testing.assert_allclose(bonferroni, [0.03, 0.12, 0.09])
+
+    def test_detects_shift_and_is_reproducible(self):
+        rng = np.random.default_rng(0)
+        treatment = rng.normal(0.5, 1.0, 400)
+        control = rng.normal(0.0, 1.0, 300)
+
+        first = compare_samples(treatment, control, n_resamples=2000, rng=np.random.default_rng(1))
+        second = compare_samples(treatment, control, n_resamples=2000, rng=np.random.default_rng(1))
+
+        assert first == second
+        assert first.method == "permutation"
+        assert first.p_value < 0.01
+        low, high = first.confidence_interval
+        assert low < first.mean_difference < high
+        assert first.effect_size == pytest.approx(0.5, abs=0.2)
+
+    def test_one_sample_without_effect(self):
+        sample = np.random.default_rng(2).normal(0.0, 1.0, 200)
+
+        result = compare_samples(sample, n_resamples=2000, rng=np.random.default_rng(3))
+
+        assert result.method == "sign_flip"
+        assert result.baseline_size is None
+        assert result.p_value > 0.05
+
+    def test_large_samples_use_batch_means(self):
+        rng = np.random.default_rng(4)
+        treatment = rng.normal(0.02, 1.0, 100_000)
+        control = rng.normal(0.0, 1.0, 100_000)
+
+        result = compare_samples(treatment, control, rng=rng)
+
+        assert result.n_resamples == 10_000
+        assert result.batch_size > 1
+        assert result.p_value < 0.01
+
+
+class TestMeasurementHypotheses:
+    """Test suite for data-driven hypotheses built from measurements"""
+
+    @pytest.mark.asyncio
+    async def test_measurements_are_tested_and_corrected(self):
+        rng = np.random.default_rng(5)
+        context = ScientificMethodContext(
+            problem="Checkout latency spikes every evening under peak load",
+            research_question="Why does checkout latency spike in the evening?",
+            domain_knowledge="Distributed services with shared caches and queues",
+            max_hypotheses=1,
+            n_resamples=2000,
+            random_seed=11,
+            measurements=[
+                {
+                    "name": "p95_latency_ms",
+                    "observations": rng.normal(110, 20, 500).tolist(),
+                    "baseline_observations": rng.normal(100, 20, 500).tolist(),
+                },
+                {
+                    "name": "error_rate",
+                    "observations": rng.normal(1.0, 0.2, 500).tolist(),
+                    "baseline_observations": rng.normal(1.0, 0.2, 500).tolist(),
+                },
+            ],
+        )
+
+        result = await ScientificMethodAnalyzer().analyze(context)
+        latency, errors = result.hypothesis_tests[-2:]
+
+        assert latency.test_result == HypothesisTestResult.SUPPORTED
+        assert errors.test_result == HypothesisTestResult.INCONCLUSIVE
+        raw = [t.sample_statistics.p_value for t in (latency, errors)]
+        expected = adjust_p_values(raw, MultipleComparisonCorrection.HOLM)
+        for test, adjusted in zip((latency, errors), expected):
+            assert test.sample_statistics.adjusted_p_value == pytest.approx(adjusted)
+            assert test.statistical_significance == test.sample_statistics.adjusted_p_value
+
+        # Raw samples are not serialized
+        dumped = result.model_dump()
+        assert all("observations" not in evidence for evidence in dumped["evidence_collected"])
+
+        repeat = await ScientificMethodAnalyzer().analyze(context)
+        assert repeat.hypothesis_tests[-2].sample_statistics == latency.sample_statistics
+
+
+class TestScientificMethodHandler:
+    """Test suite for the scientific method tool handler"""
+
+    @pytest.mark.asyncio
+    async def test_problem_and_measurements_only(self):
+        rng = np.random.default_rng(3)
+        problem = "Checkout latency spikes every evening under peak load"
+
+        response = await CognitiveToolHandler().handle_scientific_method(
+            problem=problem,
+            measurements=[
+                {
+                    "name": "p95_latency_ms",
+                    "observations": rng.normal(130, 20, 200).tolist(),
+                    "baseline_observations": rng.normal(100, 20, 200).tolist(),
+                },
+            ],
+        )
+
+        assert response["success"], response.get("error")
+        assert response["research_question"] == f"What explains {problem}?"
+        statistics = response["analysis"]["hypothesis_tests"][-1]["sample_statistics"]
+        assert statistics["p_value"] < 0.01
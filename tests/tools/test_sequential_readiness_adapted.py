@@ -0,0 +1,182 @@
+"""Test Sequential Readiness cognitive tool.
+
+Adapted to match the actual PyClarity implementation.
+"""
+
+import random
+
+import pytest
+
+from pyclarity.tools.sequential_readiness import (
+    ReadinessGraph,
+    ReadinessLevel,
+    SequentialReadinessAnalyzer,
+    SequentialReadinessContext,
+)
+from pyclarity.tools.sequential_readiness.models import ProgressionStrategy, State
+from pyclarity.tools.sequential_readiness.planner import parse_duration
+
+
+def make_graph(readiness=None):
+    """Plan -> (Train, Tooling) -> Launch"""
+    return ReadinessGraph(
+        {"Plan": 2.0, "Train": 4.0, "Tooling": 1.0, "Launch": 1.0},
+        [("Plan", "Train"), ("Plan", "Tooling"), ("Train", "Launch"), ("Tooling", "Launch")],
+        readiness,
+    )
+
+
+def layered_dag(n_levels=25, width=20, seed=0):
+    """Durations and edges of a random DAG; each state depends on three of the previous level."""
+    rng = random.Random(seed)
+    durations, edges = {}, []
+    for level in range(n_levels):
+        for k in range(width):
+            name = f"s{level}_{k}"
+            durations[name] = rng.uniform(0.5, 6.0)
+            if level:
+                for parent in rng.sample(range(width), 3):
+                    edges.append((f"s{level - 1}_{parent}", name))
+    return durations, edges
+
+
+class TestReadinessGraph:
+    """Test suite for the DAG planner"""
+
+    def test_critical_path_and_slack(self):
+        graph = make_graph()
+
+        assert graph.total_duration == 7.0
+        assert graph.critical_path() == ["Plan", "Train", "Launch"]
+        schedule = {entry.name: entry for entry in graph.schedule()}
+        assert schedule["Tooling"].earliest_start == 2.0
+        assert schedule["Tooling"].slack == 3.0
+        assert schedule["Launch"].latest_start == 6.0
+        assert graph.levels() == [["Plan"], ["Train", "Tooling"], ["Launch"]]
+        assert graph.peak_parallelism() == (2.0, ["Train", "Tooling"])
+
+    def test_readiness_changes_propagate_incrementally(self):
+        graph = make_graph({"Plan": ReadinessLevel.READY})
+        assert graph.available_states() == ["Train", "Tooling"]
+        assert graph.levels(outstanding_only=True) == [["Train", "Tooling"], ["Launch"]]
+
+        affected = graph.set_readiness("Train", ReadinessLevel.READY)
+
+        assert affected == ["Plan", "Train", "Launch"]
+        assert graph.total_duration == 2.0
+        assert graph.critical_path() == ["Tooling", "Launch"]
+        assert graph.set_readiness("Train", ReadinessLevel.EXCEEDED) == []
+
+    def test_what_if_leaves_graph_unchanged(self):
+        graph = make_graph()
+
+        change = graph.what_if("Train", ReadinessLevel.PROGRESSING)
+
+        assert change.previous_duration == 7.0
+        assert change.total_duration == 5.0
+        assert change.critical_path == ["Plan", "Train", "Launch"]
+        assert graph.total_duration == 7.0
+        assert graph.readiness("Train") == ReadinessLevel.NOT_STARTED
+
+    def test_cycles_and_unknown_states_are_rejected(self):
+        with pytest.raises(ValueError, match="cycle"):
+            ReadinessGraph({"A": 1.0, "B": 1.0}, [("A", "B"), ("B", "A")])
+        with pytest.raises(ValueError, match="Unknown"):
+            make_graph().set_readiness("Deploy", ReadinessLevel.READY)
+
+    def test_parse_duration(self):
+        assert parse_duration("2-4 weeks") == 3.0
+        assert parse_duration("about 14 days") == 2.0
+        assert parse_duration("1 to 2 months") == pytest.approx(6.5)
+        assert parse_duration("soon") is None
+
+    def test_incremental_updates_match_full_recomputation(self):
+        durations, edges = layered_dag()
+        graph = ReadinessGraph(durations, edges)
+        rng = random.Random(1)
+        levels = list(ReadinessLevel)
+        readiness = {}
+
+        for _ in range(1000):
+            name = rng.choice(graph.names)
+            readiness[name] = rng.choice(levels)
+            graph.set_readiness(name, readiness[name])
+
+        rebuilt = ReadinessGraph(durations, edges, readiness)
+        assert graph.total_duration == pytest.approx(rebuilt.total_duration)
+        assert graph.critical_path() == rebuilt.critical_path()
+        for incremental, full in zip(graph.schedule(), rebuilt.schedule()):
+            assert incremental.earliest_start == pytest.approx(full.earliest_start)
+            assert incremental.slack == pytest.approx(full.slack, abs=1e-9)
+
+
+class TestSequentialReadinessAnalyzer:
+    """Test suite for the DAG-backed analysis"""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create analyzer instance"""
+        return SequentialReadinessAnalyzer()
+
+    def make_states(self):
+        return [
+            State(name="Plan", description="Rollout plan", indicators=["Plan approved"],
+                  typical_duration="2 weeks"),
+            State(name="Train", description="Train staff", indicators=["Staff trained", "Assessed"],
+                  prerequisites=["Plan"], blockers=["Trainer availability"],
+                  typical_duration="4 weeks"),
+            State(name="Tooling", description="Set up tools", indicators=["Tools live"],
+                  prerequisites=["Plan", "Budget sign-off"], typical_duration="1 week"),
+            State(name="Launch", description="Go live", indicators=["Live in all regions"],
+                  prerequisites=["Train", "Tooling"], typical_duration="1 week"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_predefined_states_form_a_dag(self, analyzer):
+        context = SequentialReadinessContext(
+            scenario="Regional rollout of a new support platform",
+            predefined_states=self.make_states(),
+            current_status={"Plan": ReadinessLevel.READY},
+            what_if={"Train": ReadinessLevel.NEARLY_READY},
+        )
+
+        result = await analyzer.analyze(context)
+
+        assert result.dependency_map["Launch"] == ["Train", "Tooling"]
+        assert result.dependency_map["Tooling"] == ["Plan"]
+        assert result.critical_path == ["Train", "Launch"]
+        assert result.total_duration_weeks == 5.0
+        assert result.parallel_groups == [["Train", "Tooling"], ["Launch"]]
+        assert result.progression_plan.strategy == ProgressionStrategy.PARALLEL
+        assert [g.state_name for g in result.gap_analyses][:2] == ["Train", "Launch"]
+        assert result.gap_analyses[0].priority == "high"
+
+        (outcome,) = result.what_if_outcomes
+        assert outcome.total_duration_weeks == pytest.approx(2.0)
+        assert outcome.duration_change_weeks == pytest.approx(-3.0)
+        assert outcome.critical_path == ["Tooling", "Launch"]
+
+    @pytest.mark.asyncio
+    async def test_domain_template_is_linear(self, analyzer):
+        context = SequentialReadinessContext(
+            scenario="Adopting a new CRM",
+            domain_context="technology_adoption",
+        )
+
+        result = await analyzer.analyze(context)
+
+        assert len(result.identified_states) == 5
+        assert result.critical_path == [s.name for s in result.identified_states]
+        assert result.progression_plan.strategy == ProgressionStrategy.LINEAR
+        assert result.total_duration_weeks == 15.0
+
+    @pytest.mark.asyncio
+    async def test_unknown_states_are_rejected(self, analyzer):
+        context = SequentialReadinessContext(
+            scenario="Regional rollout",
+            predefined_states=self.make_states(),
+            what_if={"Deploy": ReadinessLevel.READY},
+        )
+
+        with pytest.raises(ValueError, match="Deploy"):
+            await analyzer.analyze(context)
@@ -17,7 +17,8 @@ from pyclarity.tools.sequential_thinking.models import (
     ThoughtRevision,
     ThoughtBranch,
     BranchStrategy,
-    ComplexityLevel
+    ComplexityLevel,
+    ThoughtEventType
 )
 from pyclarity.tools.sequential_thinking.analyzer import SequentialThinkingAnalyzer
 
@@ -614,4 +615,103 @@ class TestSequentialThinkingAnalyzer:
         assert len(results) == 3
         for i, result in enumerate(results):
             assert isinstance(result, SequentialThinkingResult)
-            assert len(result.reasoning_chain) == 4
\ No newline at end of file
+            assert len(result.reasoning_chain) == 4
+
+
+class TestAnalyzeStream:
+    """Test suite for streamed sequential thinking analysis"""
+
+    def _context(self, **overrides):
+        params = dict(
+            problem="How to optimize database performance for a high-traffic application?",
+            reasoning_depth=6,
+            enable_branching=True,
+            branch_strategy=BranchStrategy.PARALLEL_EXPLORATION,
+            max_branches=3,
+            allow_revisions=True,
+        )
+        params.update(overrides)
+        return SequentialThinkingContext(**params)
+
+    async def test_stream_yields_steps_then_result(self, sequential_analyzer):
+        events = [event async for event in sequential_analyzer.analyze_stream(self._context())]
+
+        assert [event.sequence for event in events] == list(range(len(events)))
+        assert events[0].event_type == ThoughtEventType.STEP
+        assert events[0].step.step_number == 1
+        assert events[-1].event_type == ThoughtEventType.RESULT
+        assert sum(event.event_type == ThoughtEventType.RESULT for event in events) == 1
+
+        result = events[-1].result
+        streamed_steps = [event.step for event in events if event.event_type == ThoughtEventType.STEP]
+        streamed_branches = [event.branch for event in events if event.event_type == ThoughtEventType.BRANCH]
+        streamed_revisions = [event.revision for event in events if event.event_type == ThoughtEventType.REVISION]
+        assert [step.step_id for step in streamed_steps] == [step.step_id for step in result.reasoning_chain]
+        assert len(streamed_branches) == len(result.branches_explored)
+        assert len(streamed_revisions) == len(result.revisions_made)
+
+    async def test_stream_can_be_cancelled_early(self, sequential_analyzer):
+        stream = sequential_analyzer.analyze_stream(self._context(reasoning_depth=15))
+
+        first = await anext(stream)
+        await stream.aclose()
+
+        assert first.event_type == ThoughtEventType.STEP
+        assert first.step.step_type == ThoughtStepType.PROBLEM_DECOMPOSITION
+
+    async def test_analyze_returns_stream_result(self, sequential_analyzer):
+        result = await sequential_analyzer.analyze(
+            self._context(enable_branching=False, allow_revisions=False, reasoning_depth=4)
+        )
+
+        assert isinstance(result, SequentialThinkingResult)
+        assert result.reasoning_chain[-1].step_type == ThoughtStepType.CONCLUSION
+        assert result.branches_explored == []
+        assert result.revisions_made == []
+
+
+class TestBeamBranchExploration:
+    """Test suite for beam-search branch exploration and seeded analysis"""
+
+    def _context(self, **overrides):
+        params = dict(
+            problem="How to optimize database performance for a high-traffic application?",
+            reasoning_depth=6,
+            branch_strategy=BranchStrategy.PARALLEL_EXPLORATION,
+            max_branches=30,
+            beam_width=4,
+            random_seed=42,
+        )
+        params.update(overrides)
+        return SequentialThinkingContext(**params)
+
+    @staticmethod
+    def _fingerprint(result):
+        return (
+            [(step.content, step.confidence_score) for step in result.reasoning_chain],
+            [(branch.branch_name, branch.branch_confidence) for branch in result.branches_explored],
+            [revision.confidence_change for revision in result.revisions_made],
+        )
+
+    async def test_beam_keeps_at_most_beam_width_branches(self, sequential_analyzer):
+        result = await sequential_analyzer.analyze(self._context())
+
+        assert 0 < len(result.branches_explored) <= 4
+        for branch in result.branches_explored:
+            assert 3 <= len(branch.steps) <= 5
+            assert branch.is_active
+            assert all(step.branch_id == branch.branch_id for step in branch.steps)
+
+    async def test_same_seed_reproduces_result(self, sequential_analyzer):
+        first = await sequential_analyzer.analyze(self._context())
+        second = await sequential_analyzer.analyze(self._context())
+        other = await sequential_analyzer.analyze(self._context(random_seed=7))
+
+        assert self._fingerprint(first) == self._fingerprint(second)
+        assert self._fingerprint(first) != self._fingerprint(other)
+
+    def test_beam_width_validation(self):
+        with pytest.raises(ValueError):
+            self._context(beam_width=0)
+        with pytest.raises(ValueError):
+            self._context(max_branches=51)
@@ -0,0 +1,82 @@
+"""Test the shared text-similarity utilities used by perspective-based tools."""
+
+import numpy as np
+import pytest
+
+from pyclarity.tools.similarity import (
+    HashedTfidfVectorizer,
+    cluster_texts,
+    cosine_similarity_matrix,
+    shared_elements,
+    tokenize,
+)
+
+
+class TestHashedTfidfVectorizer:
+    """Test suite for HashedTfidfVectorizer"""
+
+    def test_rows_are_normalized(self):
+        vectors = HashedTfidfVectorizer(n_features=256).transform(
+            ["Reduce operating cost", "Improve user experience", ""]
+        )
+
+        assert vectors.shape == (3, 256)
+        norms = np.linalg.norm(vectors, axis=1)
+        assert norms[0] == pytest.approx(1.0)
+        assert norms[1] == pytest.approx(1.0)
+        assert norms[2] == 0.0
+
+    def test_similarity_ignores_case_and_punctuation(self):
+        vectors = HashedTfidfVectorizer().transform(
+            ["Impact on cost", "impact on COST!", "Team morale"]
+        )
+        similarities = cosine_similarity_matrix(vectors)
+
+        assert similarities[0, 1] == pytest.approx(1.0)
+        assert similarities[0, 2] < 0.1
+
+    def test_tokens_in_any_script(self):
+        assert tokenize("Datenqualität: STRASSE, Straße") == ["datenqualität", "strasse", "strasse"]
+        assert tokenize("数据质量 latency!") == ["数据质量", "latency"]
+        assert tokenize("ＡＰＩ ｖ２") == ["api", "v2"]
+
+    def test_invalid_configuration_rejected(self):
+        with pytest.raises(ValueError):
+            HashedTfidfVectorizer(n_features=0)
+        with pytest.raises(ValueError):
+            HashedTfidfVectorizer(ngram_range=(2, 1))
+
+
+class TestClustering:
+    """Test suite for similarity-based grouping and common elements"""
+
+    def test_cluster_texts_groups_similar_viewpoints(self):
+        clusters = cluster_texts([
+            "Migrate to microservices to scale the data platform",
+            "Keep the monolith and invest in test coverage",
+            "Migrate to microservices so the data platform can scale",
+        ])
+
+        assert clusters == [[0, 2], [1]]
+
+    def test_cluster_texts_empty(self):
+        assert cluster_texts([]) == []
+
+    def test_shared_elements_found_in_every_group(self):
+        common = shared_elements([
+            ["Impact on cost", "Impact on speed", "Vendor lock-in"],
+            ["impact on cost", "Vendor lock-in"],
+            ["Impact on COST", "Hiring plan"],
+        ])
+
+        assert common == ["Impact on cost"]
+
+    def test_shared_elements_with_empty_group(self):
+        assert shared_elements([["Impact on cost"], []]) == []
+        assert shared_elements([["Impact on cost"]]) == ["Impact on cost"]
+
+    def test_shared_elements_keep_exact_matches_once(self):
+        assert shared_elements([["数据质量", "Latency"], ["数据质量", "latency!"]]) == ["数据质量", "Latency"]
+        assert shared_elements([["Cost", "Cost"], ["cost"]]) == ["Cost"]
+        assert shared_elements([["Cost", "cost", "Speed"]]) == ["Cost", "Speed"]
+        assert shared_elements([["!!!", "Speed"], ["!!!"], ["!!!", "Scope"]]) == ["!!!"]
@@ -0,0 +1,131 @@
+"""Test Triple Constraint cognitive tool.
+
+Adapted to match the actual PyClarity implementation.
+"""
+
+import numpy as np
+import pytest
+
+from pyclarity.tools.triple_constraint.analyzer import TripleConstraintAnalyzer
+from pyclarity.tools.triple_constraint.models import (
+    ConstraintDimension,
+    ConstraintPriority,
+    OptimizationStrategy,
+    TripleConstraintContext,
+)
+from pyclarity.tools.triple_constraint.optimizer import pareto_mask
+
+
+def brute_force_front(points):
+    ge = np.all(points[None, :, :] >= points[:, None, :], axis=2)
+    gt = np.any(points[None, :, :] > points[:, None, :], axis=2)
+    return ~(ge & gt).any(axis=1)
+
+
+class TestParetoMask:
+    """Test suite for the vectorized Pareto filter"""
+
+    @pytest.mark.parametrize("dimensions", [2, 3, 6])
+    def test_matches_brute_force(self, dimensions):
+        points = np.round(np.random.default_rng(dimensions).random((600, dimensions)), 1)
+
+        mask = pareto_mask(points, batch_size=32)
+
+        expected = brute_force_front(points)
+        assert not (mask & ~expected).any()
+        # Duplicated frontier points are kept once
+        assert mask.sum() == len({tuple(row) for row in points[expected]})
+
+
+class TestConstraintOptimizer:
+    """Test suite for scenario generation from the constraint space"""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create analyzer instance"""
+        return TripleConstraintAnalyzer()
+
+    @pytest.mark.asyncio
+    async def test_default_triangle(self, analyzer):
+        result = await analyzer.analyze(
+            TripleConstraintContext(scenario="Ship the MVP this quarter", random_seed=1)
+        )
+
+        assert [c.name for c in result.constraints] == ["quality", "time", "cost"]
+        assert result.identified_constraints is not None
+        assert len(result.scenarios) == 3
+        assert len(result.optimization_recommendations) == 3
+        assert all(s.strategy == OptimizationStrategy.BALANCED for s in result.scenarios)
+        assert result.trade_off_analyses[0].relationship == "Improving quality reduces time"
+        assert 0 < result.pareto_frontier_size <= result.feasible_allocations
+
+    @pytest.mark.asyncio
+    async def test_focus_ranks_scenarios(self, analyzer):
+        base = dict(scenario="Ship the MVP this quarter", random_seed=3)
+
+        balanced = await analyzer.analyze(TripleConstraintContext(**base))
+        focused = await analyzer.analyze(TripleConstraintContext(**base, optimization_focus="time"))
+
+        def progress(result, name):
+            return result.scenarios[0].expected_outcomes["gap_progress"][name]
+
+        assert progress(focused, "time") == 1.0
+        assert progress(focused, "time") > progress(balanced, "time")
+        balanced_progress = balanced.scenarios[0].expected_outcomes["gap_progress"].values()
+        assert min(balanced_progress) > 0
+
+        with pytest.raises(ValueError):
+            await analyzer.analyze(TripleConstraintContext(**base, optimization_focus="morale"))
+
+    @pytest.mark.asyncio
+    async def test_critical_constraints_never_regress(self, analyzer):
+        constraints = [
+            dict(dimension="quality", name="quality", current_value=60, target_value=90,
+                 priority=ConstraintPriority.CRITICAL),
+            dict(dimension="time", name="time", current_value=40, target_value=80, flexibility=0.8),
+            dict(dimension="cost", name="cost", current_value=70, target_value=60, flexibility=0.8),
+        ]
+        result = await analyzer.analyze(TripleConstraintContext(
+            scenario="Regulated release",
+            predefined_constraints=constraints,
+            optimization_focus="time",
+            random_seed=4,
+        ))
+
+        for scenario in result.scenarios:
+            assert scenario.expected_outcomes["gap_progress"]["quality"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_many_dimensions(self, analyzer):
+        dimensions = list(ConstraintDimension)
+        constraints = [
+            dict(
+                dimension=dimensions[i].value,
+                name=f"constraint_{i}",
+                current_value=40 + i,
+                target_value=80,
+                flexibility=0.4,
+            )
+            for i in range(12)
+        ]
+        trade_offs = {"constraint_0": {"constraint_1": -0.5, "constraint_2": 0.2}}
+
+        result = await analyzer.analyze(TripleConstraintContext(
+            scenario="Platform re-architecture",
+            predefined_constraints=constraints,
+            trade_off_matrix=trade_offs,
+            max_scenarios=5,
+            random_seed=5,
+        ))
+
+        assert result.identified_constraints is None
+        assert len(result.scenarios) == 5
+        assert len(result.scenarios[0].adjustments) == 12
+        assert result.pareto_frontier_size > 0
+
+        with pytest.raises(ValueError):
+            await analyzer.analyze(TripleConstraintContext(
+                scenario="Platform re-architecture",
+                predefined_constraints=constraints,
+                trade_off_matrix={"constraint_0": {"missing": -0.5}},
+            ))